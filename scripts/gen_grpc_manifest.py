@@ -0,0 +1,79 @@
+"""
+生成 gRPC Stub 与 protobuf 模块清单: src/tongsim/connection/grpc/_manifest.py
+
+运行时不再遍历 tongsim_api_protocol 包（pkgutil.walk_packages + inspect.getmembers），
+而是读取此脚本预先生成的清单，只在用到某个 Stub / 模块时才导入对应模块。
+升级 tongsim_api_protocol 后需重新运行:
+
+    python scripts/gen_grpc_manifest.py
+"""
+
+import importlib
+import inspect
+import pkgutil
+import sys
+
+_PACKAGE = "tongsim_api_protocol"
+_OUTPUT = "src/tongsim/connection/grpc/_manifest.py"
+
+_HEADER = '''"""
+connection.grpc._manifest
+
+- GRPC_STUB_MANIFEST: gRPC Stub 清单, (模块路径, Stub 类名);
+- PROTO_MODULE_MANIFEST: 定义 protobuf 消息的 _pb2 模块路径。
+
+此文件由 scripts/gen_grpc_manifest.py 生成, 请勿手动修改。
+"""
+'''
+
+
+def collect_grpc_stubs(package: str = _PACKAGE) -> list[tuple[str, str]]:
+    """遍历协议包，收集所有 gRPC Stub 的 (模块路径, 类名)。"""
+    pkg = importlib.import_module(package)
+    stubs: list[tuple[str, str]] = []
+    for _, modname, ispkg in pkgutil.walk_packages(pkg.__path__, prefix=package + "."):
+        if not ispkg and modname.endswith("_pb2_grpc"):
+            grpc_module = importlib.import_module(modname)
+            for name, _ in inspect.getmembers(grpc_module, inspect.isclass):
+                if name.endswith("Stub"):
+                    stubs.append((modname, name))
+    return sorted(stubs)
+
+
+def collect_proto_modules(package: str = _PACKAGE) -> list[str]:
+    """遍历协议包，收集所有定义 protobuf 消息的 _pb2 模块路径（不导入模块）。"""
+    pkg = importlib.import_module(package)
+    return sorted(
+        modname
+        for _, modname, ispkg in pkgutil.walk_packages(
+            pkg.__path__, prefix=package + "."
+        )
+        if not ispkg and modname.endswith("_pb2")
+    )
+
+
+def render_manifest(stubs: list[tuple[str, str]], modules: list[str]) -> str:
+    lines = [_HEADER, "GRPC_STUB_MANIFEST: tuple[tuple[str, str], ...] = ("]
+    for modname, name in stubs:
+        line = f'    ("{modname}", "{name}"),'
+        if len(line) > 88:  # 与 ruff format 的换行风格保持一致
+            line = f'    (\n        "{modname}",\n        "{name}",\n    ),'
+        lines.append(line)
+    lines.append(")")
+    lines.append("")
+    lines.append("PROTO_MODULE_MANIFEST: tuple[str, ...] = (")
+    lines.extend(f'    "{modname}",' for modname in modules)
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main(output: str = _OUTPUT) -> None:
+    stubs = collect_grpc_stubs()
+    modules = collect_proto_modules()
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(render_manifest(stubs, modules))
+    print(f"Wrote {len(stubs)} stub(s) and {len(modules)} module(s) to {output}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -15,6 +15,7 @@ __all__ = (
     "LEFT_HAND",
     "RIGHT_HAND",
     "AgentEntity",
+    "AsyncTongSim",
     "BaseObjectEntity",
     "Box",
     "CameraEntity",
@@ -26,6 +27,8 @@ __all__ = (
     "NPCEntity",
     "Pose",
     "Quaternion",
+    "RpcError",
+    "StreamGap",
     "TongSim",
     "Transform",
     "UnaryAPI",
@@ -37,11 +40,19 @@ __all__ = (
     "get_version_info",
     "initialize_logger",
     "set_log_level",
+    "strict_rpc",
 )
 
 if typing.TYPE_CHECKING:
     # 导入用于 IDE 提示和类型检查
-    from .connection.grpc import LegacyAPI, UnaryAPI, UnaryStreamAPI
+    from .connection.grpc import (
+        LegacyAPI,
+        RpcError,
+        StreamGap,
+        UnaryAPI,
+        UnaryStreamAPI,
+        strict_rpc,
+    )
     from .entity import (
         AgentEntity,
         BaseObjectEntity,
@@ -55,7 +66,7 @@ if typing.TYPE_CHECKING:
     )
     from .logger import initialize_logger, set_log_level
     from .math.geometry import Box, Pose, Quaternion, Vector2, Vector3
-    from .tongsim import TongSim
+    from .tongsim import AsyncTongSim, TongSim
     from .type import BOTH_HANDS, LEFT_HAND, RIGHT_HAND
     from .version import get_version_info
 
@@ -79,6 +90,7 @@ _dynamic_imports: dict[str, tuple[str, str]] = {
     "LightEntity": (__spec__.parent, ".entity"),
     # Core
     "TongSim": (__spec__.parent, ".tongsim"),
+    "AsyncTongSim": (__spec__.parent, ".tongsim"),
     # Action
     "action": (__spec__.parent, ".entity"),
     # Logger
@@ -92,6 +104,9 @@ _dynamic_imports: dict[str, tuple[str, str]] = {
     "UnaryAPI": (__spec__.parent, ".connection.grpc"),
     "UnaryStreamAPI": (__spec__.parent, ".connection.grpc"),
     "LegacyAPI": ((__spec__.parent, ".connection.grpc")),
+    "RpcError": (__spec__.parent, ".connection.grpc"),
+    "strict_rpc": (__spec__.parent, ".connection.grpc"),
+    "StreamGap": (__spec__.parent, ".connection.grpc"),
     # Version
     "get_version_info": (__spec__.parent, ".version"),
 }
@@ -1,25 +1,104 @@
+from typing import TYPE_CHECKING
+
 from ._legacy.streamer import LegacyStreamClient
 from .anim_cmd import AnimCommandBuilder as AnimCmd
 from .bidi_stream import BidiStream, BidiStreamReader, BidiStreamWriter
+from .cache import CACHED_METHODS, ResponseCache
+from .call_policy import (
+    COALESCED_METHODS,
+    RETRIED_METHODS,
+    CallPolicy,
+    LatencyStats,
+    RpcMetrics,
+    RpcStats,
+)
+from .channel import ChannelOptions
+from .codec import (
+    array_to_quaternions,
+    array_to_vectors,
+    arrays_to_poses,
+    arrays_to_transforms,
+    poses_to_arrays,
+    quaternions_to_array,
+    transforms_to_arrays,
+    vectors_to_array,
+)
 from .core import GrpcConnection, GrpcLegacyConnection, GrpcMujocoConnection
+from .deadline import deadline, remaining_time
+from .errors import RpcError, strict_rpc
+from .health import HealthReport, probe_health
 from .legacy_api import LegacyAPI
-from .mujoco_api import MujocoAPI
+from .replay import ReplayChannel, WireReplay
 from .streamer.animation import AnimationStreamer
+from .supervisor import (
+    ConnectionSupervisor,
+    StreamGap,
+    StreamInterruptedError,
+    resilient_stream,
+)
 from .unary_api import UnaryAPI
 from .unary_stream_api import UnaryStreamAPI
+from .utils import CodecRegistry, register_codec
+from .wirelog import WireCall, WireRecorder, read_wire_calls
+
+if TYPE_CHECKING:
+    from .mujoco_api import MujocoAPI
 
 __all__ = [
+    "CACHED_METHODS",
+    "COALESCED_METHODS",
+    "RETRIED_METHODS",
     "AnimCmd",
     "AnimationStreamer",
     "BidiStream",
     "BidiStreamReader",
     "BidiStreamWriter",
+    "CallPolicy",
+    "ChannelOptions",
+    "CodecRegistry",
+    "ConnectionSupervisor",
     "GrpcConnection",
     "GrpcLegacyConnection",
     "GrpcMujocoConnection",
+    "HealthReport",
+    "LatencyStats",
     "LegacyAPI",
     "LegacyStreamClient",
     "MujocoAPI",
+    "ReplayChannel",
+    "ResponseCache",
+    "RpcError",
+    "RpcMetrics",
+    "RpcStats",
+    "StreamGap",
+    "StreamInterruptedError",
     "UnaryAPI",
     "UnaryStreamAPI",
+    "WireCall",
+    "WireRecorder",
+    "WireReplay",
+    "array_to_quaternions",
+    "array_to_vectors",
+    "arrays_to_poses",
+    "arrays_to_transforms",
+    "deadline",
+    "poses_to_arrays",
+    "probe_health",
+    "quaternions_to_array",
+    "read_wire_calls",
+    "register_codec",
+    "remaining_time",
+    "resilient_stream",
+    "strict_rpc",
+    "transforms_to_arrays",
+    "vectors_to_array",
 ]
+
+
+def __getattr__(name: str):
+    # MujocoAPI 依赖的协议模块很少用到，首次访问时才导入
+    if name == "MujocoAPI":
+        from .mujoco_api import MujocoAPI
+
+        return MujocoAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
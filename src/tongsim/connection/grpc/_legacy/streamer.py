@@ -15,7 +15,7 @@ from tongsim.connection.grpc.bidi_stream import (
     BidiStreamWriter,
 )
 from tongsim.connection.grpc.core import GrpcConnection
-from tongsim.core import AsyncLoop
+from tongsim.core import AsyncLoop, SupervisionPolicy
 from tongsim.logger import get_logger
 
 __all__ = ["LegacyStreamClient"]
@@ -58,15 +58,34 @@ class LegacyStreamClient:
         self._writer: _StreamingFunctionWriter = _StreamingFunctionWriter(self._stream)
         self._reader: _StreamingFunctionReader = _StreamingFunctionReader(self._stream)
         self._async_loop: AsyncLoop = async_loop
+        self._started: bool = False
+
+    @property
+    def is_started(self) -> bool:
+        return self._started
 
     async def start(self):
+        """打开双向流并启动读取循环；重复调用无副作用。首次 write 时会自动调用。"""
+        if self._started:
+            return
+        self._started = True
         await self._stream.start()
-        self._async_loop.spawn(self._read_loop(), name="LegacyStreamClient:read_loop")
+        self._async_loop.spawn(
+            self._read_loop(),
+            name="LegacyStreamClient:read_loop",
+            policy=SupervisionPolicy.ISOLATE,
+            background=True,
+        )
 
     async def write(self, req: StreamingFunctionRequest) -> bool:
+        # 延迟到首次写入时再打开双向流，缩短 WorldContext 的启动时间
+        if not self._started:
+            await self.start()
         return await self._writer.write(req)
 
     async def close(self):
+        if not self._started:
+            return
         await self._writer.done()
 
     async def _read_loop(self):
@@ -0,0 +1,97 @@
+"""
+connection.grpc._manifest
+
+- GRPC_STUB_MANIFEST: gRPC Stub 清单, (模块路径, Stub 类名);
+- PROTO_MODULE_MANIFEST: 定义 protobuf 消息的 _pb2 模块路径。
+
+当前清单按 tongsim_api_protocol 0.0.27 手动维护, 尚未由脚本生成;
+可安装协议包后运行 scripts/gen_grpc_manifest.py 重新生成并覆盖此文件。
+"""
+
+GRPC_STUB_MANIFEST: tuple[tuple[str, str], ...] = (
+    (
+        "tongsim_api_protocol.component.animation.animation_pb2_grpc",
+        "AnimationServiceStub",
+    ),
+    ("tongsim_api_protocol.component.attachment_pb2_grpc", "AttachmentServiceStub"),
+    (
+        "tongsim_api_protocol.component.character_attribute_pb2_grpc",
+        "CharacterAttributeServiceStub",
+    ),
+    ("tongsim_api_protocol.component.door_state_pb2_grpc", "DoorServiceStub"),
+    ("tongsim_api_protocol.component.face_pb2_grpc", "FaceServiceStub"),
+    ("tongsim_api_protocol.component.object_state_pb2_grpc", "ObjectStateServiceStub"),
+    ("tongsim_api_protocol.component.pose_pb2_grpc", "PoseServiceStub"),
+    ("tongsim_api_protocol.component.voxel_pb2_grpc", "VoxelServiceStub"),
+    ("tongsim_api_protocol.subject.subject_pb2_grpc", "SubjectServiceStub"),
+    (
+        "tongsim_api_protocol.subsystem.acoustics_manager_pb2_grpc",
+        "AcousticsManagerServiceStub",
+    ),
+    ("tongsim_api_protocol.subsystem.camera_pb2_grpc", "CameraServiceStub"),
+    ("tongsim_api_protocol.subsystem.debug_draw_pb2_grpc", "DebugDrawServiceStub"),
+    ("tongsim_api_protocol.subsystem.distribution_pb2_grpc", "DistributionServiceStub"),
+    ("tongsim_api_protocol.subsystem.event_stream_pb2_grpc", "EventStreamServiceStub"),
+    ("tongsim_api_protocol.subsystem.map_pb2_grpc", "MapServiceStub"),
+    (
+        "tongsim_api_protocol.subsystem.mujoco_manager_pb2_grpc",
+        "MujocoManagerServiceStub",
+    ),
+    ("tongsim_api_protocol.subsystem.open_world_pb2_grpc", "OpenWorldServiceStub"),
+    ("tongsim_api_protocol.subsystem.pg_pb2_grpc", "PGServiceStub"),
+    ("tongsim_api_protocol.subsystem.record_pb2_grpc", "RecordServiceStub"),
+    ("tongsim_api_protocol.subsystem.save_game_pb2_grpc", "SaveGameServiceStub"),
+    ("tongsim_api_protocol.subsystem.scene_pb2_grpc", "SceneServiceStub"),
+    ("tongsim_api_protocol.subsystem.segment_pb2_grpc", "SegmentServiceStub"),
+)
+
+PROTO_MODULE_MANIFEST: tuple[str, ...] = (
+    "tongsim_api_protocol.basic_pb2",
+    "tongsim_api_protocol.component.animation.aim_offset_pb2",
+    "tongsim_api_protocol.component.animation.animation_pb2",
+    "tongsim_api_protocol.component.animation.cancel_pb2",
+    "tongsim_api_protocol.component.animation.climb_down_pb2",
+    "tongsim_api_protocol.component.animation.climb_platform_pb2",
+    "tongsim_api_protocol.component.animation.gesture_pb2",
+    "tongsim_api_protocol.component.animation.hand_grab_object_pb2",
+    "tongsim_api_protocol.component.animation.hand_reach_pb2",
+    "tongsim_api_protocol.component.animation.hand_release_pb2",
+    "tongsim_api_protocol.component.animation.input_move_pb2",
+    "tongsim_api_protocol.component.animation.interact_object_pb2",
+    "tongsim_api_protocol.component.animation.locomotion_pb2",
+    "tongsim_api_protocol.component.animation.mop_floor_pb2",
+    "tongsim_api_protocol.component.animation.move_to_pb2",
+    "tongsim_api_protocol.component.animation.play_animation_pb2",
+    "tongsim_api_protocol.component.animation.pour_water_pb2",
+    "tongsim_api_protocol.component.animation.readbook_pb2",
+    "tongsim_api_protocol.component.animation.sitdown_pb2",
+    "tongsim_api_protocol.component.animation.sleep_pb2",
+    "tongsim_api_protocol.component.animation.slice_food_pb2",
+    "tongsim_api_protocol.component.animation.switch_door_pb2",
+    "tongsim_api_protocol.component.animation.turn_around_pb2",
+    "tongsim_api_protocol.component.animation.wait_pb2",
+    "tongsim_api_protocol.component.animation.wash_pb2",
+    "tongsim_api_protocol.component.animation.wipe_quadrilateral_pb2",
+    "tongsim_api_protocol.component.attachment_pb2",
+    "tongsim_api_protocol.component.character_attribute_pb2",
+    "tongsim_api_protocol.component.door_state_pb2",
+    "tongsim_api_protocol.component.face_pb2",
+    "tongsim_api_protocol.component.object_state_pb2",
+    "tongsim_api_protocol.component.pose_pb2",
+    "tongsim_api_protocol.component.spawner_pb2",
+    "tongsim_api_protocol.component.voxel_pb2",
+    "tongsim_api_protocol.subject.subject_pb2",
+    "tongsim_api_protocol.subsystem.acoustics_manager_pb2",
+    "tongsim_api_protocol.subsystem.camera_pb2",
+    "tongsim_api_protocol.subsystem.debug_draw_pb2",
+    "tongsim_api_protocol.subsystem.distribution_pb2",
+    "tongsim_api_protocol.subsystem.event_stream_pb2",
+    "tongsim_api_protocol.subsystem.map_pb2",
+    "tongsim_api_protocol.subsystem.mujoco_manager_pb2",
+    "tongsim_api_protocol.subsystem.open_world_pb2",
+    "tongsim_api_protocol.subsystem.pg_pb2",
+    "tongsim_api_protocol.subsystem.record_pb2",
+    "tongsim_api_protocol.subsystem.save_game_pb2",
+    "tongsim_api_protocol.subsystem.scene_pb2",
+    "tongsim_api_protocol.subsystem.segment_pb2",
+)
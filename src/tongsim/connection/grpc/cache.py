@@ -0,0 +1,171 @@
+"""
+connection.grpc.cache
+
+静态场景查询的响应缓存:
+- ResponseCache: 以 (方法, 请求字节) 为键的 TTL + LRU 缓存，带版本号；
+- 缓存由 GrpcConnection 的拦截器读写，只对配置了 TTL 的只读方法生效（默认见 CACHED_METHODS，
+  可通过 CallPolicy.cache_ttl 按服务 / 方法调整）；
+- 场景发生变化（打开关卡、加载场景、生成 / 销毁实体、PG 中出现新物体或物体被销毁）时调用 invalidate()，
+  版本号递增，失效前发起、失效后才返回的响应不会写入缓存。
+
+缓存可能被其他线程失效（例如同步接口所在的用户线程），因此内部使用锁保护。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Final
+
+__all__ = ["CACHED_METHODS", "CacheStats", "ResponseCache"]
+
+# 默认缓存的静态查询（"Service/Method" -> TTL 秒），只在场景变化时改变
+CACHED_METHODS: Final[dict[str, float]] = {
+    "MapService/GetMapRoomInfo": 300.0,
+    "MapService/GetRoomArray": 300.0,
+    "MapService/GetNavMeshPoly": 300.0,
+    "SceneService/GetAssetList": 300.0,
+    "SceneService/GetAssetFileContent": 300.0,
+    "SubjectService/QueryComponents": 60.0,
+}
+
+MISS: Final = object()
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """
+    单个方法的缓存统计。
+
+    Attributes:
+        hits (int): 命中次数。
+        misses (int): 未命中次数（包括已过期）。
+        stores (int): 写入次数。
+        stale (int): 因期间发生失效而放弃写入的次数。
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    stale: int = 0
+
+
+class ResponseCache:
+    """
+    带 TTL、LRU 容量上限与版本号的响应缓存。
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Args:
+            max_entries (int): 最多缓存的响应数量，超出后淘汰最久未使用的条目。
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}.")
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, bytes], tuple[float, Any]] = OrderedDict()
+        self._stats: dict[str, CacheStats] = {}
+        self._version: int = 0
+        self._evictions: int = 0
+        self._invalidations: int = 0
+
+    @property
+    def version(self) -> int:
+        """缓存版本号，每次 invalidate() 后加 1。"""
+        return self._version
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, method: str, key: tuple[str, bytes]) -> Any:
+        """
+        查找缓存的响应。
+
+        Args:
+            method (str): "Service/Method"，用于统计。
+            key (tuple[str, bytes]): (完整方法名, 请求字节)。
+
+        Returns:
+            Any: 缓存的响应；未命中或已过期时返回 MISS。
+        """
+        now = time.monotonic()
+        with self._lock:
+            stats = self._method_stats(method)
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                stats.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            stats.hits += 1
+            return entry[1]
+
+    def put(
+        self,
+        method: str,
+        key: tuple[str, bytes],
+        response: Any,
+        ttl: float,
+        version: int,
+    ) -> bool:
+        """
+        写入响应。
+
+        Args:
+            method (str): "Service/Method"，用于统计。
+            key (tuple[str, bytes]): (完整方法名, 请求字节)。
+            response (Any): 响应消息，调用方需保证之后不再修改。
+            ttl (float): 存活秒数。
+            version (int): 发起请求时的缓存版本号；与当前版本不一致说明期间发生过失效，放弃写入。
+
+        Returns:
+            bool: 是否写入。
+        """
+        with self._lock:
+            stats = self._method_stats(method)
+            if version != self._version:
+                stats.stale += 1
+                return False
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            stats.stores += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def invalidate(self) -> None:
+        """清空缓存并递增版本号。"""
+        with self._lock:
+            self._entries.clear()
+            self._version += 1
+            self._invalidations += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: 包含 entries / version / hits / misses / hit_rate / evictions / invalidations，
+                以及按方法统计的 methods。
+        """
+        with self._lock:
+            hits = sum(s.hits for s in self._stats.values())
+            misses = sum(s.misses for s in self._stats.values())
+            return {
+                "entries": len(self._entries),
+                "version": self._version,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "methods": {m: asdict(s) for m, s in self._stats.items()},
+            }
+
+    def _method_stats(self, method: str) -> CacheStats:
+        stats = self._stats.get(method)
+        if stats is None:
+            stats = self._stats[method] = CacheStats()
+        return stats
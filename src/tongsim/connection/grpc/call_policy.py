@@ -0,0 +1,531 @@
+"""
+connection.grpc.call_policy
+
+GrpcConnection 通道上的 unary-unary 调用策略:
+- CallPolicy: 按服务 / 方法配置的默认调用参数（timeout、重试），覆盖 UnaryAPI 中写死的 timeout；
+- 重试: 默认只对 RETRIED_METHODS 中的只读方法开启，可通过 CallPolicy.retry 按服务 / 方法调整；
+  仅对 UNAVAILABLE / RESOURCE_EXHAUSTED 按带抖动的指数退避重试，重试不会超出截止时间。
+  UNAVAILABLE 可能在服务端已执行请求后返回，生成 / 销毁实体、控制台命令等写操作重试可能重复执行，因此默认不重试；
+- 截止时间传播: 读取 `deadline()` 设置的剩余预算，把每个 RPC 的 timeout 收紧到不超过剩余时间，
+  预算已耗尽时不再发起请求，直接以 DEADLINE_EXCEEDED 失败；
+- RpcMetrics: 按方法统计调用次数、成功 / 失败 / 重试次数、超时（DEADLINE_EXCEEDED）次数与耗时；
+- LatencyStats: 健康探测往返延迟的滑动窗口统计；
+- 请求合并（single-flight）: 同一通道上方法与请求字节完全相同的并发只读调用共享同一个在途 RPC 及其结果，
+  默认对 COALESCED_METHODS 中的只读查询开启，可通过 CallPolicy.coalesce 按服务 / 方法开关；
+- 响应缓存: 对配置了 TTL 的静态查询读写 ResponseCache（默认见 cache.CACHED_METHODS，
+  可通过 CallPolicy.cache_ttl 调整）。
+
+策略与统计通过 gRPC 客户端拦截器实现，对 UnaryAPI / LegacyAPI 的所有方法统一生效。
+"""
+
+import asyncio
+import copy
+import functools
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import grpc
+from grpc.aio import AioRpcError, ClientCallDetails, Metadata
+
+from tongsim.core.supervision import RestartBackoff
+from tongsim.logger import get_logger
+
+from .cache import CACHED_METHODS, MISS, ResponseCache
+from .deadline import remaining_time
+from .errors import RETRYABLE_STATUS_CODES
+
+__all__ = [
+    "COALESCED_METHODS",
+    "RETRIED_METHODS",
+    "CallPolicy",
+    "CallPolicyInterceptor",
+    "LatencyStats",
+    "RpcMetrics",
+    "RpcStats",
+]
+
+_logger = get_logger("gRPC")
+
+# 默认重试 2 次，等待约 50ms / 100ms（±20% 抖动）
+DEFAULT_RETRY: RestartBackoff = RestartBackoff(
+    initial=0.05, maximum=1.0, factor=2.0, jitter=0.2, max_restarts=2
+)
+
+# 默认开启重试的只读查询（"Service/Method"），写操作重复执行可能产生副作用，不在此列
+RETRIED_METHODS: frozenset[str] = frozenset(
+    {
+        "AttachmentService/GetObjectInHand",
+        "CameraService/GetCameraIntrinsicParams",
+        "MapService/GetMapRoomInfo",
+        "MapService/GetNavMeshPoly",
+        "MapService/GetNavPointInRinglike",
+        "MapService/GetRandomSpawnLocation",
+        "MapService/GetRoomArray",
+        "MapService/GetRoomNameFromLocation",
+        "ObjectStateService/GetActiveState",
+        "ObjectStateService/GetAssetName",
+        "ObjectStateService/GetGroupID",
+        "ObjectStateService/GetInteractLocation",
+        "ObjectStateService/GetIsPowered",
+        "ObjectStateService/GetPlaceLocation",
+        "ObjectStateService/GetSubjectsInSameGroup",
+        "ObjectStateService/GetType",
+        "PGService/GetComponentPG",
+        "PGService/GetObjectPG",
+        "PoseService/GetForwardVector",
+        "PoseService/GetPose",
+        "PoseService/GetRightVector",
+        "SceneService/FindClosestAgent",
+        "SceneService/FindClosestDoor",
+        "SceneService/FindClosestObjectByType",
+        "SceneService/GetAllImpassableDoors",
+        "SceneService/GetAllPassableDoors",
+        "SceneService/GetAssetFileContent",
+        "SceneService/GetAssetList",
+        "SceneService/GetContainerDoors",
+        "SceneService/GetFPS",
+        "SceneService/GetNavTarget",
+        "SceneService/GetNearestNavPoint",
+        "SceneService/GetObjectByRdf",
+        "SceneService/GetPlacedObjectInfoFromContainer",
+        "SceneService/GetSubjectsInViewFrustumWithAABBCulling",
+        "SceneService/GetTakeOutObjectInfoFromContainer",
+        "SubjectService/GetCameraImage",
+        "SubjectService/QueryComponents",
+    }
+)
+
+# 默认开启请求合并的只读查询（"Service/Method"）
+COALESCED_METHODS: frozenset[str] = frozenset(
+    {
+        "MapService/GetMapRoomInfo",
+        "MapService/GetRoomArray",
+        "MapService/GetNavMeshPoly",
+        "SceneService/GetAssetList",
+        "SceneService/GetAssetFileContent",
+        "SceneService/GetAllPassableDoors",
+        "SubjectService/QueryComponents",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CallPolicy:
+    """
+    单个服务或方法的默认调用策略。
+
+    Attributes:
+        timeout (float | None): 默认 gRPC timeout（秒），None 表示沿用调用处传入的 timeout。
+        retry (RestartBackoff | None): 可重试状态码（UNAVAILABLE / RESOURCE_EXHAUSTED）的退避参数，
+            max_restarts 即最大重试次数，max_restarts=0 表示不重试；None 表示按 RETRIED_METHODS 决定
+            （其中的方法使用 DEFAULT_RETRY，其余方法不重试）。只应对可安全重复执行的方法开启。
+        coalesce (bool | None): 是否合并相同的并发调用（共享同一个在途 RPC 与结果），
+            None 表示按 COALESCED_METHODS 决定。只应对只读方法开启。
+        cache_ttl (float | None): 响应缓存的存活秒数，0 表示不缓存，None 表示按 CACHED_METHODS 决定。
+            只应对结果只随场景变化（打开关卡、生成 / 销毁实体等）而改变的方法开启。
+    """
+
+    timeout: float | None = None
+    retry: RestartBackoff | None = None
+    coalesce: bool | None = None
+    cache_ttl: float | None = None
+
+
+_DEFAULT_POLICY = CallPolicy()
+
+
+@dataclass(slots=True)
+class RpcStats:
+    """
+    单个 RPC 方法的调用统计。
+
+    Attributes:
+        calls (int): 调用次数。
+        ok (int): 成功次数。
+        failed (int): 失败次数（包括超时）。
+        retries (int): 重试次数。
+        coalesced (int): 与其他相同的在途调用合并、未单独发起 RPC 的次数。
+        deadline_exceeded (int): 以 DEADLINE_EXCEEDED 失败的次数。
+        clamped (int): timeout 被剩余截止时间收紧的次数。
+        total_seconds (float): 累计耗时。
+        max_seconds (float): 最大耗时。
+    """
+
+    calls: int = 0
+    ok: int = 0
+    failed: int = 0
+    retries: int = 0
+    coalesced: int = 0
+    deadline_exceeded: int = 0
+    clamped: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class RpcMetrics:
+    """
+    按方法（"Service/Method"）聚合的 RPC 调用统计，可在任意线程读取。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[str, RpcStats] = {}
+
+    def record(
+        self,
+        method: str,
+        seconds: float,
+        code: grpc.StatusCode,
+        clamped: bool = False,
+        retries: int = 0,
+        coalesced: bool = False,
+    ) -> None:
+        """记录一次已完成的调用（包含其中的重试）。"""
+        with self._lock:
+            stats = self._stats.get(method)
+            if stats is None:
+                stats = self._stats[method] = RpcStats()
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.retries += retries
+            if coalesced:
+                stats.coalesced += 1
+            if clamped:
+                stats.clamped += 1
+            if code is grpc.StatusCode.OK:
+                stats.ok += 1
+            else:
+                stats.failed += 1
+                if code is grpc.StatusCode.DEADLINE_EXCEEDED:
+                    stats.deadline_exceeded += 1
+
+    def get(self, method: str) -> RpcStats:
+        """获取指定方法统计的副本，未调用过时返回全零统计。"""
+        with self._lock:
+            stats = self._stats.get(method)
+            return RpcStats(**asdict(stats)) if stats else RpcStats()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns:
+            dict[str, dict[str, Any]]: 以 "Service/Method" 为键的统计快照。
+        """
+        with self._lock:
+            return {method: asdict(s) for method, s in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class LatencyStats:
+    """
+    往返延迟（秒）的滑动窗口统计，可在任意线程读取。
+    """
+
+    def __init__(self, window: int = 64):
+        """
+        Args:
+            window (int): 保留的最近样本数。
+        """
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=window)
+        self._count: int = 0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self._count += 1
+
+    @property
+    def last(self) -> float | None:
+        """最近一次样本，没有样本时为 None。"""
+        with self._lock:
+            return self._samples[-1] if self._samples else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: 包含 count（累计样本数）与窗口内的 last / min / mean / p50 / p95 / max，
+                没有样本时除 count 外均为 None。
+        """
+        with self._lock:
+            samples = list(self._samples)
+            count = self._count
+        if not samples:
+            return {
+                "count": count,
+                "last": None,
+                "min": None,
+                "mean": None,
+                "p50": None,
+                "p95": None,
+                "max": None,
+            }
+        ordered = sorted(samples)
+        return {
+            "count": count,
+            "last": samples[-1],
+            "min": ordered[0],
+            "mean": statistics.fmean(ordered),
+            "p50": ordered[len(ordered) // 2],
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max": ordered[-1],
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._count = 0
+
+
+def _full_method(method: str | bytes) -> str:
+    return method.decode() if isinstance(method, bytes) else method
+
+
+def _request_bytes(request: Any) -> bytes:
+    """请求的确定性序列化结果，用作请求合并的键。"""
+    if isinstance(request, bytes):
+        return request
+    return request.SerializeToString(deterministic=True)
+
+
+def _split_method(method: str | bytes) -> tuple[str, str, str]:
+    """将 "/pkg.Service/Method" 拆分为 (完整服务名, 短服务名, 方法名)。"""
+    service, _, name = _full_method(method).lstrip("/").rpartition("/")
+    return service, service.rpartition(".")[2], name
+
+
+class CallPolicyInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """
+    应用 CallPolicy 与截止时间、读写响应缓存、合并相同的并发只读调用，并记录 RpcMetrics 的 unary-unary 拦截器。
+
+    策略查找顺序: "Service/Method" -> "pkg.Service/Method" -> "Service" -> "pkg.Service" -> "*"。
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, CallPolicy],
+        metrics: RpcMetrics,
+        cache: ResponseCache | None = None,
+    ):
+        """
+        Args:
+            policies (Mapping[str, CallPolicy]): 策略表，由 GrpcConnection 持有，修改后立即生效。
+            metrics (RpcMetrics): 统计对象。
+            cache (ResponseCache | None): 响应缓存，None 表示不缓存。
+        """
+        self._policies = policies
+        self._metrics = metrics
+        self._cache = cache
+        # (完整方法名, 请求字节) -> 在途调用；拦截器随 GrpcConnection 绑定在单个事件循环上
+        self._inflight: dict[tuple[str, bytes], asyncio.Future] = {}
+
+    def resolve(self, method: str | bytes) -> CallPolicy | None:
+        """查找方法对应的调用策略。"""
+        if not self._policies:
+            return None
+        service, short, name = _split_method(method)
+        for key in (f"{short}/{name}", f"{service}/{name}", short, service, "*"):
+            policy = self._policies.get(key)
+            if policy is not None:
+                return policy
+        return None
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[[ClientCallDetails, Any], Any],
+        client_call_details: ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        _, short, name = _split_method(client_call_details.method)
+        method = f"{short}/{name}"
+
+        policy = self.resolve(client_call_details.method) or _DEFAULT_POLICY
+        timeout = (
+            policy.timeout
+            if policy.timeout is not None
+            else client_call_details.timeout
+        )
+        coalesce = (
+            policy.coalesce
+            if policy.coalesce is not None
+            else method in COALESCED_METHODS
+        )
+        ttl = (
+            policy.cache_ttl
+            if policy.cache_ttl is not None
+            else CACHED_METHODS.get(method, 0.0)
+        )
+        retry = (
+            policy.retry
+            if policy.retry is not None
+            else (DEFAULT_RETRY if method in RETRIED_METHODS else None)
+        )
+        invoke = functools.partial(
+            self._invoke,
+            method,
+            retry,
+            timeout,
+            continuation,
+            client_call_details,
+            request,
+        )
+        if self._cache is None or ttl <= 0:
+            if not coalesce:
+                return await invoke()
+            key = (_full_method(client_call_details.method), _request_bytes(request))
+            return await self._coalesced(method, timeout, key, invoke)
+
+        key = (_full_method(client_call_details.method), _request_bytes(request))
+        cached = self._cache.get(method, key)
+        if cached is not MISS:
+            return copy.deepcopy(cached)
+        version = self._cache.version
+        if coalesce:
+            response = await self._coalesced(method, timeout, key, invoke)
+        else:
+            response = await invoke()
+        # 缓存中保存独立副本，调用方修改返回的消息不会影响缓存
+        self._cache.put(method, key, copy.deepcopy(response), ttl, version)
+        return response
+
+    async def _coalesced(
+        self,
+        method: str,
+        timeout: float | None,
+        key: tuple[str, bytes],
+        invoke: Callable[[], Any],
+    ) -> Any:
+        """与相同的在途调用合并；没有在途调用时发起新的调用。"""
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(invoke())
+            self._inflight[key] = shared
+            shared.add_done_callback(functools.partial(self._on_shared_done, key))
+            # 发起方被取消时不影响正在等待同一结果的其他调用方
+            return await asyncio.shield(shared)
+        return await self._join(method, timeout, shared)
+
+    async def _invoke(
+        self,
+        method: str,
+        retry: RestartBackoff | None,
+        timeout: float | None,
+        continuation: Callable[[ClientCallDetails, Any], Any],
+        client_call_details: ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        """发起调用，按策略重试，并记录统计。"""
+        started = time.perf_counter()
+        clamped = False
+        attempt = 0
+        while True:
+            try:
+                effective, clamped_now = self._clamp(method, timeout)
+                clamped |= clamped_now
+                call = await continuation(
+                    client_call_details._replace(timeout=effective), request
+                )
+                response = await call
+            except AioRpcError as e:
+                attempt += 1
+                delay = self._retry_delay(retry, e.code(), attempt)
+                if delay is None:
+                    self._metrics.record(
+                        method,
+                        time.perf_counter() - started,
+                        e.code(),
+                        clamped,
+                        attempt - 1,
+                    )
+                    raise
+                _logger.debug(
+                    f"gRPC {method} failed with {e.code().name}, retry #{attempt} in {delay:.3f}s."
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            self._metrics.record(
+                method,
+                time.perf_counter() - started,
+                grpc.StatusCode.OK,
+                clamped,
+                attempt,
+            )
+            return response
+
+    async def _join(
+        self, method: str, timeout: float | None, shared: asyncio.Future
+    ) -> Any:
+        """等待相同的在途调用，按自身的 timeout / 截止时间限制等待时长，并返回结果的副本。"""
+        started = time.perf_counter()
+        code = grpc.StatusCode.OK
+        try:
+            effective, _ = self._clamp(method, timeout)
+            async with asyncio.timeout(effective):
+                response = await asyncio.shield(shared)
+        except TimeoutError:
+            code = grpc.StatusCode.DEADLINE_EXCEEDED
+            raise AioRpcError(
+                code,
+                Metadata(),
+                Metadata(),
+                details=f"Deadline exceeded while waiting for coalesced {method}.",
+            ) from None
+        except AioRpcError as e:
+            code = e.code()
+            raise
+        finally:
+            self._metrics.record(
+                method, time.perf_counter() - started, code, coalesced=True
+            )
+        # 各调用方拿到独立的消息对象，避免互相修改
+        return copy.deepcopy(response)
+
+    def _on_shared_done(self, key: tuple[str, bytes], future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # 所有调用方都已取消时，避免 "exception was never retrieved" 警告
+        if not future.cancelled():
+            future.exception()
+
+    @staticmethod
+    def _clamp(method: str, timeout: float | None) -> tuple[float | None, bool]:
+        """按剩余截止时间收紧 timeout；预算已耗尽时抛出 DEADLINE_EXCEEDED。"""
+        budget = remaining_time()
+        if budget is None:
+            return timeout, False
+        if budget <= 0:
+            raise AioRpcError(
+                grpc.StatusCode.DEADLINE_EXCEEDED,
+                Metadata(),
+                Metadata(),
+                details=f"Deadline exhausted before calling {method}.",
+            )
+        if timeout is None or budget < timeout:
+            return budget, True
+        return timeout, False
+
+    @staticmethod
+    def _retry_delay(
+        retry: RestartBackoff | None, code: grpc.StatusCode, attempt: int
+    ) -> float | None:
+        """第 attempt 次重试前的等待秒数；不应重试时返回 None。"""
+        if (
+            retry is None
+            or code not in RETRYABLE_STATUS_CODES
+            or retry.exhausted(attempt)
+        ):
+            return None
+        delay = retry.delay(attempt)
+        budget = remaining_time()
+        if budget is not None and budget <= delay:
+            return None
+        return delay
@@ -0,0 +1,120 @@
+"""
+connection.grpc.channel
+
+gRPC 通道参数与通道创建:
+- ChannelOptions: 消息大小上限、keepalive、HTTP/2 流控窗口、压缩、媒体流专用通道数量，
+  以及流量录制 / 回放（见 connection.grpc.wirelog / replay）；
+- create_channel: 按 ChannelOptions 创建 grpc.aio 通道。
+
+每个通道都使用独立的 subchannel 池（grpc.use_local_subchannel_pool），
+保证不同通道（主通道、媒体通道、分片 loop 的通道）各自持有独立的 HTTP/2 连接，
+互不共享并发流上限与流控窗口。
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import grpc
+import grpc.aio
+
+__all__ = ["ChannelOptions", "create_channel"]
+
+_MB = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelOptions:
+    """
+    gRPC 通道参数。
+
+    Attributes:
+        max_receive_message_length (int | None): 单条接收消息的最大字节数，-1 表示不限制，None 使用 gRPC 默认值（4MB）。
+        max_send_message_length (int | None): 单条发送消息的最大字节数，None 使用 gRPC 默认值。
+        keepalive_time_ms (int | None): keepalive ping 间隔（毫秒），None 表示不开启。
+            注意服务端默认只允许 5 分钟以上的 ping 间隔，过于频繁会被断开。
+        keepalive_timeout_ms (int): 等待 keepalive ping 应答的超时（毫秒）。
+        keepalive_permit_without_calls (bool): 没有进行中的调用时是否也发送 keepalive ping。
+        initial_window_size (int | None): HTTP/2 单个流的初始流控窗口（字节），None 使用 gRPC 默认值。
+        bdp_probe (bool): 是否开启 BDP 探测以动态调整流控窗口。
+        compression (grpc.Compression | None): 通道默认压缩算法。
+        media_channels (int): 图像、体素、PG 等大流量流使用的专用通道数量，0 表示与普通调用共用主通道。
+        extra (tuple[tuple[str, Any], ...]): 额外的原始 gRPC channel arguments。
+        record_path (str | None): 非 None 时将经过通道的请求与响应追加录制到该文件。
+        replay_path (str | None): 非 None 时不连接服务器，改为回放该文件中录制的流量。
+        replay_cycle (bool): 回放时某个方法的录制调用用完后是否从头循环。
+    """
+
+    max_receive_message_length: int | None = 64 * _MB
+    max_send_message_length: int | None = None
+    keepalive_time_ms: int | None = None
+    keepalive_timeout_ms: int = 20_000
+    keepalive_permit_without_calls: bool = False
+    initial_window_size: int | None = None
+    bdp_probe: bool = True
+    compression: grpc.Compression | None = None
+    media_channels: int = 1
+    extra: tuple[tuple[str, Any], ...] = ()
+    record_path: str | None = None
+    replay_path: str | None = None
+    replay_cycle: bool = False
+
+    def __post_init__(self):
+        if self.media_channels < 0:
+            raise ValueError(f"media_channels must be >= 0, got {self.media_channels}.")
+        if self.record_path is not None and self.replay_path is not None:
+            raise ValueError("record_path and replay_path are mutually exclusive.")
+
+    def to_grpc_options(self) -> list[tuple[str, Any]]:
+        """转换为 grpc.aio.insecure_channel 的 options 参数。"""
+        options: list[tuple[str, Any]] = [
+            ("grpc.use_local_subchannel_pool", 1),
+            ("grpc.http2.bdp_probe", int(self.bdp_probe)),
+        ]
+        if self.max_receive_message_length is not None:
+            options.append(
+                ("grpc.max_receive_message_length", self.max_receive_message_length)
+            )
+        if self.max_send_message_length is not None:
+            options.append(
+                ("grpc.max_send_message_length", self.max_send_message_length)
+            )
+        if self.keepalive_time_ms is not None:
+            options.extend(
+                (
+                    ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+                    ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+                    (
+                        "grpc.keepalive_permit_without_calls",
+                        int(self.keepalive_permit_without_calls),
+                    ),
+                )
+            )
+        if self.initial_window_size is not None:
+            options.append(("grpc.http2.lookahead_bytes", self.initial_window_size))
+        options.extend(self.extra)
+        return options
+
+
+def create_channel(
+    endpoint: str,
+    options: ChannelOptions,
+    interceptors: Sequence[grpc.aio.ClientInterceptor] | None = None,
+) -> grpc.aio.Channel:
+    """
+    按 ChannelOptions 创建非加密的 grpc.aio 通道（惰性连接，首次调用时才建立连接）。
+
+    Args:
+        endpoint (str): gRPC 服务器地址。
+        options (ChannelOptions): 通道参数。
+        interceptors (Sequence[grpc.aio.ClientInterceptor] | None): 客户端拦截器。
+
+    Returns:
+        grpc.aio.Channel: 新建的通道。
+    """
+    return grpc.aio.insecure_channel(
+        endpoint,
+        options=options.to_grpc_options(),
+        compression=options.compression,
+        interceptors=interceptors,
+    )
@@ -0,0 +1,215 @@
+"""
+connection.grpc.codec
+
+repeated 几何字段与 NumPy 数组之间的批量转换:
+- 读取: 将 repeated `basic_pb2.Vector3` / `Quaternion` / `Pose` / `Transform` 直接写入连续的 `(N, 3)` / `(N, 4)` 数组，
+  不为每个元素创建 SDK 对象；
+- 写入: 将数组转换为 proto 消息列表，可直接用于构造请求或 `extend()` repeated 字段。
+
+四元数数组的列顺序为 (w, x, y, z)，与 SDK `Quaternion(w, x, y, z)` 一致。
+NumPy 为可选依赖，只在调用这些函数时导入。
+"""
+
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from tongsim_api_protocol.basic_pb2 import Pose as ProtoPose
+from tongsim_api_protocol.basic_pb2 import Quaternion as ProtoQuaternion
+from tongsim_api_protocol.basic_pb2 import Transform as ProtoTransform
+from tongsim_api_protocol.basic_pb2 import Vector3 as ProtoVector3
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = [
+    "array_to_quaternions",
+    "array_to_vectors",
+    "arrays_to_poses",
+    "arrays_to_transforms",
+    "poses_to_arrays",
+    "quaternions_to_array",
+    "transforms_to_arrays",
+    "vectors_to_array",
+]
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Array conversion requires NumPy, install it with `pip install numpy`."
+        ) from e
+    return numpy
+
+
+def _check_shape(array: "np.ndarray", columns: int, name: str) -> None:
+    if array.ndim != 2 or array.shape[1] != columns:
+        raise ValueError(
+            f"{name} must have shape (N, {columns}), got {tuple(array.shape)}."
+        )
+
+
+# 逐字段 yield 比为每个元素构造 tuple 再展开更快，且不产生中间对象
+def _iter_xyz(vectors: Sequence[ProtoVector3]) -> Iterator[float]:
+    for v in vectors:
+        yield v.x
+        yield v.y
+        yield v.z
+
+
+def _iter_wxyz(quaternions: Sequence[ProtoQuaternion]) -> Iterator[float]:
+    for q in quaternions:
+        yield q.w
+        yield q.x
+        yield q.y
+        yield q.z
+
+
+def vectors_to_array(
+    vectors: Sequence[ProtoVector3], dtype: Any = None
+) -> "np.ndarray":
+    """
+    Args:
+        vectors (Sequence[ProtoVector3]): repeated Vector3 字段或消息列表。
+        dtype (Any): 数组类型，默认 float64。
+
+    Returns:
+        np.ndarray: 形状为 (N, 3) 的数组，列为 (x, y, z)。
+    """
+    np = _numpy()
+    flat = np.fromiter(
+        _iter_xyz(vectors), dtype=dtype or np.float64, count=3 * len(vectors)
+    )
+    return flat.reshape(len(vectors), 3)
+
+
+def quaternions_to_array(
+    quaternions: Sequence[ProtoQuaternion], dtype: Any = None
+) -> "np.ndarray":
+    """
+    Args:
+        quaternions (Sequence[ProtoQuaternion]): repeated Quaternion 字段或消息列表。
+        dtype (Any): 数组类型，默认 float64。
+
+    Returns:
+        np.ndarray: 形状为 (N, 4) 的数组，列为 (w, x, y, z)。
+    """
+    np = _numpy()
+    flat = np.fromiter(
+        _iter_wxyz(quaternions), dtype=dtype or np.float64, count=4 * len(quaternions)
+    )
+    return flat.reshape(len(quaternions), 4)
+
+
+def poses_to_arrays(
+    poses: Sequence[ProtoPose], dtype: Any = None
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Args:
+        poses (Sequence[ProtoPose]): repeated Pose 字段或消息列表。
+        dtype (Any): 数组类型，默认 float64。
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: 位置 (N, 3) 与旋转 (N, 4)，旋转列为 (w, x, y, z)。
+    """
+    return (
+        vectors_to_array([p.location for p in poses], dtype),
+        quaternions_to_array([p.rotation for p in poses], dtype),
+    )
+
+
+def transforms_to_arrays(
+    transforms: Sequence[ProtoTransform], dtype: Any = None
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    Args:
+        transforms (Sequence[ProtoTransform]): repeated Transform 字段或消息列表。
+        dtype (Any): 数组类型，默认 float64。
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: 位置 (N, 3)、旋转 (N, 4) 与缩放 (N, 3)。
+    """
+    return (
+        vectors_to_array([t.location for t in transforms], dtype),
+        quaternions_to_array([t.rotation for t in transforms], dtype),
+        vectors_to_array([t.scale for t in transforms], dtype),
+    )
+
+
+def array_to_vectors(array: Any) -> list[ProtoVector3]:
+    """
+    Args:
+        array (ArrayLike): 形状为 (N, 3) 的数组，列为 (x, y, z)。
+
+    Returns:
+        list[ProtoVector3]: proto 消息列表。
+    """
+    array = _numpy().asarray(array)
+    _check_shape(array, 3, "array")
+    return [ProtoVector3(x=x, y=y, z=z) for x, y, z in array.tolist()]
+
+
+def array_to_quaternions(array: Any) -> list[ProtoQuaternion]:
+    """
+    Args:
+        array (ArrayLike): 形状为 (N, 4) 的数组，列为 (w, x, y, z)。
+
+    Returns:
+        list[ProtoQuaternion]: proto 消息列表。
+    """
+    array = _numpy().asarray(array)
+    _check_shape(array, 4, "array")
+    return [ProtoQuaternion(w=w, x=x, y=y, z=z) for w, x, y, z in array.tolist()]
+
+
+def arrays_to_poses(locations: Any, rotations: Any) -> list[ProtoPose]:
+    """
+    Args:
+        locations (ArrayLike): 形状为 (N, 3) 的位置数组。
+        rotations (ArrayLike): 形状为 (N, 4) 的旋转数组，列为 (w, x, y, z)。
+
+    Returns:
+        list[ProtoPose]: proto 消息列表。
+    """
+    np = _numpy()
+    locations, rotations = np.asarray(locations), np.asarray(rotations)
+    _check_shape(locations, 3, "locations")
+    _check_shape(rotations, 4, "rotations")
+    if len(locations) != len(rotations):
+        raise ValueError(
+            f"locations and rotations differ in length: {len(locations)} != {len(rotations)}."
+        )
+    return [
+        ProtoPose(
+            location=ProtoVector3(x=x, y=y, z=z),
+            rotation=ProtoQuaternion(w=qw, x=qx, y=qy, z=qz),
+        )
+        for (x, y, z), (qw, qx, qy, qz) in zip(
+            locations.tolist(), rotations.tolist(), strict=True
+        )
+    ]
+
+
+def arrays_to_transforms(
+    locations: Any, rotations: Any, scales: Any
+) -> list[ProtoTransform]:
+    """
+    Args:
+        locations (ArrayLike): 形状为 (N, 3) 的位置数组。
+        rotations (ArrayLike): 形状为 (N, 4) 的旋转数组，列为 (w, x, y, z)。
+        scales (ArrayLike): 形状为 (N, 3) 的缩放数组。
+
+    Returns:
+        list[ProtoTransform]: proto 消息列表。
+    """
+    poses = arrays_to_poses(locations, rotations)
+    scale_vectors = array_to_vectors(scales)
+    if len(scale_vectors) != len(poses):
+        raise ValueError(
+            f"locations and scales differ in length: {len(poses)} != {len(scale_vectors)}."
+        )
+    return [
+        ProtoTransform(location=p.location, rotation=p.rotation, scale=scale)
+        for p, scale in zip(poses, scale_vectors, strict=True)
+    ]
@@ -4,24 +4,41 @@ connection.grpc.core
 此模块封装了 gRPC.aio 通信通道与 Stub 的集中管理逻辑，提供统一的连接入口 `GrpcConnection`。
 
 依赖:
-- 所有服务 Stub 需由 `iter_all_grpc_stubs()` 函数动态发现并返回；
-- 废弃的接口通过 `ServiceInterfaceStub` 单独处理。
+- 服务 Stub 在首次 `get_stub()` 时才实例化并缓存，构造连接时不再遍历协议包；
+  `get_stub()` 也接受 Stub 类名，按预生成的清单只导入用到的协议模块（mujoco、acoustics、record 等
+  很少使用的服务不会在导入 SDK 时加载）。缓存查找是一次无锁的 dict 访问；
+- 废弃的接口通过 `ServiceInterfaceStub` 单独处理；
+- 通道上安装 CallPolicyInterceptor，统一应用按服务配置的 CallPolicy 与 deadline() 截止时间，
+  读写静态查询的响应缓存（ResponseCache）、合并相同的并发只读调用，并按方法记录 RpcMetrics；
+- 通道参数由 ChannelOptions 配置。图像、体素、PG 等大流量流通过 `get_media_stub()` 使用专用的媒体通道，
+  与延迟敏感的普通调用分属不同的 HTTP/2 连接，避免大帧造成队头阻塞；
+- `supervisor` 监视连接状态，UE 重启后按退避重连，供流订阅在恢复后重新订阅；
+- `wait_ready()` 等待通道连接就绪，`latency` 记录健康探测的往返延迟（见 connection.grpc.health）；
+- ChannelOptions.record_path 在通道最内层安装录制拦截器（recording_interceptors），录制真正发往服务端的流量；
+  ChannelOptions.replay_path 改用 ReplayChannel 回放录制的流量，不连接服务器、不创建媒体通道，
+  也不经过 CallPolicyInterceptor（回放的是录制时已经过缓存与合并的调用）。
 
 """
 
-from typing import TypeVar
+import zlib
+from collections.abc import Mapping
+from dataclasses import replace
+from typing import Any, TypeVar, overload
 
 import grpc.aio
-from tongsim_api_protocol.subsystem.mujoco_manager_pb2_grpc import (
-    MujocoManagerServiceStub,
-)
 
 from tongsim.logger import get_logger
 
 from ._legacy.generated.TongosAgentGRPCForUE_pb2_grpc import (
     ServiceInterfaceStub,
 )
-from .utils import iter_all_grpc_stubs
+from .cache import ResponseCache
+from .call_policy import CallPolicy, CallPolicyInterceptor, LatencyStats, RpcMetrics
+from .channel import ChannelOptions, create_channel
+from .replay import ReplayChannel, WireReplay
+from .supervisor import ConnectionSupervisor
+from .utils import resolve_grpc_stub
+from .wirelog import WireRecorder, recording_interceptors
 
 _logger = get_logger("gRPC")
 
@@ -30,29 +47,121 @@ T = TypeVar("T")  # 泛型变量，用于 get_stub 返回类型推断
 
 class GrpcConnection:
     """
-    自动初始化所有 gRPC stub 实例，提供访问和统一关闭通道功能。
+    按需初始化 gRPC stub 实例（首次访问时创建并缓存），提供访问和统一关闭通道功能。
     """
 
-    def __init__(self, endpoint: str = "localhost:5056"):
+    def __init__(
+        self,
+        endpoint: str = "localhost:5056",
+        call_policies: Mapping[str, CallPolicy] | None = None,
+        channel_options: ChannelOptions | None = None,
+    ):
+        """
+        Args:
+            endpoint (str): gRPC 服务器地址。
+            call_policies (Mapping[str, CallPolicy] | None): 按服务 / 方法配置的调用策略，
+                键可以是 "SceneService"、"SceneService/Step" 或 "*"（所有方法）。
+            channel_options (ChannelOptions | None): 通道参数，None 使用 ChannelOptions() 默认值。
+        """
         self._endpoint = endpoint
-        self._channel: grpc.aio.Channel | None = grpc.aio.insecure_channel(
-            self._endpoint
-        )
-        self._stubs: dict[type[object], object] = {}
+        self._channel_options: ChannelOptions = channel_options or ChannelOptions()
+        self._call_policies: dict[str, CallPolicy] = dict(call_policies or {})
+        self._metrics: RpcMetrics = RpcMetrics()
+        self._latency: LatencyStats = LatencyStats()
+        self._cache: ResponseCache = ResponseCache()
+        self._recorder: WireRecorder | None = None
+        self._replay: WireReplay | None = None
+        self._channel: grpc.aio.Channel | None
+        self._media_channels: list[grpc.aio.Channel] = []
+        options = self._channel_options
+        if options.replay_path is not None:
+            self._replay = WireReplay.acquire(options.replay_path, options.replay_cycle)
+            self._channel = ReplayChannel(self._replay)
+        else:
+            interceptors: list[grpc.aio.ClientInterceptor] = [
+                CallPolicyInterceptor(self._call_policies, self._metrics, self._cache)
+            ]
+            if options.record_path is not None:
+                self._recorder = WireRecorder.acquire(options.record_path)
+                interceptors.extend(recording_interceptors(self._recorder))
+            self._channel = create_channel(self._endpoint, options, interceptors)
+            self._media_channels = [
+                create_channel(self._endpoint, options, interceptors)
+                for _ in range(options.media_channels)
+            ]
+        self._stubs: dict[type[object] | str, object] = {}
+        self._media_stubs: dict[tuple[type[object] | str, int], object] = {}
+        self._supervisor: ConnectionSupervisor | None = None
         self._initialize()
 
     def _initialize(self):
         """
-        加载 tongsim_api_protocol 包中所有 gRPC stub 并实例化。
+        子类初始化钩子。通用连接的 stub 均在首次 get_stub() 时惰性创建。
+        """
+
+    @property
+    def endpoint(self) -> str:
+        return self._endpoint
+
+    @property
+    def channel_options(self) -> ChannelOptions:
+        return self._channel_options
+
+    @property
+    def metrics(self) -> RpcMetrics:
+        """按方法统计的 RPC 调用指标。"""
+        return self._metrics
+
+    @property
+    def cache(self) -> ResponseCache:
+        """静态查询的响应缓存。"""
+        return self._cache
+
+    @property
+    def latency(self) -> LatencyStats:
+        """健康探测的往返延迟统计。"""
+        return self._latency
+
+    async def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        触发连接并等待主通道与媒体通道全部就绪（connectivity 为 READY）。
+
+        Args:
+            timeout (float | None): 最长等待秒数，None 表示一直等待。
+
+        Returns:
+            bool: 超时前就绪返回 True，否则返回 False。
+        """
+        return await self.supervisor.wait_ready(timeout)
+
+    @property
+    def supervisor(self) -> ConnectionSupervisor:
+        """
+        连接监视器（首次访问时创建），覆盖主通道与所有媒体通道。
+        需要在通道所属的事件循环中调用其 start() / wait_ready()。
+        """
+        if self._supervisor is None:
+            if self._channel is None:
+                raise ValueError(
+                    "[GrpcConnection] Supervisor requested on a closed channel."
+                )
+            self._supervisor = ConnectionSupervisor(
+                [self._channel, *self._media_channels], name=self._endpoint
+            )
+        return self._supervisor
+
+    def set_call_policy(self, key: str, policy: CallPolicy | None) -> None:
+        """
+        设置或移除某个服务 / 方法的调用策略，对后续调用立即生效。
+
+        Args:
+            key (str): "SceneService"、"SceneService/Step"、完整服务名或 "*"。
+            policy (CallPolicy | None): 调用策略，None 表示移除。
         """
-        for _service_name, stub_cls in iter_all_grpc_stubs():
-            try:
-                _logger.debug(f"GrpcConnection instantiate stub: {_service_name}")
-                self._stubs[stub_cls] = stub_cls(self._channel)
-            except Exception as e:
-                raise RuntimeError(
-                    f"GrpcConnection failed to instantiate stub: {_service_name}. {e}"
-                ) from e
+        if policy is None:
+            self._call_policies.pop(key, None)
+        else:
+            self._call_policies[key] = policy
 
     def __enter__(self):
         raise RuntimeError("GrpcConnection must be used with 'async'")
@@ -60,15 +169,74 @@ class GrpcConnection:
     def __exit__(self, exc_type, exc_val, exc_tb):
         raise RuntimeError("GrpcConnection must be used with 'async'")
 
-    def get_stub(self, stub_cls: type[T]) -> T:
+    @overload
+    def get_stub(self, stub_cls: type[T]) -> T: ...
+
+    @overload
+    def get_stub(self, stub_cls: str) -> Any: ...
+
+    def get_stub(self, stub_cls):
         """
         获取指定类型的 gRPC stub 实例。
-        stub_cls: 例如 ExampleServiceStub
+        stub_cls: 例如 ExampleServiceStub，或类名 "ExampleServiceStub"（按清单惰性导入所在模块）
         返回值类型为 T（调用者传入的 stub_cls 类型）
+
+        命中缓存时只有一次 dict 查找，不加锁；并发创建时 setdefault 保证只保留一个实例。
+        """
+        stub = self._stubs.get(stub_cls)
+        if stub is None:
+            stub = self._stubs.setdefault(
+                stub_cls, self._instantiate_stub(stub_cls, self._channel)
+            )
+        return stub
+
+    @overload
+    def get_media_stub(self, stub_cls: type[T], key: str | None = None) -> T: ...
+
+    @overload
+    def get_media_stub(self, stub_cls: str, key: str | None = None) -> Any: ...
+
+    def get_media_stub(self, stub_cls, key=None):
+        """
+        获取绑定在媒体通道上的 stub，用于图像、体素、PG 等大流量流。
+
+        有多个媒体通道时按 key（如相机 / 实体 id）的稳定哈希选择通道；
+        未配置媒体通道（media_channels=0）时退化为 get_stub()。
+
+        Args:
+            stub_cls (type[T] | str): stub 类型或类名。
+            key (str | None): 选择媒体通道的键。
+
+        Returns:
+            T: stub 实例。
         """
-        if stub_cls not in self._stubs:
-            raise ValueError(f"[GrpcConnection] Stub {stub_cls.__name__} not found.")
-        return self._stubs[stub_cls]
+        if not self._media_channels:
+            return self.get_stub(stub_cls)
+        index = zlib.crc32(key.encode()) % len(self._media_channels) if key else 0
+        stub = self._media_stubs.get((stub_cls, index))
+        if stub is None:
+            stub = self._media_stubs.setdefault(
+                (stub_cls, index),
+                self._instantiate_stub(stub_cls, self._media_channels[index]),
+            )
+        return stub
+
+    def _instantiate_stub(
+        self, stub_cls: type[T] | str, channel: grpc.aio.Channel | None
+    ) -> T:
+        if isinstance(stub_cls, str):
+            stub_cls = resolve_grpc_stub(stub_cls)
+        if self._channel is None or channel is None:
+            raise ValueError(
+                f"[GrpcConnection] Stub {stub_cls.__name__} requested on a closed channel."
+            )
+        try:
+            _logger.debug(f"GrpcConnection instantiate stub: {stub_cls.__name__}")
+            return stub_cls(channel)
+        except Exception as e:
+            raise RuntimeError(
+                f"GrpcConnection failed to instantiate stub: {stub_cls.__name__}. {e}"
+            ) from e
 
     def __del__(self):
         if self._channel:
@@ -84,11 +252,24 @@ class GrpcConnection:
         """
         关闭 gRPC 通道并释放资源。
         """
+        if self._supervisor is not None:
+            await self._supervisor.aclose()
+            self._supervisor = None
         if self._channel:
             await self._channel.close()
             self._channel = None
             _logger.debug(f"[GrpcConnection {self._endpoint}] closed channel")
+        for channel in self._media_channels:
+            await channel.close()
+        self._media_channels.clear()
         self._stubs.clear()
+        self._media_stubs.clear()
+        if self._recorder is not None:
+            self._recorder.release()
+            self._recorder = None
+        if self._replay is not None:
+            self._replay.release()
+            self._replay = None
 
 
 class GrpcLegacyConnection(GrpcConnection):
@@ -96,9 +277,19 @@ class GrpcLegacyConnection(GrpcConnection):
     针对丢弃的通信接口，提供访问和统一关闭通道功能。
     """
 
-    def __init__(self, endpoint: str = "localhost:50052"):
+    def __init__(
+        self,
+        endpoint: str = "localhost:50052",
+        channel_options: ChannelOptions | None = None,
+    ):
         self.tongos_service_interface_stub = None
-        super().__init__(endpoint)
+        # 废弃接口没有大流量流，不需要媒体通道
+        super().__init__(
+            endpoint,
+            channel_options=replace(
+                channel_options or ChannelOptions(), media_channels=0
+            ),
+        )
 
     def _initialize(self):
         """
@@ -130,9 +321,18 @@ class GrpcMujocoConnection(GrpcConnection):
     Mujoco对接UE的功能接口。
     """
 
-    def __init__(self, endpoint: str = "localhost:5066"):
+    def __init__(
+        self,
+        endpoint: str = "localhost:5066",
+        channel_options: ChannelOptions | None = None,
+    ):
         self.mujoco_stub = None
-        super().__init__(endpoint)
+        super().__init__(
+            endpoint,
+            channel_options=replace(
+                channel_options or ChannelOptions(), media_channels=0
+            ),
+        )
 
     def _initialize(self):
         """
@@ -140,17 +340,21 @@ class GrpcMujocoConnection(GrpcConnection):
         """
         try:
             _logger.debug("GrpcMujocoConnection instantiate stub: mujoco_stub")
-            self.mujoco_stub = MujocoManagerServiceStub(self._channel)
+            self.mujoco_stub = resolve_grpc_stub("MujocoManagerServiceStub")(
+                self._channel
+            )
         except Exception as e:
             raise RuntimeError(
                 f"GrpcMujocoConnection failed to instantiate stub: mujoco_stub. {e}"
             ) from e
 
-    def get_stub(self, stub_cls: type[T]) -> T:
+    def get_stub(self, stub_cls: type[T] | str) -> T:
         """
         返回 mujoco_stub，忽略参数。
         """
-        if stub_cls is not MujocoManagerServiceStub:
+        if isinstance(stub_cls, str):
+            stub_cls = resolve_grpc_stub(stub_cls)
+        if stub_cls is not resolve_grpc_stub("MujocoManagerServiceStub"):
             raise ValueError(
                 f"[GrpcMujocoConnection] Unsupported stub type: {stub_cls.__name__}"
             )
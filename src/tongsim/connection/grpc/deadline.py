@@ -0,0 +1,63 @@
+"""
+connection.grpc.deadline
+
+基于 contextvars 的调用截止时间（deadline）传播:
+- `deadline(seconds)` 为当前上下文设置截止时间，嵌套时取更早的截止时间；
+- asyncio 任务创建时会复制当前上下文，因此截止时间会自动传递给派生的任务，
+  包括通过 AsyncLoop.spawn 跨线程提交的任务；
+- GrpcConnection 的拦截器读取剩余预算，将每个 RPC 的 gRPC timeout 收紧到不超过剩余时间。
+
+截止时间使用 time.monotonic()，可在线程间比较。
+"""
+
+import contextlib
+import time
+from collections.abc import Generator
+from contextvars import ContextVar
+
+__all__ = ["current_deadline", "deadline", "remaining_time"]
+
+_deadline: ContextVar[float | None] = ContextVar("tongsim_rpc_deadline", default=None)
+
+
+def current_deadline() -> float | None:
+    """当前上下文的截止时刻（time.monotonic() 时间轴），未设置时为 None。"""
+    return _deadline.get()
+
+
+def remaining_time() -> float | None:
+    """当前上下文剩余的时间预算（秒，可能为负），未设置截止时间时为 None。"""
+    at = _deadline.get()
+    if at is None:
+        return None
+    return at - time.monotonic()
+
+
+@contextlib.contextmanager
+def deadline(seconds: float | None) -> Generator[float | None, None, None]:
+    """
+    在 with 块内设置调用截止时间，块内发起的 RPC 的 timeout 不会超过剩余预算。
+
+    Args:
+        seconds (float | None): 从现在起的时间预算（秒），None 表示不额外限制。
+
+    Yields:
+        float | None: 生效的截止时刻；与外层截止时间嵌套时取更早者。
+
+    Example:
+        with deadline(0.5):
+            await UnaryAPI.get_fps(conn)
+    """
+    outer = _deadline.get()
+    if seconds is None:
+        yield outer
+        return
+
+    at = time.monotonic() + seconds
+    if outer is not None:
+        at = min(at, outer)
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,78 @@
+"""
+connection.grpc.errors
+
+RPC 失败的结构化表示:
+- RpcError: 携带 gRPC 状态码的异常，可区分“没有结果”与“UE 过载 / 不可用”；
+- strict_rpc(): 可选的严格模式。默认情况下 safe_async_rpc 在出错时返回默认值（False、[]、"" 等），
+  在 strict_rpc() 作用域内改为抛出 RpcError（非 gRPC 异常原样抛出）。
+
+严格模式保存在 contextvars 中，会随 spawn / create_task 传递给派生的任务，
+因此也可以包住 `WorldContext.sync_run(...)` 使用。
+"""
+
+import contextlib
+from collections.abc import Generator
+from contextvars import ContextVar
+
+import grpc
+
+__all__ = ["RETRYABLE_STATUS_CODES", "RpcError", "is_strict_rpc", "strict_rpc"]
+
+# 可以安全重试的状态码: 请求未被服务端处理（不可用）或被服务端拒绝（过载）
+RETRYABLE_STATUS_CODES: frozenset[grpc.StatusCode] = frozenset(
+    {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.RESOURCE_EXHAUSTED}
+)
+
+_strict: ContextVar[bool] = ContextVar("tongsim_strict_rpc", default=False)
+
+
+class RpcError(Exception):
+    """
+    RPC 调用失败。
+
+    Attributes:
+        code (grpc.StatusCode): gRPC 状态码。
+        method (str): 失败的 SDK 方法名，如 "UnaryAPI.get_fps"。
+        details (str): 服务端返回的错误描述。
+    """
+
+    def __init__(self, code: grpc.StatusCode, method: str, details: str = ""):
+        super().__init__(f"{method} failed with {code.name}: {details}")
+        self.code: grpc.StatusCode = code
+        self.method: str = method
+        self.details: str = details
+
+    @property
+    def retryable(self) -> bool:
+        """是否为可重试的状态码（UNAVAILABLE / RESOURCE_EXHAUSTED）。"""
+        return self.code in RETRYABLE_STATUS_CODES
+
+    @classmethod
+    def from_aio(cls, e: grpc.aio.AioRpcError, method: str) -> "RpcError":
+        return cls(e.code(), method, e.details() or "")
+
+
+def is_strict_rpc() -> bool:
+    """当前上下文是否处于严格模式。"""
+    return _strict.get()
+
+
+@contextlib.contextmanager
+def strict_rpc(enabled: bool = True) -> Generator[None, None, None]:
+    """
+    在 with 块内开启（或关闭）严格模式: safe_async_rpc 封装的方法失败时抛出 RpcError，
+    而不是返回默认值。
+
+    Example:
+        with strict_rpc():
+            try:
+                fps = await UnaryAPI.get_fps(conn)
+            except RpcError as e:
+                if e.retryable:
+                    ...
+    """
+    token = _strict.set(enabled)
+    try:
+        yield
+    finally:
+        _strict.reset(token)
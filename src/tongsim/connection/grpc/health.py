@@ -0,0 +1,73 @@
+"""
+connection.grpc.health
+
+UE 实例的可达性与健康检查:
+- probe_health: 等待通道连接就绪后，发起一次轻量 RPC（GetFPS）确认 UE 能够响应，
+  并将往返延迟记录到 `GrpcConnection.latency`；
+- HealthReport: 单次探测的结果，便于调度器据此挑选健康且延迟最低的 UE 实例。
+"""
+
+import time
+from dataclasses import dataclass
+
+from .core import GrpcConnection
+from .deadline import deadline
+from .errors import strict_rpc
+from .unary_api import UnaryAPI
+
+__all__ = ["HealthReport", "probe_health"]
+
+
+@dataclass(frozen=True, slots=True)
+class HealthReport:
+    """
+    单次健康探测的结果。
+
+    Attributes:
+        endpoint (str): gRPC 服务器地址。
+        ready (bool): 通道是否在超时前连接就绪。
+        healthy (bool): 健康 RPC 是否成功返回。
+        latency (float | None): 健康 RPC 的往返延迟（秒），失败时为 None。
+        fps (float | None): UE 当前帧率，失败时为 None。
+        error (str): 失败原因。
+    """
+
+    endpoint: str
+    ready: bool
+    healthy: bool
+    latency: float | None = None
+    fps: float | None = None
+    error: str = ""
+
+
+async def probe_health(conn: GrpcConnection, timeout: float = 1.0) -> HealthReport:
+    """
+    探测连接对应的 UE 实例是否可达且能够响应。
+
+    Args:
+        conn (GrpcConnection): 被探测的连接，必须在其通道所属的事件循环中调用。
+        timeout (float): 等待连接就绪与健康 RPC 的总预算（秒）。
+
+    Returns:
+        HealthReport: 探测结果；healthy 为 True 时 latency 已记录到 `conn.latency`。
+    """
+    started = time.monotonic()
+    if not await conn.wait_ready(timeout):
+        return HealthReport(
+            conn.endpoint,
+            ready=False,
+            healthy=False,
+            error=f"channel not ready within {timeout:.2f}s",
+        )
+
+    remaining = max(timeout - (time.monotonic() - started), 0.0)
+    t0 = time.perf_counter()
+    try:
+        with strict_rpc(), deadline(remaining):
+            fps = await UnaryAPI.get_fps(conn)
+    except Exception as e:
+        return HealthReport(conn.endpoint, ready=True, healthy=False, error=str(e))
+
+    latency = time.perf_counter() - t0
+    conn.latency.record(latency)
+    return HealthReport(conn.endpoint, True, True, latency, fps)
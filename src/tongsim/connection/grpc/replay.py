@@ -0,0 +1,398 @@
+"""
+connection.grpc.replay
+
+离线回放录制的 gRPC 流量（见 connection.grpc.wirelog）:
+- WireReplay: 按方法排队的录制调用，优先匹配请求字节完全相同的调用，否则按录制顺序取下一次调用；
+- ReplayChannel: 可替代 grpc.aio.Channel 的本地假通道，Stub 直接在其上创建，
+  响应立即按录制顺序返回，不经过网络，便于在没有 UE 的环境中确定性地测量 SDK 侧吞吐。
+
+双向流中，录制时位于第 N 条请求之后的响应，要等调用方写入第 N 条请求后才会返回，保持与录制时相同的因果顺序。
+录制时由客户端主动取消（状态为 CANCELLED）的响应流在返回全部响应后保持打开，直到调用方取消或超出 timeout；
+被取消的 unary 响应调用（如调用方超时）回放时以 CANCELLED 失败。调用时传入的 timeout 到期后以 DEADLINE_EXCEEDED 失败。
+"""
+
+import asyncio
+import os
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any, ClassVar
+
+import grpc
+from grpc.aio import AioRpcError, Metadata
+
+from .wirelog import WireCall, WireKind, read_wire_calls
+
+__all__ = ["ReplayChannel", "WireReplay"]
+
+
+class WireReplay:
+    """
+    录制调用的回放队列，可在多个 ReplayChannel（分片 loop、废弃接口连接）之间共享。
+    """
+
+    _shared: ClassVar[dict[tuple[str, bool], tuple["WireReplay", int]]] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, calls: Iterable[WireCall], cycle: bool = False):
+        """
+        Args:
+            calls (Iterable[WireCall]): 录制的调用。
+            cycle (bool): 某个方法的录制调用用完后是否从头循环，便于反复回放测量吞吐。
+        """
+        self._lock = threading.Lock()
+        self._cycle = cycle
+        self._key: tuple[str, bool] | None = None
+        self._pending: dict[str, deque[WireCall]] = {}
+        for call in calls:
+            self._pending.setdefault(call.method, deque()).append(call)
+
+    @classmethod
+    def load(cls, path: str, cycle: bool = False) -> "WireReplay":
+        return cls(read_wire_calls(path), cycle)
+
+    @classmethod
+    def acquire(cls, path: str, cycle: bool = False) -> "WireReplay":
+        """获取路径对应的共享回放队列（首次获取时读取日志），引用计数加 1。"""
+        key = (os.path.abspath(path), cycle)
+        with cls._shared_lock:
+            replay, refs = cls._shared.get(key, (None, 0))
+            if replay is None:
+                replay = cls.load(path, cycle)
+                replay._key = key  # noqa: SLF001
+            cls._shared[key] = (replay, refs + 1)
+            return replay
+
+    def release(self) -> None:
+        """引用计数减 1，归零时丢弃共享的回放队列。"""
+        key = self._key
+        if key is None:
+            return
+        with self._shared_lock:
+            replay, refs = self._shared.get(key, (self, 1))
+            if refs > 1:
+                self._shared[key] = (replay, refs - 1)
+            else:
+                self._shared.pop(key, None)
+
+    def remaining(self, method: str | None = None) -> int:
+        """尚未回放的调用数量。"""
+        with self._lock:
+            if method is not None:
+                return len(self._pending.get(method, ()))
+            return sum(len(q) for q in self._pending.values())
+
+    def take(self, method: str, request: bytes | None) -> WireCall | None:
+        """
+        取出下一次要回放的调用。
+
+        Args:
+            method (str): 完整方法名。
+            request (bytes | None): 请求字节，流式请求为 None。
+
+        Returns:
+            WireCall | None: 录制的调用，没有可用的调用时返回 None。
+        """
+        with self._lock:
+            pending = self._pending.get(method)
+            if not pending:
+                return None
+            index = 0
+            if request is not None:
+                for i, call in enumerate(pending):
+                    if call.request == request:
+                        index = i
+                        break
+            call = pending[index]
+            del pending[index]
+            if self._cycle:
+                pending.append(call)
+            return call
+
+
+def _error(code: grpc.StatusCode, details: str) -> AioRpcError:
+    return AioRpcError(code, Metadata(), Metadata(), details=details)
+
+
+class _ReplayCall:
+    """
+    回放的一次调用，实现 SDK 用到的 grpc.aio 调用接口:
+    await（unary 响应）、async for / read()（流式响应）、write() / done_writing()（流式请求）与 cancel()。
+    """
+
+    def __init__(
+        self,
+        replay: WireReplay,
+        method: str,
+        request: bytes | None,
+        deserializer: Callable[[bytes], Any] | None,
+        stream_request: bool = False,
+        stream_response: bool = False,
+        timeout: float | None = None,
+    ):
+        self._call = replay.take(method, request)
+        self._stream_response = stream_response
+        self._deadline = (
+            asyncio.get_running_loop().time() + timeout if timeout is not None else None
+        )
+        self._method = method
+        self._deserialize = deserializer or (lambda payload: payload)
+        # unary 请求在发起调用时即已写入
+        self._written = 0 if stream_request else 1
+        self._half_closed = not stream_request
+        self._progress = asyncio.Event()
+        self._cancelled = False
+        self._done = False
+        self._code: grpc.StatusCode | None = None
+        self._aiter: AsyncIterator[Any] | None = None
+
+    def __await__(self):
+        return self._unary().__await__()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        if self._aiter is None:
+            self._aiter = self._responses()
+        return self._aiter
+
+    async def read(self) -> Any:
+        return await anext(self.__aiter__(), grpc.aio.EOF)
+
+    async def write(self, request: Any) -> None:
+        if self._done:
+            raise asyncio.InvalidStateError("RPC already finished.")
+        self._written += 1
+        self._progress.set()
+
+    async def done_writing(self) -> None:
+        self._half_closed = True
+        self._progress.set()
+
+    def cancel(self) -> bool:
+        if self._done:
+            return False
+        self._cancelled = True
+        self._finish(grpc.StatusCode.CANCELLED)
+        self._progress.set()
+        return True
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def done(self) -> bool:
+        return self._done
+
+    async def code(self) -> grpc.StatusCode | None:
+        return self._code
+
+    async def details(self) -> str:
+        return self._call.details if self._call is not None else ""
+
+    async def initial_metadata(self) -> Metadata:
+        return Metadata()
+
+    async def trailing_metadata(self) -> Metadata:
+        return Metadata()
+
+    async def wait_for_connection(self) -> None:
+        return None
+
+    def time_remaining(self) -> float | None:
+        if self._deadline is None:
+            return None
+        return max(self._deadline - asyncio.get_running_loop().time(), 0.0)
+
+    async def _unary(self) -> Any:
+        response = None
+        async for response in self.__aiter__():  # noqa: B007
+            pass
+        return response
+
+    async def _wait(self, predicate: Callable[[], bool]) -> None:
+        while not predicate():
+            self._progress.clear()
+            try:
+                async with asyncio.timeout_at(self._deadline):
+                    await self._progress.wait()
+            except TimeoutError:
+                self._finish(grpc.StatusCode.DEADLINE_EXCEEDED)
+                raise _error(
+                    grpc.StatusCode.DEADLINE_EXCEEDED,
+                    f"Deadline exceeded while replaying {self._method}.",
+                ) from None
+            if self._cancelled:
+                raise asyncio.CancelledError
+
+    async def _responses(self) -> AsyncIterator[Any]:
+        if self._call is None:
+            self._finish(grpc.StatusCode.UNAVAILABLE)
+            raise _error(
+                grpc.StatusCode.UNAVAILABLE,
+                f"No recorded call left to replay for {self._method}.",
+            )
+        requests = 0
+        for kind, _, payload in self._call.events:
+            if self._cancelled:
+                raise asyncio.CancelledError
+            if kind is WireKind.REQUEST:
+                requests += 1
+                # 录制时该请求之后的响应，等调用方写入同样数量的请求后再返回
+                await self._wait(
+                    lambda n=requests: self._written >= n or self._half_closed
+                )
+                continue
+            yield self._deserialize(payload)
+            # 让出事件循环，避免长流一次性占满事件循环
+            await asyncio.sleep(0)
+
+        code = self._call.code
+        if code is grpc.StatusCode.CANCELLED and self._stream_response:
+            # 录制时由客户端取消的响应流: 保持打开直到调用方取消或超时
+            await self._wait(lambda: False)
+        self._finish(code)
+        if code is not grpc.StatusCode.OK:
+            raise _error(code, self._call.details)
+
+    def _finish(self, code: grpc.StatusCode) -> None:
+        if not self._done:
+            self._done = True
+            self._code = code
+
+
+class _ReplayMultiCallable:
+    def __init__(
+        self,
+        channel: "ReplayChannel",
+        method: str,
+        request_serializer: Callable[[Any], bytes] | None,
+        response_deserializer: Callable[[bytes], Any] | None,
+        stream_request: bool,
+        stream_response: bool,
+    ):
+        self._channel = channel
+        self._method = method
+        self._serialize = request_serializer
+        self._deserialize = response_deserializer
+        self._stream_request = stream_request
+        self._stream_response = stream_response
+
+    def __call__(
+        self, request: Any = None, timeout: float | None = None, **kwargs: Any
+    ) -> _ReplayCall:
+        if self._channel.closed:
+            raise RuntimeError("ReplayChannel is closed.")
+        if self._stream_request:
+            return self._stream_call(request, timeout)
+        payload = self._serialize(request) if self._serialize else request
+        return _ReplayCall(
+            self._channel.replay,
+            self._method,
+            payload,
+            self._deserialize,
+            stream_response=self._stream_response,
+            timeout=timeout,
+        )
+
+    def _stream_call(self, request_iterator: Any, timeout: float | None) -> _ReplayCall:
+        call = _ReplayCall(
+            self._channel.replay,
+            self._method,
+            None,
+            self._deserialize,
+            stream_request=True,
+            stream_response=self._stream_response,
+            timeout=timeout,
+        )
+        if request_iterator is not None:
+            # 与 grpc.aio 一致: 传入请求迭代器时由后台任务逐条消费
+            self._channel.track(asyncio.ensure_future(_drain(request_iterator, call)))
+        return call
+
+
+async def _drain(request_iterator: Any, call: _ReplayCall) -> None:
+    if hasattr(request_iterator, "__aiter__"):
+        async for request in request_iterator:
+            await call.write(request)
+    else:
+        for request in request_iterator:
+            await call.write(request)
+    await call.done_writing()
+
+
+class ReplayChannel:
+    """
+    回放录制流量的本地假通道，接口与 grpc.aio.Channel 中 Stub 与连接监视器用到的部分一致。
+    """
+
+    def __init__(self, replay: WireReplay):
+        """
+        Args:
+            replay (WireReplay): 回放队列。
+        """
+        self._replay = replay
+        self._closed = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def replay(self) -> WireReplay:
+        return self._replay
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def track(self, task: asyncio.Task) -> None:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def unary_unary(
+        self, method: str, request_serializer=None, response_deserializer=None, **_
+    ) -> _ReplayMultiCallable:
+        return _ReplayMultiCallable(
+            self, method, request_serializer, response_deserializer, False, False
+        )
+
+    def unary_stream(
+        self, method: str, request_serializer=None, response_deserializer=None, **_
+    ) -> _ReplayMultiCallable:
+        return _ReplayMultiCallable(
+            self, method, request_serializer, response_deserializer, False, True
+        )
+
+    def stream_unary(
+        self, method: str, request_serializer=None, response_deserializer=None, **_
+    ) -> _ReplayMultiCallable:
+        return _ReplayMultiCallable(
+            self, method, request_serializer, response_deserializer, True, False
+        )
+
+    def stream_stream(
+        self, method: str, request_serializer=None, response_deserializer=None, **_
+    ) -> _ReplayMultiCallable:
+        return _ReplayMultiCallable(
+            self, method, request_serializer, response_deserializer, True, True
+        )
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        if self.closed:
+            return grpc.ChannelConnectivity.SHUTDOWN
+        return grpc.ChannelConnectivity.READY
+
+    async def wait_for_state_change(
+        self, last_observed_state: grpc.ChannelConnectivity
+    ) -> None:
+        # 回放通道的状态只会在关闭时改变
+        await self._closed.wait()
+
+    async def channel_ready(self) -> None:
+        return None
+
+    async def close(self, grace: float | None = None) -> None:
+        self._closed.set()
+        for task in list(self._tasks):
+            task.cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
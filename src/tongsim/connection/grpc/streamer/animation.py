@@ -4,13 +4,22 @@ tongsim.connection.grpc.streamer.animation
 本模块定义了 AnimationStreamer 类，用于管理 Animation 指令的提交与结果收集。
 支持 gRPC 双向流的异步通信模式。
 
+多 loop 分片时，AnimationStreamer 固定运行在创建时传入的 AsyncLoop 上，
+其公开的异步接口会自动切换到该 loop 执行，调用方可在任意事件循环中 await。
+
+连接中断（如 UE 重启）时，未完成的等待以 StreamInterruptedError 失败；
+读取循环随后等待连接恢复并重新打开双向流，最近一次中断记录在 `last_gap` 中。
+
 """
 
 import asyncio
+import functools
 import itertools
+import time
 from collections import OrderedDict
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
-from typing import cast
+from typing import Any, TypeVar, cast
 
 from google.protobuf.message import Message
 from tongsim_api_protocol.basic_pb2 import Component, Subject
@@ -26,7 +35,12 @@ from tongsim_api_protocol.component.animation.animation_pb2_grpc import (
 from tongsim.connection.grpc.anim_cmd import CommandSpec
 from tongsim.connection.grpc.bidi_stream import BidiStream
 from tongsim.connection.grpc.core import GrpcConnection
-from tongsim.core import AsyncLoop
+from tongsim.connection.grpc.supervisor import (
+    DEFAULT_RECONNECT,
+    StreamGap,
+    StreamInterruptedError,
+)
+from tongsim.core import AsyncLoop, SupervisionPolicy
 from tongsim.logger import get_logger
 from tongsim.type.anim import AnimResultInfo
 
@@ -35,6 +49,22 @@ _logger = get_logger("animation")
 # 模块级别共享一个 animation_id 计数器
 _id_counter = itertools.count(1)
 
+R = TypeVar("R")
+
+
+def _on_streamer_loop(
+    func: Callable[..., Coroutine[Any, Any, R]],
+) -> Callable[..., Coroutine[Any, Any, R]]:
+    """将 AnimationStreamer 的异步方法切换到其所属的 AsyncLoop 上执行。"""
+
+    @functools.wraps(func)
+    async def wrapper(self: "AnimationStreamer", *args, **kwargs) -> R:
+        return await self._async_loop.run_in(
+            func(self, *args, **kwargs), name=f"AnimationStreamer:{func.__name__}"
+        )
+
+    return wrapper
+
 
 @dataclass(slots=True)
 class AnimationResultTracker:
@@ -58,23 +88,51 @@ class AnimationStreamer:
         subject_id: str,
         component_id: str,
     ):
-        self._stream: BidiStream[AnimationCommandParams, AnimationResult] = BidiStream(
-            conn.get_stub(AnimationServiceStub).SubScribeAnimation,
-            name=f"{subject_id}--AnimationStreamer",
-        )
+        self._conn: GrpcConnection = conn
         self._async_loop: AsyncLoop = async_loop
         self._subject_id: str = subject_id
         self._component_id: str = component_id
+        self._stream: BidiStream[AnimationCommandParams, AnimationResult] = (
+            self._open_stream()
+        )
         self._result_futures: OrderedDict[int, AnimationResultTracker] = OrderedDict()
+        self._is_stopped: bool = False
+        self._last_gap: StreamGap | None = None
+
+    @property
+    def loop(self) -> AsyncLoop:
+        """streamer 所属的事件循环"""
+        return self._async_loop
+
+    @property
+    def last_gap(self) -> StreamGap | None:
+        """最近一次连接中断并重新打开双向流的记录，从未中断时为 None。"""
+        return self._last_gap
+
+    def _open_stream(self) -> BidiStream[AnimationCommandParams, AnimationResult]:
+        return BidiStream(
+            self._conn.get_stub(AnimationServiceStub).SubScribeAnimation,
+            name=f"{self._subject_id}--AnimationStreamer",
+        )
 
+    @_on_streamer_loop
     async def start(self):
         """启动 streamer 读取循环。"""
+        self._is_stopped = False
         await self._stream.start()
-        self._async_loop.spawn(self._read_loop(), name="AnimationStreamer:read_loop")
+        self._async_loop.spawn(
+            self._read_loop(),
+            name="AnimationStreamer:read_loop",
+            policy=SupervisionPolicy.ISOLATE,
+            background=True,
+        )
 
+    @_on_streamer_loop
     async def stop(self):
+        self._is_stopped = True
         await self._stream.aclose()
 
+    @_on_streamer_loop
     async def submit(self, spec: CommandSpec, track: bool = True) -> int:
         """
         提交 Animation 命令，并决定是否追踪结果。
@@ -120,6 +178,7 @@ class AnimationStreamer:
         )
         return command_id
 
+    @_on_streamer_loop
     async def wait_begin(self, command_id: int) -> AnimResultInfo:
         """
         等待指定 command_id 对应的 Animation 开始（BEGIN 阶段）。
@@ -146,6 +205,7 @@ class AnimationStreamer:
         tracker.begin_future = future
         return await future
 
+    @_on_streamer_loop
     async def wait_any_begin(self, command_ids: list[int]) -> AnimResultInfo:
         """
         等待任意一个指定的 Animation 进入 BEGIN 阶段。
@@ -163,6 +223,7 @@ class AnimationStreamer:
             task.cancel()
         return result
 
+    @_on_streamer_loop
     async def wait_end(self, command_id: int) -> AnimResultInfo:
         """
         等待指定 command_id 对应的 Animation 结束（END 或 ERROR 阶段）。
@@ -190,6 +251,7 @@ class AnimationStreamer:
         future.add_done_callback(lambda _: self._try_pop(command_id))
         return await future
 
+    @_on_streamer_loop
     async def wait_all_end(self, command_ids: list[int]) -> list[AnimResultInfo]:
         """
         等待所有指定 Animation 的 END 阶段完成。
@@ -223,9 +285,59 @@ class AnimationStreamer:
     async def _read_loop(self):
         """
         内部读取循环，用于处理 gRPC 流返回的 AnimationResult。
+        流因连接中断结束后，等待连接恢复并重新打开双向流。
         """
+        since: float | None = None
+        attempt = 0
+        try:
+            while True:
+                received, reason = await self._read_results()
+                if self._is_stopped:
+                    return
+                # 中断前提交的命令结果已丢失，立即让等待方失败
+                self._cleanup_futures(
+                    exception=StreamInterruptedError(
+                        f"Animation stream of {self._subject_id} interrupted: {reason}"
+                    )
+                )
+                if received or since is None:
+                    since, attempt = time.time(), 0
+                    _logger.warning(
+                        f"[{self._subject_id}] Animation stream interrupted ({reason}), reopening."
+                    )
+                attempt += 1
+                await self._stream.aclose()
+                await self._conn.supervisor.wait_ready()
+                await asyncio.sleep(DEFAULT_RECONNECT.delay(attempt))
+                if self._is_stopped:
+                    return
+                self._stream = self._open_stream()
+                await self._stream.start()
+                self._last_gap = StreamGap(
+                    f"{self._subject_id}--AnimationStreamer",
+                    since,
+                    time.time(),
+                    reason,
+                    attempt,
+                )
+
+        finally:
+            # 在 read_loop 退出时，确保清理未完成的 Future
+            self._cleanup_futures(
+                exception=RuntimeError("Streamer read loop terminated unexpectedly.")
+            )
+
+    async def _read_results(self) -> tuple[bool, str]:
+        """
+        读取当前双向流直到结束。
+
+        Returns:
+            tuple[bool, str]: (是否收到过结果, 流结束的原因)。
+        """
+        received = False
         try:
             async for ret_result in self._stream:
+                received = True
                 proto_result = cast(AnimationResult, ret_result)
                 command_id = proto_result.command_id
                 status = proto_result.animation_command_status
@@ -270,15 +382,9 @@ class AnimationStreamer:
                     )
 
         except Exception as e:
-            # 在 gRPC 流异常或断开连接时，统一处理未完成的 Future
             _logger.error(f"Exception in read_loop: {e}")
-            self._cleanup_futures(exception=e)
-
-        finally:
-            # 在 read_loop 正常退出时，确保清理未完成的 Future
-            self._cleanup_futures(
-                exception=RuntimeError("Streamer read loop terminated unexpectedly.")
-            )
+            return received, f"{type(e).__name__}: {e}"
+        return received, "stream ended"
 
     def _cleanup_futures(self, exception: Exception):
         """
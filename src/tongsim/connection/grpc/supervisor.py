@@ -0,0 +1,339 @@
+"""
+connection.grpc.supervisor
+
+UE 进程重启 / 网络抖动后的自动重连与流重新订阅:
+- ConnectionSupervisor: 监视 GrpcConnection 各通道的连接状态（connectivity state），
+  连接丢失后按退避主动触发重连，并记录断开 / 恢复次数与连接代数（epoch）；
+- resilient_stream: 包装 unary-stream 订阅，流因连接中断而失败后等待通道恢复并重新订阅，
+  在恢复后的第一条数据之前插入一个 StreamGap 标记，让消费者明确知道中间丢失了数据；
+- StreamInterruptedError: 双向流中断时设置到未完成 Future 上的异常。
+
+grpc.aio 通道在失败后会进入 IDLE，不会自行重连，直到有新的调用或 get_state(try_to_connect=True)。
+监视任务运行在创建通道的事件循环上，随 GrpcConnection.aclose() 一起停止。
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import grpc
+import grpc.aio
+
+from tongsim.core.supervision import RestartBackoff
+from tongsim.logger import get_logger
+
+from .errors import RpcError, strict_rpc
+
+__all__ = [
+    "ConnectionSupervisor",
+    "StreamGap",
+    "StreamInterruptedError",
+    "resilient_stream",
+]
+
+_logger = get_logger("gRPC")
+
+T = TypeVar("T")
+
+# 重连 / 重新订阅的默认退避: 0.2s 起，最长 5s，不限次数
+DEFAULT_RECONNECT: RestartBackoff = RestartBackoff(
+    initial=0.2, maximum=5.0, factor=2.0, jitter=0.1
+)
+
+# 流重新订阅的默认退避: 与重连相同，但次数有限，UE 长时间不可用时放弃
+DEFAULT_RESUBSCRIBE: RestartBackoff = RestartBackoff(
+    initial=0.2, maximum=5.0, factor=2.0, jitter=0.1, max_restarts=20
+)
+
+_Connectivity = grpc.ChannelConnectivity
+
+
+@dataclass(frozen=True, slots=True)
+class StreamGap:
+    """
+    流中断标记: 表示 [since, until] 之间的数据已丢失，之后的数据来自重新订阅的流。
+
+    Attributes:
+        stream (str): 流名称。
+        since (float): 中断时刻（time.time()）。
+        until (float): 恢复时刻（time.time()）。
+        reason (str): 中断原因。
+        attempts (int): 恢复前的重新订阅次数。
+    """
+
+    stream: str
+    since: float
+    until: float
+    reason: str
+    attempts: int
+
+    @property
+    def duration(self) -> float:
+        """中断时长（秒）。"""
+        return self.until - self.since
+
+
+class StreamInterruptedError(RuntimeError):
+    """双向流因连接中断而终止，等待中的结果已丢失。"""
+
+
+class ConnectionSupervisor:
+    """
+    监视一组 grpc.aio 通道（主通道与媒体通道）的连接状态，并在连接丢失后按退避触发重连。
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[grpc.aio.Channel],
+        name: str = "",
+        backoff: RestartBackoff = DEFAULT_RECONNECT,
+    ):
+        """
+        Args:
+            channels (Sequence[grpc.aio.Channel]): 被监视的通道。
+            name (str): 名称，用于日志（通常为 endpoint）。
+            backoff (RestartBackoff): 重连退避参数。
+        """
+        self._channels: tuple[grpc.aio.Channel, ...] = tuple(channels)
+        self._name = name
+        self._backoff = backoff
+        self._watchers: list[asyncio.Task] = []
+        self._epoch: int = 0
+        self._disconnects: int = 0
+        self._lost_at: float | None = None
+        self._ready: list[bool] = [False] * len(self._channels)
+
+    @property
+    def epoch(self) -> int:
+        """连接代数，每次从断开恢复到 READY 时加 1。"""
+        return self._epoch
+
+    @property
+    def disconnects(self) -> int:
+        """已观察到的连接丢失次数。"""
+        return self._disconnects
+
+    @property
+    def is_connected(self) -> bool:
+        """所有通道当前是否均为 READY。"""
+        return all(
+            channel.get_state() is _Connectivity.READY for channel in self._channels
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return any(not task.done() for task in self._watchers)
+
+    def start(self) -> None:
+        """在当前事件循环上启动监视任务，重复调用无副作用。"""
+        if self.is_running:
+            return
+        self._watchers = [
+            asyncio.create_task(
+                self._watch(index, channel),
+                name=f"ConnectionSupervisor:{self._name}#{index}",
+            )
+            for index, channel in enumerate(self._channels)
+        ]
+
+    async def aclose(self) -> None:
+        """停止监视任务。"""
+        for task in self._watchers:
+            task.cancel()
+        for task in self._watchers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._watchers.clear()
+
+    async def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        触发连接并等待所有通道进入 READY。
+
+        Args:
+            timeout (float | None): 最长等待秒数，None 表示一直等待。
+
+        Returns:
+            bool: 在超时前全部就绪返回 True；超时或通道已关闭返回 False。
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                for channel in self._channels:
+                    while True:
+                        state = channel.get_state(try_to_connect=True)
+                        if state is _Connectivity.READY:
+                            break
+                        if state is _Connectivity.SHUTDOWN:
+                            return False
+                        await channel.wait_for_state_change(state)
+        except TimeoutError:
+            return False
+        return True
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: 包含 connected / epoch / disconnects / lost_at。
+        """
+        return {
+            "connected": self.is_connected,
+            "epoch": self._epoch,
+            "disconnects": self._disconnects,
+            "lost_at": self._lost_at,
+        }
+
+    async def _watch(self, index: int, channel: grpc.aio.Channel) -> None:
+        attempt = 0
+        state = channel.get_state(try_to_connect=True)
+        while state is not _Connectivity.SHUTDOWN:
+            if state is _Connectivity.READY:
+                attempt = 0
+                self._on_ready(index)
+            else:
+                self._on_not_ready(index, state)
+                if state in (_Connectivity.IDLE, _Connectivity.TRANSIENT_FAILURE):
+                    # 通道不会自行重连: 退避后主动触发一次连接
+                    attempt += 1
+                    with contextlib.suppress(TimeoutError):
+                        async with asyncio.timeout(self._backoff.delay(attempt)):
+                            await channel.wait_for_state_change(state)
+                    state = channel.get_state(try_to_connect=True)
+                    continue
+            await channel.wait_for_state_change(state)
+            state = channel.get_state()
+
+    def _on_ready(self, index: int) -> None:
+        if self._ready[index]:
+            return
+        self._ready[index] = True
+        if all(self._ready) and self._lost_at is not None:
+            self._epoch += 1
+            _logger.warning(
+                f"[ConnectionSupervisor {self._name}] connection restored after "
+                f"{time.time() - self._lost_at:.2f}s (epoch {self._epoch})."
+            )
+            self._lost_at = None
+
+    def _on_not_ready(self, index: int, state: grpc.ChannelConnectivity) -> None:
+        if not self._ready[index]:
+            return
+        self._ready[index] = False
+        if self._lost_at is None:
+            self._lost_at = time.time()
+            self._disconnects += 1
+            _logger.warning(
+                f"[ConnectionSupervisor {self._name}] connection lost ({state.name}), reconnecting."
+            )
+
+
+async def resilient_stream(
+    open_stream: Callable[[], AsyncIterable[T]],
+    supervisor: ConnectionSupervisor,
+    name: str = "",
+    is_active: Callable[[], bool] = lambda: True,
+    backoff: RestartBackoff = DEFAULT_RESUBSCRIBE,
+) -> AsyncIterator[T | StreamGap]:
+    """
+    自动重新订阅的 unary-stream 包装: 流因连接中断而失败（UNAVAILABLE，或流结束时通道已不再 READY）后，
+    等待通道恢复并重新调用 open_stream()，恢复后的第一条数据之前插入一个 StreamGap。
+
+    连接正常时流结束（如 UE 主动关闭流、实体被销毁）或以其他状态码失败时不重新订阅，迭代直接结束；
+    非 gRPC 异常原样抛出。open_stream() 在 strict_rpc() 作用域内迭代，safe_unary_stream 封装的
+    方法会抛出 RpcError 而不是静默结束。
+
+    Args:
+        open_stream (Callable[[], AsyncIterable[T]]): 每次调用都发起一次新的订阅。
+        supervisor (ConnectionSupervisor): 订阅所在连接的监视器。
+        name (str): 流名称，用于日志与 StreamGap。
+        is_active (Callable[[], bool]): 订阅是否仍然需要；返回 False 时（如主动停止）不再重新订阅。
+        backoff (RestartBackoff): 重新订阅的退避参数，max_restarts 耗尽后抛出 ConnectionError。
+
+    Yields:
+        T | StreamGap: 流数据，或中断标记。
+
+    Example:
+        async for item in resilient_stream(
+            lambda: UnaryStreamAPI.subscribe_collision(conn, subject_id),
+            conn.supervisor,
+            name="collision",
+        ):
+            if isinstance(item, StreamGap):
+                ...
+    """
+    supervisor.start()
+    since: float | None = None
+    reason = ""
+    attempt = 0
+    while True:
+        call = open_stream()
+        stream = aiter(call)
+        try:
+            while True:
+                # 只在取下一条数据时开启严格模式，不影响消费者自身的 RPC
+                with strict_rpc():
+                    item = await anext(stream)
+                if since is not None:
+                    gap = StreamGap(name, since, time.time(), reason, attempt)
+                    _logger.info(
+                        f"[{name}] stream resumed after {gap.duration:.2f}s ({attempt} attempts)."
+                    )
+                    yield gap
+                    since, attempt = None, 0
+                yield item
+        except StopAsyncIteration:
+            reason = _transport_failure(name, None, supervisor)
+        except (RpcError, grpc.aio.AioRpcError) as e:
+            reason = _transport_failure(name, e, supervisor)
+        finally:
+            await _close_stream(call, stream)
+
+        if reason is None or not is_active():
+            return
+        if since is None:
+            since = time.time()
+            _logger.warning(f"[{name}] stream interrupted ({reason}), resubscribing.")
+        attempt += 1
+        if backoff.exhausted(attempt):
+            raise ConnectionError(
+                f"[{name}] stream could not be resubscribed after {attempt - 1} attempts: {reason}"
+            )
+        await supervisor.wait_ready(timeout=backoff.maximum)
+        await asyncio.sleep(backoff.delay(attempt))
+        if not is_active():
+            return
+
+
+def _transport_failure(
+    name: str,
+    error: RpcError | grpc.aio.AioRpcError | None,
+    supervisor: ConnectionSupervisor,
+) -> str | None:
+    """
+    判断流的结束是否由连接中断引起。
+
+    Returns:
+        str | None: 需要重新订阅时返回中断原因，否则返回 None。
+    """
+    if error is None:
+        if supervisor.is_connected:
+            _logger.info(f"[{name}] stream ended.")
+            return None
+        return "stream ended"
+    code = error.code if isinstance(error, RpcError) else error.code()
+    if code is not grpc.StatusCode.UNAVAILABLE and supervisor.is_connected:
+        _logger.warning(f"[{name}] stream failed, not resubscribing: {error}")
+        return None
+    return f"{code.name}: {error}"
+
+
+async def _close_stream(call: AsyncIterable[Any], stream: AsyncIterator[Any]) -> None:
+    """关闭一次订阅: 取消 gRPC 调用（如有），并关闭迭代器。"""
+    cancel = getattr(call, "cancel", None)
+    if cancel is not None:
+        cancel()
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        with contextlib.suppress(Exception):
+            await aclose()
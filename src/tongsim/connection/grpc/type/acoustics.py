@@ -3,8 +3,11 @@ connection.grpc.type.acoustics
 """
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from tongsim_api_protocol.subsystem.acoustics_manager_pb2 import AudioDataChunk
+if TYPE_CHECKING:
+    # 音频协议模块只在实际订阅音频时才导入
+    from tongsim_api_protocol.subsystem.acoustics_manager_pb2 import AudioDataChunk
 
 __all__ = ["AudioDataWrapper"]
 
@@ -16,9 +19,13 @@ class AudioDataWrapper:
     提供 memoryview 支持，避免音频字段拷贝。
     """
 
-    _audio_data_grpc_message: AudioDataChunk = field(repr=False)
+    _audio_data_grpc_message: "AudioDataChunk" = field(repr=False)
 
     def __post_init__(self):
+        from tongsim_api_protocol.subsystem.acoustics_manager_pb2 import (
+            AudioDataChunk,
+        )
+
         if not isinstance(self._audio_data_grpc_message, AudioDataChunk):
             raise TypeError("Expected AudioDataChunk proto")
 
@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from tongsim_api_protocol import basic_pb2
 from tongsim_api_protocol.component.animation.animation_pb2_grpc import (
@@ -77,8 +78,6 @@ from tongsim_api_protocol.subsystem.open_world_pb2 import (
 from tongsim_api_protocol.subsystem.open_world_pb2_grpc import OpenWorldServiceStub
 from tongsim_api_protocol.subsystem.pg_pb2 import ComponentPG, PGFrequency, SubjectPG
 from tongsim_api_protocol.subsystem.pg_pb2_grpc import PGServiceStub
-from tongsim_api_protocol.subsystem.record_pb2 import FinishResponse, StartRecord
-from tongsim_api_protocol.subsystem.record_pb2_grpc import RecordServiceStub
 from tongsim_api_protocol.subsystem.save_game_pb2_grpc import SaveGameServiceStub
 from tongsim_api_protocol.subsystem.scene_pb2 import (
     AttachObjectToTargetRequest,
@@ -111,10 +110,14 @@ from tongsim_api_protocol.subsystem.segment_pb2_grpc import SegmentServiceStub
 from tongsim.math.geometry import Quaternion, Transform, Vector3
 from tongsim.type import AnimCmdHandType, ViewModeType
 
+from .codec import vectors_to_array
 from .core import GrpcConnection
 from .type import CameraImageRequest, CameraImageWrapper
 from .utils import proto_to_sdk, safe_async_rpc, sdk_to_proto
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class UnaryAPI:
     """
@@ -437,7 +440,8 @@ class UnaryAPI:
     async def get_camera_image(
         conn: GrpcConnection, image_request: CameraImageRequest
     ) -> CameraImageWrapper:
-        stub = conn.get_stub(CameraServiceStub)
+        # 整帧图像走媒体通道，避免阻塞其他延迟敏感的调用
+        stub = conn.get_media_stub(CameraServiceStub, key=image_request.camera_id)
         resp: GetCameraImageResponse = await stub.GetCameraImage(
             GetCameraImageRequest(camera_config=image_request.to_proto()), timeout=10.0
         )
@@ -603,11 +607,26 @@ class UnaryAPI:
     # === bigai.ue.subsystem.map ===
     @staticmethod
     @safe_async_rpc(default=[])
-    async def get_room_info(conn: GrpcConnection) -> list[dict]:
+    async def get_room_info(conn: GrpcConnection, as_array: bool = False) -> list[dict]:
+        """
+        as_array=True 时每个房间的 "boxes" 为 {"min": (M, 3) 数组, "max": (M, 3) 数组}（需要 NumPy）。
+        """
         stub = conn.get_stub(MapServiceStub)
         resp: MapRoomInfo = await stub.GetMapRoomInfo(
             basic_pb2.EmptyRequest(), timeout=2.0
         )
+        if as_array:
+            return [
+                {
+                    "room_name": room.room_name,
+                    "room_category": room.room_rdf,
+                    "boxes": {
+                        "min": vectors_to_array([box.min_vertex for box in room.box]),
+                        "max": vectors_to_array([box.max_vertex for box in room.box]),
+                    },
+                }
+                for room in resp.room_info
+            ]
         return [
             {
                 "room_name": room.room_name,
@@ -626,12 +645,17 @@ class UnaryAPI:
     @staticmethod
     @safe_async_rpc(default=[])
     async def get_nevmesh_polys_in_room(
-        conn: GrpcConnection, room_name: str
-    ) -> list[list[Vector3]]:
+        conn: GrpcConnection, room_name: str, as_array: bool = False
+    ) -> list[list[Vector3]] | list["np.ndarray"]:
+        """
+        as_array=True 时每个多边形为 (N, 3) 顶点数组（需要 NumPy）。
+        """
         stub = conn.get_stub(MapServiceStub)
         resp: NavMeshPolys = await stub.GetNavMeshPoly(
             RoomNameRequest(RoomName=room_name), timeout=2.0
         )
+        if as_array:
+            return [vectors_to_array(poly.vector) for poly in resp.NavPoly]
         return [[proto_to_sdk(vec) for vec in poly.vector] for poly in resp.NavPoly]
 
     # === bigai.ue.subsystem.scene ===
@@ -960,7 +984,9 @@ class UnaryAPI:
     async def start_capture(
         conn: GrpcConnection, file_name: str, directory_path: str, frame_rate: int
     ) -> bool:
-        stub = conn.get_stub(RecordServiceStub)
+        from tongsim_api_protocol.subsystem.record_pb2 import StartRecord
+
+        stub = conn.get_stub("RecordServiceStub")
         req = StartRecord(
             file_name=file_name,
             directory_path=directory_path,
@@ -972,7 +998,7 @@ class UnaryAPI:
     @staticmethod
     @safe_async_rpc(default=False)
     async def pause_capture(conn: GrpcConnection) -> bool:
-        stub = conn.get_stub(RecordServiceStub)
+        stub = conn.get_stub("RecordServiceStub")
         req = basic_pb2.EmptyResponse()
         await stub.PauseCapture(req, timeout=2.0)
         return True
@@ -980,7 +1006,7 @@ class UnaryAPI:
     @staticmethod
     @safe_async_rpc(default=False)
     async def resume_capture(conn: GrpcConnection) -> bool:
-        stub = conn.get_stub(RecordServiceStub)
+        stub = conn.get_stub("RecordServiceStub")
         req = basic_pb2.EmptyResponse()
         await stub.ResumeCapture(req, timeout=2.0)
         return True
@@ -988,9 +1014,9 @@ class UnaryAPI:
     @staticmethod
     @safe_async_rpc(default={})
     async def finish_capture(conn: GrpcConnection) -> dict:
-        stub = conn.get_stub(RecordServiceStub)
+        stub = conn.get_stub("RecordServiceStub")
         req = basic_pb2.EmptyResponse()
-        resp: FinishResponse = await stub.FinishCapture(req, timeout=5.0)
+        resp = await stub.FinishCapture(req, timeout=5.0)
         return {
             "success": resp.b_successed,
             "path": resp.out_path,
@@ -11,10 +11,6 @@ from grpc.aio import UnaryStreamCall
 from tongsim_api_protocol import basic_pb2
 from tongsim_api_protocol.component.voxel_pb2 import SubscribeVoxelRequest
 from tongsim_api_protocol.component.voxel_pb2_grpc import VoxelServiceStub
-from tongsim_api_protocol.subsystem.acoustics_manager_pb2 import AudioStreamRequest
-from tongsim_api_protocol.subsystem.acoustics_manager_pb2_grpc import (
-    AcousticsManagerServiceStub,
-)
 from tongsim_api_protocol.subsystem.camera_pb2 import CameraConfig, ImageRequest
 from tongsim_api_protocol.subsystem.camera_pb2_grpc import CameraServiceStub
 from tongsim_api_protocol.subsystem.event_stream_pb2_grpc import EventStreamServiceStub
@@ -42,7 +38,7 @@ class UnaryStreamAPI:
         image_requests: Sequence[CameraImageRequest],
         stream_name="",
     ) -> AsyncIterator[list[CameraImageWrapper]]:
-        stub = conn.get_stub(CameraServiceStub)
+        stub = conn.get_media_stub(CameraServiceStub, key=stream_name)
 
         req = ImageRequest(
             camera_config_list=[image_req.to_proto() for image_req in image_requests],
@@ -62,7 +58,11 @@ class UnaryStreamAPI:
     async def subscribe_audio(
         conn: GrpcConnection,
     ) -> AsyncIterator[AudioDataWrapper]:
-        stub = conn.get_stub(AcousticsManagerServiceStub)
+        from tongsim_api_protocol.subsystem.acoustics_manager_pb2 import (
+            AudioStreamRequest,
+        )
+
+        stub = conn.get_media_stub("AcousticsManagerServiceStub")
 
         req = AudioStreamRequest()
 
@@ -80,7 +80,7 @@ class UnaryStreamAPI:
         depth: bool = False,
         segmentation: bool = False,
     ) -> AsyncIterator[list[CameraImageWrapper]]:
-        stub = conn.get_stub(CameraServiceStub)
+        stub = conn.get_media_stub(CameraServiceStub, key=camera_id)
 
         req = ImageRequest(
             camera_config_list=[
@@ -113,7 +113,7 @@ class UnaryStreamAPI:
         is_ignore_self: bool = True,
         ignore_subjects: Sequence[str] | None = None,
     ) -> AsyncIterator[bytes]:
-        stub = conn.get_stub(VoxelServiceStub)
+        stub = conn.get_media_stub(VoxelServiceStub, key=component_id)
         request = SubscribeVoxelRequest(
             component=basic_pb2.Component(id=component_id),
             rate=rate,
@@ -139,7 +139,7 @@ class UnaryStreamAPI:
     # pg 流需要被主动 cancel，直接返回 UnaryStreamCall
     @staticmethod
     def subscribe_pg(conn: GrpcConnection) -> UnaryStreamCall:
-        stub = conn.get_stub(PGServiceStub)
+        stub = conn.get_media_stub(PGServiceStub)
         req = basic_pb2.EmptyRequest()
         return stub.SubScribePG(req)
 
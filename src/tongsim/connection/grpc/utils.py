@@ -11,6 +11,7 @@ import pkgutil
 from collections.abc import AsyncIterator, Awaitable, Callable, Generator
 from typing import Any, ParamSpec, TypeVar, cast
 
+import grpc
 from google.protobuf.message import Message as ProtoMessage
 from tongsim_api_protocol.basic_pb2 import AABB
 from tongsim_api_protocol.basic_pb2 import Pose as ProtoPose
@@ -23,12 +24,19 @@ from tongsim.logger import get_logger
 from tongsim.math.geometry import Pose, Quaternion, Transform, Vector2, Vector3
 from tongsim.math.geometry.type import Box
 
+from ._manifest import GRPC_STUB_MANIFEST, PROTO_MODULE_MANIFEST
+from .errors import RpcError, is_strict_rpc
+
 _logger = get_logger("gRPC")
 
 __all__ = [
+    "CodecRegistry",
+    "default_codecs",
     "iter_all_grpc_stubs",
     "iter_all_proto_messages",
     "proto_to_sdk",
+    "register_codec",
+    "resolve_grpc_stub",
     "safe_async_rpc",
     "safe_unary_stream",
     "sdk_to_proto",
@@ -38,29 +46,88 @@ _PACKAGE = "tongsim_api_protocol"
 
 T = TypeVar("T")
 P = ParamSpec("P")
+S = TypeVar("S")
+M = TypeVar("M", bound=ProtoMessage)
+
+# Stub 类名 -> 模块路径，由预生成的清单构建，查找时不导入任何协议模块
+_STUB_MODULES: dict[str, str] = {name: modname for modname, name in GRPC_STUB_MANIFEST}
+_resolved_stubs: dict[str, type] = {}
+
+
+def resolve_grpc_stub(name: str) -> type:
+    """按类名解析 gRPC Stub 类型，只导入清单中该 Stub 所在的模块。
 
+    Args:
+        name (str): Stub 类名，例如 "SceneServiceStub"。
 
-def iter_all_proto_messages() -> Generator[tuple[str, type[ProtoMessage]], None, None]:
+    Returns:
+        type: Stub 类型。
+
+    Raises:
+        KeyError: 清单中不存在该 Stub（升级协议包后需重新运行 scripts/gen_grpc_manifest.py）。
+    """
+    stub_cls = _resolved_stubs.get(name)
+    if stub_cls is None:
+        modname = _STUB_MODULES.get(name)
+        if modname is None:
+            raise KeyError(f"gRPC stub {name!r} not found in manifest.")
+        stub_cls = _resolved_stubs[name] = getattr(
+            importlib.import_module(modname), name
+        )
+    return stub_cls
+
+
+def iter_all_proto_messages(
+    use_manifest: bool = False,
+) -> Generator[tuple[str, type[ProtoMessage]], None, None]:
     """遍历 tongsim_api_protocol 中所有模块中的 protobuf message 类型。
 
+    默认在运行时遍历整个协议包；use_manifest=True 时只按预生成的清单逐个导入 _pb2 模块，
+    清单需与协议包一致（见 scripts/gen_grpc_manifest.py）。
+
+    Args:
+        use_manifest (bool): 是否使用预生成的清单。
+
     Yields:
         tuple[str, type[ProtoMessage]]: 每个消息的全名与类定义。
     """
-    pkg = importlib.import_module(_PACKAGE)
-    for _, modname, ispkg in pkgutil.walk_packages(pkg.__path__, prefix=_PACKAGE + "."):
-        if not ispkg and not modname.endswith("_pb2_grpc") and modname.endswith("_pb2"):
-            proto_module = importlib.import_module(modname)
-            for _, obj in inspect.getmembers(proto_module):
-                if inspect.isclass(obj) and issubclass(obj, ProtoMessage):
-                    yield obj.DESCRIPTOR.full_name, obj
+    if use_manifest:
+        modnames = iter(PROTO_MODULE_MANIFEST)
+    else:
+        pkg = importlib.import_module(_PACKAGE)
+        modnames = (
+            modname
+            for _, modname, ispkg in pkgutil.walk_packages(
+                pkg.__path__, prefix=_PACKAGE + "."
+            )
+            if not ispkg and modname.endswith("_pb2")
+        )
+    for modname in modnames:
+        proto_module = importlib.import_module(modname)
+        for _, obj in inspect.getmembers(proto_module):
+            if inspect.isclass(obj) and issubclass(obj, ProtoMessage):
+                yield obj.DESCRIPTOR.full_name, obj
+
+
+def iter_all_grpc_stubs(
+    use_manifest: bool = False,
+) -> Generator[tuple[str, type], None, None]:
+    """遍历 tongsim_api_protocol 中所有模块中的 gRPC Stub 类型。
 
+    默认在运行时遍历整个协议包；use_manifest=True 时读取预先生成的清单
+    （见 scripts/gen_grpc_manifest.py），只导入清单中的模块。
 
-def iter_all_grpc_stubs() -> Generator[tuple[str, type], None, None]:
-    """遍历 tongsim_api_protocol 中所有模块中的 gRPC Stub 类型。
+    Args:
+        use_manifest (bool): 是否使用预生成的清单。
 
     Yields:
         tuple[str, type]: 每个 Stub 类名与类定义。
     """
+    if use_manifest:
+        for _, name in GRPC_STUB_MANIFEST:
+            yield name, resolve_grpc_stub(name)
+        return
+
     pkg = importlib.import_module(_PACKAGE)
     for _, modname, ispkg in pkgutil.walk_packages(pkg.__path__, prefix=_PACKAGE + "."):
         if not ispkg and modname.endswith("_pb2_grpc"):
@@ -73,27 +140,44 @@ def iter_all_grpc_stubs() -> Generator[tuple[str, type], None, None]:
 def safe_async_rpc(
     default: T | None = None, raise_on_error: bool = False
 ) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
-    #     """
-    #     装饰器: 用于 gRPC 调用安全封装。
+    """
+    装饰器: 用于 gRPC 调用安全封装。
 
-    #     参数:
-    #         default: 出错时返回的默认值
-    #         raise_on_error: 是否在捕获异常后重新抛出（用于调试）
+    默认在出错时记录日志并返回 default；在 strict_rpc() 作用域内或 raise_on_error=True 时抛出异常，
+    其中 gRPC 错误统一转换为携带状态码的 RpcError。
+
+    参数:
+        default: 出错时返回的默认值
+        raise_on_error: 是否总是在捕获异常后重新抛出
 
-    #     用法:
-    #         @safe_async_rpc(default={}, raise_on_error=False)
-    #         def my_method(...): ...
-    #     """
+    用法:
+        @safe_async_rpc(default={}, raise_on_error=False)
+        def my_method(...): ...
+    """
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        method = func.__qualname__
+
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             try:
                 _logger.debug(f"gRPC async call {func.__name__}")
                 return await func(*args, **kwargs)
+            except grpc.aio.AioRpcError as e:
+                strict = is_strict_rpc()
+                if not strict:
+                    _logger.error(
+                        f"gRPC async call {func.__name__} failed with {e.code().name}: {e.details()}"
+                    )
+                if raise_on_error or strict:
+                    raise RpcError.from_aio(e, method) from e
             except Exception:
-                _logger.error(f"gRPC async call {func.__name__} failed", exc_info=True)
-                if raise_on_error:
+                strict = is_strict_rpc()
+                if not strict:
+                    _logger.error(
+                        f"gRPC async call {func.__name__} failed", exc_info=True
+                    )
+                if raise_on_error or strict:
                     raise
             if callable(default) and inspect.iscoroutinefunction(default):
                 return await default()
@@ -111,10 +195,12 @@ def safe_unary_stream(
     装饰器: 用于 gRPC unary-stream 异步生成器的安全封装。
 
     参数:
-        raise_on_error: 是否在异常时抛出错误，默认 False 则静默终止生成器。
+        raise_on_error: 是否在异常时抛出错误，默认 False 则静默终止生成器（strict_rpc() 作用域内总是抛出）。
     """
 
     def decorator(func: Callable[P, AsyncIterator[T]]) -> Callable[P, AsyncIterator[T]]:
+        method = func.__qualname__
+
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> AsyncIterator[T]:
             _logger.debug(f"gRPC Unary-Stream  {func.__name__} starting.")
@@ -123,10 +209,15 @@ def safe_unary_stream(
                 async for item in func(*args, **kwargs):
                     yield item
             except Exception as e:
-                _logger.error(
-                    f"gRPC Unary-Stream Error in {func.__name__}: {e}", exc_info=True
-                )
-                if raise_on_error:
+                strict = is_strict_rpc()
+                if not strict:
+                    _logger.error(
+                        f"gRPC Unary-Stream Error in {func.__name__}: {e}",
+                        exc_info=True,
+                    )
+                if raise_on_error or strict:
+                    if isinstance(e, grpc.aio.AioRpcError):
+                        raise RpcError.from_aio(e, method) from e
                     raise
                 return  # 停止 async for
 
@@ -167,20 +258,11 @@ def _sdk_to_proto_transform(t: Transform) -> ProtoTransform:
     )
 
 
-_sdk_to_proto_dispatch: dict[type, Callable[[Any], ProtoMessage]] = {
-    Vector3: _sdk_to_proto_vector3,
-    Quaternion: _sdk_to_proto_quaternion,
-    Pose: _sdk_to_proto_pose,
-    Transform: _sdk_to_proto_transform,
-    Vector2: _sdk_to_proto_vector2,
-}
-
-
-def sdk_to_proto(obj: Any) -> ProtoMessage:
-    handler = _sdk_to_proto_dispatch.get(type(obj))
-    if handler is None:
-        raise TypeError(f"Unsupported SDK type: {type(obj)}")
-    return handler(obj)
+def _sdk_to_proto_box(b: Box) -> AABB:
+    return AABB(
+        min_vertex=_sdk_to_proto_vector3(b.min),
+        max_vertex=_sdk_to_proto_vector3(b.max),
+    )
 
 
 # ========== Proto -> SDK ==========
@@ -217,18 +299,109 @@ def _proto_to_sdk_box(t: AABB) -> Box:
     )
 
 
-_proto_to_sdk_dispatch: dict[type[ProtoMessage], Callable[[ProtoMessage], Any]] = {
-    ProtoVector3: _proto_to_sdk_vector3,
-    ProtoQuaternion: _proto_to_sdk_quaternion,
-    ProtoPose: _proto_to_sdk_pose,
-    ProtoTransform: _proto_to_sdk_transform,
-    AABB: _proto_to_sdk_box,
-    ProtoVector2: _sdk_to_proto_vector2,
-}
+# ========== Codec Registry ==========
+
+
+class CodecRegistry:
+    """
+    SDK 类型与 proto 消息类型之间的双向转换注册表。
+
+    按对象的精确类型分发（不查找基类），每次转换只有一次 dict 查找；
+    每个 SDK 类型必须同时注册两个方向的转换，保证往返一致。
+    """
+
+    def __init__(self):
+        self._to_proto: dict[type, Callable[[Any], ProtoMessage]] = {}
+        self._to_sdk: dict[type[ProtoMessage], Callable[[Any], Any]] = {}
+        self._pairs: dict[type, type[ProtoMessage]] = {}
+
+    def register(
+        self,
+        sdk_type: type[S],
+        proto_type: type[M],
+        to_proto: Callable[[S], M],
+        to_sdk: Callable[[M], S],
+        *,
+        replace: bool = False,
+    ) -> None:
+        """
+        注册一对 SDK 类型与 proto 消息类型的双向转换。
+
+        Args:
+            sdk_type (type[S]): SDK 类型。
+            proto_type (type[M]): proto 消息类型。
+            to_proto (Callable[[S], M]): SDK -> proto 转换函数。
+            to_sdk (Callable[[M], S]): proto -> SDK 转换函数。
+            replace (bool): 是否覆盖已注册的转换，默认重复注册时抛出 ValueError。
+        """
+        if not replace and (sdk_type in self._to_proto or proto_type in self._to_sdk):
+            raise ValueError(
+                f"Codec for {sdk_type.__name__} <-> {proto_type.__name__} is already registered."
+            )
+        # 覆盖时先移除两侧旧配对的反向条目，保证 pairs() 与两个方向的转换一致
+        old_proto = self._pairs.pop(sdk_type, None)
+        if old_proto is not None:
+            self._to_sdk.pop(old_proto, None)
+        for old_sdk, paired in list(self._pairs.items()):
+            if paired is proto_type:
+                del self._pairs[old_sdk]
+                self._to_proto.pop(old_sdk, None)
+        self._to_proto[sdk_type] = to_proto
+        self._to_sdk[proto_type] = to_sdk
+        self._pairs[sdk_type] = proto_type
+
+    def to_proto(self, obj: Any) -> ProtoMessage:
+        handler = self._to_proto.get(type(obj))
+        if handler is None:
+            raise TypeError(f"Unsupported SDK type: {type(obj)}")
+        return handler(obj)
+
+    def to_sdk(self, message: ProtoMessage) -> Any:
+        handler = self._to_sdk.get(type(message))
+        if handler is None:
+            raise TypeError(f"Unsupported Proto message: {type(message)}")
+        return handler(message)
+
+    def pairs(self) -> list[tuple[type, type[ProtoMessage]]]:
+        """
+        Returns:
+            list[tuple[type, type[ProtoMessage]]]: 已注册的 (SDK 类型, proto 消息类型)。
+        """
+        return list(self._pairs.items())
+
+
+default_codecs = CodecRegistry()
+default_codecs.register(
+    Vector3, ProtoVector3, _sdk_to_proto_vector3, _proto_to_sdk_vector3
+)
+default_codecs.register(
+    Vector2, ProtoVector2, _sdk_to_proto_vector2, _proto_to_sdk_vector2
+)
+default_codecs.register(
+    Quaternion, ProtoQuaternion, _sdk_to_proto_quaternion, _proto_to_sdk_quaternion
+)
+default_codecs.register(Pose, ProtoPose, _sdk_to_proto_pose, _proto_to_sdk_pose)
+default_codecs.register(
+    Transform, ProtoTransform, _sdk_to_proto_transform, _proto_to_sdk_transform
+)
+default_codecs.register(Box, AABB, _sdk_to_proto_box, _proto_to_sdk_box)
+
+
+def register_codec(
+    sdk_type: type[S],
+    proto_type: type[M],
+    to_proto: Callable[[S], M],
+    to_sdk: Callable[[M], S],
+    *,
+    replace: bool = False,
+) -> None:
+    """在默认注册表中注册双向转换，之后 sdk_to_proto / proto_to_sdk 即可处理该类型。"""
+    default_codecs.register(sdk_type, proto_type, to_proto, to_sdk, replace=replace)
+
+
+def sdk_to_proto(obj: Any) -> ProtoMessage:
+    return default_codecs.to_proto(obj)
 
 
 def proto_to_sdk(message: ProtoMessage) -> Any:
-    handler = _proto_to_sdk_dispatch.get(type(message))
-    if handler is None:
-        raise TypeError(f"Unsupported Proto message: {type(message)}")
-    return handler(message)
+    return default_codecs.to_sdk(message)
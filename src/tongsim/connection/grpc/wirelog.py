@@ -0,0 +1,431 @@
+"""
+connection.grpc.wirelog
+
+gRPC 流量的二进制录制:
+- WireRecorder: 追加写入的紧凑二进制日志，记录每次调用的方法名、请求 / 响应字节、时间戳与最终状态码；
+- recording_interceptors: 安装在通道最内层的拦截器，覆盖 unary 与流式调用（SubScribePG、SubscribeImage、
+  SubScribeAnimation 等流中的每条响应都会被记录）；
+- iter_wire_records / read_wire_calls: 读取日志，按调用汇总后供 connection.grpc.replay 回放。
+
+日志格式: 文件头 `_MAGIC`，之后是连续的记录，每条记录为固定头部 `<BIdHI`
+（类型、调用 id、相对会话开始的秒数、方法名长度、负载长度）+ 方法名 + 负载。
+方法名只写在调用的 START 记录中；每次打开日志追加一条 SESSION 记录，调用 id 在会话内唯一。
+"""
+
+import asyncio
+import enum
+import itertools
+import os
+import struct
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, ClassVar
+
+import grpc
+from grpc.aio import (
+    AioRpcError,
+    ClientCallDetails,
+    ClientInterceptor,
+    StreamStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor,
+)
+
+from tongsim.logger import get_logger
+
+__all__ = [
+    "WireCall",
+    "WireKind",
+    "WireRecord",
+    "WireRecorder",
+    "iter_wire_records",
+    "read_wire_calls",
+    "recording_interceptors",
+]
+
+_logger = get_logger("gRPC")
+
+_MAGIC = b"TSWIRE\x00\x01"
+_HEADER = struct.Struct("<BIdHI")
+_STATUS = struct.Struct("<H")
+_STATUS_CODES: dict[int, grpc.StatusCode] = {c.value[0]: c for c in grpc.StatusCode}
+
+
+class WireKind(enum.IntEnum):
+    """日志记录类型。"""
+
+    SESSION = 0
+    START = 1
+    REQUEST = 2
+    RESPONSE = 3
+    END = 4
+
+
+@dataclass(frozen=True, slots=True)
+class WireRecord:
+    """
+    日志中的单条记录。
+
+    Attributes:
+        kind (WireKind): 记录类型。
+        session (int): 所属会话序号（每次打开日志追加写入时递增）。
+        call_id (int): 会话内的调用 id。
+        timestamp (float): 相对会话开始的秒数。
+        method (str): 完整方法名，只有 START 记录非空。
+        payload (bytes): 请求 / 响应字节；END 记录为状态码与 details。
+    """
+
+    kind: WireKind
+    session: int
+    call_id: int
+    timestamp: float
+    method: str
+    payload: bytes
+
+
+@dataclass(slots=True)
+class WireCall:
+    """
+    一次完整调用的录制结果。
+
+    Attributes:
+        method (str): 完整方法名，例如 "/bigai.ue.subsystem.scene.SceneService/Step"。
+        started (float): 调用开始时间（相对会话开始的秒数）。
+        events (list[tuple[WireKind, float, bytes]]): 按发生顺序排列的 REQUEST / RESPONSE。
+        code (grpc.StatusCode): 最终状态码；录制结束时仍未完成的调用记为 CANCELLED。
+        details (str): 错误详情。
+        ended (float | None): 调用结束时间。
+    """
+
+    method: str
+    started: float
+    events: list[tuple[WireKind, float, bytes]] = field(default_factory=list)
+    code: grpc.StatusCode = grpc.StatusCode.CANCELLED
+    details: str = ""
+    ended: float | None = None
+
+    @property
+    def request(self) -> bytes | None:
+        """第一条请求的字节，没有请求时为 None。"""
+        for kind, _, payload in self.events:
+            if kind is WireKind.REQUEST:
+                return payload
+        return None
+
+    @property
+    def responses(self) -> list[bytes]:
+        return [p for kind, _, p in self.events if kind is WireKind.RESPONSE]
+
+
+def _payload(message: Any) -> bytes:
+    if isinstance(message, bytes):
+        return message
+    return message.SerializeToString()
+
+
+class WireRecorder:
+    """
+    追加写入的 gRPC 流量日志。
+
+    同一路径的日志通过 acquire() / release() 在多个连接（分片 loop、废弃接口连接）之间共享，
+    写入由锁保护，可以在不同事件循环线程中同时记录。
+    """
+
+    _shared: ClassVar[dict[str, tuple["WireRecorder", int]]] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): 日志文件路径，已存在时在末尾追加新的会话。
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = open(path, "ab")  # noqa: SIM115
+        if self._file.tell() == 0:
+            self._file.write(_MAGIC)
+        self._started = time.monotonic()
+        self._ids = itertools.count()
+        self._write(WireKind.SESSION, 0, "", struct.pack("<d", time.time()))
+
+    @classmethod
+    def acquire(cls, path: str) -> "WireRecorder":
+        """获取路径对应的共享日志，引用计数加 1。"""
+        key = os.path.abspath(path)
+        with cls._shared_lock:
+            recorder, refs = cls._shared.get(key, (None, 0))
+            if recorder is None:
+                recorder = cls(path)
+            cls._shared[key] = (recorder, refs + 1)
+            return recorder
+
+    def release(self) -> None:
+        """引用计数减 1，归零时关闭日志。"""
+        key = os.path.abspath(self._path)
+        with self._shared_lock:
+            recorder, refs = self._shared.get(key, (self, 1))
+            if refs > 1:
+                self._shared[key] = (recorder, refs - 1)
+                return
+            self._shared.pop(key, None)
+        self.close()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def start(self, method: str, request: Any | None = None) -> int:
+        """
+        记录一次调用的开始。
+
+        Args:
+            method (str): 完整方法名。
+            request (Any | None): unary 请求；流式请求随后通过 request() 逐条记录。
+
+        Returns:
+            int: 调用 id。
+        """
+        call_id = next(self._ids)
+        self._write(WireKind.START, call_id, method, b"")
+        if request is not None:
+            self._write(WireKind.REQUEST, call_id, "", _payload(request))
+        return call_id
+
+    def request(self, call_id: int, request: Any) -> None:
+        self._write(WireKind.REQUEST, call_id, "", _payload(request))
+
+    def response(self, call_id: int, response: Any) -> None:
+        self._write(WireKind.RESPONSE, call_id, "", _payload(response))
+
+    def end(self, call_id: int, code: grpc.StatusCode, details: str = "") -> None:
+        payload = _STATUS.pack(code.value[0]) + (details or "").encode()
+        self._write(WireKind.END, call_id, "", payload)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                _logger.debug(f"[WireRecorder] closed {self._path}")
+
+    def _write(self, kind: WireKind, call_id: int, method: str, payload: bytes):
+        name = method.encode()
+        header = _HEADER.pack(
+            kind, call_id, time.monotonic() - self._started, len(name), len(payload)
+        )
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(header + name + payload)
+
+
+def iter_wire_records(path: str) -> Iterator[WireRecord]:
+    """
+    顺序读取日志中的所有记录。
+
+    Args:
+        path (str): 日志文件路径。
+
+    Yields:
+        WireRecord: 日志记录；末尾不完整的记录（录制进程异常退出）会被忽略。
+    """
+    with open(path, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a gRPC wire log.")
+        session = -1
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            kind, call_id, timestamp, name_len, payload_len = _HEADER.unpack(header)
+            body = f.read(name_len + payload_len)
+            if len(body) < name_len + payload_len:
+                return
+            if kind == WireKind.SESSION:
+                session += 1
+            yield WireRecord(
+                WireKind(kind),
+                session,
+                call_id,
+                timestamp,
+                body[:name_len].decode(),
+                body[name_len:],
+            )
+
+
+def read_wire_calls(path: str) -> list[WireCall]:
+    """
+    读取日志并按调用汇总。
+
+    Args:
+        path (str): 日志文件路径。
+
+    Returns:
+        list[WireCall]: 按开始顺序排列的调用。
+    """
+    calls: dict[tuple[int, int], WireCall] = {}
+    for record in iter_wire_records(path):
+        key = (record.session, record.call_id)
+        if record.kind is WireKind.START:
+            calls[key] = WireCall(record.method, record.timestamp)
+            continue
+        call = calls.get(key)
+        if call is None:
+            continue
+        if record.kind is WireKind.END:
+            (code,) = _STATUS.unpack_from(record.payload)
+            call.code = _STATUS_CODES.get(code, grpc.StatusCode.UNKNOWN)
+            call.details = record.payload[_STATUS.size :].decode()
+            call.ended = record.timestamp
+        else:
+            call.events.append((record.kind, record.timestamp, record.payload))
+    return list(calls.values())
+
+
+def _method_name(method: str | bytes) -> str:
+    return method.decode() if isinstance(method, bytes) else method
+
+
+class _Recording:
+    """录制拦截器的公共部分。"""
+
+    def __init__(self, recorder: WireRecorder):
+        self._recorder = recorder
+
+    def _start(self, details: ClientCallDetails, request: Any | None = None) -> int:
+        return self._recorder.start(_method_name(details.method), request)
+
+    async def _record_unary(self, call_id: int, call: Any) -> Any:
+        try:
+            response = await call
+        except AioRpcError as e:
+            self._recorder.end(call_id, e.code(), e.details() or "")
+            raise
+        except asyncio.CancelledError:
+            self._recorder.end(call_id, grpc.StatusCode.CANCELLED)
+            raise
+        self._recorder.response(call_id, response)
+        self._recorder.end(call_id, grpc.StatusCode.OK)
+        return response
+
+    async def _record_requests(
+        self, call_id: int, request_iterator: Any
+    ) -> AsyncIterator[Any]:
+        if hasattr(request_iterator, "__aiter__"):
+            async for request in request_iterator:
+                self._recorder.request(call_id, request)
+                yield request
+        else:
+            for request in request_iterator:
+                self._recorder.request(call_id, request)
+                yield request
+
+    async def _record_responses(self, call_id: int, call: Any) -> AsyncIterator[Any]:
+        code, details = grpc.StatusCode.OK, ""
+        try:
+            async for response in call:
+                self._recorder.response(call_id, response)
+                yield response
+        except AioRpcError as e:
+            code, details = e.code(), e.details() or ""
+            raise
+        except (asyncio.CancelledError, GeneratorExit):
+            code = grpc.StatusCode.CANCELLED
+            raise
+        finally:
+            self._recorder.end(call_id, code, details)
+
+
+class _UnaryUnaryRecording(_Recording, UnaryUnaryClientInterceptor):
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[[ClientCallDetails, Any], Any],
+        client_call_details: ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        call_id = self._start(client_call_details, request)
+        call = await continuation(client_call_details, request)
+        return await self._record_unary(call_id, call)
+
+
+class _UnaryStreamRecording(_Recording, UnaryStreamClientInterceptor):
+    async def intercept_unary_stream(
+        self,
+        continuation: Callable[[ClientCallDetails, Any], Any],
+        client_call_details: ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        call_id = self._start(client_call_details, request)
+        call = await continuation(client_call_details, request)
+        return self._record_responses(call_id, call)
+
+
+class _StreamUnaryRecording(_Recording, StreamUnaryClientInterceptor):
+    def __init__(self, recorder: WireRecorder):
+        super().__init__(recorder)
+        self._pending: set[asyncio.Task] = set()
+
+    async def intercept_stream_unary(
+        self,
+        continuation: Callable[[ClientCallDetails, Any], Any],
+        client_call_details: ClientCallDetails,
+        request_iterator: Any,
+    ) -> Any:
+        call_id = self._start(client_call_details)
+        call = await continuation(
+            client_call_details, self._record_requests(call_id, request_iterator)
+        )
+        # 调用方可能通过 write() 发送请求，write() 会等待拦截器返回，因此不能在此等待响应
+        task = asyncio.ensure_future(self._record_unary(call_id, call))
+        self._pending.add(task)
+        task.add_done_callback(self._on_recorded)
+        return call
+
+    def _on_recorded(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled():
+            # 异常已由调用方自行处理，此处只需取走，避免 "exception was never retrieved"
+            task.exception()
+
+
+class _StreamStreamRecording(_Recording, StreamStreamClientInterceptor):
+    async def intercept_stream_stream(
+        self,
+        continuation: Callable[[ClientCallDetails, Any], Any],
+        client_call_details: ClientCallDetails,
+        request_iterator: Any,
+    ) -> Any:
+        call_id = self._start(client_call_details)
+        call = await continuation(
+            client_call_details, self._record_requests(call_id, request_iterator)
+        )
+        return self._record_responses(call_id, call)
+
+
+def recording_interceptors(recorder: WireRecorder) -> list[ClientInterceptor]:
+    """
+    创建将经过通道的请求与响应写入 WireRecorder 的拦截器。
+
+    grpc.aio 按类型分别保存拦截器（同时继承多个类型的拦截器只会生效一种），因此每种调用类型各返回一个。
+    应安装在通道最内层，只记录真正发往服务端的调用（缓存命中、合并的调用不会出现在日志中）。
+
+    Args:
+        recorder (WireRecorder): 流量日志。
+
+    Returns:
+        list[ClientInterceptor]: unary-unary、unary-stream、stream-unary、stream-stream 拦截器。
+    """
+    return [
+        _UnaryUnaryRecording(recorder),
+        _UnaryStreamRecording(recorder),
+        _StreamUnaryRecording(recorder),
+        _StreamStreamRecording(recorder),
+    ]
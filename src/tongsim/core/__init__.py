@@ -1,3 +1,13 @@
-from .async_loop import AsyncLoop
+from .async_loop import AsyncLoop, DrainReport
+from .instrumentation import LoopInstrumentation
+from .offload import OffloadExecutor
+from .supervision import RestartBackoff, SupervisionPolicy
 
-__all__ = ["AsyncLoop"]
+__all__ = [
+    "AsyncLoop",
+    "DrainReport",
+    "LoopInstrumentation",
+    "OffloadExecutor",
+    "RestartBackoff",
+    "SupervisionPolicy",
+]
@@ -6,21 +6,65 @@ core.async_loop
 核心:
 1、将一个虚拟环境输入（基于Connection） 相关的所有协程派发到同一个线程（AsyncLoop 维护）上来降低并发安全的问题
     （注意: 在一个Loop内的协程 仍然可能存在并发安全问题）
-2、性能出现瓶颈时，考虑把计算密集性的处理逻辑 offload 到专用的计算线程池来解决。
+2、性能出现瓶颈时，考虑把计算密集性的处理逻辑 offload 到专用的计算池来解决（见 core.offload / WorldContext.offload）。
+3、调用方本身就是 asyncio 程序时，可通过 attach() 直接挂载到调用方正在运行的事件循环，省去跨线程转发。
+4、spawn 支持按任务指定监督策略（见 core.supervision）: 默认异常上升并取消整个 TaskGroup，
+    也可以隔离异常（ISOLATE）或按退避策略自动重启（RESTART），避免单个流异常拖垮其他流。
+5、enable_instrumentation() 可开启可选的运行时观测（事件循环延迟、任务耗时、待调度队列深度、慢回调），
+    用于区分响应慢是来自 UE 还是本地事件循环被阻塞。
+6、drain() 用于有界的优雅关闭: 在截止时间内等待在途任务完成，超时的任务与后台任务（流读取循环等）被取消，
+    并返回 DrainReport 说明哪些任务被截断。
 """
 
 import asyncio
 import contextlib
 import threading
-from collections.abc import Awaitable
+import time
+from collections.abc import Awaitable, Callable
 from concurrent.futures import Future
 from concurrent.futures import TimeoutError as FutureTimeoutError
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
 
 from tongsim.logger import get_logger
 
+from .instrumentation import LoopInstrumentation
+from .supervision import RestartBackoff, SupervisionPolicy
+
 _logger = get_logger("core")
 
+T = TypeVar("T")
+
+# drain 截止后等待被取消任务退出的最长秒数
+_CANCEL_GRACE = 1.0
+
+
+@dataclass(slots=True)
+class _TaskFailure:
+    """ISOLATE / RESTART 策略下被拦截的任务异常，避免异常传入 TaskGroup。"""
+
+    exc: Exception
+
+
+@dataclass(slots=True)
+class DrainReport:
+    """
+    AsyncLoop.drain 的结果。
+
+    Attributes:
+        loop (str): loop 名称。
+        completed (int): 截止时间内完成的在途任务数。
+        cut_off (list[str]): 截止时仍未完成而被取消的在途任务名称。
+        background_cancelled (int): 被取消的后台任务数（流读取循环等）。
+        elapsed (float): drain 耗时（秒）。
+    """
+
+    loop: str
+    completed: int = 0
+    cut_off: list[str] = field(default_factory=list)
+    background_cancelled: int = 0
+    elapsed: float = 0.0
+
 
 class AsyncLoop:
     """
@@ -29,6 +73,7 @@ class AsyncLoop:
     特性:
     - 独立后台线程，常驻 EventLoop
     - 基于 asyncio.TaskGroup 管理所有业务任务
+    - 挂载模式（attach）: 复用调用方线程中正在运行的事件循环，不创建后台线程
     """
 
     def __init__(self, name: str = "AsyncLoop") -> None:
@@ -47,6 +92,12 @@ class AsyncLoop:
         self._business_tasks: set[asyncio.Task[Any]] = (
             set()
         )  # 记录业务 spawn 出来的 task
+        self._background_tasks: set[asyncio.Task[Any]] = (
+            set()
+        )  # 其中长期运行、drain 时不等待的后台 task
+        self._attached: bool = False  # 是否挂载在调用方的事件循环上
+        self._instrumentation: LoopInstrumentation | None = None  # 可选的运行时观测
+        self._heartbeat: Future[Any] | None = None
 
     @property
     def thread(self) -> threading.Thread:
@@ -60,6 +111,69 @@ class AsyncLoop:
     def name(self) -> str:
         return self._name
 
+    @property
+    def is_attached(self) -> bool:
+        """是否以挂载模式运行在调用方的事件循环上。"""
+        return self._attached
+
+    @property
+    def instrumentation(self) -> LoopInstrumentation | None:
+        """运行时观测数据，未开启时为 None。"""
+        return self._instrumentation
+
+    def enable_instrumentation(
+        self,
+        heartbeat_interval: float = 0.1,
+        slow_callback_threshold: float | None = None,
+    ) -> LoopInstrumentation:
+        """
+        开启运行时观测: 心跳测量事件循环延迟、按任务名统计耗时、统计待调度队列深度，
+        可选地开启慢回调检测（会启用 asyncio debug 模式，有额外开销）。
+
+        Args:
+            heartbeat_interval: 心跳间隔（秒）。
+            slow_callback_threshold: 慢回调阈值（秒），None 表示不检测慢回调。
+
+        Returns:
+            LoopInstrumentation，可通过 snapshot() / to_prometheus() 导出观测数据。
+        """
+        if not self.is_running():
+            raise RuntimeError(f"[AsyncLoop {self._name}] not started.")
+        if self._instrumentation is not None:
+            return self._instrumentation
+
+        inst = LoopInstrumentation(
+            self._name, heartbeat_interval, slow_callback_threshold
+        )
+        self._instrumentation = inst
+        self._heartbeat = self.spawn(
+            inst.heartbeat(),
+            name=f"[AsyncLoop {self._name}] heartbeat",
+            policy=SupervisionPolicy.ISOLATE,
+            background=True,
+        )
+        if slow_callback_threshold is not None:
+            self._loop.call_soon_threadsafe(
+                inst.install_slow_callback_detection, self._loop
+            )
+        _logger.debug(f"[AsyncLoop {self._name}] instrumentation enabled.")
+        return inst
+
+    def disable_instrumentation(self) -> None:
+        """关闭运行时观测。"""
+        inst, self._instrumentation = self._instrumentation, None
+        if inst is None:
+            return
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        if self._loop is not None and self.is_running():
+            self._loop.call_soon_threadsafe(
+                inst.uninstall_slow_callback_detection, self._loop
+            )
+        else:
+            inst.uninstall_slow_callback_detection(None)
+
     def start(self, timeout: float = 1.0) -> None:
         """
         启动 AsyncLoop 后台线程和事件循环。
@@ -80,6 +194,29 @@ class AsyncLoop:
 
         _logger.debug(f"[AsyncLoop {self._name}] started.")
 
+    def attach(self) -> None:
+        """
+        挂载到当前线程中正在运行的事件循环，不创建后台线程。
+
+        挂载后 spawn 出来的任务直接运行在调用方的事件循环上；业务任务异常只会传递给对应 Future，
+        不会影响调用方事件循环中的其他任务。
+
+        Raises:
+            RuntimeError: 如果已经在运行，或当前线程没有正在运行的事件循环。
+        """
+        if self.is_running():
+            raise RuntimeError(f"[AsyncLoop {self._name}] already running.")
+
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError as e:
+            raise RuntimeError(
+                f"[AsyncLoop {self._name}] attach() must be called from a running event loop."
+            ) from e
+        self._thread = threading.current_thread()
+        self._attached = True
+        _logger.debug(f"[AsyncLoop {self._name}] attached to running loop.")
+
     def _run(self) -> None:
         """后台线程入口: 初始化事件循环和主任务。"""
         self._loop = asyncio.new_event_loop()
@@ -108,48 +245,171 @@ class AsyncLoop:
             assert self._loop is not None
             self._loop.call_soon_threadsafe(self._loop.stop)
 
-    def spawn(self, coro: Awaitable[Any], name: str = "") -> Future[Any]:
+    def spawn(
+        self,
+        coro: Awaitable[Any] | Callable[[], Awaitable[Any]],
+        name: str = "",
+        policy: SupervisionPolicy = SupervisionPolicy.ESCALATE,
+        backoff: RestartBackoff | None = None,
+        background: bool = False,
+    ) -> Future[Any]:
         """
         在 TaskGroup 中提交一个新的异步任务。
 
         Args:
-            coro: 待执行的 coroutine。
+            coro: 待执行的 coroutine，或返回 coroutine 的工厂函数（RESTART 策略必须传入工厂函数）。
             name: 可选，任务名称，用于日志追踪。
+            policy: 任务异常时的监督策略，默认 ESCALATE（取消整个 TaskGroup）。
+            backoff: RESTART 策略的退避参数，默认使用 RestartBackoff()。
+            background: 是否为长期运行的后台任务（如流读取循环），drain 时不等待而是直接取消。
 
         Returns:
             Future，可通过 .result(timeout) 获取 coroutine 返回值或异常。
         """
-        if not (self._loop and self._task_group):
+        if not (self._loop and (self._task_group or self._attached)):
             raise RuntimeError(f"[AsyncLoop {self._name}] not started.")
 
+        runner = self._supervised(coro, name, policy, backoff)
         outer: Future[Any] = Future()
+        inst = self._instrumentation
+        if inst is not None:
+            inst.record_submit()
 
         def _schedule() -> None:
-            task: asyncio.Task[Any] = self._task_group.create_task(coro, name=name)
+            started = self._on_scheduled(inst)
+            task: asyncio.Task[Any] = (
+                self._loop.create_task(runner, name=name)
+                if self._attached
+                else self._task_group.create_task(runner, name=name)
+            )
             self._business_tasks.add(task)
+            if background:
+                self._background_tasks.add(task)
 
             def _on_done(t: asyncio.Task[Any]) -> None:
                 self._business_tasks.discard(t)
-                if t.cancelled():
-                    outer.cancel()
-                else:
-                    exc = t.exception()
-                    if exc:
-                        _logger.exception(
-                            f"[AsyncLoop {self._name}] Task {name!r} raised: {exc}"
-                        )
-                        outer.set_exception(exc)
-                        # 业务异常直接取消整个主 TaskGroup
-                        assert self._main_task is not None
-                        self._main_task.cancel()
-                    else:
-                        outer.set_result(t.result())
+                self._background_tasks.discard(t)
+                if inst is not None and not t.cancelled():
+                    inst.record_task(name or t.get_name(), self._loop.time() - started)
+                self._settle(outer, t, name)
+
+            def _on_outer_done(f: Future[Any]) -> None:
+                # 调用方取消 Future 时同步取消 loop 内的 task
+                if f.cancelled() and not task.done():
+                    self._loop.call_soon_threadsafe(task.cancel)
 
             task.add_done_callback(_on_done)
+            outer.add_done_callback(_on_outer_done)
 
         self._loop.call_soon_threadsafe(_schedule)
         return outer
 
+    def _on_scheduled(self, inst: LoopInstrumentation | None) -> float:
+        """在 loop 线程中开始调度任务时调用，返回调度时刻。"""
+        if inst is not None:
+            inst.record_scheduled()
+        return self._loop.time()
+
+    def _supervised(
+        self,
+        coro: Awaitable[Any] | Callable[[], Awaitable[Any]],
+        name: str,
+        policy: SupervisionPolicy,
+        backoff: RestartBackoff | None,
+    ) -> Awaitable[Any]:
+        """按监督策略包装待执行的协程。"""
+        if policy is SupervisionPolicy.RESTART:
+            if not callable(coro):
+                if asyncio.iscoroutine(coro):
+                    coro.close()
+                raise TypeError(
+                    f"[AsyncLoop {self._name}] RESTART policy requires a coroutine factory."
+                )
+            return self._run_restart(coro, name, backoff or RestartBackoff())
+
+        awaitable = coro() if callable(coro) else coro
+        if policy is SupervisionPolicy.ISOLATE:
+            return self._run_isolated(awaitable)
+        return awaitable
+
+    def _settle(self, outer: Future[Any], t: asyncio.Task[Any], name: str) -> None:
+        """将 task 的结果传递给 outer Future，并按策略处理异常。"""
+        if t.cancelled():
+            outer.cancel()
+            return
+
+        exc = t.exception()
+        if exc is None:
+            result = t.result()
+            if isinstance(result, _TaskFailure):
+                # ISOLATE / RESTART: 异常只传递给对应 Future
+                _logger.error(
+                    f"[AsyncLoop {self._name}] Task {name!r} raised (isolated): {result.exc}",
+                    exc_info=result.exc,
+                )
+                exc = result.exc
+            elif not outer.done():
+                outer.set_result(result)
+        else:
+            _logger.exception(f"[AsyncLoop {self._name}] Task {name!r} raised: {exc}")
+            # 业务异常直接取消整个主 TaskGroup（挂载模式下不接管调用方的事件循环）
+            if not self._attached:
+                assert self._main_task is not None
+                self._main_task.cancel()
+
+        if exc is not None and not outer.done():
+            outer.set_exception(exc)
+
+    @staticmethod
+    async def _run_isolated(coro: Awaitable[Any]) -> Any:
+        try:
+            return await coro
+        except Exception as e:
+            return _TaskFailure(e)
+
+    async def _run_restart(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        name: str,
+        backoff: RestartBackoff,
+    ) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await factory()
+            except Exception as e:
+                attempt += 1
+                if backoff.exhausted(attempt):
+                    _logger.error(
+                        f"[AsyncLoop {self._name}] Task {name!r} failed after {attempt - 1} restart(s), giving up."
+                    )
+                    return _TaskFailure(e)
+                delay = backoff.delay(attempt)
+                _logger.warning(
+                    f"[AsyncLoop {self._name}] Task {name!r} raised: {e}; restart #{attempt} in {delay:.2f}s."
+                )
+                await asyncio.sleep(delay)
+
+    async def run_in(self, coro: Awaitable[T], name: str = "") -> T:
+        """
+        在本 loop 中执行协程并等待其结果，可在任意事件循环中 await。
+
+        - 调用方已处于本 loop 中: 直接 await，没有额外开销；
+        - 否则: 通过 spawn 跨线程提交，并在调用方的事件循环中等待结果（取消会同步传递到本 loop）。
+
+        Args:
+            coro: 待执行的 coroutine。
+            name: 可选，任务名称，用于日志追踪。
+
+        Returns:
+            coroutine 的返回值。
+        """
+        if asyncio.get_running_loop() is self._loop:
+            return await coro
+        return await asyncio.wrap_future(
+            self.spawn(coro, name=name, policy=SupervisionPolicy.ISOLATE)
+        )
+
     def cancel_tasks(self, timeout: float) -> None:
         """
         取消所有业务协程任务（spawn 出来的 task，不包括主协程）。
@@ -160,12 +420,24 @@ class AsyncLoop:
         if not self.is_running():
             return
 
+        if threading.current_thread() is self._thread:
+            # 挂载模式下在事件循环线程内调用: 无法阻塞等待，仅发出取消请求
+            for task in list(self._business_tasks):
+                task.cancel()
+            return
+
         future = asyncio.run_coroutine_threadsafe(self._cancel_tasks_seq(), self._loop)
         try:
             future.result(timeout)
         except FutureTimeoutError:
             _logger.warning(f"[AsyncLoop {self._name}] cancel_tasks timeout.")
 
+    async def async_cancel_tasks(self) -> None:
+        """
+        取消所有业务协程任务（异步接口），必须在本 loop 所在的事件循环中调用。
+        """
+        await self._cancel_tasks_seq()
+
     async def _cancel_tasks_seq(self) -> None:
         """
         在 loop 线程中取消所有已 spawn 的业务任务。
@@ -182,6 +454,69 @@ class AsyncLoop:
 
         await asyncio.gather(*tasks, return_exceptions=True)
         self._business_tasks.clear()
+        self._background_tasks.clear()
+
+    def drain(self, timeout: float) -> Future[DrainReport]:
+        """
+        有界地排空业务任务: 在 timeout 秒内等待在途任务（包括排空期间新派生的任务）完成，
+        截止后取消仍未完成的任务和所有后台任务。不会停止 loop。
+
+        返回 Future 而不阻塞，便于同时排空多个 loop；挂载模式请使用 `async_drain`。
+
+        Args:
+            timeout: 等待在途任务完成的最长秒数，0 表示立即取消。
+
+        Returns:
+            Future[DrainReport]: drain 的结果。
+        """
+        if not self.is_running():
+            outer: Future[DrainReport] = Future()
+            outer.set_result(DrainReport(loop=self._name))
+            return outer
+        return asyncio.run_coroutine_threadsafe(self._drain_seq(timeout), self._loop)
+
+    async def async_drain(self, timeout: float) -> DrainReport:
+        """
+        drain 的异步接口，必须在本 loop 所在的事件循环中调用。
+        """
+        return await self._drain_seq(timeout)
+
+    async def _drain_seq(self, timeout: float) -> DrainReport:
+        """在 loop 线程中等待在途任务完成，截止后取消剩余任务。"""
+        report = DrainReport(loop=self._name)
+        started = time.perf_counter()
+        deadline = self._loop.time() + max(timeout, 0.0)
+        current = asyncio.current_task()
+
+        def _in_flight() -> set[asyncio.Task[Any]]:
+            return {
+                t
+                for t in self._business_tasks
+                if t is not current and not t.done() and t not in self._background_tasks
+            }
+
+        pending = _in_flight()
+        while pending and (remaining := deadline - self._loop.time()) > 0:
+            done, _ = await asyncio.wait(pending, timeout=remaining)
+            report.completed += len(done)
+            pending = _in_flight()
+
+        background = {
+            t for t in self._background_tasks if t is not current and not t.done()
+        }
+        report.cut_off = sorted(t.get_name() for t in pending)
+        report.background_cancelled = len(background)
+        for task in pending | background:
+            task.cancel()
+        if pending or background:
+            await asyncio.wait(pending | background, timeout=_CANCEL_GRACE)
+
+        report.elapsed = time.perf_counter() - started
+        if report.cut_off:
+            _logger.warning(
+                f"[AsyncLoop {self._name}] drain cut off {len(report.cut_off)} task(s): {report.cut_off}"
+            )
+        return report
 
     def stop(self, timeout: float = 5.0) -> None:
         """
@@ -191,6 +526,16 @@ class AsyncLoop:
         Args:
             timeout: 等待整个关闭过程的最长秒数。
         """
+        self.disable_instrumentation()
+
+        if self._attached:
+            # 挂载模式: 事件循环归调用方所有，只取消本 loop spawn 出来的任务并解除挂载
+            self.cancel_tasks(timeout)
+            self._attached = False
+            self._thread = None
+            _logger.debug(f"[AsyncLoop {self._name}] detached.")
+            return
+
         if not self.is_running():
             return
 
@@ -210,13 +555,15 @@ class AsyncLoop:
         Returns:
             True if loop thread alive, else False.
         """
+        if self._attached:
+            return bool(self._loop and not self._loop.is_closed())
         return bool(self._thread and self._thread.is_alive())
 
     def log_task_list(self) -> None:
         """
         打印当前 loop 内所有未完成的任务信息，便于调试。
         """
-        if not (self._loop and self._task_group):
+        if not (self._loop and (self._task_group or self._attached)):
             return
         task_list = asyncio.all_tasks(self._loop)
         _logger.warning(f"[AsyncLoop {self._name}] {len(task_list)} active task(s):")
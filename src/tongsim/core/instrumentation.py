@@ -0,0 +1,278 @@
+"""
+core.instrumentation
+
+AsyncLoop 的可选运行时观测（默认关闭，通过 `AsyncLoop.enable_instrumentation()` 开启）:
+- 事件循环延迟: 周期性心跳协程测量实际唤醒时间与预期时间的偏差；
+- 任务耗时: 按任务名称统计 spawn 出来的任务从调度到完成的墙钟时间；
+- 待调度队列深度: 已 spawn 但尚未在 loop 线程中开始调度的任务数；
+- 慢回调检测: 借助 asyncio debug 模式记录单次执行超过阈值的回调。
+
+统计结果可通过 `snapshot()` 获取进程内快照，或通过 `to_prometheus()` 导出为 Prometheus 文本格式。
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+__all__ = ["LoopInstrumentation", "TaskTiming", "to_prometheus"]
+
+
+@dataclass(slots=True)
+class TaskTiming:
+    """
+    同名任务的耗时统计（单位: 秒）。
+
+    Attributes:
+        count (int): 完成次数。
+        total (float): 累计耗时。
+        max (float): 最大耗时。
+        last (float): 最近一次耗时。
+    """
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+
+@dataclass(slots=True)
+class _LagStats:
+    samples: int = 0
+    last: float = 0.0
+    max: float = 0.0
+    total: float = 0.0
+    recent: deque[float] = field(default_factory=lambda: deque(maxlen=128))
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """拦截 asyncio debug 模式输出的慢回调日志，只统计指定线程中的事件循环。"""
+
+    def __init__(self, instrumentation: "LoopInstrumentation", thread_id: int):
+        super().__init__(level=logging.WARNING)
+        self._instrumentation = instrumentation
+        self._thread_id = thread_id
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.thread != self._thread_id:
+            return
+        if not str(record.msg).startswith("Executing"):
+            return
+        self._instrumentation.record_slow_callback(record.getMessage())
+
+
+class LoopInstrumentation:
+    """
+    单个 AsyncLoop 的观测数据。
+
+    除 `record_submit` 可在任意线程调用外，其余 record_* 方法均在 loop 线程中调用。
+    """
+
+    def __init__(
+        self,
+        loop_name: str,
+        heartbeat_interval: float = 0.1,
+        slow_callback_threshold: float | None = None,
+    ):
+        """
+        Args:
+            loop_name (str): 所属 AsyncLoop 的名称，作为 Prometheus 的 loop 标签。
+            heartbeat_interval (float): 心跳间隔（秒）。
+            slow_callback_threshold (float | None): 慢回调阈值（秒），None 表示不检测慢回调。
+        """
+        self._loop_name = loop_name
+        self._heartbeat_interval = heartbeat_interval
+        self._slow_callback_threshold = slow_callback_threshold
+        self._lag = _LagStats()
+        self._tasks: dict[str, TaskTiming] = {}
+        self._submit_lock = threading.Lock()
+        self._submitted: int = 0
+        self._scheduled: int = 0
+        self._slow_callbacks: int = 0
+        self._recent_slow_callbacks: deque[str] = deque(maxlen=20)
+        self._slow_handler: _SlowCallbackHandler | None = None
+        self._started_at: float = time.monotonic()
+
+    @property
+    def loop_name(self) -> str:
+        return self._loop_name
+
+    @property
+    def heartbeat_interval(self) -> float:
+        return self._heartbeat_interval
+
+    @property
+    def slow_callback_threshold(self) -> float | None:
+        return self._slow_callback_threshold
+
+    @property
+    def pending_callbacks(self) -> int:
+        """已 spawn 但尚未在 loop 线程中开始调度的任务数。"""
+        with self._submit_lock:
+            return self._submitted - self._scheduled
+
+    # ---------- 记录 ----------
+
+    def record_submit(self) -> None:
+        with self._submit_lock:
+            self._submitted += 1
+
+    def record_scheduled(self) -> None:
+        with self._submit_lock:
+            self._scheduled += 1
+
+    def record_task(self, name: str, seconds: float) -> None:
+        timing = self._tasks.get(name)
+        if timing is None:
+            timing = self._tasks[name] = TaskTiming()
+        timing.add(seconds)
+
+    def record_lag(self, seconds: float) -> None:
+        lag = self._lag
+        lag.samples += 1
+        lag.last = seconds
+        lag.total += seconds
+        lag.recent.append(seconds)
+        if seconds > lag.max:
+            lag.max = seconds
+
+    def record_slow_callback(self, description: str) -> None:
+        self._slow_callbacks += 1
+        self._recent_slow_callbacks.append(description)
+
+    # ---------- 生命周期 ----------
+
+    async def heartbeat(self) -> None:
+        """心跳协程: 测量 sleep 的实际唤醒时间与预期时间之差作为事件循环延迟。"""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._heartbeat_interval
+            await asyncio.sleep(self._heartbeat_interval)
+            self.record_lag(max(loop.time() - expected, 0.0))
+
+    def install_slow_callback_detection(self, loop: asyncio.AbstractEventLoop) -> None:
+        """开启 asyncio debug 模式并注册慢回调日志拦截，必须在 loop 线程中调用。"""
+        if self._slow_callback_threshold is None or self._slow_handler is not None:
+            return
+        loop.set_debug(True)
+        loop.slow_callback_duration = self._slow_callback_threshold
+        self._slow_handler = _SlowCallbackHandler(self, threading.get_ident())
+        logging.getLogger("asyncio").addHandler(self._slow_handler)
+
+    def uninstall_slow_callback_detection(
+        self, loop: asyncio.AbstractEventLoop | None
+    ) -> None:
+        """关闭慢回调检测，必须在 loop 线程中调用（loop 已关闭时可在任意线程调用）。"""
+        if self._slow_handler is None:
+            return
+        logging.getLogger("asyncio").removeHandler(self._slow_handler)
+        self._slow_handler = None
+        if loop is not None and not loop.is_closed():
+            loop.set_debug(False)
+
+    # ---------- 导出 ----------
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        获取当前观测数据的快照。
+
+        Returns:
+            dict[str, Any]: 包含以下字段:
+                - loop (str): loop 名称
+                - uptime (float): 开启观测至今的秒数
+                - lag (dict): last / max / mean / p99 / samples，单位秒
+                - pending_callbacks (int): 待调度队列深度
+                - slow_callbacks (int): 慢回调次数
+                - recent_slow_callbacks (list[str]): 最近的慢回调描述
+                - tasks (dict[str, dict]): 按任务名的耗时统计（count / total / max / last）
+        """
+        lag = self._lag
+        recent = sorted(lag.recent)
+        p99 = recent[min(len(recent) - 1, int(len(recent) * 0.99))] if recent else 0.0
+        return {
+            "loop": self._loop_name,
+            "uptime": time.monotonic() - self._started_at,
+            "lag": {
+                "last": lag.last,
+                "max": lag.max,
+                "mean": lag.total / lag.samples if lag.samples else 0.0,
+                "p99": p99,
+                "samples": lag.samples,
+            },
+            "pending_callbacks": self.pending_callbacks,
+            "slow_callbacks": self._slow_callbacks,
+            "recent_slow_callbacks": list(self._recent_slow_callbacks),
+            "tasks": {name: asdict(t) for name, t in list(self._tasks.items())},
+        }
+
+    def to_prometheus(self) -> str:
+        """导出为 Prometheus 文本格式。"""
+        return to_prometheus([self])
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_PROMETHEUS_METRICS: tuple[tuple[str, str, str], ...] = (
+    ("tongsim_loop_lag_seconds", "gauge", "Last measured event loop lag."),
+    ("tongsim_loop_lag_max_seconds", "gauge", "Max measured event loop lag."),
+    ("tongsim_loop_pending_callbacks", "gauge", "Spawned tasks not yet scheduled."),
+    ("tongsim_loop_slow_callbacks_total", "counter", "Slow callbacks detected."),
+    ("tongsim_task_duration_seconds", "summary", "Wall time of spawned tasks."),
+)
+
+
+def to_prometheus(instrumentations: Iterable[LoopInstrumentation]) -> str:
+    """
+    将多个 LoopInstrumentation 的观测数据合并导出为 Prometheus 文本格式。
+
+    Args:
+        instrumentations (Iterable[LoopInstrumentation]): 观测对象集合。
+
+    Returns:
+        str: Prometheus exposition 文本。
+    """
+    snapshots = [inst.snapshot() for inst in instrumentations]
+    samples: dict[str, list[str]] = {name: [] for name, _, _ in _PROMETHEUS_METRICS}
+
+    for snap in snapshots:
+        loop = _escape_label(snap["loop"])
+        samples["tongsim_loop_lag_seconds"].append(
+            f'tongsim_loop_lag_seconds{{loop="{loop}"}} {snap["lag"]["last"]}'
+        )
+        samples["tongsim_loop_lag_max_seconds"].append(
+            f'tongsim_loop_lag_max_seconds{{loop="{loop}"}} {snap["lag"]["max"]}'
+        )
+        samples["tongsim_loop_pending_callbacks"].append(
+            f'tongsim_loop_pending_callbacks{{loop="{loop}"}} {snap["pending_callbacks"]}'
+        )
+        samples["tongsim_loop_slow_callbacks_total"].append(
+            f'tongsim_loop_slow_callbacks_total{{loop="{loop}"}} {snap["slow_callbacks"]}'
+        )
+        for task_name, timing in snap["tasks"].items():
+            labels = f'loop="{loop}",task="{_escape_label(task_name)}"'
+            samples["tongsim_task_duration_seconds"].extend(
+                (
+                    f"tongsim_task_duration_seconds_sum{{{labels}}} {timing['total']}",
+                    f"tongsim_task_duration_seconds_count{{{labels}}} {timing['count']}",
+                )
+            )
+
+    lines: list[str] = []
+    for name, metric_type, help_text in _PROMETHEUS_METRICS:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.extend(samples[name])
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,155 @@
+"""
+core.offload
+
+OffloadExecutor: WorldContext 持有的专用计算池，用于把解码等计算密集的工作移出 AsyncLoop 线程。
+
+- thread: 线程池，开销小，适合释放 GIL 或以 I/O / C 扩展为主的工作；
+- process: 进程池，可真正并行执行纯 Python 计算，但参数与返回值需要 pickle，函数必须可在模块级导入。
+
+同时统计提交数、完成数、在途数（队列深度）、排队等待时间与执行耗时。
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+from tongsim.logger import get_logger
+
+__all__ = ["OffloadExecutor", "OffloadKind"]
+
+_logger = get_logger("core")
+
+T = TypeVar("T")
+
+OffloadKind = Literal["thread", "process"]
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> tuple[float, float, T]:
+    """
+    在工作线程 / 进程中执行 fn，并返回 (开始时刻, 执行耗时, 结果)。
+
+    定义在模块级别以便在进程池中 pickle。开始时刻使用 time.time()，可跨进程比较。
+    """
+    started = time.time()
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return started, time.perf_counter() - t0, result
+
+
+class OffloadExecutor:
+    """
+    可配置的线程 / 进程计算池，带基础指标统计。
+    """
+
+    def __init__(
+        self,
+        kind: OffloadKind = "thread",
+        max_workers: int | None = None,
+        name: str = "tongsim-offload",
+    ):
+        """
+        Args:
+            kind (OffloadKind): "thread" 或 "process"。
+            max_workers (int | None): 最大工作者数量，None 使用 concurrent.futures 的默认值。
+            name (str): 线程名前缀，便于调试。
+        """
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown offload kind: {kind!r}")
+        self._kind: OffloadKind = kind
+        self._name = name
+        self._executor: Executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+            if kind == "thread"
+            else ProcessPoolExecutor(max_workers=max_workers)
+        )
+        self._max_workers: int = self._executor._max_workers  # noqa: SLF001
+        self._lock = threading.Lock()
+        self._submitted: int = 0
+        self._completed: int = 0
+        self._failed: int = 0
+        self._busy_seconds: float = 0.0
+        self._queue_wait_seconds: float = 0.0
+        self._max_queue_wait: float = 0.0
+        self._is_shutdown: bool = False
+
+    @property
+    def kind(self) -> OffloadKind:
+        return self._kind
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def in_flight(self) -> int:
+        """已提交但尚未完成的任务数（包含排队中与执行中）。"""
+        with self._lock:
+            return self._submitted - self._completed - self._failed
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        在计算池中执行 fn(*args)，并在当前事件循环中等待结果。
+
+        Args:
+            fn (Callable): 待执行的函数；process 模式下必须可 pickle。
+            *args: 位置参数；process 模式下必须可 pickle。
+
+        Returns:
+            T: fn 的返回值。
+        """
+        if self._is_shutdown:
+            raise RuntimeError(f"[OffloadExecutor {self._name}] already shut down.")
+
+        with self._lock:
+            self._submitted += 1
+        submitted_at = time.time()
+        try:
+            started, elapsed, result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _timed_call, fn, *args
+            )
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+
+        queue_wait = max(started - submitted_at, 0.0)
+        with self._lock:
+            self._completed += 1
+            self._busy_seconds += elapsed
+            self._queue_wait_seconds += queue_wait
+            if queue_wait > self._max_queue_wait:
+                self._max_queue_wait = queue_wait
+        return result
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        获取计算池的指标快照。
+
+        Returns:
+            dict[str, Any]: 包含 kind / max_workers / submitted / completed / failed /
+                in_flight / busy_seconds / queue_wait_seconds / max_queue_wait_seconds。
+        """
+        with self._lock:
+            done = self._completed
+            return {
+                "kind": self._kind,
+                "max_workers": self._max_workers,
+                "submitted": self._submitted,
+                "completed": done,
+                "failed": self._failed,
+                "in_flight": self._submitted - done - self._failed,
+                "busy_seconds": self._busy_seconds,
+                "queue_wait_seconds": self._queue_wait_seconds,
+                "max_queue_wait_seconds": self._max_queue_wait,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """关闭计算池，取消尚未开始执行的任务。"""
+        if self._is_shutdown:
+            return
+        self._is_shutdown = True
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        _logger.debug(f"[OffloadExecutor {self._name}] shut down.")
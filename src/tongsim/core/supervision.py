@@ -0,0 +1,62 @@
+"""
+core.supervision
+
+定义 AsyncLoop 业务任务的监督策略:
+- ESCALATE: 任务异常时取消整个 TaskGroup（AsyncLoop.spawn 的默认行为）；
+- ISOLATE: 任务异常只传递给对应 Future，不影响同一 loop 中的其他任务；
+- RESTART: 任务异常后按退避策略重新创建并运行，重启次数耗尽后按 ISOLATE 处理。
+"""
+
+import random
+from dataclasses import dataclass
+from enum import Enum
+
+__all__ = ["RestartBackoff", "SupervisionPolicy"]
+
+
+class SupervisionPolicy(Enum):
+    """
+    业务任务异常时的处理策略。
+
+    Attributes:
+        ESCALATE: 异常上升到 AsyncLoop，取消整个 TaskGroup。
+        ISOLATE: 异常只传递给对应 Future。
+        RESTART: 异常后按 RestartBackoff 重启任务，需要传入协程工厂函数。
+    """
+
+    ESCALATE = "escalate"
+    ISOLATE = "isolate"
+    RESTART = "restart"
+
+
+@dataclass(frozen=True, slots=True)
+class RestartBackoff:
+    """
+    RESTART 策略的指数退避参数。
+
+    Attributes:
+        initial (float): 首次重启前的等待秒数。
+        maximum (float): 单次等待的上限秒数。
+        factor (float): 每次重启后等待时间的倍率。
+        jitter (float): 随机抖动比例，0.1 表示在 ±10% 范围内抖动，避免多个流同时重连。
+        max_restarts (int | None): 最大重启次数，None 表示不限次数。
+    """
+
+    initial: float = 0.5
+    maximum: float = 10.0
+    factor: float = 2.0
+    jitter: float = 0.1
+    max_restarts: int | None = None
+
+    def delay(self, attempt: int) -> float:
+        """
+        计算第 attempt 次（从 1 开始）重启前的等待秒数。
+        """
+        base = min(self.maximum, self.initial * self.factor ** max(attempt - 1, 0))
+        if self.jitter:
+            base *= 1 + random.uniform(-self.jitter, self.jitter)
+        return max(base, 0.0)
+
+    def exhausted(self, attempt: int) -> bool:
+        """第 attempt 次重启是否已超出最大重启次数。"""
+        return self.max_restarts is not None and attempt > self.max_restarts
@@ -4,24 +4,101 @@ core.world_context
 定义 WorldContext: 管理与单个 TongSim 实例绑定的底层资源，
 包括异步事件循环、gRPC 通信等。
 
+两种运行模式:
+- 默认模式: 创建独立的 AsyncLoop 线程，同步代码通过 sync_run 跨线程提交协程；
+- 挂载模式: 通过 `await WorldContext.attach_to_running_loop(...)` 创建，
+  gRPC 通道直接绑定调用方正在运行的事件循环，async_* 接口可直接 await，无线程切换。
+
+多 loop 分片（仅默认模式）:
+    `WorldContext(..., loops=N)` 额外启动 N-1 个 AsyncLoop，每个 loop 持有独立的 GrpcConnection 通道。
+    按实体 id 的稳定哈希将实体的流（动画、相机、体素等）固定到某个 loop 上，
+    分摊多智能体场景下的 protobuf 解码压力；全局资源（PG、Legacy 连接）仍在主 loop 上。
+
+计算池:
+    WorldContext 持有一个专用计算池（线程池或进程池），通过 `await context.offload(fn, *args)`
+    将 PG 解码、体素解码等计算密集工作移出事件循环线程。
+
+任务监督:
+    sync_run 与 async_task 默认使用 ISOLATE 策略，单个任务异常不会取消同一 loop 中的其他任务；
+    长期运行的流可以使用 RESTART 策略在异常后自动重启。
+
+就绪检查:
+    `WorldContext(..., ready_timeout=...)` 在构造时等待通道连接就绪并发起一次健康 RPC，
+    UE 不可达时立即抛出 ConnectionError，而不是等到第一个业务 RPC 超时；
+    `probe_health()` 可随时探测 UE 的健康状态与往返延迟。
+
+优雅关闭:
+    `release(drain_timeout=...)` 先拒绝新的提交，在截止时间内等待在途 RPC 与流写入完成，
+    再刷新 Legacy 双向流、关闭 gRPC 通道并停止事件循环，返回 ReleaseReport 说明哪些任务被截断。
+
 """
 
+import asyncio
+import contextlib
 import threading
+import time
 import uuid
-from collections.abc import Awaitable
+import zlib
+from collections.abc import Awaitable, Callable, Iterable
 from concurrent.futures import Future
-from typing import Any, Final
+from dataclasses import dataclass, field
+from typing import Any, Final, TypeVar
 
 from tongsim.connection.grpc import (
+    CallPolicy,
+    ChannelOptions,
     GrpcConnection,
     GrpcLegacyConnection,
+    HealthReport,
     LegacyStreamClient,
+    deadline,
+    probe_health,
 )
-from tongsim.core import AsyncLoop
+from tongsim.core import AsyncLoop, DrainReport, RestartBackoff, SupervisionPolicy
+from tongsim.core.instrumentation import to_prometheus
+from tongsim.core.offload import OffloadExecutor, OffloadKind
 from tongsim.logger import get_logger
 
 _logger = get_logger("world")
 
+T = TypeVar("T")
+
+# 关闭单个 gRPC 通道 / 刷新 Legacy 双向流的最长等待秒数
+_CLOSE_TIMEOUT = 1.0
+
+
+@dataclass(slots=True)
+class ReleaseReport:
+    """
+    WorldContext.release / arelease 的结果汇总。
+
+    Attributes:
+        drains (list[DrainReport]): 每个事件循环的 drain 结果。
+        legacy_flushed (bool): Legacy 双向流是否已刷新并关闭写入端（从未打开时视为 True）。
+        errors (list[str]): 关闭通道等步骤中出现的错误。
+        elapsed (float): 释放总耗时（秒）。
+    """
+
+    drains: list[DrainReport] = field(default_factory=list)
+    legacy_flushed: bool = False
+    errors: list[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def completed(self) -> int:
+        """截止时间内完成的在途任务数。"""
+        return sum(d.completed for d in self.drains)
+
+    @property
+    def cut_off(self) -> list[str]:
+        """被截断（取消）的在途任务名称。"""
+        return [name for d in self.drains for name in d.cut_off]
+
+    @property
+    def clean(self) -> bool:
+        """是否没有任务被截断且没有出错。"""
+        return not self.cut_off and not self.errors and self.legacy_flushed
+
 
 class WorldContext:
     """
@@ -33,10 +110,41 @@ class WorldContext:
 
     注意:
         - 析构时自动关闭所有资源。
+        - 挂载模式下请使用 `await context.arelease()` 释放资源。
     """
 
-    def __init__(self, grpc_endpoint: str, legacy_grpc_endpoint: str):
+    def __init__(
+        self,
+        grpc_endpoint: str,
+        legacy_grpc_endpoint: str,
+        loops: int = 1,
+        offload_kind: OffloadKind = "thread",
+        offload_workers: int | None = None,
+        channel_options: ChannelOptions | None = None,
+        ready_timeout: float | None = None,
+    ):
+        """
+        Args:
+            grpc_endpoint (str): gRPC 服务器地址，如 "localhost:5056"
+            legacy_grpc_endpoint (str): 废弃的 gRPC 服务器地址，如 "localhost:50052"
+            loops (int): 事件循环数量，默认 1。大于 1 时按实体 id 将实体的流分片到多个 loop 上。
+            offload_kind (OffloadKind): 计算池类型，"thread"（默认）或 "process"。
+            offload_workers (int | None): 计算池工作者数量，None 使用默认值。
+            channel_options (ChannelOptions | None): gRPC 通道参数（消息大小、keepalive、流控窗口、媒体通道数等）。
+            ready_timeout (float | None): 构造时等待 UE 就绪并通过健康检查的最长秒数，None（默认）表示不检查。
+
+        Raises:
+            ConnectionError: 设置了 ready_timeout 且 UE 在超时前不可达或健康检查失败。
+        """
+        if loops < 1:
+            raise ValueError(f"loops must be >= 1, got {loops}.")
+
         self._uuid: Final[uuid.UUID] = uuid.uuid4()
+        self._is_shutdown: bool = True
+        self._is_draining: bool = False
+        self._offload: Final[OffloadExecutor] = OffloadExecutor(
+            offload_kind, offload_workers, name=f"world-offload-{self.uuid}"
+        )
         self._loop: Final[AsyncLoop] = AsyncLoop(name=f"world-main-loop-{self._uuid}")
         self._loop.start()
 
@@ -45,17 +153,108 @@ class WorldContext:
         self._legacy_stream_client: Final[LegacyStreamClient]
 
         # gRPC 会检查 task 的 loop 一致性, 此处保证 gRPC stub 的初始化都在 AsyncLoop 下:
-        self.sync_run(self._async_init_grpc(grpc_endpoint, legacy_grpc_endpoint))
+        self.sync_run(
+            self._async_init_grpc(grpc_endpoint, legacy_grpc_endpoint, channel_options)
+        )
+
+        # 分片 loop: 下标 0 即主 loop，其余 loop 各自在自己的线程内创建 gRPC 通道
+        self._shard_loops: Final[list[AsyncLoop]] = [self._loop]
+        self._shard_conns: Final[list[GrpcConnection]] = [self._conn]
+        for i in range(1, loops):
+            shard_loop = AsyncLoop(name=f"world-shard-loop-{i}-{self._uuid}")
+            shard_loop.start()
+            self._shard_loops.append(shard_loop)
+            self._shard_conns.append(
+                shard_loop.spawn(
+                    self._async_create_conn(grpc_endpoint, channel_options),
+                    name=f"[World-Context {self.uuid} shard {i} init]",
+                ).result()
+            )
+
+        _logger.debug(f"[WorldContext {self._uuid}] started with {loops} loop(s).")
+        self._is_shutdown = False
+
+        if ready_timeout is not None:
+            report = self.probe_health(ready_timeout)
+            if not report.healthy:
+                self.release()
+                raise self._unhealthy_error(report)
+
+    @classmethod
+    async def attach_to_running_loop(
+        cls,
+        grpc_endpoint: str,
+        legacy_grpc_endpoint: str,
+        offload_kind: OffloadKind = "thread",
+        offload_workers: int | None = None,
+        channel_options: ChannelOptions | None = None,
+        ready_timeout: float | None = None,
+    ) -> "WorldContext":
+        """
+        以挂载模式创建 WorldContext: 复用调用方正在运行的事件循环，不再启动 AsyncLoop 线程。
+
+        挂载模式下所有 async_* 接口可以直接 await，省去 sync_run 的跨线程提交与阻塞等待；
+        在该事件循环线程内调用 sync_run 会抛出 RuntimeError。
 
-        _logger.debug(f"[WorldContext {self._uuid}] started.")
-        self._is_shutdown: bool = False
+        Args:
+            grpc_endpoint (str): gRPC 服务器地址，如 "localhost:5056"
+            legacy_grpc_endpoint (str): 废弃的 gRPC 服务器地址，如 "localhost:50052"
+            offload_kind (OffloadKind): 计算池类型，"thread"（默认）或 "process"。
+            offload_workers (int | None): 计算池工作者数量，None 使用默认值。
+            channel_options (ChannelOptions | None): gRPC 通道参数。
+            ready_timeout (float | None): 等待 UE 就绪并通过健康检查的最长秒数，None（默认）表示不检查。
+
+        Returns:
+            WorldContext: 绑定到当前事件循环的上下文。
+
+        Raises:
+            ConnectionError: 设置了 ready_timeout 且 UE 在超时前不可达或健康检查失败。
+        """
+        self = cls.__new__(cls)
+        self._uuid = uuid.uuid4()
+        self._offload = OffloadExecutor(
+            offload_kind, offload_workers, name=f"world-offload-{self.uuid}"
+        )
+        self._loop = AsyncLoop(name=f"world-attached-loop-{self._uuid}")
+        self._is_shutdown = True
+        self._is_draining = False
+        self._loop.attach()
+
+        await self._async_init_grpc(
+            grpc_endpoint, legacy_grpc_endpoint, channel_options
+        )
+        self._shard_loops = [self._loop]
+        self._shard_conns = [self._conn]
+
+        _logger.debug(f"[WorldContext {self._uuid}] attached to running loop.")
+        self._is_shutdown = False
+
+        if ready_timeout is not None:
+            report = await self.async_probe_health(ready_timeout)
+            if not report.healthy:
+                await self.arelease()
+                raise self._unhealthy_error(report)
+        return self
 
     # TODO: classmethod
-    async def _async_init_grpc(self, grpc_endpoint: str, legacy_grpc_endpoint: str):
-        self._conn = GrpcConnection(grpc_endpoint)
-        self._conn_legacy = GrpcLegacyConnection(legacy_grpc_endpoint)
+    async def _async_init_grpc(
+        self,
+        grpc_endpoint: str,
+        legacy_grpc_endpoint: str,
+        channel_options: ChannelOptions | None = None,
+    ):
+        self._conn = GrpcConnection(grpc_endpoint, channel_options=channel_options)
+        self._conn_legacy = GrpcLegacyConnection(
+            legacy_grpc_endpoint, channel_options=channel_options
+        )
+        # 双向流延迟到首次写入时再打开（见 LegacyStreamClient.write）
         self._legacy_stream_client = LegacyStreamClient(self._conn_legacy, self._loop)
-        await self._legacy_stream_client.start()
+
+    @staticmethod
+    async def _async_create_conn(
+        grpc_endpoint: str, channel_options: ChannelOptions | None = None
+    ) -> GrpcConnection:
+        return GrpcConnection(grpc_endpoint, channel_options=channel_options)
 
     @property
     def uuid(self) -> str:
@@ -67,6 +266,34 @@ class WorldContext:
         """主事件循环"""
         return self._loop
 
+    @property
+    def num_loops(self) -> int:
+        """事件循环（分片）数量"""
+        return len(self._shard_loops)
+
+    def _shard_index(self, shard_key: str | None) -> int:
+        if shard_key is None or len(self._shard_loops) == 1:
+            return 0
+        # 使用 crc32 而非内置 hash，保证同一实体在不同进程中落到同一分片
+        return zlib.crc32(shard_key.encode()) % len(self._shard_loops)
+
+    def loop_for(self, shard_key: str | None = None) -> AsyncLoop:
+        """
+        获取分片键（通常为实体 id）对应的事件循环；shard_key 为 None 时返回主 loop。
+        """
+        return self._shard_loops[self._shard_index(shard_key)]
+
+    def conn_for(self, shard_key: str | None = None) -> GrpcConnection:
+        """
+        获取分片键（通常为实体 id）对应的 gRPC 连接，该连接只能在 `loop_for(shard_key)` 上使用。
+        """
+        return self._shard_conns[self._shard_index(shard_key)]
+
+    @property
+    def is_attached(self) -> bool:
+        """是否以挂载模式运行在调用方的事件循环上"""
+        return self._loop.is_attached
+
     @property
     def conn(self) -> GrpcConnection:
         """gRPC 连接"""
@@ -79,72 +306,426 @@ class WorldContext:
 
     @property
     def legacy_stream_client(self) -> LegacyStreamClient:
-        """弃用的 gRPC 双向流客户端"""
-        # if self._legacy_stream_client is None:
-        #     with self._legacy_stream_client_lock:
-        #         if self._legacy_stream_client is None:
-        #             self._legacy_stream_client = LegacyStreamClient(
-        #                 self._conn_legacy, self._loop
-        #             )
-        #             self.sync_run(self._legacy_stream_client.start())
+        """弃用的 gRPC 双向流客户端，双向流在首次写入时打开"""
         return self._legacy_stream_client
 
-    def sync_run(self, coro: Awaitable, timeout: float | None = None) -> Any:
+    async def offload(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        将计算密集的函数提交到 WorldContext 专用计算池中执行，避免阻塞事件循环。
+
+        Args:
+            fn (Callable): 待执行的函数；process 模式下函数与参数必须可 pickle。
+            *args: 位置参数。
+
+        Returns:
+            T: fn 的返回值。
+        """
+        return await self._offload.run(fn, *args)
+
+    def offload_stats(self) -> dict[str, Any]:
+        """
+        获取计算池的规模与队列指标，见 `OffloadExecutor.snapshot()`。
+        """
+        return self._offload.snapshot()
+
+    def enable_instrumentation(
+        self,
+        heartbeat_interval: float = 0.1,
+        slow_callback_threshold: float | None = None,
+    ) -> None:
+        """
+        为所有事件循环开启运行时观测（事件循环延迟、任务耗时、待调度队列深度、慢回调）。
+
+        Args:
+            heartbeat_interval (float): 心跳间隔（秒）。
+            slow_callback_threshold (float | None): 慢回调阈值（秒），None 表示不检测慢回调。
+        """
+        for loop in self._shard_loops:
+            loop.enable_instrumentation(heartbeat_interval, slow_callback_threshold)
+
+    def loop_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        获取所有已开启观测的事件循环的统计快照。
+
+        Returns:
+            dict[str, dict[str, Any]]: loop 名称 -> `LoopInstrumentation.snapshot()`。
+        """
+        return {
+            loop.name: loop.instrumentation.snapshot()
+            for loop in self._shard_loops
+            if loop.instrumentation is not None
+        }
+
+    def loop_stats_prometheus(self) -> str:
+        """
+        将所有已开启观测的事件循环的统计数据导出为 Prometheus 文本格式。
+        """
+        return to_prometheus(
+            loop.instrumentation
+            for loop in self._shard_loops
+            if loop.instrumentation is not None
+        )
+
+    def set_call_policy(self, key: str, policy: CallPolicy | None) -> None:
+        """
+        为所有 gRPC 连接（包括分片连接与 Legacy 连接）设置某个服务 / 方法的默认调用策略。
+
+        Args:
+            key (str): "SceneService"、"SceneService/Step"、完整服务名或 "*"。
+            policy (CallPolicy | None): 调用策略，None 表示移除。
+        """
+        for conn in (*self._shard_conns, self._conn_legacy):
+            conn.set_call_policy(key, policy)
+
+    def rpc_stats(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        获取各 gRPC 连接按方法统计的调用指标（调用次数、失败、DEADLINE_EXCEEDED 次数、耗时等）。
+
+        Returns:
+            dict[str, dict[str, dict[str, Any]]]: {loop 名称 或 "legacy": {"Service/Method": 统计}}。
+        """
+        stats = {
+            loop.name: conn.metrics.snapshot()
+            for loop, conn in zip(self._shard_loops, self._shard_conns, strict=True)
+        }
+        stats["legacy"] = self._conn_legacy.metrics.snapshot()
+        return stats
+
+    def probe_health(self, timeout: float = 1.0) -> HealthReport:
+        """
+        探测 UE 是否可达且能够响应: 等待通道就绪后发起一次轻量 RPC，并记录往返延迟。
+
+        Args:
+            timeout (float): 等待就绪与健康 RPC 的总预算（秒）。
+
+        Returns:
+            HealthReport: 探测结果，包括 ready / healthy / latency / fps。
+        """
+        return self.sync_run(self.async_probe_health(timeout))
+
+    async def async_probe_health(self, timeout: float = 1.0) -> HealthReport:
+        """
+        probe_health 的异步版本，需在主事件循环中调用（挂载模式下可直接 await）。
+        """
+        return await probe_health(self._conn, timeout)
+
+    def latency_stats(self) -> dict[str, Any]:
+        """
+        获取健康探测往返延迟的滑动窗口统计，见 `LatencyStats.snapshot()`。
+        """
+        return self._conn.latency.snapshot()
+
+    def _unhealthy_error(self, report: HealthReport) -> ConnectionError:
+        return ConnectionError(
+            f"[WorldContext {self._uuid}] TongSim at {report.endpoint} is not ready: {report.error}"
+        )
+
+    def invalidate_caches(self) -> None:
+        """
+        使所有 gRPC 连接的响应缓存失效。场景发生变化（打开关卡、加载场景、生成 / 销毁实体、
+        PG 中出现新物体或物体被销毁）时调用；可在任意线程调用。
+        """
+        for conn in (*self._shard_conns, self._conn_legacy):
+            conn.cache.invalidate()
+
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        获取各 gRPC 连接响应缓存的命中统计，见 `ResponseCache.snapshot()`。
+
+        Returns:
+            dict[str, dict[str, Any]]: {loop 名称: 缓存统计}。
+        """
+        return {
+            loop.name: conn.cache.snapshot()
+            for loop, conn in zip(self._shard_loops, self._shard_conns, strict=True)
+        }
+
+    def sync_run(
+        self,
+        coro: Awaitable,
+        timeout: float | None = None,
+        shard_key: str | None = None,
+    ) -> Any:
         """
         在事件循环中同步运行异步任务，并阻塞直到任务完成。
 
         Args:
             coro (Awaitable): 要执行的异步协程。
             timeout (float | None): 可选的超时时间（秒），超过此时间将抛出 TimeoutError。
+                同时作为截止时间传递给协程内发起的 RPC（见 connection.grpc.deadline），
+                各 RPC 的 gRPC timeout 不会超过剩余预算。
+            shard_key (str | None): 分片键（通常为实体 id），协程将运行在 `loop_for(shard_key)` 上。
 
         Returns:
             Any: 协程的返回结果。
         """
-        if threading.current_thread() is self._loop.thread:
+        self._check_accepting()
+        loop = self.loop_for(shard_key)
+        if threading.current_thread() is loop.thread:
             raise RuntimeError(
-                f"Cannot call `sync_run` from the same thread as AsyncLoop [{self._loop.name}] — this would cause a deadlock."
+                f"Cannot call `sync_run` from the same thread as AsyncLoop [{loop.name}] — this would cause a deadlock."
             )
 
-        return self._loop.spawn(
-            coro, name=f"[World-Context {self.uuid} sync task]"
-        ).result(timeout=timeout)
+        # spawn 时复制调用方的 contextvars，截止时间随之传入 loop 中的任务
+        with deadline(timeout):
+            future = loop.spawn(
+                coro,
+                name=f"[World-Context {self.uuid} sync task]",
+                policy=SupervisionPolicy.ISOLATE,
+            )
+        return future.result(timeout=timeout)
 
-    def async_task(self, coro: Awaitable[Any], name: str) -> Future[Any]:
+    def sync_run_many(
+        self,
+        coros: Iterable[Awaitable[Any]],
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        shard_key: str | None = None,
+    ) -> list[Any]:
         """
-        启动一个异步任务
+        批量同步运行多个协程: 只做一次跨线程提交，在事件循环中并发执行后一次性返回。
+
+        Args:
+            coros (Iterable[Awaitable]): 要执行的协程集合。
+            concurrency (int | None): 最大并发数，None 表示不限制。
+            timeout (float | None): 整批任务共享的超时时间（秒），超时未完成的项返回 TimeoutError。
+            shard_key (str | None): 分片键，整批协程运行在 `loop_for(shard_key)` 上。
+
+        Returns:
+            list[Any]: 与输入顺序一致的结果列表；执行失败的项为对应的异常对象。
         """
-        return self._loop.spawn(coro, name=name)
+        coros = list(coros)
+        if not coros:
+            return []
+        if concurrency is not None and concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}.")
 
-    def release(self):
+        with deadline(timeout):
+            return self.sync_run(
+                self._gather_bounded(coros, concurrency, timeout), shard_key=shard_key
+            )
+
+    def sync_gather(
+        self,
+        *coros: Awaitable[Any],
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        shard_key: str | None = None,
+    ) -> list[Any]:
         """
-        释放所有资源，包括:
-        - 停止任务组
-        - 关闭 gRPC
-        - 停止事件循环
+        与 sync_run_many 相同，但任意一项失败时抛出（按输入顺序）第一个异常。
+
+        Returns:
+            list[Any]: 与输入顺序一致的结果列表。
+        """
+        results = self.sync_run_many(
+            coros, concurrency=concurrency, timeout=timeout, shard_key=shard_key
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    @staticmethod
+    async def _gather_bounded(
+        coros: list[Awaitable[Any]], concurrency: int | None, timeout: float | None
+    ) -> list[Any]:
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        expires_at = (
+            asyncio.get_running_loop().time() + timeout if timeout is not None else None
+        )
+
+        async def _run(coro: Awaitable[Any]) -> Any:
+            try:
+                async with asyncio.timeout_at(expires_at):
+                    if semaphore is None:
+                        return await coro
+                    async with semaphore:
+                        return await coro
+            finally:
+                # 排队期间超时的协程从未被调度，需显式关闭
+                if asyncio.iscoroutine(coro):
+                    coro.close()
+
+        return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True)
+
+    def async_task(
+        self,
+        coro: Awaitable[Any] | Callable[[], Awaitable[Any]],
+        name: str,
+        shard_key: str | None = None,
+        policy: SupervisionPolicy = SupervisionPolicy.ISOLATE,
+        backoff: RestartBackoff | None = None,
+        background: bool = False,
+    ) -> Future[Any]:
+        """
+        启动一个异步任务，shard_key 不为空时运行在对应的分片 loop 上。
+
+        Args:
+            coro (Awaitable | Callable[[], Awaitable]): 协程，或返回协程的工厂函数（RESTART 策略必须为工厂函数）。
+            name (str): 任务名称。
+            shard_key (str | None): 分片键（通常为实体 id）。
+            policy (SupervisionPolicy): 监督策略，默认 ISOLATE，异常只传递给返回的 Future。
+            backoff (RestartBackoff | None): RESTART 策略的退避参数。
+            background (bool): 是否为长期运行的后台任务（如取流），release 排空时不等待而是直接取消。
+        """
+        self._check_accepting()
+        return self.loop_for(shard_key).spawn(
+            coro, name=name, policy=policy, backoff=backoff, background=background
+        )
+
+    def _check_accepting(self) -> None:
+        if self._is_draining:
+            raise RuntimeError(
+                f"[WorldContext {self._uuid}] is releasing; new tasks are rejected."
+            )
+
+    def release(self, drain_timeout: float = 0.0) -> ReleaseReport | None:
+        """
+        释放所有资源:
+        - 拒绝新的 sync_run / async_task 提交
+        - 在 drain_timeout 秒内等待所有 loop 中的在途任务完成，之后取消剩余任务与后台流
+        - 刷新 Legacy 双向流，关闭 gRPC 通道
+        - 停止事件循环与计算池
+
+        Args:
+            drain_timeout (float): 等待在途任务的最长秒数，默认 0 即立即取消（析构时使用）。
+
+        Returns:
+            ReleaseReport | None: 释放结果；已释放过时返回 None。
         """
         if self._is_shutdown:
-            return
+            return None
         self._is_shutdown = True
+        self._is_draining = True
 
         _logger.debug(f"[WorldContext {self._uuid}] releasing...")
 
+        if self._loop.is_attached:
+            self._release_attached()
+            return None
+
+        started = time.perf_counter()
+        report = ReleaseReport()
+
+        # 所有 loop 同时排空，共享同一截止时间
+        drains = [loop.drain(drain_timeout) for loop in self._shard_loops]
+        for loop, drain in zip(self._shard_loops, drains, strict=True):
+            try:
+                report.drains.append(drain.result(drain_timeout + _CLOSE_TIMEOUT))
+            except Exception as e:
+                report.errors.append(f"drain {loop.name}: {e!r}")
+
+        report.legacy_flushed = self._run_closing(
+            self._loop,
+            self._legacy_stream_client.close(),
+            "flush legacy stream",
+            report,
+        )
+
+        closing = [
+            (loop, conn.aclose(), f"close gRPC connection on {loop.name}")
+            for loop, conn in zip(self._shard_loops, self._shard_conns, strict=True)
+        ]
+        closing.append((self._loop, self._conn_legacy.aclose(), "close legacy gRPC"))
+        for loop, coro, what in closing:
+            self._run_closing(loop, coro, what, report)
+
+        for loop in reversed(self._shard_loops):
+            loop.stop()
+        self._offload.shutdown()
+
+        report.elapsed = time.perf_counter() - started
+        self._log_release(report)
+        return report
+
+    @staticmethod
+    def _run_closing(
+        loop: AsyncLoop, coro: Awaitable[Any], what: str, report: ReleaseReport
+    ) -> bool:
+        """在 loop 中直接执行关闭步骤（不再经过 spawn 产生业务任务），出错时记录到 report。"""
         try:
-            self._loop.cancel_tasks(timeout=1.0)
-            self._loop.spawn(
-                self._conn_legacy.aclose(),
-                name=f"WorldContext {self.uuid} release legacy gRPC connection.",
-            ).result(timeout=1.0)
-            self._loop.spawn(
-                self._conn.aclose(),
-                name=f"WorldContext {self.uuid} release gRPC connection.",
-            ).result(timeout=1.0)
+            asyncio.run_coroutine_threadsafe(coro, loop.loop).result(_CLOSE_TIMEOUT)
         except Exception as e:
-            _logger.warning(
-                f"[WorldContext {self._uuid}] failed to release cleanly: {e}"
+            report.errors.append(f"{what}: {e!r}")
+            return False
+        return True
+
+    @staticmethod
+    async def _aclose_step(
+        coro: Awaitable[Any], what: str, report: ReleaseReport
+    ) -> bool:
+        """挂载模式下执行关闭步骤，出错时记录到 report。"""
+        try:
+            async with asyncio.timeout(_CLOSE_TIMEOUT):
+                await coro
+        except Exception as e:
+            report.errors.append(f"{what}: {e!r}")
+            return False
+        return True
+
+    def _log_release(self, report: ReleaseReport) -> None:
+        if report.clean:
+            _logger.debug(
+                f"[WorldContext {self._uuid}] release complete in {report.elapsed:.3f}s, "
+                f"{report.completed} in-flight task(s) drained."
+            )
+            return
+        _logger.warning(
+            f"[WorldContext {self._uuid}] release finished in {report.elapsed:.3f}s with "
+            f"{len(report.cut_off)} task(s) cut off {report.cut_off}, errors: {report.errors}"
+        )
+
+    async def arelease(self, drain_timeout: float = 0.0) -> ReleaseReport | None:
+        """
+        释放所有资源（异步接口），用于挂载模式，需在所挂载的事件循环中调用。
+
+        Args:
+            drain_timeout (float): 等待在途任务的最长秒数，默认 0 即立即取消。
+
+        Returns:
+            ReleaseReport | None: 释放结果；已释放过时返回 None。
+        """
+        if self._is_shutdown:
+            return None
+        if not self._loop.is_attached:
+            raise RuntimeError(
+                f"[WorldContext {self._uuid}] arelease() is only available in attached mode, use release()."
             )
+        self._is_shutdown = True
+        self._is_draining = True
+
+        _logger.debug(f"[WorldContext {self._uuid}] releasing (attached)...")
+        started = time.perf_counter()
+        report = ReleaseReport()
+        report.drains.append(await self._loop.async_drain(drain_timeout))
+        report.legacy_flushed = await self._aclose_step(
+            self._legacy_stream_client.close(), "flush legacy stream", report
+        )
+        await self._aclose_step(self._conn_legacy.aclose(), "close legacy gRPC", report)
+        await self._aclose_step(self._conn.aclose(), "close gRPC connection", report)
+        self._loop.stop()
+        self._offload.shutdown()
+
+        report.elapsed = time.perf_counter() - started
+        self._log_release(report)
+        return report
+
+    def _release_attached(self):
+        """挂载模式下的同步释放: 事件循环归调用方所有，只能提交关闭请求而无法阻塞等待。"""
+        self._offload.shutdown()
+        loop = self._loop.loop
+        if loop.is_closed():
+            self._loop.stop()
+            return
+
+        async def _close_connections():
+            await self._conn_legacy.aclose()
+            await self._conn.aclose()
 
         self._loop.stop()
-        _logger.debug(f"[WorldContext {self._uuid}] release complete.")
+        with contextlib.suppress(RuntimeError):
+            asyncio.run_coroutine_threadsafe(_close_connections(), loop)
 
     def __enter__(self):
         return self
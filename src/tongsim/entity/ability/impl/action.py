@@ -293,9 +293,10 @@ class AgentActionAbilityImpl(AbilityImplBase):
     @classmethod
     async def create(cls, entity: Entity) -> "AgentActionAbilityImpl":
         anim_component_id = entity.get_component_id(ComponentTags.ANIM)
+        # 按实体 id 分片: streamer 的 gRPC 流与读取循环固定在同一个 loop 上
         streamer = AnimationStreamer(
-            entity.context.conn,
-            entity.context.loop,
+            entity.context.conn_for(entity.id),
+            entity.context.loop_for(entity.id),
             entity.id,
             anim_component_id,
         )
@@ -444,6 +445,6 @@ class AgentActionAbilityImpl(AbilityImplBase):
         )
 
     def __del__(self):
-        loop = self._context.loop.loop
+        loop = self._anim_streamer.loop.loop
         if loop.is_running():
             loop.call_soon_threadsafe(asyncio.create_task, self._anim_streamer.stop())
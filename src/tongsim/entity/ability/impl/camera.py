@@ -3,8 +3,14 @@
 from collections.abc import AsyncIterator
 from typing import Protocol
 
-from tongsim.connection.grpc import UnaryAPI, UnaryStreamAPI
+from tongsim.connection.grpc import (
+    StreamGap,
+    UnaryAPI,
+    UnaryStreamAPI,
+    resilient_stream,
+)
 from tongsim.connection.grpc.type import CameraImageRequest, CameraImageWrapper
+from tongsim.core import RestartBackoff, SupervisionPolicy
 from tongsim.entity.ability.base import AbilityImplBase
 from tongsim.entity.ability.registry import AbilityRegistry
 from tongsim.entity.entity import Entity
@@ -160,6 +166,14 @@ class CameraAbility(Protocol):
             list[VisibleObjectInfo] | None: 可见物体信息列表，若尚未接收或未启用则为 None。
         """
 
+    def fetch_last_stream_gap(self) -> StreamGap | None:
+        """
+        获取图像数据流最近一次中断（UE 重启 / 断线后自动重新订阅）的记录。
+
+        Returns:
+            StreamGap | None: 最近一次中断的起止时间与原因，从未中断时为 None。
+        """
+
     def get_current_imageshot(
         self,
         rgb: bool = True,
@@ -233,6 +247,7 @@ class CameraAbilityImpl(AbilityImplBase):
         super().__init__(entity)
         self._is_streaming_imagedata: bool = False
         self._last_imagedata: CameraImageWrapper | None = None
+        self._last_gap: StreamGap | None = None
 
     @classmethod
     def is_applicable(cls, entity: Entity) -> bool:
@@ -269,25 +284,34 @@ class CameraAbilityImpl(AbilityImplBase):
     ) -> None:
         async def handle_image():
             _logger.info(f"[Camera {self._entity_id}] subscribe image starting")
-            stream = UnaryStreamAPI.subscribe_image(
-                self._context.conn,
-                [
-                    CameraImageRequest(
-                        self._entity_id,
-                        rgb,
-                        depth,
-                        segmentation,
-                        mirror_segmentation,
-                        visible_object_list,
-                    ),
-                ],
-                # TODO: stream name
-                stream_name=self._entity_id,
+            conn = self._context.conn_for(self._entity_id)
+            request = CameraImageRequest(
+                self._entity_id,
+                rgb,
+                depth,
+                segmentation,
+                mirror_segmentation,
+                visible_object_list,
+            )
+            # 连接中断后等待通道恢复并自动重新订阅
+            stream = resilient_stream(
+                lambda: UnaryStreamAPI.subscribe_image(
+                    conn,
+                    [request],
+                    # TODO: stream name
+                    stream_name=self._entity_id,
+                ),
+                conn.supervisor,
+                name=f"Camera {self._entity_id}",
+                is_active=lambda: self._is_streaming_imagedata,
             )
             _logger.debug(f"[Camera {self._entity_id}] subscribe image")
 
             # 缓存最新一帧的图像:
             async for image_batch in stream:
+                if isinstance(image_batch, StreamGap):
+                    self._last_gap = image_batch
+                    continue
                 _logger.debug(f"[Camera {self._entity_id}] Received image batch")
                 if len(image_batch) != 1:
                     _logger.warning(
@@ -300,22 +324,31 @@ class CameraAbilityImpl(AbilityImplBase):
             return
 
         self._is_streaming_imagedata = True
-        # 启动异步取图Task
+        # 启动异步取图Task（固定在该实体所属的分片 loop 上，异常后自动重新订阅）
         self._context.async_task(
-            coro=handle_image(),
+            coro=handle_image,
             name=f"[Camera {self._entity_id} imagedata streaming]",
+            shard_key=self._entity_id,
+            policy=SupervisionPolicy.RESTART,
+            backoff=RestartBackoff(max_restarts=3),
+            background=True,
         )
 
     def stop_imagedata_streaming(self) -> bool:
+        # 先清除标记，避免取流任务把主动停止的流当作异常重启
+        self._is_streaming_imagedata = False
         is_stopped = self._context.sync_run(
             UnaryAPI.cancel_image_stream(self._context.conn, self._entity_id)
         )
-        if is_stopped:
-            self._is_streaming_imagedata = False
+        if not is_stopped:
+            self._is_streaming_imagedata = True
 
     def fetch_image_data_from_streaming(self) -> CameraImageWrapper | None:
         return self._last_imagedata
 
+    def fetch_last_stream_gap(self) -> StreamGap | None:
+        return self._last_gap
+
     def fetch_rgb_from_streaming(
         self, deep_copy: bool = False
     ) -> memoryview | bytes | None:
@@ -2,9 +2,15 @@
 tongsim.entity.ability.impl.collision
 """
 
+from collections.abc import AsyncIterator
 from typing import Protocol
 
-from tongsim.connection.grpc import LegacyAPI
+from tongsim.connection.grpc import (
+    LegacyAPI,
+    StreamGap,
+    UnaryStreamAPI,
+    resilient_stream,
+)
 from tongsim.connection.tags import ComponentTags
 from tongsim.entity.ability.base import AbilityImplBase
 from tongsim.entity.ability.registry import AbilityRegistry
@@ -59,6 +65,17 @@ class CollisionShapeAbility(Protocol):
             Box: 绝对 Box（世界坐标系下）
         """
 
+    def async_subscribe_overlap_events(self) -> AsyncIterator[str | StreamGap]:
+        """
+        异步订阅该物体的重叠（碰撞）事件，逐个返回与之重叠的对象 id。
+
+        连接中断（如 UE 重启）后会等待连接恢复并自动重新订阅，
+        恢复后的第一个事件之前会先返回一个 `StreamGap`，表示中间可能丢失了事件。
+
+        Returns:
+            AsyncIterator[str | StreamGap]: 重叠对象 id 或中断标记。
+        """
+
 
 @AbilityRegistry.register(CollisionShapeAbility)
 class CollisionShapeAbilityImpl(AbilityImplBase):
@@ -91,3 +108,11 @@ class CollisionShapeAbilityImpl(AbilityImplBase):
         min = transform.transform_vector3(relative_aabb.min)
         max = transform.transform_vector3(relative_aabb.max)
         return Box(min, max)
+
+    def async_subscribe_overlap_events(self) -> AsyncIterator[str | StreamGap]:
+        conn = self._context.conn
+        return resilient_stream(
+            lambda: UnaryStreamAPI.subscribe_collision(conn, self._entity_id),
+            conn.supervisor,
+            name=f"Collision {self._entity_id}",
+        )
@@ -2,8 +2,9 @@ from asyncio import Future
 from collections.abc import AsyncIterator
 from typing import Protocol
 
-from tongsim.connection.grpc import UnaryStreamAPI
+from tongsim.connection.grpc import StreamGap, UnaryStreamAPI, resilient_stream
 from tongsim.connection.grpc.type import CameraImageWrapper
+from tongsim.core import RestartBackoff, SupervisionPolicy
 from tongsim.entity.ability.base import AbilityImplBase
 from tongsim.entity.ability.registry import AbilityRegistry
 from tongsim.entity.entity import Entity
@@ -30,6 +31,11 @@ class HFCameraAbility(Protocol):
         启动后，将持续接收来自服务器的图像帧数据，并缓存最近一帧。
         """
 
+    def stop_imagedata_streaming(self) -> None:
+        """
+        停止图像数据流接收任务，之后不再重新订阅。
+        """
+
     @property
     def is_streaming_started(self) -> bool:
         """
@@ -88,6 +94,14 @@ class HFCameraAbility(Protocol):
             memoryview | bytes | None: 分割图像数据（如果存在），如果没有数据则返回 `None`。
         """
 
+    async def async_fetch_last_stream_gap(self) -> StreamGap | None:
+        """
+        获取图像数据流最近一次中断（UE 重启 / 断线后自动重新订阅）的记录。
+
+        Returns:
+            StreamGap | None: 最近一次中断的起止时间与原因，从未中断时为 `None`。
+        """
+
     async def async_subscribe_imagedata(
         self, rgb: bool = True, depth: bool = True, segmentation: bool = True
     ) -> AsyncIterator[CameraImageWrapper]:
@@ -111,7 +125,9 @@ class HFCameraAbilityImpl(AbilityImplBase):
     def __init__(self, entity: Entity):
         super().__init__(entity)
         self._last_imagedata: CameraImageWrapper | None = None
+        self._last_gap: StreamGap | None = None
         self._stream_task: Future | None = None
+        self._is_streaming: bool = False
 
     @classmethod
     def is_applicable(cls, entity: Entity) -> bool:
@@ -126,33 +142,56 @@ class HFCameraAbilityImpl(AbilityImplBase):
     ) -> None:
         async def handle_image():
             _logger.info(f"[HFCamera {self._entity_id}] subscribe image starting")
-            stream = UnaryStreamAPI.subscribe_hf_image(
-                self._context.conn,
-                camera_id=self._entity_id,
-                rgb=rgb,
-                depth=depth,
-                segmentation=segmentation,
+            conn = self._context.conn_for(self._entity_id)
+            # 连接中断后等待通道恢复并自动重新订阅
+            stream = resilient_stream(
+                lambda: UnaryStreamAPI.subscribe_hf_image(
+                    conn,
+                    camera_id=self._entity_id,
+                    rgb=rgb,
+                    depth=depth,
+                    segmentation=segmentation,
+                ),
+                conn.supervisor,
+                name=f"HFCamera {self._entity_id}",
+                is_active=lambda: self._is_streaming,
             )
 
             # 缓存最新一帧的图像:
             async for image_batch in stream:
+                if isinstance(image_batch, StreamGap):
+                    self._last_gap = image_batch
+                    continue
                 _logger.debug(f"[HFCamera {self._entity_id}] Received image batch")
                 if len(image_batch) != 1:
                     _logger.warning(
                         f"HFCamera stream received unexpected response length: {len(image_batch)}"
                     )
                 self._last_imagedata = image_batch[0]
-            _logger.info(f"[HFCamera {self._entity_id}] subscribe image finished")
 
-        # 启动异步取图Task
+        self._is_streaming = True
+        # 启动异步取图Task（固定在该实体所属的分片 loop 上，重新订阅失败时由 RESTART 策略兜底）
         self._stream_task = self._context.async_task(
-            coro=handle_image(),
+            coro=handle_image,
             name=f"[HFCamera {self._entity_id} imagedata streaming]",
+            shard_key=self._entity_id,
+            policy=SupervisionPolicy.RESTART,
+            backoff=RestartBackoff(max_restarts=3),
+            background=True,
         )
 
+    def stop_imagedata_streaming(self) -> None:
+        # 先清除标记，避免取流任务把主动停止的流当作中断重新订阅
+        self._is_streaming = False
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+
     async def async_fetch_image_data_from_streaming(self) -> CameraImageWrapper | None:
         return self._last_imagedata
 
+    async def async_fetch_last_stream_gap(self) -> StreamGap | None:
+        return self._last_gap
+
     async def async_fetch_rgb_from_streaming(
         self, deep_copy: bool = False
     ) -> memoryview | bytes | None:
@@ -4,12 +4,13 @@ from asyncio import Future
 from collections.abc import AsyncIterator, Sequence
 from typing import Protocol
 
-from tongsim.connection.grpc import UnaryStreamAPI
+from tongsim.connection.grpc import StreamGap, UnaryStreamAPI, resilient_stream
+from tongsim.core import RestartBackoff, SupervisionPolicy
 from tongsim.entity.ability.base import AbilityImplBase
 from tongsim.entity.ability.registry import AbilityRegistry
 from tongsim.entity.entity import Entity
 from tongsim.logger import get_logger
-from tongsim.math import Vector3
+from tongsim.math import Vector3, decode_voxel
 
 _logger = get_logger("voxel")
 
@@ -44,6 +45,11 @@ class VoxelAbility(Protocol):
             ignore_subjects (Sequence[str] | None): 要忽略的目标列表。默认为 `None`。
         """
 
+    def stop_voxel_data_streaming(self) -> None:
+        """
+        停止体素数据流，之后不再重新订阅。
+        """
+
     @property
     def is_streaming_started(self) -> bool:
         """
@@ -94,6 +100,30 @@ class VoxelAbility(Protocol):
             bytes | None: 最新的体素数据或 `None`。
         """
 
+    async def async_fetch_decoded_voxel_data(self) -> list[list[list[bool]]] | None:
+        """
+        异步获取最新的体素数据并解码为三维布尔数组，解码在 WorldContext 的计算池中执行。
+
+        Returns:
+            list[list[list[bool]]] | None: 按 x / y / z 索引的体素占用情况，尚未收到数据时为 `None`。
+        """
+
+    def fetch_decoded_voxel_data(self) -> list[list[list[bool]]] | None:
+        """
+        同步版本: 获取最新的体素数据并解码为三维布尔数组。
+
+        Returns:
+            list[list[list[bool]]] | None: 按 x / y / z 索引的体素占用情况，尚未收到数据时为 `None`。
+        """
+
+    async def async_fetch_last_stream_gap(self) -> StreamGap | None:
+        """
+        获取体素数据流最近一次中断（UE 重启 / 断线后自动重新订阅）的记录。
+
+        Returns:
+            StreamGap | None: 最近一次中断的起止时间与原因，从未中断时为 `None`。
+        """
+
     def block_fetch_voxel_data(self) -> bytes | None:
         """
         阻塞当前线程，直到获取到最新的体素数据。
@@ -110,9 +140,11 @@ class VoxelAbilityImpl(AbilityImplBase):
     def __init__(self, entity: Entity):
         super().__init__(entity)
         self._last_voxel: bytes | None = None
+        self._last_gap: StreamGap | None = None
         self.component_id = entity.get_component_id("VoxelComponent")
         self._voxel_resolution: tuple[int, int, int] = (0, 0, 0)
         self._stream_task: Future | None = None
+        self._is_streaming: bool = False
         self._voxel_data_event: asyncio.Event = asyncio.Event()
 
     @classmethod
@@ -140,28 +172,51 @@ class VoxelAbilityImpl(AbilityImplBase):
 
         async def handle_voxel():
             _logger.info(f"[Voxel {self._entity_id}] subscribe voxel starting")
-            self._stream = UnaryStreamAPI.subscribe_voxel(
-                self._context.conn,
-                self.component_id,
-                rate,
-                voxel_half_resolution,
-                voxel_extent,
-                center_offset,
-                is_ignore_self,
-                ignore_subjects,
+            conn = self._context.conn_for(self._entity_id)
+            # 连接中断后等待通道恢复并自动重新订阅
+            self._stream = resilient_stream(
+                lambda: UnaryStreamAPI.subscribe_voxel(
+                    conn,
+                    self.component_id,
+                    rate,
+                    voxel_half_resolution,
+                    voxel_extent,
+                    center_offset,
+                    is_ignore_self,
+                    ignore_subjects,
+                ),
+                conn.supervisor,
+                name=f"Voxel {self._entity_id}",
+                is_active=lambda: self._is_streaming,
             )
 
             async for voxel in self._stream:
+                if isinstance(voxel, StreamGap):
+                    self._last_gap = voxel
+                    continue
                 _logger.debug(f"[Voxel {self._entity_id}] Received voxel batch")
                 self._last_voxel = voxel
                 self._voxel_data_event.set()
-            _logger.info(f"[Voxel {self._entity_id}] subscribe voxel finished")
 
+        self._is_streaming = True
         self._stream_task = self._context.async_task(
-            coro=handle_voxel(),
+            coro=handle_voxel,
             name=f"[Voxel {self._entity_id} voxel_data streaming]",
+            shard_key=self._entity_id,
+            policy=SupervisionPolicy.RESTART,
+            backoff=RestartBackoff(max_restarts=3),
+            background=True,
         )
 
+    def stop_voxel_data_streaming(self) -> None:
+        # 先清除标记，避免取流任务把主动停止的流当作中断重新订阅
+        self._is_streaming = False
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+
+    async def async_fetch_last_stream_gap(self) -> StreamGap | None:
+        return self._last_gap
+
     async def _block_fetch_voxel(self, deepcopy: bool = False) -> bytes | None:
         await self._voxel_data_event.wait()
         self._voxel_data_event.clear()
@@ -176,10 +231,22 @@ class VoxelAbilityImpl(AbilityImplBase):
             return bytes(self._last_voxel)
         return self._last_voxel
 
+    async def async_fetch_decoded_voxel_data(self) -> list[list[list[bool]]] | None:
+        voxel = self._last_voxel
+        if voxel is None:
+            return None
+        return await self._context.offload(decode_voxel, voxel, self._voxel_resolution)
+
+    def fetch_decoded_voxel_data(self) -> list[list[list[bool]]] | None:
+        return self._context.sync_run(self.async_fetch_decoded_voxel_data())
+
     def block_fetch_voxel_data(
         self, deepcopy: bool = False, timeout: float = 2
     ) -> bytes | None:
-        return self._context.sync_run(self._block_fetch_voxel(deepcopy), timeout)
+        # asyncio.Event 不能跨 loop 使用，需与取流任务运行在同一分片 loop 上
+        return self._context.sync_run(
+            self._block_fetch_voxel(deepcopy), timeout, shard_key=self._entity_id
+        )
 
     async def async_subscribe_voxel_data(
         self,
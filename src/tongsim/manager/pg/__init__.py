@@ -1,11 +1,23 @@
+from .columnar import PGColumns
+from .feed import PGChange, PGChangeSubscription, PGFeedPolicy, PGFeedStats
 from .manager import PGManager
+from .query import PGQueryPlan, PGQuerySubscription
 from .registry import PG_COMPONENT_REGISTRY
 from .schema import PGQueryMeta, validate_query_meta
+from .view import MessageView
 
 __all__ = [
     "PG_COMPONENT_REGISTRY",
+    "MessageView",
+    "PGChange",
+    "PGChangeSubscription",
+    "PGColumns",
+    "PGFeedPolicy",
+    "PGFeedStats",
     "PGManager",
     "PGQueryMeta",
+    "PGQueryPlan",
+    "PGQuerySubscription",
     "query_fields_batch",
     "validate_query_meta",
 ]
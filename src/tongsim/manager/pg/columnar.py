@@ -0,0 +1,239 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from google.protobuf.message import Message
+
+from .indexer import PGIndexer
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ["PGColumns"]
+
+_INITIAL_CAPACITY = 1024
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Columnar PG store requires NumPy, install it with `pip install numpy`."
+        ) from e
+    return numpy
+
+
+class PGColumns:
+    """
+    PG 的列式存储: 每个 subject 的位姿、缩放与包围盒保存在连续的 NumPy 数组中，
+    行号即 PGIndexer 中的 subject 索引（按首次出现的顺序稠密分配）。
+
+    合并 PG 时原地更新，访问方法返回数组的视图（零拷贝）:
+
+    - 视图会随后续合并原地变化，需要快照请自行 copy()
+    - 出现新 subject 导致扩容时底层数组会重新分配，之前取得的视图不再更新，需重新获取；
+      PG 重新同步时原地清空，不会重新分配
+    - 缺失的数据为 NaN；与 query() 一致，同一 subject 的多个组件带有同类数据时取 component_pg 中靠后的组件
+
+    四元数列顺序为 (w, x, y, z)，与 SDK `Quaternion(w, x, y, z)` 一致。
+    """
+
+    def __init__(self, indexer: PGIndexer, dtype: Any = None):
+        """
+        Args:
+            indexer (PGIndexer): 提供 subject 索引的索引器。
+            dtype (Any): 数组类型，默认 float64。
+        """
+        self._np = _numpy()
+        self._indexer = indexer
+        self._dtype = dtype or self._np.float64
+        self._subject_ids: list[str] = []
+        self._allocate(_INITIAL_CAPACITY)
+
+    def _allocate(self, capacity: int):
+        np = self._np
+        self._location = np.full((capacity, 3), np.nan, dtype=self._dtype)
+        self._rotation = np.full((capacity, 4), np.nan, dtype=self._dtype)
+        self._scale = np.full((capacity, 3), np.nan, dtype=self._dtype)
+        self._aabb_min = np.full((capacity, 3), np.nan, dtype=self._dtype)
+        self._aabb_max = np.full((capacity, 3), np.nan, dtype=self._dtype)
+        self._destroyed = np.zeros(capacity, dtype=bool)
+        # 当前数据来自哪个组件（component_pg 中的下标），-1 表示缺失
+        self._pose_source = np.full(capacity, -1, dtype=np.int32)
+        self._scale_source = np.full(capacity, -1, dtype=np.int32)
+        self._aabb_source = np.full(capacity, -1, dtype=np.int32)
+
+    def _arrays(self) -> tuple["np.ndarray", ...]:
+        return (
+            self._location,
+            self._rotation,
+            self._scale,
+            self._aabb_min,
+            self._aabb_max,
+            self._destroyed,
+            self._pose_source,
+            self._scale_source,
+            self._aabb_source,
+        )
+
+    def _grow(self, capacity: int):
+        size = len(self._subject_ids)
+        old = self._arrays()
+        self._allocate(capacity)
+        for src, dst in zip(old, self._arrays(), strict=True):
+            dst[:size] = src[:size]
+
+    def clear(self):
+        """清空所有数据（PG 重置时调用）。原地重置已有数组，之前取得的视图在重新同步后继续更新。"""
+        size = len(self._subject_ids)
+        self._subject_ids = []
+        for array in (
+            self._location,
+            self._rotation,
+            self._scale,
+            self._aabb_min,
+            self._aabb_max,
+        ):
+            array[:size] = self._np.nan
+        self._destroyed[:size] = False
+        self._pose_source[:size] = -1
+        self._scale_source[:size] = -1
+        self._aabb_source[:size] = -1
+
+    # ===== 合并 =====
+
+    def add_subject(self, sid: str, sidx: int, components: Any):
+        """
+        登记新 subject 并写入其组件数据。
+
+        Args:
+            sid (str): Subject ID。
+            sidx (int): PGIndexer 分配的 subject 索引，需与登记顺序一致。
+            components (Any): 该 subject 的 repeated ComponentPG。
+        """
+        if sidx != len(self._subject_ids):
+            raise ValueError(
+                f"Subject index {sidx} is not dense (expected {len(self._subject_ids)})."
+            )
+        if sidx == len(self._destroyed):
+            self._grow(2 * len(self._destroyed))
+        self._subject_ids.append(sid)
+        for cidx, comp in enumerate(components):
+            self.update_component(sidx, cidx, comp)
+
+    def update_component(self, sidx: int, cidx: int, comp: Message):
+        """
+        用单个 ComponentPG 原地更新 subject 的数据。
+
+        Args:
+            sidx (int): subject 索引。
+            cidx (int): 组件在 component_pg 中的下标。
+            comp (Message): ComponentPG 消息。
+        """
+        if comp.HasField("pose") and cidx >= self._pose_source[sidx]:
+            loc, rot = comp.pose.location, comp.pose.rotation
+            self._location[sidx] = (loc.x, loc.y, loc.z)
+            self._rotation[sidx] = (rot.w, rot.x, rot.y, rot.z)
+            self._pose_source[sidx] = cidx
+        if comp.HasField("scale") and cidx >= self._scale_source[sidx]:
+            scale = comp.scale
+            self._scale[sidx] = (scale.x, scale.y, scale.z)
+            self._scale_source[sidx] = cidx
+        if comp.HasField("aabb") and cidx >= self._aabb_source[sidx]:
+            lo, hi = comp.aabb.min_vertex, comp.aabb.max_vertex
+            self._aabb_min[sidx] = (lo.x, lo.y, lo.z)
+            self._aabb_max[sidx] = (hi.x, hi.y, hi.z)
+            self._aabb_source[sidx] = cidx
+
+    def replace_component(
+        self, sidx: int, cidx: int, comp: Message, components: Iterable[Message]
+    ):
+        """
+        组件被替换后更新 subject 的数据。新组件缺少原本作为来源的数据（如组件类型改变）时，
+        清空该行并按 components 重新选取来源。
+
+        Args:
+            sidx (int): subject 索引。
+            cidx (int): 被替换的组件在 component_pg 中的下标。
+            comp (Message): 新的 ComponentPG 消息。
+            components (Iterable[Message]): 替换后该 subject 的全部 ComponentPG，仅在需要重新选取来源时遍历。
+        """
+        if (
+            (self._pose_source[sidx] == cidx and not comp.HasField("pose"))
+            or (self._scale_source[sidx] == cidx and not comp.HasField("scale"))
+            or (self._aabb_source[sidx] == cidx and not comp.HasField("aabb"))
+        ):
+            self._clear_row(sidx)
+            for i, component in enumerate(components):
+                self.update_component(sidx, i, component)
+        else:
+            self.update_component(sidx, cidx, comp)
+
+    def _clear_row(self, sidx: int):
+        nan = self._np.nan
+        self._location[sidx] = nan
+        self._rotation[sidx] = nan
+        self._scale[sidx] = nan
+        self._aabb_min[sidx] = nan
+        self._aabb_max[sidx] = nan
+        self._pose_source[sidx] = -1
+        self._scale_source[sidx] = -1
+        self._aabb_source[sidx] = -1
+
+    def mark_destroyed(self, sidx: int):
+        self._destroyed[sidx] = True
+
+    # ===== 访问 =====
+
+    def __len__(self) -> int:
+        return len(self._subject_ids)
+
+    def subject_ids(self) -> list[str]:
+        """
+        Returns:
+            list[str]: 与数组行对齐的 subject ID，视为只读。
+        """
+        return self._subject_ids
+
+    def index(self, sid: str) -> int | None:
+        """
+        Returns:
+            int | None: subject 所在的行号，不存在时为 None。
+        """
+        return self._indexer.get_subject_index(sid)
+
+    def positions(self) -> "np.ndarray":
+        """
+        Returns:
+            np.ndarray: 形状为 (N, 3) 的位置视图。
+        """
+        return self._location[: len(self._subject_ids)]
+
+    def rotations(self) -> "np.ndarray":
+        """
+        Returns:
+            np.ndarray: 形状为 (N, 4) 的旋转视图，列为 (w, x, y, z)。
+        """
+        return self._rotation[: len(self._subject_ids)]
+
+    def scales(self) -> "np.ndarray":
+        """
+        Returns:
+            np.ndarray: 形状为 (N, 3) 的缩放视图。
+        """
+        return self._scale[: len(self._subject_ids)]
+
+    def aabbs(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        Returns:
+            tuple[np.ndarray, np.ndarray]: 包围盒最小顶点与最大顶点视图，形状均为 (N, 3)。
+        """
+        size = len(self._subject_ids)
+        return self._aabb_min[:size], self._aabb_max[:size]
+
+    def destroyed(self) -> "np.ndarray":
+        """
+        Returns:
+            np.ndarray: 形状为 (N,) 的布尔视图，True 表示 subject 已被销毁。
+        """
+        return self._destroyed[: len(self._subject_ids)]
@@ -0,0 +1,349 @@
+import asyncio
+import itertools
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Literal
+
+from tongsim.connection.grpc import StreamGap
+
+__all__ = [
+    "PGChange",
+    "PGChangeFeed",
+    "PGChangeSubscription",
+    "PGFeedPolicy",
+    "PGFeedStats",
+]
+
+PGFeedPolicy = Literal["drop_oldest", "coalesce", "block"]
+
+_POLICIES: tuple[str, ...] = ("drop_oldest", "coalesce", "block")
+
+
+@dataclass(frozen=True, slots=True)
+class PGChange:
+    """
+    一帧（或合并后的多帧）PG 变化。
+
+    Attributes:
+        sequence (int): 变化序号，PG 每合并一帧加一；合并后的变化为其中最新一帧的序号。
+        frame (int): UE 帧号；合并后的变化为其中最新一帧的帧号。
+        changed_subjects (frozenset[str]): 新增或组件发生变化的 subject ID，不含被销毁的 subject。
+        destroyed_subjects (frozenset[str]): 被销毁的 subject ID。
+        gap (StreamGap | None): 连接中断并全量重新同步后的首帧带有中断记录，
+            此时 PG 已被重建，应按全量处理而不是增量。
+        frames (int): 包含的帧数，coalesce 策略合并时大于 1。
+        published_at (float): 最早一帧的发布时刻（time.monotonic()）。
+    """
+
+    sequence: int
+    frame: int
+    changed_subjects: frozenset[str]
+    destroyed_subjects: frozenset[str]
+    gap: StreamGap | None = None
+    frames: int = 1
+    published_at: float = 0.0
+
+    def merge(self, newer: "PGChange") -> "PGChange":
+        """与之后的一帧变化合并为一个变化。"""
+        destroyed = self.destroyed_subjects | newer.destroyed_subjects
+        return PGChange(
+            sequence=newer.sequence,
+            frame=newer.frame,
+            changed_subjects=(self.changed_subjects - newer.destroyed_subjects)
+            | newer.changed_subjects,
+            destroyed_subjects=destroyed - newer.changed_subjects,
+            gap=newer.gap or self.gap,
+            frames=self.frames + newer.frames,
+            published_at=self.published_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PGFeedStats:
+    """
+    单个订阅者的积压统计。
+
+    Attributes:
+        name (str): 订阅者名称。
+        policy (PGFeedPolicy): 队列满时的策略。
+        maxsize (int): 队列容量。
+        pending (int): 队列中尚未取出的变化数量。
+        max_pending (int): pending 的历史最大值。
+        delivered (int): 已取出的变化数量。
+        dropped (int): drop_oldest 策略丢弃的变化数量。
+        coalesced (int): coalesce 策略合并掉的帧数。
+        blocked_seconds (float): block 策略下 PG 合并因等待该订阅者而阻塞的总时长。
+        lag_frames (int): 最新发布的变化序号与最近一次取出的变化序号之差。
+        lag_seconds (float): 队列中最早的变化已等待的时长，队列为空时为 0。
+    """
+
+    name: str
+    policy: PGFeedPolicy
+    maxsize: int
+    pending: int
+    max_pending: int
+    delivered: int
+    dropped: int
+    coalesced: int
+    blocked_seconds: float
+    lag_frames: int
+    lag_seconds: float
+
+
+class PGChangeSubscription:
+    """
+    PG 变化订阅，由 PGManager.subscribe_changes() 创建，每个订阅者拥有独立的有界队列。
+
+    队列已满时按 policy 处理新的变化:
+
+    - drop_oldest: 丢弃最早的变化，dropped 计数加一
+    - coalesce: 与队尾的变化合并（subject 集合取并集），不丢失变化的 subject，但帧会被合并
+    - block: PG 合并等待该订阅者取出变化后再继续，对 UE 的 PG 流形成背压；
+      订阅者必须持续消费或及时 close()，否则 PG 流会一直阻塞
+
+    PG 流停止时订阅结束，队列中剩余的变化取完后迭代终止。
+
+    示例:
+        async with pg_manager.subscribe_changes(maxsize=8, policy="coalesce") as changes:
+            async for change in changes:
+                handle(change.changed_subjects, change.destroyed_subjects)
+    """
+
+    def __init__(
+        self,
+        feed: "PGChangeFeed",
+        maxsize: int,
+        policy: PGFeedPolicy,
+        name: str,
+    ):
+        self._feed = feed
+        self._maxsize = maxsize
+        self._policy = policy
+        self._name = name
+        self._items: deque[PGChange] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._closed = False
+        self._last_sequence = feed.sequence
+        self._max_pending = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._blocked_seconds = 0.0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def policy(self) -> PGFeedPolicy:
+        return self._policy
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> PGFeedStats:
+        """
+        Returns:
+            PGFeedStats: 当前的积压统计。
+        """
+        lag_seconds = (
+            time.monotonic() - self._items[0].published_at if self._items else 0.0
+        )
+        return PGFeedStats(
+            name=self._name,
+            policy=self._policy,
+            maxsize=self._maxsize,
+            pending=len(self._items),
+            max_pending=self._max_pending,
+            delivered=self._delivered,
+            dropped=self._dropped,
+            coalesced=self._coalesced,
+            blocked_seconds=self._blocked_seconds,
+            lag_frames=self._feed.sequence - self._last_sequence,
+            lag_seconds=lag_seconds,
+        )
+
+    def get_nowait(self) -> PGChange | None:
+        """
+        Returns:
+            PGChange | None: 队首的变化，队列为空时为 None。
+        """
+        if not self._items:
+            return None
+        change = self._items.popleft()
+        self._last_sequence = change.sequence
+        self._delivered += 1
+        self._writable.set()
+        return change
+
+    async def get(self) -> PGChange | None:
+        """
+        等待并取出下一个变化。
+
+        Returns:
+            PGChange | None: 下一个变化；订阅已结束且队列为空时为 None。
+        """
+        while not self._items:
+            if self._closed:
+                return None
+            self._readable.clear()
+            await self._readable.wait()
+        return self.get_nowait()
+
+    def close(self):
+        """取消订阅，队列中剩余的变化仍可取出。阻塞在该订阅者上的 PG 合并会继续。"""
+        self._feed.unsubscribe(self)
+        self.finish()
+
+    def __aiter__(self) -> "PGChangeSubscription":
+        return self
+
+    async def __anext__(self) -> PGChange:
+        change = await self.get()
+        if change is None:
+            raise StopAsyncIteration
+        return change
+
+    async def __aenter__(self) -> "PGChangeSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"PGChangeSubscription(name={self._name!r}, policy={self._policy!r}, "
+            f"pending={len(self._items)}/{self._maxsize}, closed={self._closed})"
+        )
+
+    # ===== 由 PGChangeFeed 调用 =====
+
+    def offer(self, change: PGChange) -> bool:
+        """
+        按策略放入变化。
+
+        Returns:
+            bool: False 表示 block 策略下队列已满，需要等待 wait_writable() 后重试。
+        """
+        if self._closed:
+            return True
+        items = self._items
+        if len(items) >= self._maxsize:
+            if self._policy == "drop_oldest":
+                items.popleft()
+                self._dropped += 1
+            elif self._policy == "coalesce":
+                items[-1] = items[-1].merge(change)
+                self._coalesced += change.frames
+                self._readable.set()
+                return True
+            else:
+                self._writable.clear()
+                return False
+        items.append(change)
+        self._max_pending = max(self._max_pending, len(items))
+        self._readable.set()
+        return True
+
+    async def wait_writable(self):
+        t0 = time.monotonic()
+        try:
+            await self._writable.wait()
+        finally:
+            self._blocked_seconds += time.monotonic() - t0
+
+    def finish(self):
+        """结束订阅，唤醒等待中的消费者与 PG 合并。"""
+        self._closed = True
+        self._readable.set()
+        self._writable.set()
+
+
+class PGChangeFeed:
+    """
+    PG 变化的扇出分发器: PGManager 每合并一帧调用一次 publish()，变化按各订阅者的策略放入其队列。
+    """
+
+    def __init__(self):
+        self._sequence = 0
+        self._names = itertools.count()
+        # 写时复制，发布时遍历的是快照；订阅对象被回收后自动移除
+        self._subscriptions: tuple[weakref.ref[PGChangeSubscription], ...] = ()
+
+    @property
+    def sequence(self) -> int:
+        """最新发布的变化序号。"""
+        return self._sequence
+
+    def subscribe(
+        self,
+        maxsize: int = 64,
+        policy: PGFeedPolicy = "drop_oldest",
+        name: str | None = None,
+    ) -> PGChangeSubscription:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}.")
+        if policy not in _POLICIES:
+            raise ValueError(
+                f"Unknown PG feed policy {policy!r}, expected one of {_POLICIES}."
+            )
+        subscription = PGChangeSubscription(
+            self, maxsize, policy, name or f"pg-feed-{next(self._names)}"
+        )
+        self._subscriptions = (*self._subscriptions, weakref.ref(subscription))
+        return subscription
+
+    def unsubscribe(self, subscription: PGChangeSubscription):
+        self._subscriptions = tuple(
+            ref for ref in self._subscriptions if ref() not in (None, subscription)
+        )
+
+    def subscriptions(self) -> list[PGChangeSubscription]:
+        return [s for s in (ref() for ref in self._subscriptions) if s is not None]
+
+    async def publish(
+        self,
+        frame: int,
+        changed: set[str] | frozenset[str],
+        destroyed: set[str] | frozenset[str],
+        gap: StreamGap | None = None,
+    ):
+        """
+        发布一帧变化。没有 block 策略的订阅者时不会挂起。
+        """
+        self._sequence += 1
+        if not self._subscriptions:
+            return
+        change = PGChange(
+            sequence=self._sequence,
+            frame=frame,
+            changed_subjects=frozenset(changed),
+            destroyed_subjects=frozenset(destroyed),
+            gap=gap,
+            published_at=time.monotonic(),
+        )
+        pruned = False
+        for ref in self._subscriptions:
+            subscription = ref()
+            if subscription is None:
+                pruned = True
+                continue
+            while not subscription.offer(change):
+                await subscription.wait_writable()
+        if pruned:
+            # 等待期间订阅列表可能已变化，按当前列表移除
+            self._subscriptions = tuple(
+                ref for ref in self._subscriptions if ref() is not None
+            )
+
+    def close(self):
+        """结束所有订阅。"""
+        subscriptions, self._subscriptions = self._subscriptions, ()
+        for ref in subscriptions:
+            subscription = ref()
+            if subscription is not None:
+                subscription.finish()
@@ -2,16 +2,27 @@ class PGIndexer:
     """
     PGIndexer 提供全量 PG 数据结构中的 sid/cid -> 索引映射，
     便于快速定位 subject_pg / component_pg。
+
+    同时维护组件类型的倒排索引: 组件类型（ComponentPG 中已设置的字段名，如 "pose"）
+    -> [(sid, cidx)]，查询时只需访问带有该类型组件的 subject。
     """
 
     def __init__(self):
         self._subject_index: dict[str, int] = {}
         self._component_index: dict[tuple[str, str], int] = {}
+        # 组件类型 -> 有序集合 {(sid, cidx)}
+        self._type_index: dict[str, dict[tuple[str, int], None]] = {}
+        self._component_types: dict[tuple[str, int], frozenset[str]] = {}
+        # 组件类型 -> 按 (subject 索引, cidx) 排序的条目，倒排索引变化时失效
+        self._sorted_types: dict[str, list[tuple[str, int]]] = {}
 
     def clear(self):
         """重置索引状态"""
         self._subject_index.clear()
         self._component_index.clear()
+        self._type_index.clear()
+        self._component_types.clear()
+        self._sorted_types.clear()
 
     # ===== Subject 索引 =====
 
@@ -34,3 +45,49 @@ class PGIndexer:
 
     def get_component_index(self, sid: str, cid: str) -> int | None:
         return self._component_index.get((sid, cid))
+
+    # ===== 组件类型倒排索引 =====
+
+    def set_component_types(
+        self, sid: str, cidx: int, types: frozenset[str]
+    ) -> frozenset[str]:
+        """
+        登记 subject 第 cidx 个组件带有的组件类型，组件被替换时重新登记。
+
+        Args:
+            sid (str): Subject ID。
+            cidx (int): 组件在 component_pg 中的下标。
+            types (frozenset[str]): 组件类型集合。
+
+        Returns:
+            frozenset[str]: 之前登记的组件类型。
+        """
+        key = (sid, cidx)
+        old = self._component_types.get(key, frozenset())
+        if old == types:
+            return old
+        for ctype in old - types:
+            self._type_index[ctype].pop(key, None)
+            self._sorted_types.pop(ctype, None)
+        for ctype in types - old:
+            self._type_index.setdefault(ctype, {})[key] = None
+            self._sorted_types.pop(ctype, None)
+        self._component_types[key] = types
+        return old
+
+    def get_component_types(self, sid: str, cidx: int) -> frozenset[str]:
+        return self._component_types.get((sid, cidx), frozenset())
+
+    def components_of_type(self, ctype: str) -> list[tuple[str, int]]:
+        """
+        Returns:
+            list[tuple[str, int]]: 带有该类型的 (sid, cidx)，按 subject 索引与 cidx 排序，视为只读。
+        """
+        entries = self._sorted_types.get(ctype)
+        if entries is None:
+            entries = sorted(
+                self._type_index.get(ctype, ()),
+                key=lambda e: (self._subject_index[e[0]], e[1]),
+            )
+            self._sorted_types[ctype] = entries
+        return entries
@@ -1,26 +1,46 @@
 import asyncio
 import contextlib
 import time
-from collections import defaultdict
-from collections.abc import AsyncIterator
+import weakref
+from collections.abc import AsyncIterator, Iterator
 from concurrent.futures import Future
 from typing import Any
 
-from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+from grpc.aio import AioRpcError
 
-from tongsim.connection.grpc import UnaryAPI, UnaryStreamAPI
+from tongsim.connection.grpc import StreamGap, UnaryAPI, UnaryStreamAPI
+from tongsim.connection.grpc.supervisor import DEFAULT_RECONNECT
 from tongsim.core.world_context import WorldContext
 from tongsim.logger import get_logger
 
+from .columnar import PGColumns
+from .feed import PGChangeFeed, PGChangeSubscription, PGFeedPolicy, PGFeedStats
 from .indexer import PGIndexer
+from .query import PGQueryPlan, PGQuerySubscription
 from .registry import PG_COMPONENT_REGISTRY, ComponentSchema
-from .schema import PGQueryMeta, validate_query_meta
+from .schema import PGQueryMeta
+from .view import MessageView, message_field_value
 
 _logger = get_logger("pg")
 
 __all__ = ["PGManager"]
 
 
+def _detached(message: Message) -> Message:
+    """拷贝子消息。直接引用帧内的子消息会让整帧消息一直驻留在内存中。"""
+    copy = type(message)()
+    copy.CopyFrom(message)
+    return copy
+
+
+def _component_types(comp: Message) -> frozenset[str]:
+    """ComponentPG 中已设置的组件类型（除 component 标识外的字段名）。"""
+    return frozenset(
+        field.name for field, _ in comp.ListFields() if field.name != "component"
+    )
+
+
 class PGManager:
     """
     PGManager 管理全量 PG(Parse-Graph) 数据状态。 默认维护在 TongSim 对象实例中，可通过其子方法 pg_manager() 获取。
@@ -28,9 +48,15 @@ class PGManager:
     功能:
 
     - 从 gRPC Stream 接收增量 PG 数据
-    - 将增量数据合并为结构完整的全量 PG
+    - 将增量数据合并为结构完整的全量 PG: 直接从 proto 消息合并，组件以 MessageView 保存，
+      只有被查询或访问的组件才会转换为 dict
     - 支持基于 subject/component ID 的高性能索引访问
-    - 提供基于 metainfo 的字段查询接口，支持同步与异步版本
+    - 可选的列式存储（PGColumns）: 位姿、缩放与包围盒保存在 NumPy 数组中，支持零拷贝的向量化访问
+    - 连接中断（如 UE 重启）后自动等待连接恢复，并按首帧全量重新同步（包括重新分配分割图 ID）
+    - 提供基于 metainfo 的字段查询接口，支持同步与异步版本；查询可预先编译为 PGQueryPlan，
+      并通过组件类型倒排索引只访问带有所查询组件的 subject
+    - 合并时按帧记录变化的 subject 与组件类型，订阅的查询（PGQuerySubscription）只重新计算变化的 subject
+    - 每帧的变化分发给各个变化订阅者（PGChangeSubscription）的独立有界队列，慢消费者按自己的策略丢弃、合并或背压
 
     注意:
 
@@ -41,29 +67,88 @@ class PGManager:
         self._pg: dict = {}  # 当前完整 PG 状态
         self._pg_freq: int = 10
         self._indexer = PGIndexer()
+        self._columns: PGColumns | None = None
+        # 当前帧的变化: subject ID -> 变化的组件类型，以及被销毁的 subject
+        self._dirty: dict[str, set[str]] = {}
+        self._destroyed_subjects: set[str] = set()
+        # 写时复制，合并时遍历的是快照；订阅对象被回收后自动移除
+        self._subscriptions: tuple[weakref.ref[PGQuerySubscription], ...] = ()
         self._context: WorldContext = world_context
         self._stream_task: Future | None = None
         self._stream = None
         self._next_segmentation_id: int = 1
         self._assign_segmentation_id: bool = True  # 记录当前是否启用了分割图 ID 分配
-        self._event = asyncio.Event()
+        self._feed = PGChangeFeed()
+        self._current_frame: int = 0
+        self._last_gap: StreamGap | None = None
 
-    async def notify_new_pg(self) -> AsyncIterator[dict]:
+    async def notify_new_pg(
+        self, include_gaps: bool = False
+    ) -> AsyncIterator[dict | StreamGap]:
         """
         异步推送 PG 更新。每当 _run_pg_stream 合并了新帧，就 yield 一次当前的 self._pg，请使用异步函数去运行，否则会卡住
 
         说明：
-        - 这是一个“热”流：多个消费者并行订阅时，都会在事件触发时各自被唤醒。
+        - 这是一个“热”流：每个消费者拥有独立的变化订阅（容量为 1 的 coalesce 队列），
+          消费者处理较慢时多帧合并为一次推送，不会影响其他消费者。
         - 返回的 dict 视为只读视图；若需要拷贝请在消费者侧自行 copy/deepcopy。
+        - include_gaps=True 时，连接中断并全量重新同步后，会在重新同步的 PG 之前先 yield 一个 StreamGap。
+        - 需要知道每帧变化了哪些 subject 时，请使用 subscribe_changes()。
+
+        Args:
+            include_gaps (bool): 是否推送中断标记，默认 False。
         """
+        if not self.is_pg_stream_started:
+            return
+        subscription = self._feed.subscribe(1, "coalesce", name="notify_new_pg")
         try:
-            while self.is_pg_stream_started:
-                await self._event.wait()
-                self._event.clear()
+            async for change in subscription:
+                if include_gaps and change.gap is not None:
+                    yield change.gap
                 yield self._pg
-        except asyncio.CancelledError:
-            # 让上层正常感知取消
-            raise
+        finally:
+            subscription.close()
+
+    def subscribe_changes(
+        self,
+        maxsize: int = 64,
+        policy: PGFeedPolicy = "drop_oldest",
+        name: str | None = None,
+    ) -> PGChangeSubscription:
+        """
+        订阅 PG 变化: 每合并一帧，向订阅者的独立队列放入一个 PGChange
+        （帧号、变化的 subject ID、被销毁的 subject ID）。需在 PG 流所在的事件循环中消费。
+
+        示例:
+            async with pg_manager.subscribe_changes(maxsize=8, policy="coalesce") as changes:
+                async for change in changes:
+                    poses = await pg_manager.async_query_fields(metas)
+                    ...
+
+        Args:
+            maxsize (int): 队列容量。
+            policy (PGFeedPolicy): 队列满时的策略: "drop_oldest"、"coalesce" 或 "block"，见 PGChangeSubscription。
+            name (str | None): 订阅者名称，用于积压统计。
+
+        Returns:
+            PGChangeSubscription: 变化订阅，PG 流停止时结束，不再使用时请调用 close()。
+
+        Raises:
+            ValueError: maxsize 小于 1 或 policy 不合法。
+        """
+        return self._feed.subscribe(maxsize, policy, name)
+
+    def feed_stats(self) -> list[PGFeedStats]:
+        """
+        Returns:
+            list[PGFeedStats]: 各个变化订阅者的积压统计（包括 notify_new_pg 的消费者）。
+        """
+        return [s.stats() for s in self._feed.subscriptions()]
+
+    @property
+    def last_gap(self) -> StreamGap | None:
+        """最近一次 PG 流中断并全量重新同步的记录，从未中断时为 None。"""
+        return self._last_gap
 
     @property
     def is_pg_stream_started(self) -> bool:
@@ -75,20 +160,39 @@ class PGManager:
         """
         return self._stream_task and not self._stream_task.done()
 
-    def start_pg_stream(self, pg_freq: int = 10, assign_segmentation_id: bool = True):
+    @property
+    def columns(self) -> PGColumns | None:
+        """
+        PG 的列式存储，启动 PG 流时传入 columnar=True 才会维护，否则为 None。
+
+        示例:
+            positions = pg_manager.columns.positions()  # (N, 3) 视图，随 PG 合并原地更新
+        """
+        return self._columns
+
+    def start_pg_stream(
+        self,
+        pg_freq: int = 10,
+        assign_segmentation_id: bool = True,
+        columnar: bool = False,
+    ):
         """
         启动 PG 流监听（同步接口）。
 
         Args:
             pg_freq (int): PG 刷新频率，单位为帧数（默认每 10 帧更新一次）。
             assign_segmentation_id (bool): 是否启用分割图 ID 分配, 默认为 True，即自动给场景中每个物体 分配分割图 ID.
+            columnar (bool): 是否同时维护列式存储（需要安装 NumPy），通过 columns 属性访问。
         """
         self._context.sync_run(
-            self.async_start_pg_stream(pg_freq, assign_segmentation_id)
+            self.async_start_pg_stream(pg_freq, assign_segmentation_id, columnar)
         )
 
     async def async_start_pg_stream(
-        self, pg_freq: int = 10, assign_segmentation_id: bool = True
+        self,
+        pg_freq: int = 10,
+        assign_segmentation_id: bool = True,
+        columnar: bool = False,
     ):
         """
         启动 PG 流监听（异步接口）。
@@ -96,6 +200,7 @@ class PGManager:
         Args:
             pg_freq (int): PG 刷新频率，单位为帧数（默认每 10 帧更新一次）。
             assign_segmentation_id (bool): 是否启用分割图 ID 分配, 默认为 True，即自动给场景中每个物体 分配分割图 ID.
+            columnar (bool): 是否同时维护列式存储（需要安装 NumPy），通过 columns 属性访问。
         """
         if self._stream_task and not self._stream_task.done():
             return
@@ -104,24 +209,15 @@ class PGManager:
         if succ:
             self._pg_freq = pg_freq
             self._assign_segmentation_id = assign_segmentation_id
+            self._columns = PGColumns(self._indexer) if columnar else None
 
-            self._stream = UnaryStreamAPI.subscribe_pg(self._context.conn)
-            pg_iter = self._stream.__aiter__()
-            pg_msg = await anext(pg_iter)
-
-            # 预处理首帧: offload 到线程池执行，避免阻塞事件循环
-
-            loop = asyncio.get_running_loop()
-            segment_id_map = await loop.run_in_executor(
-                None, self.do_merge_first_pg, pg_msg
-            )
-
-            if segment_id_map:
-                await UnaryAPI.set_segment_id(self._context.conn, segment_id_map)
+            await self._subscribe_full_pg()
+            await self._publish_changes()
 
             self._stream_task = self._context.async_task(
                 self._run_pg_stream(self._stream),
                 name=f"Context-{self._context.uuid} PG-Stream",
+                background=True,
             )
 
         else:
@@ -156,22 +252,15 @@ class PGManager:
             except Exception as e:
                 _logger.exception(f"Exception during PG stream stop: {e}")
             self._stream_task = None
-            self._pg = {}
-            self._indexer.clear()
-            self._next_segmentation_id: int = 1
+            self._reset_pg()
             self._assign_segmentation_id: bool = True
-            self._event.set()
+            self._feed.close()
 
-    def do_merge_first_pg(self, pg_msg: dict) -> dict[str, int] | None:
+    def do_merge_first_pg(self, pg_msg: Message) -> dict[str, int] | None:
         t0 = time.perf_counter()
-        new_pg = MessageToDict(
-            pg_msg,
-            preserving_proto_field_name=True,
-            always_print_fields_with_no_presence=True,
-        )
-        segment_id_map = self._merge_pg(new_pg)
+        segment_id_map = self._merge_pg(pg_msg)
         t1 = time.perf_counter()
-        frame = new_pg.get("current_frame", "?")
+        frame = pg_msg.current_frame
         _logger.info(f"Init full PG frame {frame} in {(t1 - t0) * 1000:.2f} ms")
         return segment_id_map
 
@@ -180,7 +269,7 @@ class PGManager:
         从 PG 流中获取当前的全量 PG 数据（同步接口）。
 
         Returns:
-            dict: 当前帧的完整 PG 数据结构。
+            dict: 当前帧的完整 PG 数据结构，其中的组件为只读的 MessageView。
         """
         return self._context.sync_run(self.async_fetch_full_pg_from_streaming())
 
@@ -189,7 +278,7 @@ class PGManager:
         从 PG 流中获取当前的全量 PG 数据（异步接口）。
 
         Returns:
-            dict: 当前帧的完整 PG 数据结构。
+            dict: 当前帧的完整 PG 数据结构，其中的组件为只读的 MessageView。
         """
         return self._pg
 
@@ -220,7 +309,9 @@ class PGManager:
             return None
         return self._pg["subject_pg"][sidx]
 
-    def fetch_component_pg_from_streaming(self, sid: str, cid: str) -> dict | None:
+    def fetch_component_pg_from_streaming(
+        self, sid: str, cid: str
+    ) -> MessageView | None:
         """
         获取指定组件的 PG 信息（同步接口）。
 
@@ -229,7 +320,7 @@ class PGManager:
             cid (str): Component ID。
 
         Returns:
-            dict | None: 指定组件的 PG 数据（若不存在则为 None）。
+            MessageView | None: 指定组件的 PG 数据（若不存在则为 None），需要 dict 时调用 to_dict()。
         """
         return self._context.sync_run(
             self.async_fetch_component_pg_from_streaming(sid, cid)
@@ -237,7 +328,7 @@ class PGManager:
 
     async def async_fetch_component_pg_from_streaming(
         self, sid: str, cid: str
-    ) -> dict | None:
+    ) -> MessageView | None:
         """
         获取指定组件的 PG 信息（异步接口）。
 
@@ -246,7 +337,7 @@ class PGManager:
             cid (str): Component ID。
 
         Returns:
-            dict | None: 指定组件的 PG 数据（若不存在则为 None）。
+            MessageView | None: 指定组件的 PG 数据（若不存在则为 None），需要 dict 时调用 to_dict()。
         """
         sidx = self._indexer.get_subject_index(sid)
         cidx = self._indexer.get_component_index(sid, cid)
@@ -254,14 +345,30 @@ class PGManager:
             return None
         return self._pg["subject_pg"][sidx]["component_pg"][cidx]
 
-    def query(self, metas: list[dict]) -> dict[str, dict[str, Any]]:
+    def compile_query(self, metas: list[dict]) -> PGQueryPlan:
+        """
+        编译查询计划: 只校验与分组一次 metas，返回的计划可在每一帧重复传给 query() / async_query_fields()。
+
+        Args:
+            metas (list[dict]): 查询字段的 metainfo 列表。
+
+        Returns:
+            PGQueryPlan: 可复用的查询计划。
+
+        Raises:
+            PGQueryError: 任何非法字段或格式错误
+        """
+        return PGQueryPlan(metas)
+
+    def query(self, metas: list[dict] | PGQueryPlan) -> dict[str, dict[str, Any]]:
         """
         执行组件字段查询（同步接口）。
 
-        关于 metas 参数: 可使用 get_pg_metainfo_schema() 获取支持的组件与字段。
+        关于 metas 参数: 可使用 get_pg_metainfo_schema() 获取支持的组件与字段；
+        每帧重复执行的查询可先通过 compile_query() 编译。
 
         Args:
-            metas (list[dict]): 查询字段的 metainfo 列表。
+            metas (list[dict] | PGQueryPlan): 查询字段的 metainfo 列表或已编译的查询计划。
 
         Returns:
             dict[str, dict[str, Any]]: subject_id → 字段结果映射。
@@ -271,14 +378,17 @@ class PGManager:
         """
         return self._context.sync_run(self.async_query_fields(metas))
 
-    async def async_query_fields(self, metas: list[dict]) -> dict[str, dict[str, Any]]:
+    async def async_query_fields(
+        self, metas: list[dict] | PGQueryPlan
+    ) -> dict[str, dict[str, Any]]:
         """
         执行组件字段查询（异步接口）。
 
-        关于 metas 参数: 可使用 get_pg_metainfo_schema() 获取支持的组件与字段。
+        关于 metas 参数: 可使用 get_pg_metainfo_schema() 获取支持的组件与字段；
+        每帧重复执行的查询可先通过 compile_query() 编译。
 
         Args:
-            metas (list[dict]): 查询字段的 metainfo 列表。
+            metas (list[dict] | PGQueryPlan): 查询字段的 metainfo 列表或已编译的查询计划。
 
         Returns:
             dict[str, dict[str, Any]]: subject_id → 字段结果映射。
@@ -286,22 +396,99 @@ class PGManager:
                 - 值为一个字典，包含该主体上查询到的字段结果
                 - 附加键 "__meta__" 包含本次查询的全局信息
         """
-        validated = self._validate_metas(metas)
-        metas_by_component = self._group_metas_by_component(validated)
+        plan = metas if isinstance(metas, PGQueryPlan) else PGQueryPlan(metas)
+        subjects = self._pg.get("subject_pg", [])
 
         result: dict[str, dict[str, Any]] = {}
 
-        for subj in self._pg.get("subject_pg", []):
-            sid = subj["subject"]["id"]
+        # 只访问倒排索引中带有所查询组件的 (sid, cidx)
+        for sid, cidx, component_name in self._iter_plan_hits(plan):
+            subj = subjects[self._indexer.get_subject_index(sid)]
             if self._subject_pass_filter(subj):
                 continue
-            self._extract_fields_from_subject(subj, sid, metas_by_component, result)
+            self._extract_fields(
+                subj["component_pg"][cidx],
+                component_name,
+                plan.metas_by_component[component_name],
+                sid,
+                result,
+            )
 
         # 加入全局元信息
         result["__meta__"] = {"beijing_timestamp": self._pg.get("beijing_timestamp", 0)}
 
         return result
 
+    def subscribe_query(self, metas: list[dict] | PGQueryPlan) -> PGQuerySubscription:
+        """
+        订阅查询: 之后每次 refresh() 只重新计算上次以来发生变化的 subject，原地更新结果。
+
+        Args:
+            metas (list[dict] | PGQueryPlan): 查询字段的 metainfo 列表或已编译的查询计划。
+
+        Returns:
+            PGQuerySubscription: 查询订阅，不再使用时调用 close()。
+        """
+        plan = metas if isinstance(metas, PGQueryPlan) else PGQueryPlan(metas)
+        subscription = PGQuerySubscription(self, plan)
+        self._subscriptions = (*self._subscriptions, weakref.ref(subscription))
+        return subscription
+
+    def unsubscribe_query(self, subscription: PGQuerySubscription):
+        """取消查询订阅，等价于 subscription.close()。"""
+        self._subscriptions = tuple(
+            ref for ref in self._subscriptions if ref() not in (None, subscription)
+        )
+
+    def refresh_query(self, subscription: PGQuerySubscription) -> set[str]:
+        """
+        按累积的变化更新订阅的查询结果（同步接口）。
+
+        Args:
+            subscription (PGQuerySubscription): subscribe_query() 返回的订阅。
+
+        Returns:
+            set[str]: 结果发生变化的 subject ID（包括新增与移除）。
+        """
+        return self._context.sync_run(self.async_refresh_query(subscription))
+
+    async def async_refresh_query(self, subscription: PGQuerySubscription) -> set[str]:
+        """
+        按累积的变化更新订阅的查询结果（异步接口）。
+
+        Args:
+            subscription (PGQuerySubscription): subscribe_query() 返回的订阅。
+
+        Returns:
+            set[str]: 结果发生变化的 subject ID（包括新增与移除）。
+        """
+        result = subscription.result
+        dirty = subscription.take_dirty()
+
+        if dirty is None:
+            # 首次刷新或 PG 重新同步: 重建整个结果
+            fresh = await self.async_query_fields(subscription.plan)
+            changed = {
+                sid
+                for sid in result.keys() | fresh.keys()
+                if sid != "__meta__" and result.get(sid) != fresh.get(sid)
+            }
+            result.clear()
+            result.update(fresh)
+            return changed
+
+        changed: set[str] = set()
+        for sid in dirty:
+            entry = self._evaluate_subject(sid, subscription.plan)
+            if entry is None:
+                if result.pop(sid, None) is not None:
+                    changed.add(sid)
+            elif entry != result.get(sid):
+                result[sid] = entry
+                changed.add(sid)
+        result["__meta__"] = {"beijing_timestamp": self._pg.get("beijing_timestamp", 0)}
+        return changed
+
     def get_pg_metainfo_schema(self) -> dict[str, ComponentSchema]:
         """
         获取当前 PG 查询支持的组件及其字段定义。
@@ -314,66 +501,176 @@ class PGManager:
     async def _run_pg_stream(self, stream):
         """
         从 gRPC 流中持续接收增量 PG，并合并到当前状态。
+        流因连接中断（AioRpcError 或流结束）终止后，等待连接恢复并全量重新同步，之后继续接收增量。
+        合并等其他异常不会触发重新同步: 记录后结束 PG 流任务并结束所有变化订阅。
+        """
+        try:
+            while True:
+                reason = await self._consume_pg_stream(stream)
+                if self._stream is None:
+                    # async_stop_pg_stream 主动取消了流
+                    return
+                stream = await self._resync_pg(reason)
+        except Exception:
+            _logger.exception(
+                f"PG stream task failed in context {self._context.uuid}, stopping."
+            )
+            self._feed.close()
+            raise
+
+    async def _consume_pg_stream(self, stream) -> str:
+        """
+        接收并合并增量 PG，直到流结束或因传输错误中断。合并与分发中的异常向上传播。
+
+        Returns:
+            str: 流结束的原因。
         """
         max_duration_ms = 1000.0 / max(self._pg_freq, 1)
+        iterator = stream.__aiter__()
 
-        try:
-            async for pg_msg in stream:
-                t0 = time.perf_counter()
-                new_pg = MessageToDict(
-                    pg_msg,
-                    preserving_proto_field_name=True,
-                    always_print_fields_with_no_presence=True,
+        while True:
+            try:
+                pg_msg = await anext(iterator)
+            except StopAsyncIteration:
+                return "stream ended"
+            except asyncio.CancelledError:
+                _logger.info(
+                    f"PG stream task cancelled for context {self._context.uuid}"
+                )
+                raise  # 取消应向上传播以便正常关闭
+            except AioRpcError as e:
+                _logger.warning(
+                    f"PG stream interrupted in context {self._context.uuid}: {e.code().name} {e.details()}"
                 )
-                segment_id_map = self._merge_pg(new_pg)
-                self._event.set()
+                return f"{e.code().name}: {e.details()}"
 
-                t1 = time.perf_counter()
+            t0 = time.perf_counter()
+            # 直接从 proto 消息合并，不做整帧的 dict 解码
+            segment_id_map = self._merge_pg(pg_msg)
 
-                duration_ms = (t1 - t0) * 1000
-                frame = new_pg.get("current_frame", "?")
+            duration_ms = (time.perf_counter() - t0) * 1000
+            frame = pg_msg.current_frame
 
-                if duration_ms > max_duration_ms:
-                    _logger.warning(
-                        f"Merge PG frame {frame} took {duration_ms:.2f} ms (exceeds {max_duration_ms:.2f} ms budget)"
-                    )
-                else:
-                    _logger.debug(f"Merge PG frame {frame} in {duration_ms:.2f} ms")
+            if duration_ms > max_duration_ms:
+                _logger.warning(
+                    f"Merge PG frame {frame} took {duration_ms:.2f} ms (exceeds {max_duration_ms:.2f} ms budget)"
+                )
+            else:
+                _logger.debug(f"Merge PG frame {frame} in {duration_ms:.2f} ms")
 
-                # 设置增量的 segment_id
-                if segment_id_map:
-                    await UnaryAPI.set_segment_id(self._context.conn, segment_id_map)
+            # 设置增量的 segment_id
+            if segment_id_map:
+                await UnaryAPI.set_segment_id(self._context.conn, segment_id_map)
 
-        except asyncio.CancelledError:
-            _logger.info(f"PG stream task cancelled for context {self._context.uuid}")
-            raise  # 取消应向上传播以便正常关闭
+            # block 策略的订阅者积压时在此等待，暂停读取 PG 流
+            await self._publish_changes()
 
-        except Exception as e:
-            _logger.exception(
-                f"PG stream encountered error in context {self._context.uuid}: {e}"
-            )
+    async def _subscribe_full_pg(self, reset: bool = False):
+        """
+        订阅 PG 流，合并首帧（全量 PG），并为新物体设置分割图 ID。
+
+        Args:
+            reset (bool): 合并首帧前是否清空当前 PG 与分割图 ID 分配（重新同步时使用）。
+        """
+        stream = UnaryStreamAPI.subscribe_pg(self._context.conn)
+        pg_msg = await anext(stream.__aiter__())
+        self._stream = stream
+
+        # 合并首帧: 在事件循环中执行以保证线程安全
+        t0 = time.perf_counter()
+        if reset:
+            self._reset_pg()
+        segment_id_map = self._merge_pg(pg_msg)
+        t1 = time.perf_counter()
+        frame = pg_msg.current_frame
+        _logger.info(f"Init full PG frame {frame} in {(t1 - t0) * 1000:.2f} ms")
+
+        if segment_id_map:
+            await UnaryAPI.set_segment_id(self._context.conn, segment_id_map)
+
+    async def _resync_pg(self, reason: str):
+        """
+        等待连接恢复后全量重新同步: 重新设置刷新频率、重新订阅，并用首帧重建 PG 与分割图 ID。
+        UE 重启后旧的 PG 状态与分割图 ID 均已失效，因此不做增量合并。
+
+        Returns:
+            重新订阅的 PG 流。
+        """
+        since = time.time()
+        _logger.warning(
+            f"PG stream interrupted in context {self._context.uuid} ({reason}), resyncing."
+        )
+        supervisor = self._context.conn.supervisor
+        supervisor.start()
+        attempt = 0
+        while True:
+            attempt += 1
+            await supervisor.wait_ready()
+            await asyncio.sleep(DEFAULT_RECONNECT.delay(attempt))
+            if not await UnaryAPI.set_pg_frequency(self._context.conn, self._pg_freq):
+                continue
+            try:
+                await self._subscribe_full_pg(reset=True)
+            except (AioRpcError, StopAsyncIteration) as e:
+                reason = f"{type(e).__name__}: {e}"
+                _logger.debug(f"PG resubscribe attempt {attempt} failed: {reason}")
+                continue
+            break
 
-    def _merge_pg(self, new_pg: dict) -> dict[str, int] | None:
-        """将增量 PG 合并到 self._pg，并更新索引器"""
-        if "world_id" in new_pg:
-            self._pg["world_id"] = new_pg["world_id"]
-        if "current_frame" in new_pg:
-            self._pg["current_frame"] = new_pg["current_frame"]
-        if "beijing_timestamp" in new_pg:
-            self._pg["beijing_timestamp"] = new_pg["beijing_timestamp"].get(
-                "timestamp_ms", 0
+        self._last_gap = StreamGap("PG", since, time.time(), reason, attempt)
+        await self._publish_changes(self._last_gap)
+        _logger.info(
+            f"PG stream resynced in context {self._context.uuid} after {self._last_gap.duration:.2f}s."
+        )
+        return self._stream
+
+    def _reset_pg(self):
+        """清空 PG 状态、索引与分割图 ID 分配。"""
+        self._pg = {}
+        self._indexer.clear()
+        self._dirty = {}
+        self._destroyed_subjects = set()
+        for ref in self._subscriptions:
+            subscription = ref()
+            if subscription is not None:
+                subscription.mark_stale()
+        if self._columns is not None:
+            self._columns.clear()
+        self._next_segmentation_id = 1
+
+    def _merge_pg(self, pg_msg: Message) -> dict[str, int] | None:
+        """
+        将增量 PG 消息合并到 self._pg，并更新索引器。
+        标量字段的取值与 MessageToDict 的结果一致，组件以 MessageView 保存，查询时才转换为 dict。
+        """
+        self._pg["world_id"] = message_field_value(pg_msg, "world_id")
+        self._pg["current_frame"] = message_field_value(pg_msg, "current_frame")
+        self._current_frame = pg_msg.current_frame
+        if pg_msg.HasField("beijing_timestamp"):
+            self._pg["beijing_timestamp"] = message_field_value(
+                pg_msg.beijing_timestamp, "timestamp_ms"
             )
 
         new_subject_ids: list[str] = []  # 收集用于设置 分割图 ID
+        destroyed = False
+        self._dirty = {}
+        self._destroyed_subjects = set()
 
-        for subject in new_pg.get("subject_pg", []):
-            sid = subject["subject"]["id"]
+        for subject in pg_msg.subject_pg:
+            sid = subject.subject.id
             if not self._indexer.has_subject(sid):
                 self._merge_subject_new(subject, sid)
                 new_subject_ids.append(sid)
             else:
+                destroyed |= subject.subject_destroyed
                 self._merge_subject_existing(subject, sid)
 
+        self._notify_subscriptions()
+
+        # 物体被创建或销毁: 房间、资源等静态查询的缓存结果可能已过期
+        if new_subject_ids or destroyed:
+            self._context.invalidate_caches()
+
         if self._assign_segmentation_id and new_subject_ids:
             sid_segid_map = {
                 sid: self._next_segmentation_id + i
@@ -383,83 +680,161 @@ class PGManager:
             return sid_segid_map
         return None
 
-    def _merge_subject_new(self, subject: dict, sid: str):
-        self._pg.setdefault("subject_pg", []).append(subject)
+    def _merge_subject_new(self, subject: Message, sid: str):
+        # 整个 SubjectPG 只拷贝一次，各组件视图引用拷贝中的子消息
+        subject = _detached(subject)
+        self._pg.setdefault("subject_pg", []).append(
+            {
+                "subject": MessageView(subject.subject),
+                "component_pg": [MessageView(comp) for comp in subject.component_pg],
+                "subject_destroyed": subject.subject_destroyed,
+            }
+        )
         sidx = len(self._pg["subject_pg"]) - 1
         self._indexer.register_subject(sid, sidx)
 
-        for i, comp in enumerate(subject.get("component_pg", [])):
-            if "component" in comp and "id" in comp["component"]:
-                self._indexer.register_component(sid, comp["component"]["id"], i)
+        dirty = self._dirty.setdefault(sid, set())
+        for i, comp in enumerate(subject.component_pg):
+            if comp.HasField("component"):
+                self._indexer.register_component(sid, comp.component.id, i)
+            types = _component_types(comp)
+            self._indexer.set_component_types(sid, i, types)
+            dirty.update(types)
 
-    def _merge_subject_existing(self, subject: dict, sid: str):
+        if self._columns is not None:
+            self._columns.add_subject(sid, sidx, subject.component_pg)
+
+    def _merge_subject_existing(self, subject: Message, sid: str):
         sidx = self._indexer.get_subject_index(sid)
         subject_ref = self._pg["subject_pg"][sidx]
 
-        if subject.get("subject_destroyed"):
+        if subject.subject_destroyed:
             subject_ref["is_subject_destroyed"] = True
+            self._destroyed_subjects.add(sid)
+            if self._columns is not None:
+                self._columns.mark_destroyed(sidx)
             return
 
-        for comp in subject.get("component_pg", []):
-            if "component" not in comp or "id" not in comp["component"]:
+        for comp in subject.component_pg:
+            if not comp.HasField("component"):
                 continue
 
-            cid = comp["component"]["id"]
+            cid = comp.component.id
             cidx = self._indexer.get_component_index(sid, cid)
+            view = MessageView(_detached(comp))
+            components = subject_ref["component_pg"]
 
             if cidx is not None:
-                subject_ref["component_pg"][cidx] = comp
+                components[cidx] = view
+                if self._columns is not None:
+                    self._columns.replace_component(
+                        sidx, cidx, comp, (v.message for v in components)
+                    )
             else:
-                subject_ref["component_pg"].append(comp)
-                self._indexer.register_component(
-                    sid, cid, len(subject_ref["component_pg"]) - 1
-                )
+                cidx = len(components)
+                components.append(view)
+                self._indexer.register_component(sid, cid, cidx)
+                if self._columns is not None:
+                    self._columns.update_component(sidx, cidx, comp)
+            types = _component_types(comp)
+            old_types = self._indexer.set_component_types(sid, cidx, types)
+            self._dirty.setdefault(sid, set()).update(types, old_types)
+
+    def _notify_subscriptions(self):
+        """将当前帧的变化记录到各个查询订阅中，并移除已回收的订阅。"""
+        if not self._subscriptions:
+            return
+        alive = []
+        for ref in self._subscriptions:
+            subscription = ref()
+            if subscription is not None:
+                subscription.mark_dirty(self._dirty, self._destroyed_subjects)
+                alive.append(ref)
+        if len(alive) != len(self._subscriptions):
+            self._subscriptions = tuple(alive)
+
+    async def _publish_changes(self, gap: StreamGap | None = None):
+        """将最近合并的一帧变化分发给变化订阅者。"""
+        await self._feed.publish(
+            self._current_frame,
+            self._dirty.keys() - self._destroyed_subjects,
+            self._destroyed_subjects,
+            gap,
+        )
 
-    def _validate_metas(self, metas: list[dict]) -> list[PGQueryMeta]:
-        return [validate_query_meta(m) for m in metas]
+    def _evaluate_subject(self, sid: str, plan: PGQueryPlan) -> dict[str, Any] | None:
+        """
+        对单个 subject 执行查询计划。
 
-    def _group_metas_by_component(
-        self, metas: list[PGQueryMeta]
-    ) -> dict[str, list[PGQueryMeta]]:
-        grouped: dict[str, list[PGQueryMeta]] = defaultdict(list)
-        for meta in metas:
-            grouped[meta["component"]].append(meta)
-        return grouped
+        Returns:
+            dict[str, Any] | None: 该 subject 的查询结果；subject 不存在、已销毁或没有命中的字段时为 None。
+        """
+        sidx = self._indexer.get_subject_index(sid)
+        if sidx is None:
+            return None
+        subj = self._pg["subject_pg"][sidx]
+        if self._subject_pass_filter(subj):
+            return None
+
+        found: dict[str, dict[str, Any]] = {}
+        for cidx, comp in enumerate(subj["component_pg"]):
+            types = self._indexer.get_component_types(sid, cidx)
+            for component_name, metas in plan.metas_by_component.items():
+                if component_name in types:
+                    self._extract_fields(comp, component_name, metas, sid, found)
+        return found.get(sid)
+
+    def _iter_plan_hits(self, plan: PGQueryPlan) -> Iterator[tuple[str, int, str]]:
+        """
+        按 (subject, 组件, 查询中组件类型) 的顺序产出命中的 (sid, cidx, 组件类型)，
+        与逐个 subject / 组件遍历时的结果顺序与覆盖关系一致。
+        """
+        names = list(plan.metas_by_component)
+        if len(names) == 1:
+            for sid, cidx in self._indexer.components_of_type(names[0]):
+                yield sid, cidx, names[0]
+            return
+
+        order = {name: i for i, name in enumerate(names)}
+        hits = [
+            (sid, cidx, name)
+            for name in names
+            for sid, cidx in self._indexer.components_of_type(name)
+        ]
+        hits.sort(
+            key=lambda h: (self._indexer.get_subject_index(h[0]), h[1], order[h[2]])
+        )
+        yield from hits
 
     def _subject_pass_filter(self, subj: dict) -> bool:
         return subj.get("is_subject_destroyed", False)
 
-    def _extract_fields_from_subject(
+    def _extract_fields(
         self,
-        subj: dict,
+        comp: MessageView,
+        component_name: str,
+        metas: tuple[PGQueryMeta, ...],
         sid: str,
-        metas_by_component: dict[str, list[PGQueryMeta]],
         result: dict[str, dict[str, Any]],
     ):
-        for comp in subj.get("component_pg", []):
-            cid = comp["component"]["id"]
+        # 组件为 MessageView: 取值时只转换被查询的组件
+        comp_data = comp[component_name]
 
-            for component_name, metas in metas_by_component.items():
-                if component_name not in comp:
+        for meta in metas:
+            allow_multiple = meta.get("allow_multiple", False)
+            for field in meta["fields"]:
+                if field not in comp_data:
                     continue
 
-                comp_data = comp[component_name]
-
-                for meta in metas:
-                    allow_multiple = meta.get("allow_multiple", False)
-                    for field in meta["fields"]:
-                        if field not in comp_data:
-                            continue
-
-                        field_name = meta.get("as_", {}).get(field, field)
-                        result.setdefault(sid, {})
-
-                        if allow_multiple:
-                            result[sid].setdefault(field_name, []).append(
-                                {
-                                    "component_id": cid,
-                                    "value": comp_data[field],
-                                }
-                            )
-                        else:
-                            result[sid][field_name] = comp_data[field]
+                field_name = meta.get("as_", {}).get(field, field)
+                result.setdefault(sid, {})
+
+                if allow_multiple:
+                    result[sid].setdefault(field_name, []).append(
+                        {
+                            "component_id": comp["component"]["id"],
+                            "value": comp_data[field],
+                        }
+                    )
+                else:
+                    result[sid][field_name] = comp_data[field]
@@ -0,0 +1,155 @@
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from .schema import PGQueryMeta, validate_query_meta
+
+if TYPE_CHECKING:
+    from .manager import PGManager
+
+__all__ = ["PGQueryPlan", "PGQuerySubscription"]
+
+
+class PGQueryPlan:
+    """
+    编译后的 PG 查询计划，由 PGManager.compile_query() 创建。
+
+    metas 只在编译时校验与分组一次，之后可在每一帧重复传给 query() / async_query_fields()。
+    执行时通过组件类型倒排索引只访问带有所查询组件的 subject。
+    """
+
+    __slots__ = ("_metas", "_metas_by_component")
+
+    def __init__(self, metas: list[dict]):
+        """
+        Args:
+            metas (list[dict]): 查询字段的 metainfo 列表。
+
+        Raises:
+            PGQueryError: 任何非法字段或格式错误
+        """
+        self._metas: tuple[PGQueryMeta, ...] = tuple(
+            validate_query_meta(m) for m in metas
+        )
+        grouped: dict[str, list[PGQueryMeta]] = defaultdict(list)
+        for meta in self._metas:
+            grouped[meta["component"]].append(meta)
+        self._metas_by_component: dict[str, tuple[PGQueryMeta, ...]] = {
+            component: tuple(group) for component, group in grouped.items()
+        }
+
+    @property
+    def metas(self) -> tuple[PGQueryMeta, ...]:
+        """校验并标准化后的 metas。"""
+        return self._metas
+
+    @property
+    def metas_by_component(self) -> dict[str, tuple[PGQueryMeta, ...]]:
+        """组件类型 -> 该组件上的 metas，按首次出现的顺序排列。"""
+        return self._metas_by_component
+
+    def __repr__(self) -> str:
+        return f"PGQueryPlan(components={list(self._metas_by_component)})"
+
+
+class PGQuerySubscription:
+    """
+    增量查询订阅，由 PGManager.subscribe_query() 创建。
+
+    PGManager 合并每一帧时记录变化的 subject（只记录带有所查询组件类型的变化与销毁），
+    refresh() 只重新计算这些 subject，原地更新上一次的 result 并返回结果发生变化的 subject ID。
+    首次 refresh() 以及 PG 全量重新同步后会重建整个结果。
+
+    示例:
+        sub = pg_manager.subscribe_query(metas)
+        while running:
+            changed = sub.refresh()
+            for sid in changed:
+                handle(sid, sub.result.get(sid))  # None 表示该 subject 已不在结果中
+
+    Attributes:
+        result (dict[str, dict[str, Any]]): 与 query() 格式相同的结果，refresh() 原地更新，
+            新出现的 subject 追加在末尾。
+    """
+
+    def __init__(self, manager: "PGManager", plan: PGQueryPlan):
+        self._manager = manager
+        self._plan = plan
+        self._components = frozenset(plan.metas_by_component)
+        self._dirty: set[str] = set()
+        self._stale = True
+        self._closed = False
+        self.result: dict[str, dict[str, Any]] = {}
+
+    @property
+    def plan(self) -> PGQueryPlan:
+        return self._plan
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def stale(self) -> bool:
+        """下一次 refresh() 是否需要重建整个结果。"""
+        return self._stale
+
+    def refresh(self) -> set[str]:
+        """
+        同步接口: 按累积的变化更新 result。
+
+        Returns:
+            set[str]: 结果发生变化的 subject ID（包括新增与移除）。
+        """
+        return self._manager.refresh_query(self)
+
+    async def async_refresh(self) -> set[str]:
+        """
+        异步接口: 按累积的变化更新 result。
+
+        Returns:
+            set[str]: 结果发生变化的 subject ID（包括新增与移除）。
+        """
+        return await self._manager.async_refresh_query(self)
+
+    def close(self):
+        """取消订阅，之后不再记录变化。"""
+        self._manager.unsubscribe_query(self)
+        self._closed = True
+        self._dirty.clear()
+
+    # ===== 由 PGManager 调用 =====
+
+    def mark_dirty(self, dirty: dict[str, set[str]], destroyed: set[str]):
+        """
+        记录一帧中的变化。
+
+        Args:
+            dirty (dict[str, set[str]]): subject ID -> 发生变化的组件类型（替换前后的并集）。
+            destroyed (set[str]): 本帧被销毁的 subject ID。
+        """
+        if self._stale:
+            return
+        components = self._components
+        self._dirty.update(
+            sid for sid, types in dirty.items() if not components.isdisjoint(types)
+        )
+        self._dirty.update(destroyed)
+
+    def mark_stale(self):
+        """PG 被重置，下一次 refresh() 重建整个结果。"""
+        self._stale = True
+        self._dirty.clear()
+
+    def take_dirty(self) -> set[str] | None:
+        """
+        取出并清空累积的变化。
+
+        Returns:
+            set[str] | None: 需要重新计算的 subject ID；需要重建整个结果时为 None。
+        """
+        if self._stale:
+            self._stale = False
+            self._dirty.clear()
+            return None
+        dirty, self._dirty = self._dirty, set()
+        return dirty
@@ -0,0 +1,146 @@
+from collections.abc import Iterator, Mapping
+from typing import Any, Final
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+
+__all__ = ["MessageView", "message_field_value"]
+
+# 与 MessageToDict 的输出保持一致的转换参数
+_DICT_OPTIONS: Final[dict[str, bool]] = {
+    "preserving_proto_field_name": True,
+    "always_print_fields_with_no_presence": True,
+}
+
+# JSON 映射中 64 位整数以字符串表示
+_INT64_TYPES: Final = frozenset(
+    {
+        FieldDescriptor.TYPE_INT64,
+        FieldDescriptor.TYPE_UINT64,
+        FieldDescriptor.TYPE_SINT64,
+        FieldDescriptor.TYPE_FIXED64,
+        FieldDescriptor.TYPE_SFIXED64,
+    }
+)
+
+# 取值与 JSON 映射完全一致，可直接返回
+_PLAIN_TYPES: Final = frozenset(
+    {
+        FieldDescriptor.TYPE_BOOL,
+        FieldDescriptor.TYPE_STRING,
+        FieldDescriptor.TYPE_INT32,
+        FieldDescriptor.TYPE_UINT32,
+        FieldDescriptor.TYPE_SINT32,
+        FieldDescriptor.TYPE_FIXED32,
+        FieldDescriptor.TYPE_SFIXED32,
+    }
+)
+
+_UNSUPPORTED: Final = object()
+
+
+def _field_to_json(message: Message, field: FieldDescriptor) -> Any:
+    """
+    按 MessageToDict 的规则转换单个字段。
+    repeated、map、浮点与 bytes 字段的规则较多，返回 _UNSUPPORTED，由调用方整体转换。
+    """
+    value = getattr(message, field.name)
+    if isinstance(value, Message):
+        return MessageToDict(value, **_DICT_OPTIONS)
+    if isinstance(value, bool | int | str):
+        if field.type in _PLAIN_TYPES:
+            return value
+        if field.type in _INT64_TYPES:
+            return str(value)
+        if field.type == FieldDescriptor.TYPE_ENUM:
+            enum_value = field.enum_type.values_by_number.get(value)
+            return value if enum_value is None else enum_value.name
+    return _UNSUPPORTED
+
+
+def message_field_value(message: Message, name: str) -> Any:
+    """
+    获取 proto 消息单个字段在 MessageToDict 结果中的取值，未设置的有 presence 字段返回 None。
+
+    Args:
+        message (Message): proto 消息。
+        name (str): 字段名。
+    """
+    field = message.DESCRIPTOR.fields_by_name[name]
+    if field.has_presence and not message.HasField(name):
+        return None
+    value = _field_to_json(message, field)
+    if value is _UNSUPPORTED:
+        return MessageToDict(message, **_DICT_OPTIONS).get(name)
+    return value
+
+
+class MessageView(Mapping[str, Any]):
+    """
+    proto 消息的只读 dict 视图，键与取值和 MessageToDict(preserving_proto_field_name=True,
+    always_print_fields_with_no_presence=True) 的结果一致。
+
+    字段在首次访问时才转换并缓存，PG 中未被查询的组件不会产生 dict 转换开销。
+    需要普通 dict（如 json.dump、修改）时调用 to_dict()。
+    """
+
+    __slots__ = ("_complete", "_message", "_values")
+
+    def __init__(self, message: Message):
+        self._message = message
+        self._values: dict[str, Any] = {}
+        self._complete = False
+
+    @property
+    def message(self) -> Message:
+        """被包装的 proto 消息，视为只读。"""
+        return self._message
+
+    def to_dict(self) -> dict[str, Any]:
+        """完整转换为 dict，等价于对消息调用 MessageToDict。"""
+        self._materialize()
+        return dict(self._values)
+
+    def _materialize(self):
+        if not self._complete:
+            self._values = MessageToDict(self._message, **_DICT_OPTIONS)
+            self._complete = True
+
+    def __contains__(self, key: object) -> bool:
+        if self._complete:
+            return key in self._values
+        field = (
+            self._message.DESCRIPTOR.fields_by_name.get(key)
+            if isinstance(key, str)
+            else None
+        )
+        if field is None:
+            return False
+        return not field.has_presence or self._message.HasField(key)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            if self._complete or key not in self:
+                raise
+        value = _field_to_json(
+            self._message, self._message.DESCRIPTOR.fields_by_name[key]
+        )
+        if value is _UNSUPPORTED:
+            self._materialize()
+            return self._values[key]
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        if self._complete:
+            return iter(self._values)
+        return (f.name for f in self._message.DESCRIPTOR.fields if f.name in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"MessageView({self.to_dict()!r})"
@@ -1,8 +1,14 @@
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
 from tongsim.connection.grpc import UnaryAPI
 from tongsim.core.world_context import WorldContext
 from tongsim.logger import get_logger
 from tongsim.math.geometry import Vector3
 
+if TYPE_CHECKING:
+    import numpy as np
+
 _logger = get_logger("spatial")
 
 
@@ -14,29 +20,37 @@ class SpatialManager:
     def __init__(self, world_context: WorldContext):
         self._context: WorldContext = world_context
 
-    def get_current_room_info(self) -> list[dict]:
+    def get_current_room_info(self, as_array: bool = False) -> list[dict]:
         """
         获取当前地图中所有房间信息。
 
+        Args:
+            as_array (bool): 是否以 NumPy 数组返回边界框（需要安装 NumPy）。
+
         Returns:
             list[dict]: 每个房间信息包含如下字段:
                 - room_name (str)
                 - room_category (str)
-                - boxes (list[dict]): AABB 边界框，包含 min/max 三维坐标。
+                - boxes (list[dict]): AABB 边界框，包含 min/max 三维坐标；
+                  as_array=True 时为 {"min": (M, 3) 数组, "max": (M, 3) 数组}。
         """
-        return self._context.sync_run(self.async_get_current_room_info())
+        return self._context.sync_run(self.async_get_current_room_info(as_array))
 
-    async def async_get_current_room_info(self) -> list[dict]:
+    async def async_get_current_room_info(self, as_array: bool = False) -> list[dict]:
         """
         异步获取当前地图房间信息。
 
+        Args:
+            as_array (bool): 是否以 NumPy 数组返回边界框（需要安装 NumPy）。
+
         Returns:
             list[dict]: 每个房间信息包含如下字段:
                 - room_name (str)
                 - room_category (str)
-                - boxes (list[dict]): AABB 边界框，包含 min/max 三维坐标。
+                - boxes (list[dict]): AABB 边界框，包含 min/max 三维坐标；
+                  as_array=True 时为 {"min": (M, 3) 数组, "max": (M, 3) 数组}。
         """
-        return await UnaryAPI.get_room_info(self._context.conn)
+        return await UnaryAPI.get_room_info(self._context.conn, as_array=as_array)
 
     def get_nearest_nav_position(self, target_location: Vector3) -> Vector3 | None:
         """
@@ -92,6 +106,30 @@ class SpatialManager:
         """
         return await UnaryAPI.get_random_spawn_location(self._context.conn, room_name)
 
+    def get_nearest_nav_positions(
+        self,
+        target_locations: Sequence[Vector3],
+        concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> list[Vector3 | None]:
+        """
+        批量获取多个目标点附近最近的可导航位置，整批请求只做一次跨线程提交。
+
+        Args:
+            target_locations (Sequence[Vector3]): 待查询的目标位置列表。
+            concurrency (int | None): 最大并发请求数，None 表示不限制。
+            timeout (float | None): 整批请求的超时时间（秒）。
+
+        Returns:
+            list[Vector3 | None]: 与输入顺序一致的导航点；查询失败的项为 None。
+        """
+        results = self._context.sync_run_many(
+            (self.async_get_nearest_nav_position(loc) for loc in target_locations),
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+        return [None if isinstance(r, BaseException) else r for r in results]
+
     def get_room_name_from_location(self, location: Vector3) -> str:
         """
         获得该位置所在的房间名
@@ -116,6 +154,32 @@ class SpatialManager:
         """
         return await UnaryAPI.get_room_name_from_location(self._context.conn, location)
 
+    def get_room_names_from_locations(
+        self,
+        locations: Sequence[Vector3],
+        concurrency: int | None = None,
+        timeout: float | None = None,
+    ) -> list[str]:
+        """
+        批量获得多个位置所在的房间名，整批请求只做一次跨线程提交。
+
+        Args:
+            locations (Sequence[Vector3]): 查询位置列表。
+            concurrency (int | None): 最大并发请求数，None 表示不限制。
+            timeout (float | None): 整批请求的超时时间（秒）。
+
+        Returns:
+            list[str]: 与输入顺序一致的房间名。
+
+        Raises:
+            Exception: 任意一项查询失败时抛出第一个异常。
+        """
+        return self._context.sync_gather(
+            *(self.async_get_room_name_from_location(loc) for loc in locations),
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
     def get_room_array(self) -> list[str]:
         """
         获得当前地图所有房间
@@ -172,30 +236,38 @@ class SpatialManager:
             self._context.conn, center, min_radius, max_radius, room
         )
 
-    def get_navmesh_polys_in_room(self, room_name: str) -> list[list[Vector3]]:
+    def get_navmesh_polys_in_room(
+        self, room_name: str, as_array: bool = False
+    ) -> list[list[Vector3]] | list["np.ndarray"]:
         """
         获取房间内导航网格多边形顶点列表（同步接口）。
 
         Args:
             room_name (str): 房间名称。
+            as_array (bool): 是否以 NumPy 数组返回顶点（需要安装 NumPy）。
 
         Returns:
-            list[list[Vector3]]: 导航网格多边形集合。每个元素表示一个多边形的顶点列表，顶点类型为 Vector3。
+            list[list[Vector3]]: 导航网格多边形集合。每个元素表示一个多边形的顶点列表，顶点类型为 Vector3；
+                as_array=True 时每个多边形为 (N, 3) 数组。
         """
-        return self._context.sync_run(self.async_get_navmesh_polys_in_room(room_name))
+        return self._context.sync_run(
+            self.async_get_navmesh_polys_in_room(room_name, as_array)
+        )
 
     async def async_get_navmesh_polys_in_room(
-        self, room_name: str
-    ) -> list[list[Vector3]]:
+        self, room_name: str, as_array: bool = False
+    ) -> list[list[Vector3]] | list["np.ndarray"]:
         """
         获取房间内导航网格多边形顶点列表（异步接口）。
 
         Args:
             room_name (str): 房间名称。
+            as_array (bool): 是否以 NumPy 数组返回顶点（需要安装 NumPy）。
 
         Returns:
-            list[list[Vector3]]: 导航网格多边形集合。每个元素表示一个多边形的顶点列表，顶点类型为 Vector3。
+            list[list[Vector3]]: 导航网格多边形集合。每个元素表示一个多边形的顶点列表，顶点类型为 Vector3；
+                as_array=True 时每个多边形为 (N, 3) 数组。
         """
         return await UnaryAPI.get_nevmesh_polys_in_room(
-            self._context.conn, room_name=room_name
+            self._context.conn, room_name=room_name, as_array=as_array
         )
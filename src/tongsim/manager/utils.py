@@ -141,6 +141,7 @@ class UtilFuncs:
             location=Vector3(),
             is_simulating_physics=False,
         )
+        self._context.invalidate_caches()
 
         return await UnaryAPI.attach_object_to_target(
             self._context.conn,
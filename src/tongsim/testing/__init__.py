@@ -0,0 +1,9 @@
+"""
+tongsim.testing
+
+离线测试工具: 进程内的 UE gRPC 替身服务器，用于在没有 Unreal 的环境中压测与基准测试 SDK。
+"""
+
+from .fake_ue import FakeUEConfig, FakeUEServer, build_pg_frames
+
+__all__ = ["FakeUEConfig", "FakeUEServer", "build_pg_frames"]
@@ -0,0 +1,536 @@
+"""
+tongsim.testing.fake_ue
+
+进程内的 UE gRPC 替身服务器，用于在没有 Unreal 的环境中对 SDK 热路径做压力测试与基准测试:
+- FakeUEConfig: 实体数量、每帧位姿变化的实体比例、UE / 相机帧率、图像尺寸、普通调用延迟、动画时长等参数；
+- FakeUEServer: 基于 grpc.aio.server 实现 Subject、PG 流、相机流、动画双向流、Scene / Map、Segment
+  与废弃的 ServiceInterface，这些服务中的其余方法返回空响应（服务端流保持打开直到客户端取消）；
+- build_pg_frames: 构造服务器推送的全量 / 增量 PG 帧，可脱离服务器用于 PG 合并基准测试。
+
+服务与消息类型从 tongsim_api_protocol 的描述符中解析，不依赖生成的 Servicer 基类；
+可通过 handlers 按 "Service/Method" 覆盖任意方法的实现。
+
+PG 增量帧在首次订阅时预先序列化，发送时只在末尾追加帧号与时间戳
+（protobuf 解析时后出现的标量字段覆盖之前的值），因此大实体数量下服务端也不会成为瓶颈。
+"""
+
+import asyncio
+import importlib
+import itertools
+import math
+import time
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any, Final
+
+import grpc
+import grpc.aio
+from google.protobuf import json_format, message_factory
+from google.protobuf.descriptor import MethodDescriptor
+from google.protobuf.message import Message
+
+from tongsim.logger import get_logger
+
+__all__ = ["FakeUEConfig", "FakeUEServer"]
+
+_logger = get_logger("fake_ue")
+
+# (定义服务的 _pb2 模块, 服务名)
+_SERVICES: Final[tuple[tuple[str, str], ...]] = (
+    ("tongsim_api_protocol.subject.subject_pb2", "SubjectService"),
+    ("tongsim_api_protocol.subsystem.pg_pb2", "PGService"),
+    ("tongsim_api_protocol.subsystem.camera_pb2", "CameraService"),
+    ("tongsim_api_protocol.component.animation.animation_pb2", "AnimationService"),
+    ("tongsim_api_protocol.subsystem.scene_pb2", "SceneService"),
+    ("tongsim_api_protocol.subsystem.map_pb2", "MapService"),
+    ("tongsim_api_protocol.subsystem.segment_pb2", "SegmentService"),
+    (
+        "tongsim.connection.grpc._legacy.generated.TongosAgentGRPCForUE_pb2",
+        "ServiceInterface",
+    ),
+)
+
+# 预先序列化的 PG 增量帧数量，循环发送
+_DELTA_POOL = 16
+# 废弃接口中表示成功的返回码
+_SERVE_SUCCESS = 1
+
+
+@dataclass(frozen=True, slots=True)
+class FakeUEConfig:
+    """
+    替身服务器参数。
+
+    Attributes:
+        subjects (int): PG 中的实体数量，每个实体带 pose、scale、aabb 三个组件。
+        moving_ratio (float): 每个 PG 增量帧中位姿发生变化的实体比例。
+        ue_fps (float): 模拟的 UE 帧率；PG 每隔 SetPGFrequency 设置的帧数推送一次增量，inf 表示不限速。
+        camera_fps (float): 相机流的帧率，inf 表示不限速。
+        image_width (int): 相机图像宽度。
+        image_height (int): 相机图像高度。
+        unary_latency (float): 每次 unary 调用的模拟处理延迟（秒）。
+        anim_duration (float): 动画命令从 BEGIN 到 END 的时长（秒）。
+        rooms (int): GetMapRoomInfo 返回的房间数量。
+        pg_frequency (int): 客户端调用 SetPGFrequency 之前使用的 PG 刷新间隔（帧）。
+    """
+
+    subjects: int = 100
+    moving_ratio: float = 0.05
+    ue_fps: float = 60.0
+    camera_fps: float = 30.0
+    image_width: int = 64
+    image_height: int = 64
+    unary_latency: float = 0.0
+    anim_duration: float = 0.0
+    rooms: int = 4
+    pg_frequency: int = 10
+
+    def __post_init__(self):
+        if self.subjects < 0:
+            raise ValueError(f"subjects must be >= 0, got {self.subjects}.")
+        if not 0.0 <= self.moving_ratio <= 1.0:
+            raise ValueError(
+                f"moving_ratio must be in [0, 1], got {self.moving_ratio}."
+            )
+        if self.ue_fps <= 0 or self.camera_fps <= 0:
+            raise ValueError("ue_fps and camera_fps must be > 0.")
+
+
+def _subject_id(index: int) -> str:
+    return f"FakeSubject_{index}"
+
+
+def _from_dict(message_cls: type[Message], data: dict) -> Message:
+    # 按字段名构造，协议中不存在的字段被忽略
+    return json_format.ParseDict(data, message_cls(), ignore_unknown_fields=True)
+
+
+def _pg_header(pg_cls: type[Message], frame: int) -> bytes:
+    header = pg_cls(current_frame=frame)
+    header.beijing_timestamp.timestamp_ms = int(time.time() * 1000)
+    return header.SerializeToString()
+
+
+def build_pg_frames(
+    config: FakeUEConfig, pg_cls: type[Message]
+) -> tuple[bytes, list[bytes]]:
+    """
+    构造替身服务器推送的 PG 帧，也可直接用于 PG 合并等离线基准测试。
+
+    每个实体带有 pose / scale / aabb 三个组件；增量帧中只包含 moving_ratio 比例实体的 pose 组件。
+    帧中不带帧号与时间戳。
+
+    Args:
+        config (FakeUEConfig): 实体数量与移动比例。
+        pg_cls (type[Message]): PG 消息类型。
+
+    Returns:
+        tuple[bytes, list[bytes]]: 序列化后的全量帧，以及循环使用的增量帧。
+    """
+    n = config.subjects
+    full = pg_cls(world_id="FakeWorld")
+    for i in range(n):
+        _fill_subject_pg(full.subject_pg.add(), i, 0, full=True)
+    moving = round(n * config.moving_ratio)
+    deltas = []
+    for k in range(_DELTA_POOL):
+        delta = pg_cls()
+        for j in range(moving):
+            _fill_subject_pg(
+                delta.subject_pg.add(), (k * moving + j) % n, k + 1, full=False
+            )
+        deltas.append(delta.SerializeToString())
+    return full.SerializeToString(), deltas
+
+
+def _fill_subject_pg(subject: Any, index: int, step: int, full: bool) -> None:
+    # 直接写字段比 json_format.ParseDict 快一个数量级，20k 实体的全量帧也只需数百毫秒
+    sid = _subject_id(index)
+    x, y = (index % 100) * 100.0 + step * 10.0, (index // 100) * 100.0
+    subject.subject.id = sid
+    pose = subject.component_pg.add()
+    pose.component.id = f"{sid}_pose"
+    location = pose.pose.location
+    location.x, location.y, location.z = x, y, 0.0
+    pose.pose.rotation.w = 1.0
+    if not full:
+        return
+    scale = subject.component_pg.add()
+    scale.component.id = f"{sid}_scale"
+    scale.scale.x, scale.scale.y, scale.scale.z = 1.0, 1.0, 1.0
+    aabb = subject.component_pg.add()
+    aabb.component.id = f"{sid}_aabb"
+    lo, hi = aabb.aabb.min_vertex, aabb.aabb.max_vertex
+    lo.x, lo.y, lo.z = x - 50.0, y - 50.0, 0.0
+    hi.x, hi.y, hi.z = x + 50.0, y + 50.0, 100.0
+
+
+def _interval(fps: float, frames: int = 1) -> float:
+    return 0.0 if math.isinf(fps) else frames / fps
+
+
+class _Pacer:
+    """按固定间隔推进的节拍器，按绝对时间对齐，避免处理耗时累积成漂移。"""
+
+    def __init__(self):
+        self._next = time.monotonic()
+
+    async def tick(self, interval: float) -> None:
+        if interval <= 0:
+            # 不限速时也让出事件循环，避免饿死其他调用
+            await asyncio.sleep(0)
+            return
+        # 落后于节拍时立即发送并从当前时间重新对齐，不做突发补发
+        self._next = max(self._next + interval, time.monotonic())
+        await asyncio.sleep(max(self._next - time.monotonic(), 0.0))
+
+
+class FakeUEServer:
+    """
+    进程内的 UE gRPC 替身服务器。
+
+    用法:
+
+        async with FakeUEServer(FakeUEConfig(subjects=5000)) as ue:
+            context = await WorldContext.attach_to_running_loop(ue.endpoint, ue.legacy_endpoint)
+
+    主接口与废弃接口分别监听两个端口（endpoint / legacy_endpoint），两者提供相同的服务。
+
+    Attributes:
+        calls (Counter[str]): 按 "Service/Method" 统计的调用次数（流式调用按打开次数计）。
+        segment_ids (dict[str, int]): 客户端通过 SetSegmentId 设置的分割图 ID。
+    """
+
+    def __init__(
+        self,
+        config: FakeUEConfig | None = None,
+        handlers: Mapping[str, Callable[..., Any]] | None = None,
+        host: str = "127.0.0.1",
+    ):
+        """
+        Args:
+            config (FakeUEConfig | None): 服务器参数，None 使用默认值。
+            handlers (Mapping[str, Callable[..., Any]] | None): 按 "Service/Method" 覆盖方法实现，
+                签名为 (request, context, response_cls)；unary 方法为返回响应的协程，
+                服务端流为异步生成器，客户端流的 request 为请求的异步迭代器。
+            host (str): 监听地址。
+        """
+        self._config: FakeUEConfig = config or FakeUEConfig()
+        self._overrides: dict[str, Callable[..., Any]] = dict(handlers or {})
+        self._host = host
+        self._server: grpc.aio.Server | None = None
+        self._ports: tuple[int, int] = (0, 0)
+        self._started = time.monotonic()
+        self._stopping = asyncio.Event()
+        self._pg_frequency: int = self._config.pg_frequency
+        self._pg_frames: tuple[bytes, list[bytes]] | None = None
+        self._image_streams: dict[str, asyncio.Event] = {}
+        self._placeholders: dict[str, bytes] = {}
+        self._builtin: dict[str, Callable[..., Any]] = {
+            "SubjectService/QueryComponents": self._query_components,
+            "SceneService/GetFPS": self._get_fps,
+            "MapService/GetMapRoomInfo": self._get_map_room_info,
+            "SegmentService/SetSegmentId": self._set_segment_id,
+            "PGService/SetPGFrequency": self._set_pg_frequency,
+            "PGService/SubScribePG": self._subscribe_pg,
+            "CameraService/GetCameraImage": self._get_camera_image,
+            "CameraService/SubscribeImage": self._subscribe_image,
+            "CameraService/SubscribeCustomRenderImage": self._subscribe_image,
+            "CameraService/CancelImageStream": self._cancel_image_stream,
+            "AnimationService/SubScribeAnimation": self._subscribe_animation,
+            "ServiceInterface/CallFunction": self._call_function,
+            "ServiceInterface/StreamingFunction": self._streaming_function,
+        }
+        self.calls: Counter[str] = Counter()
+        self.segment_ids: dict[str, int] = {}
+
+    @property
+    def config(self) -> FakeUEConfig:
+        return self._config
+
+    @property
+    def endpoint(self) -> str:
+        """主接口地址，对应 GrpcConnection。"""
+        return f"{self._host}:{self._ports[0]}"
+
+    @property
+    def legacy_endpoint(self) -> str:
+        """废弃接口地址，对应 GrpcLegacyConnection。"""
+        return f"{self._host}:{self._ports[1]}"
+
+    def subject_ids(self) -> list[str]:
+        """PG 中所有实体的 subject id。"""
+        return [_subject_id(i) for i in range(self._config.subjects)]
+
+    async def start(self) -> "FakeUEServer":
+        """绑定随机端口并启动服务器。"""
+        if self._server is not None:
+            raise RuntimeError("FakeUEServer already started.")
+        server = grpc.aio.server()
+        server.add_generic_rpc_handlers(
+            tuple(
+                self._service_handler(module, service) for module, service in _SERVICES
+            )
+        )
+        self._ports = (
+            server.add_insecure_port(f"{self._host}:0"),
+            server.add_insecure_port(f"{self._host}:0"),
+        )
+        self._stopping.clear()
+        self._started = time.monotonic()
+        await server.start()
+        self._server = server
+        _logger.debug(
+            f"[FakeUEServer] listening on {self.endpoint}, {self.legacy_endpoint}"
+        )
+        return self
+
+    async def stop(self, grace: float | None = None) -> None:
+        """结束所有流并停止服务器。"""
+        self._stopping.set()
+        if self._server is not None:
+            await self._server.stop(grace)
+            self._server = None
+
+    async def __aenter__(self) -> "FakeUEServer":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    # ===== 服务注册 =====
+
+    def _service_handler(self, module: str, service: str) -> grpc.GenericRpcHandler:
+        descriptor = importlib.import_module(module).DESCRIPTOR.services_by_name[
+            service
+        ]
+        return grpc.method_handlers_generic_handler(
+            descriptor.full_name,
+            {
+                method.name: self._method_handler(service, method)
+                for method in descriptor.methods
+            },
+        )
+
+    def _method_handler(
+        self, service: str, method: MethodDescriptor
+    ) -> grpc.RpcMethodHandler:
+        key = f"{service}/{method.name}"
+        request_cls = message_factory.GetMessageClass(method.input_type)
+        response_cls = message_factory.GetMessageClass(method.output_type)
+        impl = self._overrides.get(key) or self._builtin.get(key)
+        deserializer = request_cls.FromString
+
+        if method.server_streaming:
+            impl = impl or self._idle_stream
+
+            async def stream(request: Any, context: grpc.aio.ServicerContext):
+                self.calls[key] += 1
+                async for response in impl(request, context, response_cls):
+                    yield response
+
+            # 已序列化的响应（PG 帧）直接写出
+            def serializer(response: Any) -> bytes:
+                if isinstance(response, bytes):
+                    return response
+                return response.SerializeToString()
+
+            if method.client_streaming:
+                return grpc.stream_stream_rpc_method_handler(
+                    stream, deserializer, serializer
+                )
+            return grpc.unary_stream_rpc_method_handler(
+                stream, deserializer, serializer
+            )
+
+        impl = impl or self._empty
+
+        async def unary(request: Any, context: grpc.aio.ServicerContext) -> Message:
+            self.calls[key] += 1
+            if self._config.unary_latency > 0:
+                await asyncio.sleep(self._config.unary_latency)
+            return await impl(request, context, response_cls)
+
+        serializer = response_cls.SerializeToString
+        if method.client_streaming:
+            return grpc.stream_unary_rpc_method_handler(unary, deserializer, serializer)
+        return grpc.unary_unary_rpc_method_handler(unary, deserializer, serializer)
+
+    @staticmethod
+    async def _empty(request: Any, context, response_cls: type[Message]) -> Message:
+        return response_cls()
+
+    async def _idle_stream(
+        self, request: Any, context, response_cls: type[Message]
+    ) -> AsyncIterator[Message]:
+        if hasattr(request, "__aiter__"):
+            # 双向流: 每条请求回复一条空响应
+            async for _ in request:
+                yield response_cls()
+            return
+        # 服务端流: 不推送数据，保持打开直到客户端取消或服务器停止
+        await self._stopping.wait()
+
+    def _current_frame(self) -> int:
+        fps = self._config.ue_fps
+        if math.isinf(fps):
+            return 0
+        return int((time.monotonic() - self._started) * fps)
+
+    # ===== Subject / Scene / Map / Segment =====
+
+    async def _query_components(self, request, context, response_cls):
+        components = {f"{request.id}_{c}": c for c in ("pose", "scale", "aabb")}
+        return _from_dict(response_cls, {"components_map": components})
+
+    async def _get_fps(self, request, context, response_cls):
+        fps = self._config.ue_fps
+        return response_cls(float=0.0 if math.isinf(fps) else fps)
+
+    async def _get_map_room_info(self, request, context, response_cls):
+        rooms = [
+            {
+                "room_name": f"FakeRoom_{i}",
+                "room_rdf": "living_room",
+                "box": [
+                    {
+                        "min_vertex": {"x": i * 1000.0, "y": 0.0, "z": 0.0},
+                        "max_vertex": {"x": (i + 1) * 1000.0, "y": 1000.0, "z": 300.0},
+                    }
+                ],
+            }
+            for i in range(self._config.rooms)
+        ]
+        return _from_dict(response_cls, {"room_info": rooms})
+
+    async def _set_segment_id(self, request, context, response_cls):
+        self.segment_ids.update(request.id_map)
+        return response_cls()
+
+    # ===== PG =====
+
+    async def _set_pg_frequency(self, request, context, response_cls):
+        self._pg_frequency = max(int(request.frequency), 1)
+        return response_cls()
+
+    async def _subscribe_pg(
+        self, request, context, response_cls
+    ) -> AsyncIterator[bytes]:
+        if self._pg_frames is None:
+            # 大实体数量时构造全量帧耗时较长，放到线程中避免阻塞其他调用
+            self._pg_frames = await asyncio.to_thread(
+                build_pg_frames, self._config, response_cls
+            )
+        full, deltas = self._pg_frames
+        frame = self._current_frame()
+        yield full + _pg_header(response_cls, frame)
+        pacer = _Pacer()
+        for tick in itertools.count():
+            await pacer.tick(_interval(self._config.ue_fps, self._pg_frequency))
+            if self._stopping.is_set():
+                return
+            frame += self._pg_frequency
+            yield deltas[tick % len(deltas)] + _pg_header(response_cls, frame)
+
+    # ===== Camera =====
+
+    def _placeholder(self, channel: str, bytes_per_pixel: int) -> bytes:
+        data = self._placeholders.get(channel)
+        if data is None:
+            size = self._config.image_width * self._config.image_height
+            data = self._placeholders[channel] = bytes(size * bytes_per_pixel)
+        return data
+
+    def _fill_image(self, image: Any, camera_config: Any) -> None:
+        image.camera_id = camera_config.camera_id
+        image.ts = int(time.time() * 1000)
+        image.width = self._config.image_width
+        image.height = self._config.image_height
+        if camera_config.b_rgb:
+            image.rgb = self._placeholder("rgb", 4)
+        if camera_config.b_depth:
+            image.depth = self._placeholder("depth", 4)
+        if camera_config.b_segmentation:
+            image.segmentation = self._placeholder("segmentation", 4)
+
+    async def _get_camera_image(self, request, context, response_cls):
+        response = response_cls()
+        self._fill_image(response.camera_image_res, request.camera_config)
+        return response
+
+    async def _subscribe_image(
+        self, request, context, response_cls
+    ) -> AsyncIterator[Message]:
+        name = request.stream_name
+        cancelled = self._image_streams[name] = asyncio.Event()
+        try:
+            pacer = _Pacer()
+            while not (cancelled.is_set() or self._stopping.is_set()):
+                response = response_cls()
+                for camera_config in request.camera_config_list:
+                    self._fill_image(response.camera_image_list.add(), camera_config)
+                yield response
+                await pacer.tick(_interval(self._config.camera_fps))
+        finally:
+            if self._image_streams.get(name) is cancelled:
+                del self._image_streams[name]
+
+    async def _cancel_image_stream(self, request, context, response_cls):
+        cancelled = self._image_streams.get(request.stream_name)
+        if cancelled is not None:
+            cancelled.set()
+        return response_cls()
+
+    # ===== Animation =====
+
+    async def _subscribe_animation(
+        self, request_iterator, context, response_cls
+    ) -> AsyncIterator[Message]:
+        status = response_cls.DESCRIPTOR.fields_by_name[
+            "animation_command_status"
+        ].enum_type.values_by_name
+        begin, end = status["BEGIN"].number, status["END"].number
+        results: asyncio.Queue[Message | None] = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        def result(command_id: int, code: int) -> Message:
+            return response_cls(
+                command_id=command_id,
+                animation_command_status=code,
+                current_frame=self._current_frame(),
+            )
+
+        def finish(command_id: int) -> None:
+            results.put_nowait(result(command_id, end))
+
+        async def consume():
+            async for params in request_iterator:
+                results.put_nowait(result(params.command_id, begin))
+                if self._config.anim_duration > 0:
+                    loop.call_later(
+                        self._config.anim_duration, finish, params.command_id
+                    )
+                else:
+                    finish(params.command_id)
+            # 客户端结束写入后，等待进行中的动画结束再关闭流
+            await asyncio.sleep(self._config.anim_duration)
+            results.put_nowait(None)
+
+        reader = asyncio.create_task(consume())
+        try:
+            while (response := await results.get()) is not None:
+                yield response
+        finally:
+            reader.cancel()
+
+    # ===== 废弃接口 ServiceInterface =====
+
+    async def _call_function(self, request, context, response_cls):
+        return response_cls(code=_SERVE_SUCCESS)
+
+    async def _streaming_function(
+        self, request_iterator, context, response_cls
+    ) -> AsyncIterator[Message]:
+        async for _ in request_iterator:
+            yield response_cls(code=_SERVE_SUCCESS)
@@ -2,14 +2,19 @@
 tongsim.tongsim
 
 对应单个 TongSim UE 实例, 内部依赖 WorldContext 管理连接与任务调度。
+
+- TongSim: 同步阻塞接口，所有调用经由 WorldContext 的 AsyncLoop 线程执行；
+- AsyncTongSim: 原生 asyncio 接口，直接绑定调用方的事件循环，只使用 async_* 方法。
 """
 
 import os.path
 import pickle
-from typing import Final, TypeVar
+from collections.abc import Sequence
+from typing import TypeVar
 
-from tongsim.connection.grpc import LegacyAPI, UnaryAPI
-from tongsim.core.world_context import WorldContext
+from tongsim.connection.grpc import ChannelOptions, LegacyAPI, UnaryAPI
+from tongsim.core.offload import OffloadKind
+from tongsim.core.world_context import ReleaseReport, WorldContext
 from tongsim.entity import AgentEntity, CameraEntity
 from tongsim.entity.mixin import HFCameraEntity, MixinEntityBase
 from tongsim.logger import get_logger
@@ -21,7 +26,7 @@ from tongsim.manager.utils import UtilFuncs
 from tongsim.math.geometry import Quaternion, Vector3
 from tongsim.type import ViewModeType
 
-__all__ = ["TongSim"]
+__all__ = ["AsyncTongSim", "TongSim"]
 
 _logger = get_logger("tongsim")
 
@@ -34,23 +39,49 @@ class TongSim:
     所有方法为同步阻塞接口，便于在同步项目或脚本中使用。
     """
 
-    def __init__(self, grpc_endpoint: str, legacy_grpc_endpoint: str):
+    def __init__(
+        self,
+        grpc_endpoint: str,
+        legacy_grpc_endpoint: str,
+        loops: int = 1,
+        offload_kind: OffloadKind = "thread",
+        offload_workers: int | None = None,
+        channel_options: ChannelOptions | None = None,
+        ready_timeout: float | None = None,
+    ):
         """
         初始化一个 TongSim 实例。
 
         Args:
             endpoint (str): gRPC 服务器地址，如 "localhost:5056"
             legacy_endpoint (str): 废弃的 gRPC 服务器地址，如 "localhost:50052"
-        """
-        self._context: Final[WorldContext] = WorldContext(
-            grpc_endpoint, legacy_grpc_endpoint
+            loops (int): 事件循环数量，默认 1。智能体较多时可增大，各实体的流按 id 分片到不同 loop 上。
+            offload_kind (OffloadKind): 解码等计算密集工作使用的计算池类型，"thread"（默认）或 "process"。
+            offload_workers (int | None): 计算池工作者数量，None 使用默认值。
+            channel_options (ChannelOptions | None): gRPC 通道参数，例如图像流使用的媒体通道数、消息大小上限。
+            ready_timeout (float | None): 等待 UE 就绪并通过健康检查的最长秒数，超时抛出 ConnectionError；None 表示不检查。
+        """
+        self._setup(
+            WorldContext(
+                grpc_endpoint,
+                legacy_grpc_endpoint,
+                loops=loops,
+                offload_kind=offload_kind,
+                offload_workers=offload_workers,
+                channel_options=channel_options,
+                ready_timeout=ready_timeout,
+            )
         )
-        self._pg_manager: Final[PGManager] = PGManager(self._context)
-        self._spatical_manager: Final[SpatialManager] = SpatialManager(self._context)
-        self._trace_manager: Final[TraceManager] = TraceManager(self._context)
-        self._spatial_manager: Final[SpatialManager] = SpatialManager(self._context)
-        self._debug_draw: Final[DebugDraw] = DebugDraw(self._context)
-        self._utils: Final[UtilFuncs] = UtilFuncs(self._context)
+
+    def _setup(self, context: WorldContext):
+        """基于已创建的 WorldContext 初始化各个管理器。"""
+        self._context: WorldContext = context
+        self._pg_manager: PGManager = PGManager(self._context)
+        self._spatical_manager: SpatialManager = SpatialManager(self._context)
+        self._trace_manager: TraceManager = TraceManager(self._context)
+        self._spatial_manager: SpatialManager = SpatialManager(self._context)
+        self._debug_draw: DebugDraw = DebugDraw(self._context)
+        self._utils: UtilFuncs = UtilFuncs(self._context)
 
     @property
     def utils(self) -> UtilFuncs:
@@ -115,15 +146,26 @@ class TongSim:
         Returns:
             bool: 是否打开成功
         """
+        return self._context.sync_run(self.async_open_level(level_name))
 
-        async def async_open_level():
-            await self.pg_manager.async_stop_pg_stream()
-            return await LegacyAPI.open_level(self._context.conn_legacy, level_name)
+    async def async_open_level(self, level_name: str) -> bool:
+        """
+        打开一个指定关卡（异步接口）。
+
+        Args:
+            level_name (str): 关卡资源名（支持自动补全 SDBP_Map_ 前缀）
 
+        Returns:
+            bool: 是否打开成功
+        """
         if not level_name.startswith("SDBP_Map_"):
             level_name = f"SDBP_Map_{level_name}"
 
-        return self._context.sync_run(async_open_level())
+        await self.pg_manager.async_stop_pg_stream()
+        try:
+            return await LegacyAPI.open_level(self._context.conn_legacy, level_name)
+        finally:
+            self._context.invalidate_caches()
 
     def spawn_entity(
         self,
@@ -153,21 +195,48 @@ class TongSim:
         Returns:
             T: 构造完成的 Entity 实例。
         """
-
-        async def _spawn_and_wrap() -> T:
-            entity_id: str = await UnaryAPI.spawn_object(
-                self._context.conn,
-                blueprint=blueprint,
+        return self._context.sync_run(
+            self.async_spawn_entity(
+                entity_type,
+                blueprint,
+                location,
                 desired_name=desired_name,
-                location=location,
-                rotation=quat,
+                quat=quat,
                 scale=scale,
                 is_simulating_physics=is_simulating_physics,
                 is_vr_grippable=is_vr_grippable,
             )
-            return await entity_type.from_grpc(entity_id, self._context)
+        )
 
-        return self._context.sync_run(_spawn_and_wrap())
+    async def async_spawn_entity(
+        self,
+        entity_type: type[T],
+        blueprint: str,
+        location: Vector3,
+        desired_name: str = "",
+        quat: Quaternion | None = None,
+        scale: Vector3 | None = None,
+        is_simulating_physics: bool = True,
+        is_vr_grippable: bool = True,
+    ) -> T:
+        """
+        创建一个实体对象，并构造指定类型的 Entity（异步接口）。参数说明参见 `spawn_entity`。
+
+        Returns:
+            T: 构造完成的 Entity 实例。
+        """
+        entity_id: str = await UnaryAPI.spawn_object(
+            self._context.conn,
+            blueprint=blueprint,
+            desired_name=desired_name,
+            location=location,
+            rotation=quat,
+            scale=scale,
+            is_simulating_physics=is_simulating_physics,
+            is_vr_grippable=is_vr_grippable,
+        )
+        self._context.invalidate_caches()
+        return await entity_type.from_grpc(entity_id, self._context)
 
     def destroy_entity(self, entity_id: str) -> bool:
         """
@@ -179,9 +248,22 @@ class TongSim:
         Returns:
             bool: 是否成功销毁实体。
         """
-        return self._context.sync_run(
-            LegacyAPI.destroy_object(self._context.conn_legacy, entity_id)
-        )
+        return self._context.sync_run(self.async_destroy_entity(entity_id))
+
+    async def async_destroy_entity(self, entity_id: str) -> bool:
+        """
+        销毁指定 ID 的实体对象（异步接口）。
+
+        Args:
+            entity_id (str): 实体的唯一 ID。
+
+        Returns:
+            bool: 是否成功销毁实体。
+        """
+        try:
+            return await LegacyAPI.destroy_object(self._context.conn_legacy, entity_id)
+        finally:
+            self._context.invalidate_caches()
 
     def spawn_agent(
         self,
@@ -201,21 +283,38 @@ class TongSim:
         Returns:
             str: 新 agent 的 UE 实例名
         """
-
-        async def _spawn_agent_and_wrap() -> AgentEntity:
-            agent_id: str = await UnaryAPI.spawn_object(
-                self._context.conn,
-                blueprint=blueprint,
-                desired_name=desired_name,
-                location=location,
-                rotation=quat,
-                scale=scale,
-                is_simulating_physics=True,
-                is_vr_grippable=False,
+        return self._context.sync_run(
+            self.async_spawn_agent(
+                blueprint, location, desired_name=desired_name, quat=quat, scale=scale
             )
-            return await AgentEntity.from_grpc(agent_id, self._context)
+        )
+
+    async def async_spawn_agent(
+        self,
+        blueprint: str,
+        location: Vector3,
+        desired_name: str = "",
+        quat: Quaternion | None = None,
+        scale: Vector3 | None = None,
+    ) -> AgentEntity:
+        """
+        创建一个 agent 实例（异步接口）。参数说明参见 `spawn_agent`。
 
-        return self._context.sync_run(_spawn_agent_and_wrap())
+        Returns:
+            AgentEntity: 新 agent 的 Entity 实例
+        """
+        agent_id: str = await UnaryAPI.spawn_object(
+            self._context.conn,
+            blueprint=blueprint,
+            desired_name=desired_name,
+            location=location,
+            rotation=quat,
+            scale=scale,
+            is_simulating_physics=True,
+            is_vr_grippable=False,
+        )
+        self._context.invalidate_caches()
+        return await AgentEntity.from_grpc(agent_id, self._context)
 
     def spawn_camera(
         self,
@@ -242,21 +341,40 @@ class TongSim:
         Returns:
             Entity: 封装摄像机的 Entity 实例
         """
-
-        async def _spawn_camera_and_wrap() -> CameraEntity:
-            camera_id = await UnaryAPI.spawn_camera(
-                self._context.conn,
-                camera_name,
-                loc,
-                quat,
-                fov,
-                width,
-                height,
-                pixel_streamer_name,
+        return self._context.sync_run(
+            self.async_spawn_camera(
+                camera_name, loc, quat, fov, width, height, pixel_streamer_name
             )
-            return await CameraEntity.from_grpc(camera_id, self._context)
+        )
+
+    async def async_spawn_camera(
+        self,
+        camera_name: str,
+        loc: Vector3,
+        quat: Quaternion,
+        fov: float = 90.0,
+        width: int = 1280,
+        height: int = 720,
+        pixel_streamer_name: str | None = None,
+    ) -> CameraEntity:
+        """
+        创建一个摄像机实例（异步接口）。参数说明参见 `spawn_camera`。
 
-        return self._context.sync_run(_spawn_camera_and_wrap())
+        Returns:
+            CameraEntity: 封装摄像机的 Entity 实例
+        """
+        camera_id = await UnaryAPI.spawn_camera(
+            self._context.conn,
+            camera_name,
+            loc,
+            quat,
+            fov,
+            width,
+            height,
+            pixel_streamer_name,
+        )
+        self._context.invalidate_caches()
+        return await CameraEntity.from_grpc(camera_id, self._context)
 
     def spawn_hf_camera(
         self,
@@ -283,25 +401,44 @@ class TongSim:
         Returns:
             HFCameraEntity: 封装高速摄像机的 HFCameraEntity 实例
         """
-
-        async def _spawn_camera_and_wrap() -> HFCameraEntity:
-            camera_id = camera_name + "_" + attach_owner
-            await UnaryAPI.spawn_hf_camera(
-                self._context.conn,
-                camera_id,
-                frequency,
-                socket,
-                True,
-                True,
-                True,
-                attach_owner,
-                fov,
-                width,
-                height,
+        return self._context.sync_run(
+            self.async_spawn_hf_camera(
+                camera_name, frequency, socket, attach_owner, fov, width, height
             )
-            return await HFCameraEntity.create(camera_id, self._context, [])
+        )
 
-        return self._context.sync_run(_spawn_camera_and_wrap())
+    async def async_spawn_hf_camera(
+        self,
+        camera_name: str,
+        frequency: int,
+        socket: str,
+        attach_owner: str = "",
+        fov: float = 90.0,
+        width: int = 1280,
+        height: int = 720,
+    ) -> HFCameraEntity:
+        """
+        创建一个高速摄像机实例（异步接口）。参数说明参见 `spawn_hf_camera`。
+
+        Returns:
+            HFCameraEntity: 封装高速摄像机的 HFCameraEntity 实例
+        """
+        camera_id = camera_name + "_" + attach_owner
+        await UnaryAPI.spawn_hf_camera(
+            self._context.conn,
+            camera_id,
+            frequency,
+            socket,
+            True,
+            True,
+            True,
+            attach_owner,
+            fov,
+            width,
+            height,
+        )
+        self._context.invalidate_caches()
+        return await HFCameraEntity.create(camera_id, self._context, [])
 
     def entity_from_id(self, entity_type: type[T], entity_id: str) -> T:
         """
@@ -314,8 +451,43 @@ class TongSim:
         Returns:
             T: 构造完成的实体对象。
         """
-        return self._context.sync_run(
-            entity_type.from_grpc(entity_id=entity_id, world_context=self._context)
+        return self._context.sync_run(self.async_entity_from_id(entity_type, entity_id))
+
+    async def async_entity_from_id(self, entity_type: type[T], entity_id: str) -> T:
+        """
+        根据 Entity ID 构造一个完整的 Entity 实例（异步接口）。
+
+        Args:
+            entity_type (Type[T]): 要构造的 Entity 类型（必须为 MixinEntityBase 子类）
+            entity_id (str): 实体的唯一标识符。
+
+        Returns:
+            T: 构造完成的实体对象。
+        """
+        return await entity_type.from_grpc(
+            entity_id=entity_id, world_context=self._context
+        )
+
+    def entities_from_ids(
+        self,
+        entity_type: type[T],
+        entity_ids: Sequence[str],
+        concurrency: int | None = None,
+    ) -> list[T]:
+        """
+        批量根据 Entity ID 构造 Entity 实例，整批请求只做一次跨线程提交。
+
+        Args:
+            entity_type (Type[T]): 要构造的 Entity 类型（必须为 MixinEntityBase 子类）
+            entity_ids (Sequence[str]): 实体 ID 列表。
+            concurrency (int | None): 最大并发请求数，None 表示不限制。
+
+        Returns:
+            list[T]: 与输入顺序一致的实体对象列表。
+        """
+        return self._context.sync_gather(
+            *(self.async_entity_from_id(entity_type, eid) for eid in entity_ids),
+            concurrency=concurrency,
         )
 
     def get_closest_entity_id(
@@ -333,9 +505,20 @@ class TongSim:
             str: 最近物体的 Entity ID；如果未找到，将返回空字符串。
         """
         return self._context.sync_run(
-            UnaryAPI.find_closest_object_by_type(
-                self._context.conn, location, max_dist, object_type
-            )
+            self.async_get_closest_entity_id(location, max_dist, object_type)
+        )
+
+    async def async_get_closest_entity_id(
+        self, location: Vector3, max_dist: float, object_type: str | None = None
+    ) -> str:
+        """
+        获取距离指定位置最近的某类物体的实体 ID（异步接口）。参数说明参见 `get_closest_entity_id`。
+
+        Returns:
+            str: 最近物体的 Entity ID；如果未找到，将返回空字符串。
+        """
+        return await UnaryAPI.find_closest_object_by_type(
+            self._context.conn, location, max_dist, object_type
         )
 
     def get_closest_agent_entity_id(self, location: Vector3, max_dist: float) -> str:
@@ -350,9 +533,24 @@ class TongSim:
             str: 最近 Agent 的 Entity ID；若无结果返回空字符串。
         """
         return self._context.sync_run(
-            UnaryAPI.find_closest_agent(self._context.conn, location, max_dist)
+            self.async_get_closest_agent_entity_id(location, max_dist)
         )
 
+    async def async_get_closest_agent_entity_id(
+        self, location: Vector3, max_dist: float
+    ) -> str:
+        """
+        获取距离指定位置最近的 Agent（智能体）实体 ID（异步接口）。
+
+        Args:
+            location (Vector3): 搜索起点位置。
+            max_dist (float): 最大搜索半径。
+
+        Returns:
+            str: 最近 Agent 的 Entity ID；若无结果返回空字符串。
+        """
+        return await UnaryAPI.find_closest_agent(self._context.conn, location, max_dist)
+
     def get_entity_by_name(self, entity_type: type[T], name: str) -> T:
         """
         基于名称构造任意类型的 Entity。id 支持模糊匹配。
@@ -367,23 +565,39 @@ class TongSim:
         Raises:
             RuntimeError: 未找到匹配的实体
         """
+        entity = self._context.sync_run(
+            self._async_find_entity_by_name(entity_type, name)
+        )
+        if entity is None:
+            raise RuntimeError(f"{entity_type.__name__} with name '{name}' not found.")
+        return entity
 
-        async def _get_entity_by_name() -> T | None:
-            object_ids: list[str] = await LegacyAPI.get_object_ids_by_name(
-                self._context.conn_legacy, name
-            )
-            if not object_ids:
-                return None
-
-            return await entity_type.from_grpc(
-                entity_id=object_ids[0], world_context=self._context
-            )
+    async def async_get_entity_by_name(self, entity_type: type[T], name: str) -> T:
+        """
+        基于名称构造任意类型的 Entity（异步接口）。参数说明参见 `get_entity_by_name`。
 
-        entity = self._context.sync_run(_get_entity_by_name())
+        Raises:
+            RuntimeError: 未找到匹配的实体
+        """
+        entity = await self._async_find_entity_by_name(entity_type, name)
         if entity is None:
             raise RuntimeError(f"{entity_type.__name__} with name '{name}' not found.")
         return entity
 
+    async def _async_find_entity_by_name(
+        self, entity_type: type[T], name: str
+    ) -> T | None:
+        # 未找到时返回 None 而非抛出异常，避免在事件循环内触发任务组取消
+        object_ids: list[str] = await LegacyAPI.get_object_ids_by_name(
+            self._context.conn_legacy, name
+        )
+        if not object_ids:
+            return None
+
+        return await entity_type.from_grpc(
+            entity_id=object_ids[0], world_context=self._context
+        )
+
     def get_entities_by_rdf_type(self, entity_type: type[T], rdf_type: str) -> list[T]:
         """
         获取所有 RDF 类型匹配的实体。
@@ -395,17 +609,26 @@ class TongSim:
         Returns:
             list[T]: 匹配到的实体对象列表
         """
+        return self._context.sync_run(
+            self.async_get_entities_by_rdf_type(entity_type, rdf_type)
+        )
 
-        async def _get_entities() -> list[T]:
-            object_ids: list[str] = await UnaryAPI.get_object_by_rdf(
-                self._context.conn, rdf_type
-            )
-            return [
-                await entity_type.from_grpc(object_id, self._context)
-                for object_id in object_ids
-            ]
+    async def async_get_entities_by_rdf_type(
+        self, entity_type: type[T], rdf_type: str
+    ) -> list[T]:
+        """
+        获取所有 RDF 类型匹配的实体（异步接口）。参数说明参见 `get_entities_by_rdf_type`。
 
-        return self._context.sync_run(_get_entities())
+        Returns:
+            list[T]: 匹配到的实体对象列表
+        """
+        object_ids: list[str] = await UnaryAPI.get_object_by_rdf(
+            self._context.conn, rdf_type
+        )
+        return [
+            await entity_type.from_grpc(object_id, self._context)
+            for object_id in object_ids
+        ]
 
     def get_asset_file_content(self, asset_path: str) -> tuple[str, str]:
         """
@@ -419,11 +642,21 @@ class TongSim:
                 - 北京时间格式的最后修改时间（ISO 格式字符串）
                 - 文件内容的原始 JSON 字符串
         """
+        return self._context.sync_run(self.async_get_asset_file_content(asset_path))
+
+    async def async_get_asset_file_content(self, asset_path: str) -> tuple[str, str]:
+        """
+        获取指定资产文件的内容和最后修改时间（异步接口）。参数说明参见 `get_asset_file_content`。
+
+        Returns:
+            tuple[str, str]: (北京时间格式的最后修改时间, 文件内容的原始 JSON 字符串)
+        """
         from datetime import datetime, timedelta, timezone
 
-        last_modified_time_str, file_content_json_str = self._context.sync_run(
-            UnaryAPI.get_asset_file_content(self._context.conn, asset_path)
-        )
+        (
+            last_modified_time_str,
+            file_content_json_str,
+        ) = await UnaryAPI.get_asset_file_content(self._context.conn, asset_path)
 
         dt_utc = datetime.fromisoformat(last_modified_time_str.replace("Z", "+00:00"))
         dt_china = dt_utc.astimezone(timezone(timedelta(hours=8)))
@@ -439,10 +672,19 @@ class TongSim:
         Returns:
             bool: 切换是否成功。
         """
+        return self._context.sync_run(self.async_change_view_mode(new_view_mode))
 
-        return self._context.sync_run(
-            UnaryAPI.switch_camera_mode(self._context.conn, new_view_mode)
-        )
+    async def async_change_view_mode(self, new_view_mode: ViewModeType) -> bool:
+        """
+        切换 TongSim 主相机的视角模式（异步接口）。
+
+        Args:
+            new_view_mode (ViewModeType): 目标视角模式。
+
+        Returns:
+            bool: 切换是否成功。
+        """
+        return await UnaryAPI.switch_camera_mode(self._context.conn, new_view_mode)
 
     def change_view_target(self, new_view_agent_id: str) -> bool:
         """
@@ -454,9 +696,20 @@ class TongSim:
         Returns:
             bool: 切换是否成功。
         """
+        return self._context.sync_run(self.async_change_view_target(new_view_agent_id))
 
-        return self._context.sync_run(
-            UnaryAPI.camera_switch_character(self._context.conn, new_view_agent_id)
+    async def async_change_view_target(self, new_view_agent_id: str) -> bool:
+        """
+        切换 TongSim 相机跟随目标（异步接口），必须传入agent_id
+
+        Args:
+            new_view_agent_id (str): 目标角色ID。
+
+        Returns:
+            bool: 切换是否成功。
+        """
+        return await UnaryAPI.camera_switch_character(
+            self._context.conn, new_view_agent_id
         )
 
     def exec_console_command(self, console_command: str) -> bool:
@@ -469,9 +722,19 @@ class TongSim:
         Returns:
             bool: 指令是否成功发送到 TongSim
         """
-        return self._context.sync_run(
-            UnaryAPI.exec_console_command(self._context.conn, console_command)
-        )
+        return self._context.sync_run(self.async_exec_console_command(console_command))
+
+    async def async_exec_console_command(self, console_command: str) -> bool:
+        """
+        执行控制台指令（异步接口）。
+
+        Args:
+            console_command (str): 需要执行的控制台指令字符串。
+
+        Returns:
+            bool: 指令是否成功发送到 TongSim
+        """
+        return await UnaryAPI.exec_console_command(self._context.conn, console_command)
 
     def save_scene(self, path: str, file_name: str, overwrite: bool = True) -> bool:
         """
@@ -490,6 +753,66 @@ class TongSim:
             return False
 
         response = self._context.sync_run(UnaryAPI.save_game(self._context.conn))
+        return self._write_scene_file(response, path, file_name, overwrite)
+
+    async def async_save_scene(
+        self, path: str, file_name: str, overwrite: bool = True
+    ) -> bool:
+        """
+        保存场景到指定的路径和文件名（异步接口）。参数说明参见 `save_scene`。
+
+        Returns:
+            bool: 如果保存成功，返回 True；否则返回 False。
+        """
+        if not os.path.isdir(path):
+            _logger.warning(f"The directory {path} does not exist.")
+            return False
+
+        response = await UnaryAPI.save_game(self._context.conn)
+        return self._write_scene_file(response, path, file_name, overwrite)
+
+    def load_scene(self, path: str, file_name: str) -> bool:
+        """
+        从指定路径加载场景。
+
+        Args:
+            path (str): 场景文件的目录路径。
+            file_name (str): 需要加载的文件名，支持 .pkl 格式。
+
+        Returns:
+            bool: 如果加载成功，返回 True；否则返回 False。
+        """
+        scene = self._read_scene_file(path, file_name)
+        if scene is None:
+            return False
+
+        file_dir, save_context = scene
+        self._context.sync_run(UnaryAPI.load_game(self._context.conn, save_context))
+        self._context.invalidate_caches()
+        _logger.info(f"Scene loaded successfully from {file_dir}.")
+        return True
+
+    async def async_load_scene(self, path: str, file_name: str) -> bool:
+        """
+        从指定路径加载场景（异步接口）。参数说明参见 `load_scene`。
+
+        Returns:
+            bool: 如果加载成功，返回 True；否则返回 False。
+        """
+        scene = self._read_scene_file(path, file_name)
+        if scene is None:
+            return False
+
+        file_dir, save_context = scene
+        await UnaryAPI.load_game(self._context.conn, save_context)
+        self._context.invalidate_caches()
+        _logger.info(f"Scene loaded successfully from {file_dir}.")
+        return True
+
+    @staticmethod
+    def _write_scene_file(
+        response: object, path: str, file_name: str, overwrite: bool
+    ) -> bool:
         file_dir = os.path.join(path, file_name) + ".pkl"
 
         # 检查文件是否已经存在
@@ -511,23 +834,11 @@ class TongSim:
             _logger.warning(f"Error in saving scene: {e}")
             return False
 
-    def load_scene(self, path: str, file_name: str) -> bool:
-        """
-        从指定路径加载场景。
-
-        Args:
-            path (str): 场景文件的目录路径。
-            file_name (str): 需要加载的文件名，支持 .pkl 格式。
-
-        Returns:
-            bool: 如果加载成功，返回 True；否则返回 False。
-        """
-        return self._load_scene(path, file_name)
-
-    def _load_scene(self, path: str, file_name: str) -> bool:
+    @staticmethod
+    def _read_scene_file(path: str, file_name: str) -> tuple[str, object] | None:
         if not os.path.isdir(path):
             _logger.warning(f"The directory {path} does not exist.")
-            return False
+            return None
 
         file_dir = os.path.join(path, file_name)
 
@@ -539,34 +850,36 @@ class TongSim:
             file_dir = file_dir + ".pb"
         else:
             _logger.warning(f"The file {file_dir} does not exist.")
-            return False
+            return None
 
         try:
             file_extension = os.path.splitext(file_dir)[1].lower()
 
             with open(file_dir, "rb") as file:
                 if file_extension == ".pkl":
-                    self._context.sync_run(
-                        UnaryAPI.load_game(self._context.conn, pickle.load(file))
-                    )
-                elif file_extension == ".pb":
-                    self._context.sync_run(
-                        UnaryAPI.load_game(self._context.conn, file.read())
-                    )
-                else:
-                    _logger.warning(f"Unsupported file format for {file_dir}.")
-                    return False
-
-            _logger.info(f"Scene loaded successfully from {file_dir}.")
-            return True
+                    return file_dir, pickle.load(file)
+                if file_extension == ".pb":
+                    return file_dir, file.read()
+
+            _logger.warning(f"Unsupported file format for {file_dir}.")
+            return None
 
         except Exception as e:
             _logger.warning(f"There are Error in loading scene: {e}")
-            return False
+            return None
+
+    def close(self, drain_timeout: float = 0.0) -> ReleaseReport | None:
+        """
+        关闭当前实例并释放资源。
 
-    def close(self):
-        """关闭当前实例并释放资源"""
-        self._context.release()
+        Args:
+            drain_timeout (float): 等待在途请求（如 set_segment_id、动画提交）完成的最长秒数，
+                默认 0 即立即取消。
+
+        Returns:
+            ReleaseReport | None: 释放结果，说明哪些在途任务被截断；已关闭时返回 None。
+        """
+        return self._context.release(drain_timeout)
 
     def __enter__(self):
         """支持 with 上下文管理器"""
@@ -575,3 +888,74 @@ class TongSim:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """支持 with 上下文管理器"""
         self.close()
+
+
+class AsyncTongSim(TongSim):
+    """
+    AsyncTongSim 实例: TongSim 的原生 asyncio 版本。
+
+    WorldContext 以挂载模式运行，gRPC 通道直接绑定调用方正在运行的事件循环，
+    所有 async_* 方法（包括各个 Manager 与 Ability 的 async_* 方法）直接 await 即可，
+    不再经过 AsyncLoop 线程转发。同步接口在该事件循环中不可用。
+
+    Example:
+        async with await AsyncTongSim.connect("localhost:5056", "localhost:50052") as ts:
+            await ts.async_open_level("Map_01")
+    """
+
+    def __init__(self, context: WorldContext):
+        """
+        基于挂载模式的 WorldContext 初始化，通常应使用 `AsyncTongSim.connect` 创建。
+
+        Args:
+            context (WorldContext): 通过 `WorldContext.attach_to_running_loop` 创建的上下文。
+        """
+        if not context.is_attached:
+            raise ValueError("AsyncTongSim requires an attached WorldContext.")
+        self._setup(context)
+
+    @classmethod
+    async def connect(
+        cls,
+        grpc_endpoint: str,
+        legacy_grpc_endpoint: str,
+        offload_kind: OffloadKind = "thread",
+        offload_workers: int | None = None,
+        channel_options: ChannelOptions | None = None,
+        ready_timeout: float | None = None,
+    ) -> "AsyncTongSim":
+        """
+        在当前事件循环中连接一个 TongSim 实例。
+
+        Args:
+            grpc_endpoint (str): gRPC 服务器地址，如 "localhost:5056"
+            legacy_grpc_endpoint (str): 废弃的 gRPC 服务器地址，如 "localhost:50052"
+            offload_kind (OffloadKind): 计算池类型，"thread"（默认）或 "process"。
+            offload_workers (int | None): 计算池工作者数量，None 使用默认值。
+            channel_options (ChannelOptions | None): gRPC 通道参数。
+            ready_timeout (float | None): 等待 UE 就绪并通过健康检查的最长秒数，超时抛出 ConnectionError；None 表示不检查。
+
+        Returns:
+            AsyncTongSim: 绑定到当前事件循环的 TongSim 实例。
+        """
+        context = await WorldContext.attach_to_running_loop(
+            grpc_endpoint,
+            legacy_grpc_endpoint,
+            offload_kind=offload_kind,
+            offload_workers=offload_workers,
+            channel_options=channel_options,
+            ready_timeout=ready_timeout,
+        )
+        return cls(context)
+
+    async def aclose(self, drain_timeout: float = 0.0) -> ReleaseReport | None:
+        """关闭当前实例并释放资源（异步接口），参数说明参见 `close`。"""
+        return await self._context.arelease(drain_timeout)
+
+    async def __aenter__(self):
+        """支持 async with 上下文管理器"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """支持 async with 上下文管理器"""
+        await self.aclose()
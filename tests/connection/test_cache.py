@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from tongsim.connection.grpc import ResponseCache
+from tongsim.connection.grpc.cache import MISS
+
+_METHOD = "MapService/GetRoomArray"
+
+
+def _key(payload: bytes) -> tuple[str, bytes]:
+    return (f"/pkg.{_METHOD}", payload)
+
+
+def test_ttl_expiry():
+    cache = ResponseCache()
+    assert cache.put(_METHOD, _key(b"a"), "rooms", ttl=0.05, version=cache.version)
+    assert cache.get(_METHOD, _key(b"a")) == "rooms"
+    time.sleep(0.06)
+    assert cache.get(_METHOD, _key(b"a")) is MISS
+    assert len(cache) == 0
+
+    stats = cache.snapshot()["methods"][_METHOD]
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    for payload in (b"a", b"b"):
+        cache.put(_METHOD, _key(payload), payload, ttl=10.0, version=0)
+    # 访问 a 之后，最久未使用的是 b
+    assert cache.get(_METHOD, _key(b"a")) == b"a"
+    cache.put(_METHOD, _key(b"c"), b"c", ttl=10.0, version=0)
+
+    assert cache.get(_METHOD, _key(b"b")) is MISS
+    assert cache.get(_METHOD, _key(b"a")) == b"a"
+    assert cache.get(_METHOD, _key(b"c")) == b"c"
+    assert cache.snapshot()["evictions"] == 1
+
+
+def test_invalidate_discards_stale_responses():
+    cache = ResponseCache()
+    cache.put(_METHOD, _key(b"a"), "old", ttl=10.0, version=cache.version)
+
+    version = cache.version  # 请求发起时的版本
+    cache.invalidate()
+    assert cache.get(_METHOD, _key(b"a")) is MISS
+    # 失效前发起的请求在失效后才返回，不能写入缓存
+    assert not cache.put(_METHOD, _key(b"a"), "stale", ttl=10.0, version=version)
+    assert cache.get(_METHOD, _key(b"a")) is MISS
+
+    snapshot = cache.snapshot()
+    assert snapshot["invalidations"] == 1
+    assert snapshot["methods"][_METHOD]["stale"] == 1
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError, match="max_entries"):
+        ResponseCache(max_entries=0)
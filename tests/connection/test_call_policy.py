@@ -0,0 +1,237 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import grpc
+import pytest
+import pytest_asyncio
+
+from tongsim.connection.grpc import (
+    RETRIED_METHODS,
+    CallPolicy,
+    GrpcConnection,
+    RpcError,
+    deadline,
+    remaining_time,
+    strict_rpc,
+)
+from tongsim.connection.grpc.call_policy import DEFAULT_RETRY
+from tongsim.connection.grpc.utils import safe_async_rpc
+from tongsim.core.supervision import RestartBackoff
+
+_METHOD = "/bigai.test.EchoService/Echo"
+_FLAKY = "/bigai.test.EchoService/Flaky"
+_INVALID = "/bigai.test.EchoService/Invalid"
+_COUNTED = "/bigai.test.EchoService/Counted"
+
+_flaky_calls = 0
+_counted_calls = 0
+
+
+async def _slow_echo(request: bytes, context) -> bytes:
+    await asyncio.sleep(0.3)
+    return request
+
+
+async def _flaky(request: bytes, context) -> bytes:
+    # 前两次调用模拟 UE 过载
+    global _flaky_calls
+    _flaky_calls += 1
+    if _flaky_calls <= 2:
+        await context.abort(grpc.StatusCode.UNAVAILABLE, "overloaded")
+    return request
+
+
+async def _counted(request: bytes, context) -> bytes:
+    global _counted_calls
+    _counted_calls += 1
+    await asyncio.sleep(0.1)
+    return request
+
+
+async def _invalid(request: bytes, context) -> bytes:
+    await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "bad request")
+
+
+@pytest_asyncio.fixture
+async def echo_conn() -> AsyncGenerator[GrpcConnection, None]:
+    # 进程内的 gRPC 服务，只用于验证通道拦截器，不依赖 TongSim
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "bigai.test.EchoService",
+                {
+                    "Echo": grpc.unary_unary_rpc_method_handler(_slow_echo),
+                    "Flaky": grpc.unary_unary_rpc_method_handler(_flaky),
+                    "Invalid": grpc.unary_unary_rpc_method_handler(_invalid),
+                    "Counted": grpc.unary_unary_rpc_method_handler(_counted),
+                },
+            ),
+        )
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    conn = GrpcConnection(f"127.0.0.1:{port}")
+    yield conn
+    await conn.aclose()
+    await server.stop(None)
+
+
+def _echo(conn: GrpcConnection, method: str = _METHOD):
+    return conn._channel.unary_unary(method)  # noqa: SLF001
+
+
+def test_deadline_nesting():
+    assert remaining_time() is None
+    with deadline(10.0) as outer:
+        with deadline(100.0) as inner:
+            assert inner == outer
+        with deadline(None) as unchanged:
+            assert unchanged == outer
+        assert 0 < remaining_time() <= 10.0
+    assert remaining_time() is None
+
+
+async def test_deadline_clamps_rpc_timeout(echo_conn: GrpcConnection):
+    echo = _echo(echo_conn)
+    assert await echo(b"ping", timeout=2.0) == b"ping"
+
+    with deadline(0.05), pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await echo(b"ping", timeout=2.0)
+    assert exc_info.value.code() is grpc.StatusCode.DEADLINE_EXCEEDED
+
+    # 预算耗尽时不再发起请求
+    with deadline(-1.0), pytest.raises(grpc.aio.AioRpcError):
+        await echo(b"ping")
+
+    stats = echo_conn.metrics.get("EchoService/Echo")
+    assert stats.calls == 3
+    assert stats.ok == 1
+    assert stats.deadline_exceeded == 2
+    assert stats.clamped == 1
+
+
+async def test_service_call_policy(echo_conn: GrpcConnection):
+    echo = _echo(echo_conn)
+    echo_conn.set_call_policy("EchoService", CallPolicy(timeout=0.05))
+    with pytest.raises(grpc.aio.AioRpcError):
+        await echo(b"ping", timeout=5.0)
+
+    # 方法级策略优先于服务级策略
+    echo_conn.set_call_policy("EchoService/Echo", CallPolicy(timeout=2.0))
+    assert await echo(b"ping", timeout=0.01) == b"ping"
+    assert echo_conn.metrics.get("EchoService/Echo").deadline_exceeded == 1
+
+
+async def test_retry_only_retryable_codes(echo_conn: GrpcConnection):
+    global _flaky_calls
+    _flaky_calls = 0
+    echo_conn.set_call_policy("EchoService", CallPolicy(retry=DEFAULT_RETRY))
+    assert await _echo(echo_conn, _FLAKY)(b"ping", timeout=2.0) == b"ping"
+    flaky = echo_conn.metrics.get("EchoService/Flaky")
+    assert (flaky.calls, flaky.ok, flaky.retries) == (1, 1, 2)
+
+    with pytest.raises(grpc.aio.AioRpcError):
+        await _echo(echo_conn, _INVALID)(b"ping", timeout=2.0)
+    assert echo_conn.metrics.get("EchoService/Invalid").retries == 0
+
+    _flaky_calls = 0
+    echo_conn.set_call_policy(
+        "EchoService/Flaky", CallPolicy(retry=RestartBackoff(max_restarts=0))
+    )
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await _echo(echo_conn, _FLAKY)(b"ping", timeout=2.0)
+    assert exc_info.value.code() is grpc.StatusCode.UNAVAILABLE
+
+
+async def test_write_not_retried_by_default(echo_conn: GrpcConnection):
+    # 不在 RETRIED_METHODS 中的方法（如生成实体）可能已在服务端执行，UNAVAILABLE 时不重试
+    global _flaky_calls
+    _flaky_calls = 0
+    assert "EchoService/Flaky" not in RETRIED_METHODS
+    assert "SceneService/SpawnObject" not in RETRIED_METHODS
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await _echo(echo_conn, _FLAKY)(b"ping", timeout=2.0)
+    assert exc_info.value.code() is grpc.StatusCode.UNAVAILABLE
+    assert _flaky_calls == 1
+    assert echo_conn.metrics.get("EchoService/Flaky").retries == 0
+
+
+async def test_strict_rpc(echo_conn: GrpcConnection):
+    @safe_async_rpc(default=b"")
+    async def invalid(conn: GrpcConnection) -> bytes:
+        return await _echo(conn, _INVALID)(b"ping", timeout=2.0)
+
+    assert await invalid(echo_conn) == b""
+
+    with strict_rpc(), pytest.raises(RpcError) as exc_info:
+        await invalid(echo_conn)
+    assert exc_info.value.code is grpc.StatusCode.INVALID_ARGUMENT
+    assert not exc_info.value.retryable
+    assert exc_info.value.method.endswith("invalid")
+
+
+async def test_coalesce_identical_inflight_calls(echo_conn: GrpcConnection):
+    global _counted_calls
+    counted = _echo(echo_conn, _COUNTED)
+
+    # 未开启合并: 每次调用都单独发起 RPC
+    _counted_calls = 0
+    await asyncio.gather(*(counted(b"a", timeout=2.0) for _ in range(3)))
+    assert _counted_calls == 3
+
+    _counted_calls = 0
+    echo_conn.set_call_policy("EchoService/Counted", CallPolicy(coalesce=True))
+    results = await asyncio.gather(
+        *(counted(b"a", timeout=2.0) for _ in range(5)),
+        counted(b"b", timeout=2.0),
+    )
+    assert results == [b"a"] * 5 + [b"b"]
+    # 相同请求只发起一次 RPC，不同请求字节各自发起
+    assert _counted_calls == 2
+    stats = echo_conn.metrics.get("EchoService/Counted")
+    assert stats.coalesced == 4
+    assert stats.ok == 3 + 6
+
+    # 在途调用完成后，新的调用重新发起 RPC
+    await counted(b"a", timeout=2.0)
+    assert _counted_calls == 3
+
+
+async def test_coalesced_caller_keeps_own_deadline(echo_conn: GrpcConnection):
+    counted = _echo(echo_conn, _COUNTED)
+    echo_conn.set_call_policy("EchoService/Counted", CallPolicy(coalesce=True))
+
+    async def impatient() -> bytes:
+        await asyncio.sleep(0.01)
+        with deadline(0.02):
+            return await counted(b"x", timeout=2.0)
+
+    leader, follower = await asyncio.gather(
+        counted(b"x", timeout=2.0), impatient(), return_exceptions=True
+    )
+    assert leader == b"x"
+    assert isinstance(follower, grpc.aio.AioRpcError)
+    assert follower.code() is grpc.StatusCode.DEADLINE_EXCEEDED
+
+
+async def test_cached_responses_until_invalidated(echo_conn: GrpcConnection):
+    global _counted_calls
+    _counted_calls = 0
+    counted = _echo(echo_conn, _COUNTED)
+    echo_conn.set_call_policy("EchoService/Counted", CallPolicy(cache_ttl=10.0))
+
+    assert await counted(b"a", timeout=2.0) == b"a"
+    assert await counted(b"a", timeout=2.0) == b"a"
+    assert await counted(b"b", timeout=2.0) == b"b"
+    assert _counted_calls == 2
+
+    # 场景变化后重新请求
+    echo_conn.cache.invalidate()
+    assert await counted(b"a", timeout=2.0) == b"a"
+    assert _counted_calls == 3
+
+    stats = echo_conn.cache.snapshot()["methods"]["EchoService/Counted"]
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+    # 命中缓存的调用不发起 RPC
+    assert echo_conn.metrics.get("EchoService/Counted").calls == 3
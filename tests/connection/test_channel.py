@@ -0,0 +1,54 @@
+import grpc
+
+from tongsim.connection.grpc import ChannelOptions, GrpcConnection
+
+_UNUSED_ENDPOINT = "127.0.0.1:1"
+
+
+class _FakeStub:
+    def __init__(self, channel):
+        self.channel = channel
+
+
+def test_channel_options():
+    options = dict(
+        ChannelOptions(
+            keepalive_time_ms=60_000,
+            initial_window_size=4 * 1024 * 1024,
+            extra=(("grpc.primary_user_agent", "tongsim-test"),),
+        ).to_grpc_options()
+    )
+    assert options["grpc.use_local_subchannel_pool"] == 1
+    assert options["grpc.keepalive_time_ms"] == 60_000
+    assert options["grpc.http2.lookahead_bytes"] == 4 * 1024 * 1024
+    assert options["grpc.primary_user_agent"] == "tongsim-test"
+    assert "grpc.keepalive_time_ms" not in dict(ChannelOptions().to_grpc_options())
+
+
+async def test_media_stub_uses_dedicated_channel():
+    conn = GrpcConnection(
+        _UNUSED_ENDPOINT,
+        channel_options=ChannelOptions(
+            media_channels=2, compression=grpc.Compression.Gzip
+        ),
+    )
+    try:
+        unary = conn.get_stub(_FakeStub)
+        media = conn.get_media_stub(_FakeStub, key="camera-1")
+        assert media is conn.get_media_stub(_FakeStub, key="camera-1")
+        assert media.channel is not unary.channel
+        channels = {
+            conn.get_media_stub(_FakeStub, key=f"camera-{i}").channel for i in range(16)
+        }
+        assert len(channels) == 2
+        assert unary.channel not in channels
+    finally:
+        await conn.aclose()
+
+    shared = GrpcConnection(
+        _UNUSED_ENDPOINT, channel_options=ChannelOptions(media_channels=0)
+    )
+    try:
+        assert shared.get_media_stub(_FakeStub) is shared.get_stub(_FakeStub)
+    finally:
+        await shared.aclose()
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from tongsim_api_protocol import basic_pb2
+
+from tongsim.connection.grpc import (
+    array_to_quaternions,
+    array_to_vectors,
+    arrays_to_poses,
+    arrays_to_transforms,
+    poses_to_arrays,
+    quaternions_to_array,
+    transforms_to_arrays,
+    vectors_to_array,
+)
+
+
+def test_vectors_round_trip():
+    vectors = basic_pb2.Vector3(x=1.0, y=2.0, z=3.0), basic_pb2.Vector3(x=-4.5, z=6.0)
+    array = vectors_to_array(vectors)
+    assert array.shape == (2, 3)
+    assert array.dtype == np.float64
+    np.testing.assert_array_equal(array, [[1.0, 2.0, 3.0], [-4.5, 0.0, 6.0]])
+    assert array_to_vectors(array) == list(vectors)
+
+
+def test_quaternions_use_wxyz_columns():
+    quats = [basic_pb2.Quaternion(w=1.0), basic_pb2.Quaternion(x=0.5, y=-0.5, w=0.5)]
+    array = quaternions_to_array(quats, dtype=np.float32)
+    assert array.dtype == np.float32
+    np.testing.assert_array_equal(array, [[1.0, 0, 0, 0], [0.5, 0.5, -0.5, 0]])
+    assert array_to_quaternions(array) == quats
+
+
+def test_poses_round_trip():
+    poses = [
+        basic_pb2.Pose(
+            location=basic_pb2.Vector3(x=float(i), y=1.0, z=2.0),
+            rotation=basic_pb2.Quaternion(w=1.0, z=float(i)),
+        )
+        for i in range(5)
+    ]
+    locations, rotations = poses_to_arrays(poses)
+    assert locations.shape == (5, 3)
+    assert rotations.shape == (5, 4)
+    assert arrays_to_poses(locations, rotations) == poses
+
+
+def test_transforms_round_trip():
+    transforms = [
+        basic_pb2.Transform(
+            location=basic_pb2.Vector3(x=float(i)),
+            rotation=basic_pb2.Quaternion(w=1.0),
+            scale=basic_pb2.Vector3(x=1.0, y=2.0, z=float(i)),
+        )
+        for i in range(3)
+    ]
+    locations, rotations, scales = transforms_to_arrays(transforms)
+    assert (locations.shape, rotations.shape, scales.shape) == ((3, 3), (3, 4), (3, 3))
+    np.testing.assert_array_equal(scales[:, 2], [0.0, 1.0, 2.0])
+    assert arrays_to_transforms(locations, rotations, scales) == transforms
+
+
+def test_empty_and_invalid_shapes():
+    assert vectors_to_array([]).shape == (0, 3)
+    assert array_to_vectors(np.empty((0, 3))) == []
+    with pytest.raises(ValueError, match=r"\(N, 3\)"):
+        array_to_vectors(np.zeros((2, 4)))
+    with pytest.raises(ValueError, match="differ in length"):
+        arrays_to_poses(np.zeros((2, 3)), np.zeros((3, 4)))
@@ -0,0 +1,136 @@
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from tongsim_api_protocol import basic_pb2
+
+from tongsim.connection.grpc.utils import (
+    CodecRegistry,
+    default_codecs,
+    proto_to_sdk,
+    sdk_to_proto,
+)
+from tongsim.logger import get_logger
+from tongsim.math.geometry import Box, Pose, Quaternion, Transform, Vector2, Vector3
+
+_logger = get_logger("performance")
+
+
+def _scalar(rng: random.Random) -> float:
+    # SDK 的 glm 类型以 float32 存储，取 float32 可精确表示的值以便比较往返结果
+    return rng.randint(-4096, 4096) / 8
+
+
+def _vector3(rng: random.Random) -> Vector3:
+    return Vector3(_scalar(rng), _scalar(rng), _scalar(rng))
+
+
+def _quaternion(rng: random.Random) -> Quaternion:
+    return Quaternion(_scalar(rng), _scalar(rng), _scalar(rng), _scalar(rng))
+
+
+# 每个注册的 SDK 类型的随机样本生成器；新增类型必须在此补充，否则 test_all_codecs_covered 失败
+_SAMPLES: dict[type, Callable[[random.Random], Any]] = {
+    Vector3: _vector3,
+    Vector2: lambda rng: Vector2(_scalar(rng), _scalar(rng)),
+    Quaternion: _quaternion,
+    Pose: lambda rng: Pose(_vector3(rng), _quaternion(rng)),
+    Transform: lambda rng: Transform(_vector3(rng), _quaternion(rng), _vector3(rng)),
+    Box: lambda rng: Box(_vector3(rng), _vector3(rng)),
+}
+
+
+def test_all_codecs_covered():
+    assert {sdk_type for sdk_type, _ in default_codecs.pairs()} == set(_SAMPLES)
+
+
+@pytest.mark.parametrize("sdk_type", list(_SAMPLES), ids=lambda t: t.__name__)
+def test_round_trip(sdk_type: type):
+    rng = random.Random(sdk_type.__name__)
+    proto_type = dict(default_codecs.pairs())[sdk_type]
+    for _ in range(200):
+        obj = _SAMPLES[sdk_type](rng)
+        message = sdk_to_proto(obj)
+        assert type(message) is proto_type
+        assert proto_to_sdk(message) == obj
+        assert sdk_to_proto(proto_to_sdk(message)) == message
+
+
+def test_vector2_converts_to_sdk():
+    result = proto_to_sdk(basic_pb2.Vector2(x=1.5, y=-2.0))
+    assert isinstance(result, Vector2)
+    assert result == Vector2(1.5, -2.0)
+
+
+def test_custom_registry():
+    registry = CodecRegistry()
+    with pytest.raises(TypeError, match="Unsupported SDK type"):
+        registry.to_proto(Vector3())
+
+    registry.register(
+        str,
+        basic_pb2.String,
+        lambda s: basic_pb2.String(string=s),
+        lambda m: m.string,
+    )
+    assert registry.to_sdk(registry.to_proto("kitchen")) == "kitchen"
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(str, basic_pb2.String, str, str)
+    registry.register(
+        str,
+        basic_pb2.String,
+        lambda s: basic_pb2.String(string=s.upper()),
+        str,
+        replace=True,
+    )
+    assert registry.to_proto("a").string == "A"
+
+
+def test_replace_drops_previous_pairing():
+    registry = CodecRegistry()
+    registry.register(
+        str, basic_pb2.String, lambda s: basic_pb2.String(string=s), lambda m: m.string
+    )
+    registry.register(
+        float, basic_pb2.Float, lambda f: basic_pb2.Float(float=f), lambda m: m.float
+    )
+
+    # str 改为对应 Float: 旧的 String -> str 与 float <-> Float 配对都被移除
+    registry.register(
+        str,
+        basic_pb2.Float,
+        lambda s: basic_pb2.Float(float=len(s)),
+        lambda m: str(int(m.float)),
+        replace=True,
+    )
+    assert registry.pairs() == [(str, basic_pb2.Float)]
+    assert registry.to_sdk(registry.to_proto("abc")) == "3"
+    with pytest.raises(TypeError, match="Unsupported Proto message"):
+        registry.to_sdk(basic_pb2.String(string="a"))
+    with pytest.raises(TypeError, match="Unsupported SDK type"):
+        registry.to_proto(1.0)
+
+
+def test_codec_micro_benchmark(num=10_000):
+    """逐类型测量 sdk_to_proto / proto_to_sdk 的单次转换开销"""
+    rng = random.Random(0)
+    for sdk_type, sample in _SAMPLES.items():
+        obj = sample(rng)
+        message = sdk_to_proto(obj)
+
+        t0 = time.perf_counter()
+        for _ in range(num):
+            sdk_to_proto(obj)
+        to_proto = (time.perf_counter() - t0) / num
+
+        t0 = time.perf_counter()
+        for _ in range(num):
+            proto_to_sdk(message)
+        to_sdk = (time.perf_counter() - t0) / num
+
+        _logger.info(
+            f"{sdk_type.__name__:<12}: to_proto {to_proto * 1e6:.2f} us, "
+            f"to_sdk {to_sdk * 1e6:.2f} us"
+        )
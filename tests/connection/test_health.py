@@ -0,0 +1,68 @@
+import time
+
+import grpc
+from tongsim_api_protocol import basic_pb2
+
+from tongsim.connection.grpc import GrpcConnection, LatencyStats, probe_health
+
+
+class _FpsHandler(grpc.GenericRpcHandler):
+    # 只实现健康探测使用的 GetFPS，服务名与协议包一致即可匹配
+    def service(self, handler_call_details):
+        if handler_call_details.method.endswith("/GetFPS"):
+            return grpc.unary_unary_rpc_method_handler(self._get_fps)
+        return None
+
+    @staticmethod
+    async def _get_fps(request: bytes, context) -> bytes:
+        return basic_pb2.Float(float=60.0).SerializeToString()
+
+
+def test_latency_stats_window():
+    stats = LatencyStats(window=4)
+    assert stats.snapshot()["last"] is None
+    for seconds in (0.4, 0.1, 0.2, 0.3, 0.5):
+        stats.record(seconds)
+    snapshot = stats.snapshot()
+    assert snapshot["count"] == 5
+    assert snapshot["last"] == 0.5
+    assert snapshot["min"] == 0.1
+    assert snapshot["max"] == 0.5
+    assert abs(snapshot["mean"] - 0.275) < 1e-9
+
+
+async def test_probe_health_records_latency():
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers((_FpsHandler(),))
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    conn = GrpcConnection(f"127.0.0.1:{port}")
+    try:
+        report = await probe_health(conn, timeout=2.0)
+    finally:
+        await conn.aclose()
+        await server.stop(None)
+
+    assert report.ready and report.healthy
+    assert report.fps == 60.0
+    assert report.latency is not None and report.latency > 0
+    assert conn.latency.snapshot()["count"] == 1
+
+
+async def test_probe_health_unreachable_is_bounded():
+    server = grpc.aio.server()
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    await server.stop(None)
+
+    conn = GrpcConnection(f"127.0.0.1:{port}")
+    started = time.perf_counter()
+    try:
+        report = await probe_health(conn, timeout=0.3)
+    finally:
+        await conn.aclose()
+
+    assert time.perf_counter() - started < 1.0
+    assert not report.ready
+    assert not report.healthy
+    assert "not ready" in report.error
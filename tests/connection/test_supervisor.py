@@ -0,0 +1,194 @@
+import asyncio
+import contextlib
+
+import grpc
+
+from tongsim.connection.grpc import (
+    ChannelOptions,
+    GrpcConnection,
+    StreamGap,
+    resilient_stream,
+)
+from tongsim.core import RestartBackoff
+
+_TICKS = "/bigai.test.TickService/Ticks"
+
+# 缩短 gRPC 内部的重连退避，便于在测试中快速恢复
+_FAST_RECONNECT = ChannelOptions(
+    media_channels=0,
+    extra=(
+        ("grpc.initial_reconnect_backoff_ms", 100),
+        ("grpc.min_reconnect_backoff_ms", 100),
+        ("grpc.max_reconnect_backoff_ms", 200),
+    ),
+)
+
+
+async def _ticks(request: bytes, context):
+    for i in range(1_000_000):
+        yield i.to_bytes(4, "big")
+        await asyncio.sleep(0.01)
+
+
+async def _finite(request: bytes, context):
+    for i in range(3):
+        yield i.to_bytes(4, "big")
+
+
+async def _missing(request: bytes, context):
+    await context.abort(grpc.StatusCode.NOT_FOUND, "subject destroyed")
+    yield b""
+
+
+async def _start_server(address: str) -> tuple[grpc.aio.Server, int]:
+    # 进程内的 gRPC 服务，模拟可以重启的 UE 进程
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "bigai.test.TickService",
+                {
+                    "Ticks": grpc.unary_stream_rpc_method_handler(_ticks),
+                    "Finite": grpc.unary_stream_rpc_method_handler(_finite),
+                    "Missing": grpc.unary_stream_rpc_method_handler(_missing),
+                },
+            ),
+        )
+    )
+    port = server.add_insecure_port(address)
+    await server.start()
+    return server, port
+
+
+async def _wait_until(predicate, timeout: float = 5.0):
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.02)
+
+
+async def test_supervisor_tracks_restart():
+    server, port = await _start_server("127.0.0.1:0")
+    conn = GrpcConnection(f"127.0.0.1:{port}", channel_options=_FAST_RECONNECT)
+    supervisor = conn.supervisor
+    try:
+        supervisor.start()
+        assert await supervisor.wait_ready(timeout=5.0)
+        assert supervisor.epoch == 0
+
+        await server.stop(None)
+        await _wait_until(lambda: supervisor.disconnects == 1)
+        assert not supervisor.is_connected
+
+        server, _ = await _start_server(f"127.0.0.1:{port}")
+        assert await supervisor.wait_ready(timeout=5.0)
+        await _wait_until(lambda: supervisor.epoch == 1)
+        assert supervisor.snapshot()["lost_at"] is None
+    finally:
+        await conn.aclose()
+        await server.stop(None)
+
+
+async def test_wait_ready_times_out_without_server():
+    server, port = await _start_server("127.0.0.1:0")
+    await server.stop(None)
+    conn = GrpcConnection(f"127.0.0.1:{port}", channel_options=_FAST_RECONNECT)
+    try:
+        assert not await conn.supervisor.wait_ready(timeout=0.3)
+    finally:
+        await conn.aclose()
+
+
+async def test_resilient_stream_resubscribes_with_gap():
+    server, port = await _start_server("127.0.0.1:0")
+    conn = GrpcConnection(f"127.0.0.1:{port}", channel_options=_FAST_RECONNECT)
+    ticks = conn._channel.unary_stream(_TICKS)  # noqa: SLF001
+    stream = resilient_stream(
+        lambda: ticks(b""),
+        conn.supervisor,
+        name="ticks",
+        backoff=RestartBackoff(initial=0.05, maximum=0.2),
+    )
+    received: list[bytes | StreamGap] = []
+    try:
+        async with asyncio.timeout(10.0):
+            async for item in stream:
+                received.append(item)
+                if len(received) == 3:
+                    # 模拟 UE 重启: 服务端下线后在同一端口重新启动
+                    await server.stop(None)
+                    server, _ = await _start_server(f"127.0.0.1:{port}")
+                if isinstance(item, StreamGap):
+                    break
+            # 恢复后的数据来自新订阅，计数从 0 重新开始
+            assert await anext(stream) == (0).to_bytes(4, "big")
+    finally:
+        with contextlib.suppress(Exception):
+            await stream.aclose()
+        await conn.aclose()
+        await server.stop(None)
+
+    gap = received[-1]
+    assert isinstance(gap, StreamGap)
+    assert gap.stream == "ticks"
+    assert gap.attempts >= 1
+    assert gap.duration >= 0
+    assert all(isinstance(item, bytes) for item in received[:-1])
+
+
+async def test_resilient_stream_stops_when_inactive():
+    server, port = await _start_server("127.0.0.1:0")
+    conn = GrpcConnection(f"127.0.0.1:{port}", channel_options=_FAST_RECONNECT)
+    ticks = conn._channel.unary_stream(_TICKS)  # noqa: SLF001
+    stopped = asyncio.Event()
+    received = []
+    try:
+        async with asyncio.timeout(5.0):
+            async for item in resilient_stream(
+                lambda: ticks(b""),
+                conn.supervisor,
+                is_active=lambda: not stopped.is_set(),
+            ):
+                received.append(item)
+                if len(received) == 2:
+                    # 主动停止: 流结束后不再重新订阅
+                    stopped.set()
+                    await server.stop(None)
+    finally:
+        await conn.aclose()
+        await server.stop(None)
+
+    assert len(received) == 2
+
+
+async def test_resilient_stream_ends_without_transport_failure():
+    server, port = await _start_server("127.0.0.1:0")
+    conn = GrpcConnection(f"127.0.0.1:{port}", channel_options=_FAST_RECONNECT)
+    opened = {"Finite": 0, "Missing": 0}
+
+    def _open(method: str):
+        opened[method] += 1
+        return conn._channel.unary_stream(f"/bigai.test.TickService/{method}")(b"")  # noqa: SLF001
+
+    try:
+        async with asyncio.timeout(5.0):
+            # UE 正常结束流: 连接仍然就绪，不重新订阅
+            finite = [
+                item
+                async for item in resilient_stream(
+                    lambda: _open("Finite"), conn.supervisor
+                )
+            ]
+            # 非连接类错误（如实体已销毁）: 不重新订阅
+            missing = [
+                item
+                async for item in resilient_stream(
+                    lambda: _open("Missing"), conn.supervisor
+                )
+            ]
+    finally:
+        await conn.aclose()
+        await server.stop(None)
+
+    assert finite == [i.to_bytes(4, "big") for i in range(3)]
+    assert missing == []
+    assert opened == {"Finite": 1, "Missing": 1}
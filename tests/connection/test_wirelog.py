@@ -0,0 +1,158 @@
+from pathlib import Path
+
+import grpc
+import pytest
+
+from tongsim.connection.grpc import (
+    ChannelOptions,
+    GrpcConnection,
+    ReplayChannel,
+    WireRecorder,
+    WireReplay,
+    read_wire_calls,
+)
+
+_SERVICE = "bigai.test.WireService"
+_ECHO = f"/{_SERVICE}/Echo"
+_COUNT = f"/{_SERVICE}/Count"
+_CHAT = f"/{_SERVICE}/Chat"
+_MISSING = f"/{_SERVICE}/Missing"
+
+
+async def _echo(request: bytes, context) -> bytes:
+    return request
+
+
+async def _count(request: bytes, context):
+    for i in range(int(request)):
+        yield str(i).encode()
+
+
+async def _chat(request_iterator, context):
+    async for request in request_iterator:
+        yield request.upper()
+
+
+async def _missing(request: bytes, context) -> bytes:
+    await context.abort(grpc.StatusCode.NOT_FOUND, "no such actor")
+
+
+async def _exercise(conn: GrpcConnection) -> list:
+    channel = conn._channel  # noqa: SLF001
+    results: list = [
+        await channel.unary_unary(_ECHO)(b"ping"),
+        await channel.unary_unary(_ECHO)(b"pong"),
+        [r async for r in channel.unary_stream(_COUNT)(b"3")],
+    ]
+    chat = channel.stream_stream(_CHAT)()
+    replies = []
+    for word in (b"a", b"b"):
+        await chat.write(word)
+        replies.append(await chat.read())
+    await chat.done_writing()
+    assert await chat.read() is grpc.aio.EOF
+    results.append(replies)
+    with pytest.raises(grpc.aio.AioRpcError) as e:
+        await channel.unary_unary(_MISSING)(b"x")
+    results.append((e.value.code(), e.value.details()))
+    return results
+
+
+async def test_record_and_replay(tmp_path: Path):
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                _SERVICE,
+                {
+                    "Echo": grpc.unary_unary_rpc_method_handler(_echo),
+                    "Count": grpc.unary_stream_rpc_method_handler(_count),
+                    "Chat": grpc.stream_stream_rpc_method_handler(_chat),
+                    "Missing": grpc.unary_unary_rpc_method_handler(_missing),
+                },
+            ),
+        )
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    log = str(tmp_path / "traffic.wire")
+    conn = GrpcConnection(
+        f"127.0.0.1:{port}",
+        channel_options=ChannelOptions(media_channels=0, record_path=log),
+    )
+    try:
+        recorded = await _exercise(conn)
+    finally:
+        await conn.aclose()
+        await server.stop(None)
+
+    assert recorded == [
+        b"ping",
+        b"pong",
+        [b"0", b"1", b"2"],
+        [b"A", b"B"],
+        (grpc.StatusCode.NOT_FOUND, "no such actor"),
+    ]
+    calls = read_wire_calls(log)
+    assert [c.method for c in calls] == [_ECHO, _ECHO, _COUNT, _CHAT, _MISSING]
+    assert calls[2].responses == [b"0", b"1", b"2"]
+    assert calls[3].request == b"a"
+    assert calls[4].code is grpc.StatusCode.NOT_FOUND
+
+    # 回放不需要服务器
+    replay = GrpcConnection(
+        "127.0.0.1:1", channel_options=ChannelOptions(replay_path=log)
+    )
+    try:
+        assert await replay.wait_ready(timeout=1)
+        assert await _exercise(replay) == recorded
+        with pytest.raises(grpc.aio.AioRpcError) as e:
+            await replay._channel.unary_unary(_ECHO)(b"ping")  # noqa: SLF001
+        assert e.value.code() is grpc.StatusCode.UNAVAILABLE
+    finally:
+        await replay.aclose()
+
+
+def test_replay_matches_request_and_cycles(tmp_path: Path):
+    log = tmp_path / "traffic.wire"
+    recorder = WireRecorder(str(log))
+    for request in (b"a", b"b"):
+        call_id = recorder.start(_ECHO, request)
+        recorder.response(call_id, request * 2)
+        recorder.end(call_id, grpc.StatusCode.OK)
+    recorder.close()
+    # 模拟录制进程异常退出: 末尾不完整的记录被忽略
+    with open(log, "ab") as f:
+        f.write(b"\x01\x00")
+
+    replay = WireReplay.load(str(log), cycle=True)
+    assert replay.take(_ECHO, b"b").responses == [b"bb"]
+    assert replay.take(_ECHO, b"a").responses == [b"aa"]
+    assert replay.take(_ECHO, b"c").responses == [b"bb"]
+    assert replay.remaining() == 2
+
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        ChannelOptions(record_path=str(log), replay_path=str(log))
+
+
+async def test_replay_cancelled_calls(tmp_path: Path):
+    log = tmp_path / "traffic.wire"
+    recorder = WireRecorder(str(log))
+    # 调用方超时取消的 unary 调用与客户端取消的流
+    recorder.end(recorder.start(_ECHO, b"ping"), grpc.StatusCode.CANCELLED)
+    call_id = recorder.start(_COUNT, b"9")
+    recorder.response(call_id, b"0")
+    recorder.end(call_id, grpc.StatusCode.CANCELLED)
+    recorder.close()
+
+    async with ReplayChannel(WireReplay.load(str(log))) as channel:
+        with pytest.raises(grpc.aio.AioRpcError) as e:
+            await channel.unary_unary(_ECHO)(b"ping")
+        assert e.value.code() is grpc.StatusCode.CANCELLED
+
+        # 流在返回录制的响应后保持打开，直到超出 timeout
+        stream = channel.unary_stream(_COUNT)(b"9", timeout=0.05)
+        assert await stream.read() == b"0"
+        with pytest.raises(grpc.aio.AioRpcError) as e:
+            await stream.read()
+        assert e.value.code() is grpc.StatusCode.DEADLINE_EXCEEDED
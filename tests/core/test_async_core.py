@@ -1,13 +1,14 @@
 # tests/test_async_core.py
 
 import asyncio
+import threading
 import time
 from collections.abc import Generator
 from concurrent.futures import CancelledError
 
 import pytest
 
-from tongsim.core import AsyncLoop
+from tongsim.core import AsyncLoop, RestartBackoff, SupervisionPolicy
 from tongsim.logger import get_logger
 
 _logger = get_logger("test")
@@ -71,3 +72,215 @@ def test_exception_propagation(async_loop: AsyncLoop):
     assert (
         counter == 1
     )  # good_task 的 count+=1 因为 bad_task 提前抛出异常，不应该执行！
+
+
+async def test_attach_to_running_loop():
+    # 挂载模式: 任务直接运行在当前事件循环中, 业务异常不影响其他任务
+    attached = AsyncLoop(name="testcore-attached-loop")
+    attached.attach()
+    assert attached.is_attached
+    assert attached.loop is asyncio.get_running_loop()
+
+    async def bad_task():
+        raise RuntimeError("bad_task failure")
+
+    async def good_task():
+        await asyncio.sleep(0.01)
+        return "good"
+
+    bad = attached.spawn(bad_task(), name="attached-bad")
+    good = attached.spawn(good_task(), name="attached-good")
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wrap_future(bad)
+    assert await asyncio.wrap_future(good) == "good"
+
+    attached.stop()
+    assert not attached.is_attached
+    assert not attached.is_running()
+
+
+def test_run_in_across_loops():
+    # run_in: 跨 loop 执行时协程运行在目标 loop 的线程上，同 loop 时直接 await
+    loop_a = AsyncLoop(name="testcore-run-in-a")
+    loop_b = AsyncLoop(name="testcore-run-in-b")
+    loop_a.start()
+    loop_b.start()
+
+    async def current_thread_name():
+        return threading.current_thread().name
+
+    async def caller():
+        remote = await loop_b.run_in(current_thread_name(), name="remote")
+        local = await loop_a.run_in(current_thread_name(), name="local")
+        return remote, local
+
+    try:
+        remote, local = loop_a.spawn(caller(), name="caller").result(timeout=1)
+        assert remote == loop_b.name
+        assert local == loop_a.name
+    finally:
+        loop_a.stop()
+        loop_b.stop()
+
+
+def test_cancel_future_cancels_task():
+    loop = AsyncLoop(name="testcore-cancel-loop")
+    loop.start()
+    cancelled = asyncio.Event()
+
+    async def long_task():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def is_cancelled():
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        return cancelled.is_set()
+
+    try:
+        fut = loop.spawn(long_task(), name="long")
+        time.sleep(0.05)
+        fut.cancel()
+        assert loop.spawn(is_cancelled(), name="check").result(timeout=2)
+    finally:
+        loop.stop()
+
+
+def test_isolate_policy_keeps_other_tasks():
+    loop = AsyncLoop(name="testcore-isolate-loop")
+    loop.start()
+
+    async def bad_task():
+        raise RuntimeError("isolated failure")
+
+    async def good_task():
+        await asyncio.sleep(0.02)
+        return "good"
+
+    try:
+        bad = loop.spawn(bad_task(), name="bad", policy=SupervisionPolicy.ISOLATE)
+        good = loop.spawn(good_task(), name="good")
+        with pytest.raises(RuntimeError, match="isolated failure"):
+            bad.result(timeout=1)
+        assert good.result(timeout=1) == "good"
+        assert loop.is_running()
+    finally:
+        loop.stop()
+
+
+def test_restart_policy_with_backoff():
+    loop = AsyncLoop(name="testcore-restart-loop")
+    loop.start()
+    attempts = 0
+
+    async def flaky_stream():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise RuntimeError("stream broken")
+        return attempts
+
+    async def always_fail():
+        raise RuntimeError("always")
+
+    backoff = RestartBackoff(initial=0.01, maximum=0.02, jitter=0.0)
+    try:
+        # RESTART 需要协程工厂函数
+        with pytest.raises(TypeError):
+            loop.spawn(flaky_stream(), policy=SupervisionPolicy.RESTART)
+
+        fut = loop.spawn(
+            flaky_stream,
+            name="flaky",
+            policy=SupervisionPolicy.RESTART,
+            backoff=backoff,
+        )
+        assert fut.result(timeout=1) == 3
+
+        limited = RestartBackoff(initial=0.01, jitter=0.0, max_restarts=2)
+        fut = loop.spawn(
+            always_fail, name="fail", policy=SupervisionPolicy.RESTART, backoff=limited
+        )
+        with pytest.raises(RuntimeError, match="always"):
+            fut.result(timeout=1)
+        assert loop.is_running()
+    finally:
+        loop.stop()
+
+
+def test_restart_backoff_delay():
+    backoff = RestartBackoff(initial=0.5, maximum=2.0, factor=2.0, jitter=0.0)
+    assert [backoff.delay(i) for i in range(1, 5)] == [0.5, 1.0, 2.0, 2.0]
+    assert not backoff.exhausted(100)
+    assert RestartBackoff(max_restarts=1).exhausted(2)
+
+
+def test_instrumentation():
+    loop = AsyncLoop(name="testcore-instrumented-loop")
+    loop.start()
+    try:
+        inst = loop.enable_instrumentation(
+            heartbeat_interval=0.01, slow_callback_threshold=0.02
+        )
+        assert loop.enable_instrumentation() is inst
+
+        async def blocking():
+            time.sleep(0.05)  # 故意阻塞事件循环
+
+        async def quick():
+            await asyncio.sleep(0.01)
+
+        loop.spawn(quick(), name="quick").result(timeout=1)
+        loop.spawn(blocking(), name="blocking").result(timeout=1)
+        time.sleep(0.05)
+
+        snap = inst.snapshot()
+        assert snap["tasks"]["quick"]["count"] == 1
+        assert snap["tasks"]["blocking"]["max"] >= 0.05
+        assert snap["lag"]["max"] >= 0.03
+        assert snap["slow_callbacks"] >= 1
+        assert snap["pending_callbacks"] == 0
+
+        text = inst.to_prometheus()
+        assert "# TYPE tongsim_loop_lag_seconds gauge" in text
+        assert (
+            'tongsim_task_duration_seconds_count{loop="testcore-instrumented-loop",task="quick"} 1'
+            in text
+        )
+    finally:
+        loop.stop()
+    assert loop.instrumentation is None
+
+
+def test_drain_waits_in_flight_and_cancels_background():
+    loop = AsyncLoop(name="testcore-drain-loop")
+    loop.start()
+    try:
+
+        async def short():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def forever():
+            await asyncio.Future()
+
+        fast = loop.spawn(short(), name="short")
+        slow = loop.spawn(asyncio.sleep(10), name="slow")
+        stream = loop.spawn(forever(), name="stream", background=True)
+
+        t0 = time.perf_counter()
+        report = loop.drain(timeout=0.2).result(timeout=2)
+        assert time.perf_counter() - t0 < 1.0
+
+        assert fast.result(timeout=1) == "done"
+        assert slow.cancelled()
+        assert stream.cancelled()
+        assert report.completed == 1
+        assert report.cut_off == ["slow"]
+        assert report.background_cancelled == 1
+        assert loop.is_running()
+    finally:
+        loop.stop()
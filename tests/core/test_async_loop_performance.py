@@ -0,0 +1,78 @@
+import asyncio
+import time
+
+from tongsim.core import AsyncLoop
+from tongsim.core.world_context import WorldContext
+from tongsim.logger import get_logger
+
+_logger = get_logger("performance")
+
+# gRPC 通道是惰性连接的，只测量调度开销时不需要真实的 TongSim 服务
+_UNUSED_ENDPOINT = "127.0.0.1:1"
+
+
+async def _noop_rpc() -> int:
+    # 模拟一次几乎无开销的 RPC, 只用于测量调度本身的开销
+    return 1
+
+
+def test_sync_run_vs_attached_overhead(num=10_000):
+    """
+    对比同步接口与挂载模式下单次调用的调度开销:
+    - sync_run: WorldContext.sync_run，包括 deadline()、_check_accepting、ISOLATE 包装、跨线程提交与阻塞等待
+    - direct await: AsyncTongSim 的 async_* 方法在调用方事件循环上直接 await，没有额外调度
+
+    另外记录同一个 AsyncLoop.spawn 在线程模式与挂载模式下的开销作为参考。
+    """
+    context = WorldContext(_UNUSED_ENDPOINT, _UNUSED_ENDPOINT)
+    try:
+        t0 = time.perf_counter()
+        sync_results = sum(context.sync_run(_noop_rpc()) for _ in range(num))
+        sync_run = time.perf_counter() - t0
+    finally:
+        context.release()
+
+    async def _direct() -> tuple[int, float]:
+        results = 0
+        t0 = time.perf_counter()
+        for _ in range(num):
+            results += await _noop_rpc()
+        return results, time.perf_counter() - t0
+
+    direct_results, direct = asyncio.run(_direct())
+
+    # 参考: AsyncLoop.spawn 在两种模式下的开销，两者都包含 spawn 的监督与 Future 包装
+    loop = AsyncLoop(name="bench-thread-loop")
+    loop.start()
+    try:
+        t0 = time.perf_counter()
+        for _ in range(num):
+            loop.spawn(_noop_rpc(), name="bench").result(timeout=1)
+        thread_spawn = time.perf_counter() - t0
+    finally:
+        loop.stop()
+
+    async def _attached_spawn() -> float:
+        attached = AsyncLoop(name="bench-attached-loop")
+        attached.attach()
+        try:
+            t0 = time.perf_counter()
+            for _ in range(num):
+                await asyncio.wrap_future(attached.spawn(_noop_rpc(), name="bench"))
+            return time.perf_counter() - t0
+        finally:
+            attached.stop()
+
+    attached_spawn = asyncio.run(_attached_spawn())
+
+    _logger.info(f"{'sync_run':<30}: {sync_run / num * 1e6:.2f} us/call")
+    _logger.info(f"{'direct await':<30}: {direct / num * 1e6:.2f} us/call")
+    _logger.info(
+        f"{'saved per call':<30}: {(sync_run - direct) / num * 1e6:.2f} us/call"
+    )
+    _logger.info(
+        f"{'spawn (thread / attached)':<30}: {thread_spawn / num * 1e6:.2f} / "
+        f"{attached_spawn / num * 1e6:.2f} us/call"
+    )
+    assert sync_results == direct_results == num
+    assert direct < sync_run
@@ -0,0 +1,66 @@
+# tests/core/test_offload.py
+
+import asyncio
+import time
+
+import pytest
+
+from tongsim.core import OffloadExecutor
+from tongsim.math import decode_voxel
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+async def test_offload_run_and_metrics(kind):
+    executor = OffloadExecutor(kind=kind, max_workers=2)
+    try:
+        results = await asyncio.gather(*(executor.run(pow, i, 2) for i in range(8)))
+        assert results == [i * i for i in range(8)]
+
+        with pytest.raises(ValueError):
+            await executor.run(int, "not a number")
+
+        stats = executor.snapshot()
+        assert stats["kind"] == kind
+        assert stats["max_workers"] == 2
+        assert stats["submitted"] == 9
+        assert stats["completed"] == 8
+        assert stats["failed"] == 1
+        assert stats["in_flight"] == 0
+    finally:
+        executor.shutdown(wait=True)
+
+    with pytest.raises(RuntimeError):
+        await executor.run(pow, 2, 2)
+
+
+async def test_offload_keeps_loop_responsive():
+    executor = OffloadExecutor(kind="thread", max_workers=1)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    try:
+        await executor.run(time.sleep, 0.1)  # 在事件循环中 time.sleep 会阻塞所有 tick
+        assert ticks >= 5
+        # 排队等待时间被记录
+        await asyncio.gather(
+            executor.run(time.sleep, 0.05), executor.run(time.sleep, 0)
+        )
+        assert executor.snapshot()["max_queue_wait_seconds"] >= 0.04
+    finally:
+        task.cancel()
+        executor.shutdown(wait=True)
+
+
+async def test_offload_decode_voxel():
+    executor = OffloadExecutor(kind="process", max_workers=1)
+    try:
+        voxel = await executor.run(decode_voxel, bytes([0b00000101]), (1, 1, 8))
+        assert voxel == [[[True, False, True, False, False, False, False, False]]]
+    finally:
+        executor.shutdown(wait=True)
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from tongsim.connection.grpc._manifest import (
+    GRPC_STUB_MANIFEST,
+    PROTO_MODULE_MANIFEST,
+)
+from tongsim.connection.grpc.core import GrpcConnection
+from tongsim.connection.grpc.utils import (
+    iter_all_grpc_stubs,
+    iter_all_proto_messages,
+)
+from tongsim.core.world_context import WorldContext
+from tongsim.logger import get_logger
+
+_logger = get_logger("performance")
+
+# gRPC 通道是惰性连接的，启动耗时的测量不需要真实的 TongSim 服务
+_UNUSED_ENDPOINT = "127.0.0.1:1"
+
+# 在独立的解释器中测量导入耗时，并统计加载了哪些协议模块
+_IMPORT_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - t0
+loaded = sorted(m for m in sys.modules if m.startswith("tongsim_api_protocol."))
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+# 常规工作负载用不到的服务，导入 SDK 时不应加载
+_RARELY_USED_MODULES = (
+    "tongsim_api_protocol.subsystem.mujoco_manager_pb2",
+    "tongsim_api_protocol.subsystem.mujoco_manager_pb2_grpc",
+    "tongsim_api_protocol.subsystem.acoustics_manager_pb2",
+    "tongsim_api_protocol.subsystem.acoustics_manager_pb2_grpc",
+    "tongsim_api_protocol.subsystem.record_pb2",
+    "tongsim_api_protocol.subsystem.record_pb2_grpc",
+)
+
+
+def _probe_import(statement: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE.format(statement=statement)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_manifest_matches_protocol_package():
+    """预生成的 Stub 清单应与协议包中实际存在的 Stub 一致，否则需重新运行 scripts/gen_grpc_manifest.py"""
+    from_manifest = {name for name, _ in iter_all_grpc_stubs(use_manifest=True)}
+    from_walk = {name for name, _ in iter_all_grpc_stubs(use_manifest=False)}
+    assert from_manifest == from_walk
+
+    messages_from_manifest = {
+        name for name, _ in iter_all_proto_messages(use_manifest=True)
+    }
+    messages_from_walk = {
+        name for name, _ in iter_all_proto_messages(use_manifest=False)
+    }
+    assert messages_from_manifest == messages_from_walk
+
+
+def test_protocol_import_time():
+    """
+    导入耗时回归基准:
+    - 导入 SDK 只加载实际用到的协议模块，mujoco / acoustics / record 等在首次使用时才导入；
+    - 与一次性导入清单中所有协议模块（旧的遍历方式）对比。
+    """
+    sdk = _probe_import("import tongsim.connection.grpc")
+    everything = _probe_import(
+        "import importlib\n"
+        "from tongsim.connection.grpc._manifest import GRPC_STUB_MANIFEST, PROTO_MODULE_MANIFEST\n"
+        "for m in [*PROTO_MODULE_MANIFEST, *(m for m, _ in GRPC_STUB_MANIFEST)]:\n"
+        "    importlib.import_module(m)"
+    )
+
+    _logger.info(
+        f"{'import tongsim.connection.grpc':<30}: {sdk['elapsed'] * 1e3:.2f} ms, "
+        f"{len(sdk['loaded'])} protocol module(s)"
+    )
+    _logger.info(
+        f"{'import all protocol modules':<30}: {everything['elapsed'] * 1e3:.2f} ms, "
+        f"{len(everything['loaded'])} protocol module(s)"
+    )
+    assert not set(_RARELY_USED_MODULES) & set(sdk["loaded"])
+    assert len(sdk["loaded"]) < len(everything["loaded"])
+    assert len(everything["loaded"]) >= len(PROTO_MODULE_MANIFEST) + len(
+        GRPC_STUB_MANIFEST
+    )
+
+
+def test_world_context_startup():
+    """
+    测量 WorldContext 的构造与释放耗时:
+    - gRPC stub 在首次 get_stub() 时才实例化；
+    - 弃用的双向流在首次写入时才打开。
+    """
+    t0 = time.perf_counter()
+    context = WorldContext(_UNUSED_ENDPOINT, _UNUSED_ENDPOINT)
+    startup = time.perf_counter() - t0
+    try:
+        assert not context.legacy_stream_client.is_started
+    finally:
+        context.release()
+
+    _logger.info(f"{'WorldContext startup':<30}: {startup * 1e3:.2f} ms")
+
+
+def test_lazy_stub_creation(num=1_000):
+    """对比惰性 get_stub 的首次创建与缓存命中开销"""
+    _, stub_cls = next(iter_all_grpc_stubs(use_manifest=True))
+
+    async def _bench() -> tuple[float, float]:
+        conn = GrpcConnection(_UNUSED_ENDPOINT)
+        try:
+            t0 = time.perf_counter()
+            first = conn.get_stub(stub_cls)
+            first_call = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            for _ in range(num):
+                assert conn.get_stub(stub_cls) is first
+            cached = (time.perf_counter() - t0) / num
+        finally:
+            await conn.aclose()
+        return first_call, cached
+
+    first_call, cached = asyncio.run(_bench())
+    _logger.info(f"{'get_stub (first call)':<30}: {first_call * 1e6:.2f} us")
+    _logger.info(f"{'get_stub (cached)':<30}: {cached * 1e6:.2f} us/call")
+    assert cached <= first_call
@@ -0,0 +1,119 @@
+# tests/core/test_world_context.py
+
+import asyncio
+import time
+from collections.abc import Generator
+
+import pytest
+
+from tongsim.core.world_context import WorldContext
+
+# gRPC 通道是惰性连接的，以下用例不需要真实的 TongSim 服务
+_UNUSED_ENDPOINT = "127.0.0.1:1"
+
+
+@pytest.fixture(scope="module")
+def context() -> Generator[WorldContext, None, None]:
+    ctx = WorldContext(_UNUSED_ENDPOINT, _UNUSED_ENDPOINT, loops=2)
+    yield ctx
+    ctx.release()
+
+
+def test_sync_run_many_ordered_with_exceptions(context: WorldContext):
+    async def echo(i: int) -> int:
+        await asyncio.sleep(0.01 * (5 - i))
+        if i == 2:
+            raise ValueError("bad item")
+        return i
+
+    results = context.sync_run_many(echo(i) for i in range(5))
+    assert results[:2] == [0, 1]
+    assert isinstance(results[2], ValueError)
+    assert results[3:] == [3, 4]
+
+    with pytest.raises(ValueError, match="bad item"):
+        context.sync_gather(*(echo(i) for i in range(5)))
+
+
+def test_sync_run_many_concurrency_and_timeout(context: WorldContext):
+    running = 0
+    peak = 0
+
+    async def work(delay: float) -> float:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return delay
+
+    assert (
+        context.sync_run_many((work(0.01) for _ in range(8)), concurrency=2)
+        == [0.01] * 8
+    )
+    assert peak == 2
+
+    results = context.sync_run_many([work(0.0), work(1.0)], timeout=0.1)
+    assert results[0] == 0.0
+    assert isinstance(results[1], TimeoutError)
+
+
+def test_shard_routing(context: WorldContext):
+    assert context.num_loops == 2
+    assert context.loop_for(None) is context.loop
+    assert context.loop_for("agent-1") is context.loop_for("agent-1")
+    assert len({context.loop_for(f"agent-{i}") for i in range(32)}) == 2
+
+    key = "agent-1"
+    shard_loop = context.loop_for(key)
+
+    async def on_loop() -> bool:
+        return asyncio.get_running_loop() is shard_loop.loop
+
+    assert context.sync_run(on_loop(), shard_key=key)
+
+
+def test_release_drains_in_flight():
+    ctx = WorldContext(_UNUSED_ENDPOINT, _UNUSED_ENDPOINT)
+
+    async def in_flight() -> str:
+        await asyncio.sleep(0.05)
+        return "applied"
+
+    fut = ctx.async_task(in_flight(), name="in-flight")
+    report = ctx.release(drain_timeout=1.0)
+
+    assert fut.result(timeout=1) == "applied"
+    assert report is not None
+    assert report.completed == 1
+    assert report.cut_off == []
+    assert report.clean
+    assert ctx.release() is None
+
+    with pytest.raises(RuntimeError, match="releasing"):
+        ctx.sync_run(in_flight())
+
+
+def test_release_cycles_are_fast():
+    for _ in range(5):
+        ctx = WorldContext(_UNUSED_ENDPOINT, _UNUSED_ENDPOINT, loops=2)
+        ctx.async_task(asyncio.sleep(10), name="stuck")
+        report = ctx.release(drain_timeout=0.05)
+        assert report is not None
+        assert report.cut_off == ["stuck"]
+        assert report.elapsed < 1.0
+
+
+def test_ready_timeout_fails_fast_when_unreachable():
+    started = time.perf_counter()
+    with pytest.raises(ConnectionError, match="not ready"):
+        WorldContext(_UNUSED_ENDPOINT, _UNUSED_ENDPOINT, ready_timeout=0.3)
+    assert time.perf_counter() - started < 2.0
+
+
+def test_probe_health_unreachable(context: WorldContext):
+    report = context.probe_health(timeout=0.2)
+    assert not report.ready
+    assert not report.healthy
+    assert report.latency is None
+    assert context.latency_stats()["count"] == 0
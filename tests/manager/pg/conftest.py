@@ -0,0 +1,15 @@
+from collections.abc import Generator
+
+import pytest
+
+from tongsim.core.world_context import WorldContext
+
+# gRPC 通道是惰性连接的，合并、查询与分发不需要真实的 TongSim 服务
+_UNUSED_ENDPOINT = "127.0.0.1:1"
+
+
+@pytest.fixture(scope="module")
+def context() -> Generator[WorldContext, None, None]:
+    ctx = WorldContext(_UNUSED_ENDPOINT, _UNUSED_ENDPOINT)
+    yield ctx
+    ctx.release()
@@ -0,0 +1,90 @@
+import numpy as np
+from tongsim_api_protocol.subsystem.pg_pb2 import PG
+
+from tongsim.core.world_context import WorldContext
+from tongsim.manager.pg import PGColumns, PGManager
+from tongsim.testing import FakeUEConfig, build_pg_frames
+
+
+def _columnar_manager(context: WorldContext) -> PGManager:
+    pg = PGManager(context)
+    pg._columns = PGColumns(pg._indexer)  # noqa: SLF001
+    return pg
+
+
+def test_columns_match_query_and_update_in_place(context: WorldContext):
+    # 超过初始容量，覆盖扩容路径
+    full, deltas = build_pg_frames(FakeUEConfig(subjects=1500, moving_ratio=0.1), PG)
+    pg = _columnar_manager(context)
+    pg._merge_pg(PG.FromString(full))  # noqa: SLF001
+
+    columns = pg.columns
+    positions = columns.positions()
+    aabb_min, aabb_max = columns.aabbs()
+    assert positions.shape == (1500, 3)
+    assert columns.rotations()[0].tolist() == [1.0, 0.0, 0.0, 0.0]
+    assert np.all(columns.scales() == 1.0)
+    assert np.all(aabb_max - aabb_min == [100.0, 100.0, 100.0])
+
+    for delta in deltas[:2]:
+        pg._merge_pg(PG.FromString(delta))  # noqa: SLF001
+
+    # 之前取得的视图随合并原地更新
+    assert np.shares_memory(positions, columns.positions())
+    result = pg.query([{"component": "pose", "fields": ["location"]}])
+    for sid, row in zip(columns.subject_ids(), positions, strict=True):
+        location = result[sid]["location"]
+        assert row.tolist() == [location["x"], location["y"], location["z"]]
+    moved = PG.FromString(deltas[1]).subject_pg[0].subject.id
+    assert positions[columns.index(moved)][0] != aabb_min[columns.index(moved)][0] + 50
+
+    destroyed = PG()
+    subject = destroyed.subject_pg.add(subject_destroyed=True)
+    subject.subject.id = moved
+    pg._merge_pg(destroyed)  # noqa: SLF001
+    assert columns.destroyed().nonzero()[0].tolist() == [columns.index(moved)]
+
+    # 重新同步时原地清空，之前取得的视图继续随合并更新
+    pg._reset_pg()  # noqa: SLF001
+    assert len(columns) == 0
+    assert columns.positions().shape == (0, 3)
+    assert np.isnan(positions).all()
+    pg._merge_pg(PG.FromString(full))  # noqa: SLF001
+    assert np.shares_memory(positions, columns.positions())
+    assert np.array_equal(positions, columns.positions())
+    assert not np.isnan(positions).any()
+
+
+def test_columns_follow_component_type_change(context: WorldContext):
+    full, _ = build_pg_frames(FakeUEConfig(subjects=4), PG)
+    pg = _columnar_manager(context)
+    pg._merge_pg(PG.FromString(full))  # noqa: SLF001
+    columns = pg.columns
+    row = columns.index("FakeSubject_1")
+
+    # 缩放组件被替换为只带位姿的组件: 缩放不再有来源，位姿改由该组件提供
+    update = PG()
+    subject = update.subject_pg.add()
+    subject.subject.id = "FakeSubject_1"
+    comp = subject.component_pg.add()
+    comp.component.id = "FakeSubject_1_scale"
+    comp.pose.location.x = 7.0
+    comp.pose.rotation.w = 1.0
+    pg._merge_pg(update)  # noqa: SLF001
+
+    assert np.isnan(columns.scales()[row]).all()
+    assert columns.positions()[row].tolist() == [7.0, 0.0, 0.0]
+    assert "FakeSubject_1" not in pg.query([{"component": "scale", "fields": ["x"]}])
+
+    # 再次替换为不带位姿的组件后，位姿回落到下标更小的组件
+    comp.ClearField("pose")
+    comp.scale.x = 2.0
+    pg._merge_pg(update)  # noqa: SLF001
+    location = pg.query([{"component": "pose", "fields": ["location"]}])
+    expected = location["FakeSubject_1"]["location"]
+    assert columns.positions()[row].tolist() == [
+        expected.get("x", 0.0),
+        expected.get("y", 0.0),
+        expected.get("z", 0.0),
+    ]
+    assert columns.scales()[row][0] == 2.0
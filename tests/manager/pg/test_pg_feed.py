@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from tongsim_api_protocol.subsystem.pg_pb2 import PG
+
+from tongsim.core.world_context import WorldContext
+from tongsim.manager.pg import PGManager
+from tongsim.testing import FakeUEConfig, build_pg_frames
+
+
+async def _merge(pg: PGManager, frame: bytes | PG) -> PG:
+    pg_msg = PG.FromString(frame) if isinstance(frame, bytes) else frame
+    pg._merge_pg(pg_msg)  # noqa: SLF001
+    await pg._publish_changes()  # noqa: SLF001
+    return pg_msg
+
+
+def _subject_ids(pg_msg: PG) -> frozenset[str]:
+    return frozenset(subject.subject.id for subject in pg_msg.subject_pg)
+
+
+async def test_feed_policies(context: WorldContext):
+    full, deltas = build_pg_frames(FakeUEConfig(subjects=50, moving_ratio=0.1), PG)
+    pg = PGManager(context)
+    drop = pg.subscribe_changes(maxsize=2, policy="drop_oldest", name="drop")
+    coalesce = pg.subscribe_changes(maxsize=2, policy="coalesce", name="coalesce")
+    block = pg.subscribe_changes(maxsize=2, policy="block", name="block")
+
+    full_msg = await _merge(pg, full)
+    moved = await _merge(pg, deltas[0])
+
+    # 队列已满: block 订阅者让发布挂起，直到其取出一个变化
+    third = PG.FromString(deltas[1])
+    pg._merge_pg(third)  # noqa: SLF001
+    publish = asyncio.ensure_future(pg._publish_changes())  # noqa: SLF001
+    await asyncio.sleep(0)
+    assert not publish.done()
+
+    first = await block.get()
+    assert first.changed_subjects == _subject_ids(full_msg)
+    await publish
+    assert block.stats().pending == 2
+
+    # drop_oldest 丢弃了全量帧，coalesce 将后两帧合并
+    assert [c.sequence for c in (drop.get_nowait(), drop.get_nowait())] == [2, 3]
+    assert drop.stats().dropped == 1
+
+    assert coalesce.get_nowait().sequence == 1
+    merged = coalesce.get_nowait()
+    assert (merged.sequence, merged.frames) == (3, 2)
+    assert merged.changed_subjects == _subject_ids(moved) | _subject_ids(third)
+    assert coalesce.stats().coalesced == 1
+    assert coalesce.stats().lag_frames == 0
+    assert coalesce.get_nowait() is None
+
+    # 每个订阅者的积压相互独立
+    stats = {s.name: s for s in pg.feed_stats()}
+    assert stats["block"].lag_frames == 2
+    assert stats["drop"].delivered == 2
+    assert stats["block"].max_pending == 2
+
+    with pytest.raises(ValueError):
+        pg.subscribe_changes(policy="latest")  # type: ignore[arg-type]
+
+
+async def test_feed_destroyed_and_close(context: WorldContext):
+    full, _ = build_pg_frames(FakeUEConfig(subjects=10), PG)
+    pg = PGManager(context)
+    await _merge(pg, full)
+
+    async with pg.subscribe_changes(maxsize=4) as changes:
+        update = PG(current_frame=100)
+        gone = update.subject_pg.add(subject_destroyed=True)
+        gone.subject.id = "FakeSubject_1"
+        await _merge(pg, update)
+
+        change = await changes.get()
+        assert change.destroyed_subjects == {"FakeSubject_1"}
+        assert change.changed_subjects == set()
+        assert change.frame == 100
+        assert change.gap is None
+
+    # 关闭后迭代结束，发布不再放入该订阅者
+    assert changes.closed
+    await _merge(pg, update)
+    assert [c async for c in changes] == []
+    assert pg.feed_stats() == []
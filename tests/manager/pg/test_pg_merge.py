@@ -0,0 +1,69 @@
+import pytest
+from google.protobuf.json_format import MessageToDict
+from tongsim_api_protocol.subsystem.pg_pb2 import PG
+
+from tongsim.core.world_context import WorldContext
+from tongsim.manager.pg import MessageView, PGManager
+from tongsim.testing import FakeUEConfig, build_pg_frames
+
+
+def _to_dict(message) -> dict:
+    return MessageToDict(
+        message,
+        preserving_proto_field_name=True,
+        always_print_fields_with_no_presence=True,
+    )
+
+
+def test_merge_from_proto_matches_message_to_dict(context: WorldContext):
+    full, deltas = build_pg_frames(FakeUEConfig(subjects=50, moving_ratio=0.2), PG)
+    frames = [PG.FromString(full), *(PG.FromString(d) for d in deltas[:3])]
+    frames[-1].current_frame = 42
+    frames[-1].beijing_timestamp.timestamp_ms = 1_700_000_000_000
+
+    pg = PGManager(context)
+    segment_ids = pg._merge_pg(frames[0])  # noqa: SLF001
+    assert segment_ids == {f"FakeSubject_{i}": i + 1 for i in range(50)}
+    for frame in frames[1:]:
+        assert pg._merge_pg(frame) is None  # noqa: SLF001
+
+    # 期望值: 每个组件取最后一次出现时的 MessageToDict 结果
+    expected: dict[str, dict[str, dict]] = {}
+    for frame in frames:
+        for subject in _to_dict(frame)["subject_pg"]:
+            for comp in subject["component_pg"]:
+                expected.setdefault(subject["subject"]["id"], {})[
+                    comp["component"]["id"]
+                ] = comp
+
+    full_pg = pg.fetch_full_pg_from_streaming()
+    assert full_pg["current_frame"] == "42"
+    assert full_pg["beijing_timestamp"] == "1700000000000"
+    assert len(full_pg["subject_pg"]) == 50
+    for subject in full_pg["subject_pg"]:
+        sid = subject["subject"]["id"]
+        comps = {c["component"]["id"]: c.to_dict() for c in subject["component_pg"]}
+        assert comps == expected[sid]
+
+    moved = frames[-1].subject_pg[0].subject.id
+    result = pg.query([{"component": "pose", "fields": ["location"]}])
+    assert (
+        result[moved]["location"]
+        == expected[moved][f"{moved}_pose"]["pose"]["location"]
+    )
+    assert result["__meta__"] == {"beijing_timestamp": "1700000000000"}
+
+
+def test_message_view_materializes_lazily():
+    full, _ = build_pg_frames(FakeUEConfig(subjects=1), PG)
+    aabb = PG.FromString(full).subject_pg[0].component_pg[2]
+    view = MessageView(aabb)
+
+    assert "aabb" in view
+    assert "pose" not in view
+    assert view.get("pose") is None
+    assert view["component"] == {"id": "FakeSubject_0_aabb"}
+    assert list(view._values) == ["component"]  # noqa: SLF001
+    assert dict(view) == view.to_dict() == _to_dict(aabb)
+    with pytest.raises(KeyError):
+        view["scale"]
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+from google.protobuf.json_format import MessageToDict
+from tongsim_api_protocol.subsystem.pg_pb2 import PG
+
+from tongsim.core.world_context import WorldContext
+from tongsim.logger import get_logger
+from tongsim.manager.pg import PGColumns, PGManager
+from tongsim.testing import FakeUEConfig, build_pg_frames
+
+_logger = get_logger("performance")
+
+
+class DictMergePG:
+    """对照组: 整帧 MessageToDict 后按 dict 合并（PGManager 原先的做法）"""
+
+    def __init__(self):
+        self.pg: dict = {"subject_pg": []}
+        self.subject_index: dict[str, int] = {}
+        self.component_index: dict[tuple[str, str], int] = {}
+
+    def merge(self, pg_msg):
+        new_pg = MessageToDict(
+            pg_msg,
+            preserving_proto_field_name=True,
+            always_print_fields_with_no_presence=True,
+        )
+        for subject in new_pg.get("subject_pg", []):
+            sid = subject["subject"]["id"]
+            sidx = self.subject_index.get(sid)
+            if sidx is None:
+                self.subject_index[sid] = len(self.pg["subject_pg"])
+                self.pg["subject_pg"].append(subject)
+                for i, comp in enumerate(subject["component_pg"]):
+                    self.component_index[(sid, comp["component"]["id"])] = i
+                continue
+            components = self.pg["subject_pg"][sidx]["component_pg"]
+            for comp in subject["component_pg"]:
+                components[self.component_index[(sid, comp["component"]["id"])]] = comp
+
+
+def _ms_per_frame(merge, frames: list) -> float:
+    t0 = time.perf_counter()
+    for frame in frames:
+        merge(frame)
+    return (time.perf_counter() - t0) * 1000 / len(frames)
+
+
+@pytest.mark.parametrize("subjects", [1_000, 5_000, 20_000])
+def test_pg_merge_from_proto_vs_message_to_dict(context: WorldContext, subjects: int):
+    """对比每帧合并耗时: 直接从 proto 消息合并 vs 整帧 MessageToDict 后按 dict 合并（5% 实体移动）"""
+    full, deltas = build_pg_frames(
+        FakeUEConfig(subjects=subjects, moving_ratio=0.05), PG
+    )
+    full_msg = PG.FromString(full)
+    delta_msgs = [PG.FromString(d) for d in deltas]
+
+    reference = DictMergePG()
+    dict_full = _ms_per_frame(reference.merge, [full_msg])
+    dict_delta = _ms_per_frame(reference.merge, delta_msgs)
+
+    pg = PGManager(context)
+    proto_full = _ms_per_frame(pg._merge_pg, [full_msg])  # noqa: SLF001
+    proto_delta = _ms_per_frame(pg._merge_pg, delta_msgs)  # noqa: SLF001
+
+    _logger.info(
+        f"{subjects:>6} subjects full frame : MessageToDict {dict_full:9.2f} ms | proto {proto_full:8.2f} ms"
+    )
+    _logger.info(
+        f"{subjects:>6} subjects delta frame: MessageToDict {dict_delta:9.2f} ms | proto {proto_delta:8.2f} ms"
+    )
+    assert proto_delta < dict_delta
+    assert proto_full < dict_full
+
+
+def test_pg_positions_columns_vs_query(context: WorldContext, subjects=20_000):
+    """对比获取全部实体位置: query() 遍历 dict vs 列式存储的零拷贝视图"""
+    full, _ = build_pg_frames(FakeUEConfig(subjects=subjects), PG)
+    pg = PGManager(context)
+    pg._columns = PGColumns(pg._indexer)  # noqa: SLF001
+    pg._merge_pg(PG.FromString(full))  # noqa: SLF001
+
+    t0 = time.perf_counter()
+    result = pg.query([{"component": "pose", "fields": ["location"]}])
+    t1 = time.perf_counter()
+    positions = pg.columns.positions()
+    t2 = time.perf_counter()
+
+    _logger.info(
+        f"{subjects:>6} subjects positions: query {(t1 - t0) * 1000:9.2f} ms | columns {(t2 - t1) * 1000:8.4f} ms"
+    )
+    assert len(result) - 1 == len(positions) == subjects
+
+
+def test_pg_subscribed_query_vs_full_query(context: WorldContext, subjects=20_000):
+    """对比每帧查询耗时（5% 实体移动）: 每帧重新 query() vs 订阅查询只刷新变化的 subject"""
+    full, deltas = build_pg_frames(
+        FakeUEConfig(subjects=subjects, moving_ratio=0.05), PG
+    )
+    pg = PGManager(context)
+    plan = pg.compile_query([{"component": "pose", "fields": ["location"]}])
+    sub = pg.subscribe_query(plan)
+    pg._merge_pg(PG.FromString(full))  # noqa: SLF001
+    sub.refresh()
+
+    query_s = refresh_s = 0.0
+    for delta in deltas:
+        pg._merge_pg(PG.FromString(delta))  # noqa: SLF001
+        t0 = time.perf_counter()
+        sub.refresh()
+        t1 = time.perf_counter()
+        pg.query(plan)
+        query_s += time.perf_counter() - t1
+        refresh_s += t1 - t0
+
+    _logger.info(
+        f"{subjects:>6} subjects per frame: query {query_s * 1000 / len(deltas):9.2f} ms | refresh {refresh_s * 1000 / len(deltas):8.2f} ms"
+    )
+    assert sub.result == pg.query(plan)
+    assert refresh_s < query_s
@@ -0,0 +1,118 @@
+from typing import Any
+
+from tongsim_api_protocol.subsystem.pg_pb2 import PG
+
+from tongsim.core.world_context import WorldContext
+from tongsim.manager.pg import PGManager, PGQueryPlan
+from tongsim.testing import FakeUEConfig, build_pg_frames
+
+_METAS = [
+    {"component": "aabb", "fields": ["max_vertex"]},
+    {
+        "component": "pose",
+        "fields": ["location", "rotation"],
+        "as": {"location": "pos"},
+    },
+    {"component": "scale", "fields": ["x"]},
+]
+
+
+def _scan_query(full_pg: dict, plan: PGQueryPlan) -> dict[str, Any]:
+    """对照组: 逐个 subject / 组件 / meta 遍历"""
+    result: dict[str, dict[str, Any]] = {}
+    for subj in full_pg["subject_pg"]:
+        if subj.get("is_subject_destroyed"):
+            continue
+        sid = subj["subject"]["id"]
+        for comp in subj["component_pg"]:
+            for name, metas in plan.metas_by_component.items():
+                if name not in comp:
+                    continue
+                for meta in metas:
+                    for field in meta["fields"]:
+                        if field in comp[name]:
+                            alias = meta["as_"].get(field, field)
+                            result.setdefault(sid, {})[alias] = comp[name][field]
+    result["__meta__"] = {"beijing_timestamp": full_pg.get("beijing_timestamp", 0)}
+    return result
+
+
+def test_compiled_plan_matches_full_scan(context: WorldContext):
+    full, deltas = build_pg_frames(FakeUEConfig(subjects=100, moving_ratio=0.1), PG)
+    pg = PGManager(context)
+    plan = pg.compile_query(_METAS)
+    assert list(plan.metas_by_component) == ["aabb", "pose", "scale"]
+
+    pg._merge_pg(PG.FromString(full))  # noqa: SLF001
+    for delta in deltas[:3]:
+        pg._merge_pg(PG.FromString(delta))  # noqa: SLF001
+        result = pg.query(plan)
+        assert result == _scan_query(pg.fetch_full_pg_from_streaming(), plan)
+        assert list(result) == list(
+            _scan_query(pg.fetch_full_pg_from_streaming(), plan)
+        )
+    assert pg.query(_METAS) == result
+
+    # 组件被替换为其他类型后倒排索引随之更新；已销毁的 subject 不再出现在结果中
+    update = PG()
+    subject = update.subject_pg.add()
+    subject.subject.id = "FakeSubject_1"
+    comp = subject.component_pg.add()
+    comp.component.id = "FakeSubject_1_scale"
+    comp.pose.location.x = 7.0
+    gone = update.subject_pg.add(subject_destroyed=True)
+    gone.subject.id = "FakeSubject_2"
+    pg._merge_pg(update)  # noqa: SLF001
+
+    result = pg.query(plan)
+    assert result == _scan_query(pg.fetch_full_pg_from_streaming(), plan)
+    assert "x" not in result["FakeSubject_1"]
+    assert result["FakeSubject_1"]["pos"] == {"x": 7.0, "y": 0.0, "z": 0.0}
+    assert "FakeSubject_2" not in result
+    assert pg.query([{"component": "camera_param", "fields": ["fov"]}]) == {
+        "__meta__": result["__meta__"]
+    }
+
+
+def test_subscribed_query_updates_in_place(context: WorldContext):
+    full, deltas = build_pg_frames(FakeUEConfig(subjects=100, moving_ratio=0.1), PG)
+    pg = PGManager(context)
+    sub = pg.subscribe_query([{"component": "pose", "fields": ["location"]}])
+    aabb_sub = pg.subscribe_query([{"component": "aabb", "fields": ["min_vertex"]}])
+    result = sub.result
+
+    pg._merge_pg(PG.FromString(full))  # noqa: SLF001
+    assert sub.refresh() == {f"FakeSubject_{i}" for i in range(100)}
+    assert aabb_sub.refresh() == {f"FakeSubject_{i}" for i in range(100)}
+    assert sub.refresh() == set()
+
+    moved: set[str] = set()
+    for delta in deltas[:2]:
+        delta_msg = PG.FromString(delta)
+        pg._merge_pg(delta_msg)  # noqa: SLF001
+        moved_now = {s.subject.id for s in delta_msg.subject_pg}
+        assert sub.refresh() == moved_now
+        moved |= moved_now
+        assert sub.result is result
+        assert result == pg.query(sub.plan)
+        # 增量帧只更新了 pose 组件
+        assert aabb_sub.refresh() == set()
+
+    gone = PG()
+    gone.subject_pg.add(subject_destroyed=True).subject.id = "FakeSubject_3"
+    pg._merge_pg(gone)  # noqa: SLF001
+    assert sub.refresh() == {"FakeSubject_3"}
+    assert "FakeSubject_3" not in result
+
+    # PG 重新同步后重建整个结果
+    pg._reset_pg()  # noqa: SLF001
+    pg._merge_pg(PG.FromString(full))  # noqa: SLF001
+    assert sub.stale
+    assert sub.refresh() == {"FakeSubject_3"} | moved
+    assert result == pg.query(sub.plan)
+
+    aabb_sub.close()
+    assert len(pg._subscriptions) == 1  # noqa: SLF001
+    del sub
+    pg._merge_pg(PG.FromString(deltas[0]))  # noqa: SLF001
+    assert pg._subscriptions == ()  # noqa: SLF001
@@ -0,0 +1,63 @@
+from collections.abc import AsyncIterator
+
+import grpc
+import pytest
+from grpc.aio import AioRpcError, Metadata
+from tongsim_api_protocol.subsystem.pg_pb2 import PG
+
+from tongsim.core.world_context import WorldContext
+from tongsim.manager.pg import PGManager
+from tongsim.testing import FakeUEConfig, build_pg_frames
+
+
+async def _stream(
+    frames: list[bytes], error: Exception | None = None
+) -> AsyncIterator[PG]:
+    for frame in frames:
+        yield PG.FromString(frame)
+    if error is not None:
+        raise error
+
+
+def _manager(context: WorldContext) -> tuple[PGManager, list[str]]:
+    pg = PGManager(context)
+    pg._assign_segmentation_id = False  # noqa: SLF001
+    pg._stream = object()  # noqa: SLF001
+    resyncs: list[str] = []
+
+    async def resync(reason: str):
+        resyncs.append(reason)
+        pg._stream = None  # noqa: SLF001
+        return _stream([])
+
+    pg._resync_pg = resync  # noqa: SLF001
+    return pg, resyncs
+
+
+async def test_transport_error_triggers_resync(context: WorldContext):
+    full, _ = build_pg_frames(FakeUEConfig(subjects=5), PG)
+    pg, resyncs = _manager(context)
+    error = AioRpcError(
+        grpc.StatusCode.UNAVAILABLE, Metadata(), Metadata(), "ue restarted"
+    )
+
+    await pg._run_pg_stream(_stream([full], error))  # noqa: SLF001
+    assert resyncs == ["UNAVAILABLE: ue restarted"]
+    full_pg = await pg.async_fetch_full_pg_from_streaming()
+    assert len(full_pg["subject_pg"]) == 5
+
+
+async def test_merge_error_stops_without_resync(context: WorldContext):
+    full, _ = build_pg_frames(FakeUEConfig(subjects=5), PG)
+    pg, resyncs = _manager(context)
+    changes = pg.subscribe_changes()
+
+    def broken_merge(pg_msg: PG):
+        raise ValueError("bad frame")
+
+    pg._merge_pg = broken_merge  # noqa: SLF001
+    with pytest.raises(ValueError, match="bad frame"):
+        await pg._run_pg_stream(_stream([full]))  # noqa: SLF001
+    assert resyncs == []
+    # 变化订阅随 PG 流任务结束
+    assert await changes.get() is None
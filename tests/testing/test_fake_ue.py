@@ -0,0 +1,101 @@
+import time
+from collections.abc import AsyncGenerator
+
+import pytest_asyncio
+
+from tongsim.connection.grpc import (
+    AnimationStreamer,
+    AnimCmd,
+    GrpcConnection,
+    UnaryAPI,
+    UnaryStreamAPI,
+)
+from tongsim.connection.grpc.type import CameraImageRequest
+from tongsim.core.world_context import WorldContext
+from tongsim.logger import get_logger
+from tongsim.manager.pg import PGManager
+from tongsim.testing import FakeUEConfig, FakeUEServer
+
+_logger = get_logger("performance")
+
+_SUBJECTS = 500
+
+
+@pytest_asyncio.fixture
+async def fake_ue() -> AsyncGenerator[FakeUEServer, None]:
+    config = FakeUEConfig(
+        subjects=_SUBJECTS, moving_ratio=0.1, ue_fps=600.0, camera_fps=200.0
+    )
+    async with FakeUEServer(config) as ue:
+        yield ue
+
+
+@pytest_asyncio.fixture
+async def context(fake_ue: FakeUEServer) -> AsyncGenerator[WorldContext, None]:
+    ctx = await WorldContext.attach_to_running_loop(
+        fake_ue.endpoint, fake_ue.legacy_endpoint
+    )
+    yield ctx
+    await ctx.arelease()
+
+
+async def test_pg_stream(context: WorldContext, fake_ue: FakeUEServer):
+    pg = PGManager(context)
+    await pg.async_start_pg_stream(pg_freq=2)
+    try:
+        frames = 0
+        t0 = time.perf_counter()
+        async for full_pg in pg.notify_new_pg():
+            subject_pg = full_pg["subject_pg"]
+            frames += 1
+            if frames == 20:
+                break
+        elapsed = time.perf_counter() - t0
+        _logger.info(f"PG {_SUBJECTS} subjects: {frames / elapsed:.1f} frames/s")
+
+        assert len(subject_pg) == _SUBJECTS
+        result = await pg.async_query_fields(
+            [{"component": "pose", "fields": ["location"]}]
+        )
+        assert set(fake_ue.subject_ids()) <= result.keys()
+        # 首帧中的所有实体都分配了分割图 ID
+        assert len(fake_ue.segment_ids) == _SUBJECTS
+    finally:
+        await pg.async_stop_pg_stream()
+
+
+async def test_animation_streamer(context: WorldContext):
+    streamer = AnimationStreamer(
+        context.conn, context.loop, "FakeSubject_0", "FakeSubject_0_anim"
+    )
+    await streamer.start()
+    try:
+        t0 = time.perf_counter()
+        command_ids = [
+            await streamer.submit(AnimCmd.turn_around_degree(90.0)) for _ in range(200)
+        ]
+        results = await streamer.wait_all_end(command_ids)
+        elapsed = time.perf_counter() - t0
+        _logger.info(f"Animation: {len(results) / elapsed:.0f} commands/s")
+    finally:
+        await streamer.stop()
+    assert [r.command_id for r in results] == command_ids
+    assert all(r.status == "end" for r in results)
+
+
+async def test_camera_stream_and_unary(fake_ue: FakeUEServer):
+    async with GrpcConnection(fake_ue.endpoint) as conn:
+        assert await UnaryAPI.get_fps(conn) == 600.0
+        assert len(await UnaryAPI.get_room_info(conn)) == fake_ue.config.rooms
+
+        frames = 0
+        async for images in UnaryStreamAPI.subscribe_image(
+            conn, [CameraImageRequest("FakeCamera", b_depth=True)], stream_name="bench"
+        ):
+            image = images[0]
+            assert image.camera_id == "FakeCamera"
+            assert len(image.depth) == image.width * image.height * 4
+            frames += 1
+            if frames == 30:
+                break
+    assert fake_ue.calls["CameraService/SubscribeImage"] == 1